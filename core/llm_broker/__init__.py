@@ -64,6 +64,7 @@ from .schemas import (
     RequestState,
     LLMRequest,
     LLMResponse,
+    RequestSpec,
 )
 
 __all__ = [
@@ -94,4 +95,5 @@ __all__ = [
     "RequestState",
     "LLMRequest",
     "LLMResponse",
+    "RequestSpec",
 ]
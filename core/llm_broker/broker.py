@@ -15,12 +15,13 @@ from contextlib import asynccontextmanager
 from contextvars import ContextVar
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Any, AsyncIterator
+from typing import Any, AsyncIterator, Sequence
 
 from anthropic import AsyncAnthropic, RateLimitError
 from langsmith import traceable
 from langsmith.wrappers import wrap_anthropic
 
+from core.task_queue.budget.ledger import current_usage_scopes, record_llm_usage
 from core.task_queue.shutdown import get_shutdown_coordinator
 from core.types import ModelTier
 
@@ -43,6 +44,7 @@ from .schemas import (
     BatchPolicy,
     LLMRequest,
     LLMResponse,
+    RequestSpec,
     RequestState,
     UserMode,
 )
@@ -125,6 +127,8 @@ class LLMBroker:
 
         # Future tracking for request resolution
         self._pending_futures: dict[str, asyncio.Future[LLMResponse]] = {}
+        # Requesters' track_usage() scopes, credited when their response lands
+        self._usage_scopes: dict[str, tuple] = {}
         self._id_mapping: dict[str, str] = {}  # sanitized -> original request_id
 
         # Background task
@@ -315,40 +319,104 @@ class LLMBroker:
         Raises:
             QueueOverflowError: If queue full and overflow_behavior is "reject"
         """
-        if not self._started:
-            await self.start()
-
-        # Create request
-        request = LLMRequest.create(
+        spec = RequestSpec(
             prompt=prompt,
-            model=model.value,
+            model=model,
             policy=policy,
             max_tokens=max_tokens,
             system=system,
             effort=effort,
             tools=tools,
             tool_choice=tool_choice,
-            metadata=metadata or {},
+            metadata=metadata,
             messages=messages,
         )
+        futures = await self.request_many([spec])
+        return futures[0]
+
+    async def request_many(
+        self,
+        specs: Sequence[RequestSpec],
+    ) -> list[asyncio.Future[LLMResponse]]:
+        """Submit several requests in one queue transaction.
+
+        All requests are validated before any is queued. Batch-routed
+        requests are persisted and enqueued under a single lock (one queue
+        read and write) instead of one round-trip each, and batch triggers
+        are checked once afterwards.
+
+        Args:
+            specs: Request parameters, in order
+
+        Returns:
+            Futures resolving to LLMResponse, in the order of specs
+
+        Raises:
+            ValueError: If a spec is invalid (nothing is queued)
+            QueueOverflowError: If the batch-routed requests do not fit in
+                the queue and overflow_behavior is "reject" (nothing is queued)
+        """
+        for i, spec in enumerate(specs):
+            if not isinstance(spec.model, ModelTier):
+                raise ValueError(f"Request {i}: model must be a ModelTier, got {spec.model!r}")
+            if spec.max_tokens <= 0:
+                raise ValueError(f"Request {i}: max_tokens must be positive")
+            if not spec.prompt and not spec.messages:
+                raise ValueError(f"Request {i}: prompt or messages required")
+
+        if not self._started:
+            await self.start()
 
-        # Create future for this request
         loop = asyncio.get_running_loop()
-        future: asyncio.Future[LLMResponse] = loop.create_future()
-        self._pending_futures[request.request_id] = future
+        futures: list[asyncio.Future[LLMResponse]] = []
+        to_batch: list[LLMRequest] = []
+        to_sync: list[LLMRequest] = []
+
+        for spec in specs:
+            request = LLMRequest.create(
+                prompt=spec.prompt,
+                model=spec.model.value,
+                policy=spec.policy,
+                max_tokens=spec.max_tokens,
+                system=spec.system,
+                effort=spec.effort,
+                tools=spec.tools,
+                tool_choice=spec.tool_choice,
+                metadata=spec.metadata or {},
+                messages=spec.messages,
+            )
+            future: asyncio.Future[LLMResponse] = loop.create_future()
+            self._pending_futures[request.request_id] = future
+            if scopes := current_usage_scopes():
+                self._usage_scopes[request.request_id] = scopes
+            futures.append(future)
+
+            if should_batch(self._mode, spec.policy, spec.model, spec.effort):
+                to_batch.append(request)
+            else:
+                to_sync.append(request)
 
-        # Determine routing
-        if should_batch(self._mode, policy, model, effort):
-            await self._queue_for_batch(request)
-            if self._metrics:
+        if self._metrics:
+            for request in to_batch:
                 self._metrics.record_request(batched=True)
-        else:
-            # Execute synchronously with tracked task
-            self._spawn_sync_task(request)
-            if self._metrics:
+            for request in to_sync:
                 self._metrics.record_request(batched=False)
 
-        return future
+        if to_batch:
+            try:
+                # Requests that overflow the queue fall back to sync
+                to_sync.extend(await self._queue_for_batch(to_batch))
+            except QueueOverflowError:
+                for request in to_batch + to_sync:
+                    self._pending_futures.pop(request.request_id, None)
+                    self._usage_scopes.pop(request.request_id, None)
+                raise
+
+        # Execute synchronously with tracked tasks
+        for request in to_sync:
+            self._spawn_sync_task(request)
+
+        return futures
 
     def _should_batch(
         self,
@@ -365,42 +433,48 @@ class LLMBroker:
 
     # Queue management
 
-    async def _queue_for_batch(self, request: LLMRequest) -> None:
-        """Queue a request for batch processing.
+    async def _queue_for_batch(self, requests: list[LLMRequest]) -> list[LLMRequest]:
+        """Queue requests for batch processing in one persistence transaction.
 
         Args:
-            request: The request to queue
+            requests: The requests to queue
+
+        Returns:
+            Requests that did not fit in the queue (to run via sync API)
 
         Raises:
-            QueueOverflowError: If queue full and overflow_behavior is "reject"
+            QueueOverflowError: If the requests do not all fit and
+                overflow_behavior is "reject" (none are queued)
         """
-        # Check queue size
-        queue_size = await self._persistence.get_queue_size()
-        if queue_size >= self._config.max_queue_size:
+        reject = self._config.overflow_behavior == "reject"
+        added, queue_size = await self._persistence.add_requests(
+            requests,
+            max_queue_size=self._config.max_queue_size,
+            partial=not reject,
+        )
+        overflow = requests[added:]
+
+        if overflow:
             if self._metrics:
                 self._metrics.record_queue_overflow()
-
-            if self._config.overflow_behavior == "reject":
-                raise QueueOverflowError(queue_size, self._config.max_queue_size)
-            else:
-                # Fall back to sync with tracked task
-                logger.warning(
-                    f"Queue overflow ({queue_size}/{self._config.max_queue_size}), "
-                    f"falling back to sync for request {request.request_id}"
-                )
-                self._spawn_sync_task(request)
-                return
-
-        # Add to persistent queue
-        await self._persistence.add_request(request)
+            if reject:
+                raise QueueOverflowError(queue_size + len(requests), self._config.max_queue_size)
+            logger.warning(
+                f"Queue overflow ({queue_size}/{self._config.max_queue_size}), "
+                f"falling back to sync for {len(overflow)} requests"
+            )
 
         # Track in current batch group if active (uses contextvars for isolation)
         current_group = _current_batch_group.get()
         if current_group:
-            current_group.add_request(request.request_id)
+            for request in requests[:added]:
+                current_group.add_request(request.request_id)
 
         # Check if threshold reached
-        await self._check_batch_triggers()
+        if added and queue_size >= self._config.batch_threshold:
+            await self._check_batch_triggers()
+
+        return overflow
 
     async def _check_batch_triggers(self) -> None:
         """Check if batch should be submitted based on queue size."""
@@ -611,6 +685,16 @@ class LLMBroker:
                 f"(output_tokens={output_tokens})"
             )
 
+        scopes = self._usage_scopes.pop(request_id, ())
+        if response.success and response.usage:
+            record_llm_usage(
+                response.model or "unknown",
+                response.usage,
+                batched=response.batched,
+                source="broker",
+                scopes=scopes,
+            )
+
         future = self._pending_futures.pop(request_id, None)
         if future and not future.done():
             future.set_result(response)
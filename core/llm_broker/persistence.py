@@ -153,6 +153,38 @@ class BrokerPersistence:
             await self.write_queue(queue)
             logger.debug(f"Added request {request.request_id} to queue")
 
+    async def add_requests(
+        self,
+        requests: list[LLMRequest],
+        max_queue_size: int | None = None,
+        partial: bool = True,
+    ) -> tuple[int, int]:
+        """Add several requests in one locked read-modify-write.
+
+        Args:
+            requests: Requests to queue, in order
+            max_queue_size: Cap on QUEUED requests; requests beyond it are
+                not added
+            partial: If False, add nothing unless every request fits
+
+        Returns:
+            (number added - always a prefix of requests, QUEUED count after)
+        """
+        async with self.lock():
+            queue = await self.read_queue()
+            queued = sum(1 for r in queue["requests"] if r["state"] == RequestState.QUEUED.value)
+
+            room = len(requests) if max_queue_size is None else max(0, max_queue_size - queued)
+            if not partial and room < len(requests):
+                room = 0
+            accepted = requests[:room]
+
+            if accepted:
+                queue["requests"].extend(r.to_dict() for r in accepted)
+                await self.write_queue(queue)
+                logger.debug(f"Added {len(accepted)} requests to queue")
+            return len(accepted), queued + len(accepted)
+
     async def get_queued_requests(self) -> list[LLMRequest]:
         """Get all requests in QUEUED state.
 
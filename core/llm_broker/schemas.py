@@ -43,6 +43,26 @@ class RequestState(Enum):
     FAILED = "failed"  # Request failed (API error, validation, etc.)
 
 
+@dataclass
+class RequestSpec:
+    """Parameters of one request submitted via LLMBroker.request_many().
+
+    Mirrors the keyword arguments of LLMBroker.request(); `model` is a
+    ModelTier.
+    """
+
+    prompt: str
+    model: Any
+    policy: BatchPolicy = BatchPolicy.PREFER_SPEED
+    max_tokens: int = 4096
+    system: str | None = None
+    effort: str | None = None
+    tools: list[dict[str, Any]] | None = None
+    tool_choice: dict[str, Any] | None = None
+    metadata: dict[str, Any] | None = None
+    messages: list[dict[str, Any]] | None = None
+
+
 @dataclass
 class LLMRequest:
     """A request to be processed by the broker.
@@ -0,0 +1,269 @@
+"""Browser context pooling for the Playwright fallback scraper.
+
+A fresh context per URL pays for process-level setup, cold HTTP caches and
+TLS handshakes on every scrape. BrowserContextPool keeps a bounded set of
+warmed contexts and hands out one page at a time per context, so several
+URLs load concurrently. Every context routes its requests through
+should_block_request(), which aborts images, fonts, media and subresources
+from tracker hosts before they reach the network.
+
+DomainPacer replaces the scraper's old global delay: requests to the same
+domain stay spaced apart, while requests to different domains go out at
+once.
+"""
+
+import asyncio
+import logging
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING, Any
+from urllib.parse import urlsplit
+
+if TYPE_CHECKING:
+    from playwright.async_api import Browser, BrowserContext, Page, Route
+
+logger = logging.getLogger(__name__)
+
+# Subresources that never contribute text to the scraped markdown
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "media"})
+
+# Analytics, ad and session-replay hosts (subdomains are matched too)
+TRACKER_HOSTS = frozenset(
+    {
+        "google-analytics.com",
+        "googletagmanager.com",
+        "googlesyndication.com",
+        "googleadservices.com",
+        "doubleclick.net",
+        "adservice.google.com",
+        "facebook.net",
+        "connect.facebook.net",
+        "hotjar.com",
+        "clarity.ms",
+        "bat.bing.com",
+        "scorecardresearch.com",
+        "quantserve.com",
+        "chartbeat.com",
+        "chartbeat.net",
+        "segment.io",
+        "segment.com",
+        "mixpanel.com",
+        "nr-data.net",
+        "newrelic.com",
+        "optimizely.com",
+        "crazyegg.com",
+        "taboola.com",
+        "outbrain.com",
+        "criteo.com",
+        "criteo.net",
+        "adsrvr.org",
+        "amazon-adsystem.com",
+    }
+)
+
+# Read the length of the main content region; pages without a landmark fall
+# back to the whole body
+_CONTENT_LENGTH_JS = """() => {
+    const main = document.querySelector("main, article, [role=main]") || document.body;
+    return main ? main.innerText.length : 0;
+}"""
+
+
+def _domain(url: str) -> str:
+    return (urlsplit(url).hostname or "").lower()
+
+
+def is_tracker_host(host: str, trackers: frozenset[str] = TRACKER_HOSTS) -> bool:
+    """Whether a hostname is, or is a subdomain of, a known tracker host."""
+    host = host.lower().rstrip(".")
+    while host:
+        if host in trackers:
+            return True
+        _, _, host = host.partition(".")
+    return False
+
+
+def should_block_request(resource_type: str, url: str) -> bool:
+    """Whether a subrequest should be aborted instead of fetched.
+
+    Documents are never blocked by host: the page being scraped may itself
+    live on a tracker vendor's domain (e.g. their docs site).
+    """
+    if resource_type in BLOCKED_RESOURCE_TYPES:
+        return True
+    return resource_type != "document" and is_tracker_host(_domain(url))
+
+
+async def block_unneeded_resources(route: "Route") -> None:
+    """Playwright route handler that drops images, fonts, media and trackers."""
+    request = route.request
+    if should_block_request(request.resource_type, request.url):
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+async def wait_for_stable_content(
+    page: "Page",
+    timeout: float,
+    interval: float = 0.25,
+    settle_polls: int = 2,
+) -> bool:
+    """Wait until the page's main content stops changing.
+
+    Polls the text length of the main content region and returns once it is
+    non-empty and unchanged for ``settle_polls`` consecutive polls. Unlike
+    ``networkidle`` this doesn't wait on analytics beacons, long polling or
+    lazy-loaded assets that never add text.
+
+    Args:
+        page: Page that has finished DOMContentLoaded
+        timeout: Maximum time to wait in seconds
+        interval: Seconds between polls
+        settle_polls: Consecutive unchanged polls that count as stable
+
+    Returns:
+        True if the content settled, False if the timeout was reached first
+    """
+    deadline = time.monotonic() + timeout
+    last_length = -1
+    unchanged = 0
+    while True:
+        try:
+            length = await page.evaluate(_CONTENT_LENGTH_JS)
+        except Exception:
+            # Context destroyed by a client-side redirect; start over
+            length = -1
+        if length > 0 and length == last_length:
+            unchanged += 1
+            if unchanged >= settle_polls:
+                return True
+        else:
+            unchanged = 0
+        last_length = length
+
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        await asyncio.sleep(min(interval, remaining))
+
+
+class DomainPacer:
+    """Per-domain request spacing.
+
+    Each call reserves the next free slot for its domain, so concurrent
+    callers for one domain are spaced ``delay`` seconds apart in arrival
+    order, and callers for other domains don't wait at all.
+    """
+
+    # Drop expired slots once this many domains are tracked
+    _PRUNE_AFTER = 1024
+
+    def __init__(self, delay: float):
+        self.delay = delay
+        self._next_slot: dict[str, float] = {}
+
+    async def wait(self, url: str) -> None:
+        """Sleep until the URL's domain may be requested again."""
+        domain = _domain(url)
+        now = time.monotonic()
+        start = max(now, self._next_slot.get(domain, 0.0))
+        self._next_slot[domain] = start + self.delay
+        if len(self._next_slot) > self._PRUNE_AFTER:
+            self._next_slot = {d: t for d, t in self._next_slot.items() if t > now}
+
+        if start > now:
+            logger.debug(f"Pacing {domain}: waiting {start - now:.2f}s")
+            await asyncio.sleep(start - now)
+
+
+class BrowserContextPool:
+    """Bounded pool of reusable browser contexts.
+
+    ``page()`` checks out an idle context (or creates one, up to ``size``)
+    and yields a new page in it. Contexts go back to the pool after use and
+    are recycled after ``max_uses`` pages so cookies and caches don't grow
+    without bound. A context whose page raised is closed rather than reused,
+    since a crashed or half-navigated context can poison later scrapes.
+    """
+
+    def __init__(
+        self,
+        get_browser: Callable[[], Awaitable["Browser"]],
+        size: int,
+        context_options: dict[str, Any] | None = None,
+        max_uses: int = 50,
+        block_resources: bool = True,
+    ):
+        """Initialize the pool.
+
+        Args:
+            get_browser: Coroutine returning the (lazily launched) browser
+            size: Maximum number of contexts, and so concurrent pages
+            context_options: Keyword arguments for ``browser.new_context()``
+            max_uses: Pages served by a context before it is replaced
+            block_resources: Route requests through block_unneeded_resources
+        """
+        self._get_browser = get_browser
+        self.size = size
+        self._context_options = context_options or {}
+        self._max_uses = max_uses
+        self._block_resources = block_resources
+
+        self._slots = asyncio.Semaphore(size)
+        self._idle: list[tuple["BrowserContext", int]] = []
+        # Bumped by close() so contexts checked out before it aren't pooled again
+        self._generation = 0
+        self.contexts_created = 0
+
+    async def _new_context(self) -> "BrowserContext":
+        browser = await self._get_browser()
+        context = await browser.new_context(**self._context_options)
+        if self._block_resources:
+            await context.route("**/*", block_unneeded_resources)
+        self.contexts_created += 1
+        logger.debug(f"Created browser context ({self.contexts_created} total)")
+        return context
+
+    @staticmethod
+    async def _close_context(context: "BrowserContext") -> None:
+        try:
+            await context.close()
+        except Exception as e:
+            logger.debug(f"Error closing browser context: {e}")
+
+    @asynccontextmanager
+    async def page(self) -> AsyncIterator["Page"]:
+        """Check out a context and yield a fresh page in it."""
+        async with self._slots:
+            generation = self._generation
+            if self._idle:
+                context, uses = self._idle.pop()
+            else:
+                context, uses = await self._new_context(), 0
+
+            reusable = False
+            page = None
+            try:
+                page = await context.new_page()
+                yield page
+                reusable = True
+            finally:
+                if page is not None:
+                    try:
+                        await page.close()
+                    except Exception:
+                        reusable = False
+                uses += 1
+                if reusable and uses < self._max_uses and generation == self._generation:
+                    self._idle.append((context, uses))
+                else:
+                    await self._close_context(context)
+
+    async def close(self) -> None:
+        """Close idle contexts. Contexts checked out at the time are closed on return."""
+        self._generation += 1
+        idle, self._idle = self._idle, []
+        for context, _ in idle:
+            await self._close_context(context)
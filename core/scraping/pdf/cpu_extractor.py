@@ -1,18 +1,38 @@
 """CPU-based PDF extraction for text-heavy documents.
 
-Uses proper lifecycle management for ThreadPoolExecutor to avoid resource leaks.
+Small documents are extracted in a thread pool. PyMuPDF holds the GIL for
+most of its text and layout work, so documents of PROCESS_MIN_PAGES or more
+are split into page ranges and extracted in parallel worker processes, then
+reassembled in page order. The worker pool is replaced after a fixed
+number of ranges per worker to contain MuPDF memory growth.
+
+Uses proper lifecycle management for both executors to avoid resource leaks.
 """
 
 import asyncio
 import atexit
-from concurrent.futures import ThreadPoolExecutor
+import logging
+import multiprocessing
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass
-from typing import Self
+from typing import Iterable, Self
 
 import fitz
 
 fitz.TOOLS.mupdf_display_errors(False)
 
+logger = logging.getLogger(__name__)
+
+# Documents with at least this many pages go to the process pool
+PROCESS_MIN_PAGES = int(os.getenv("THALA_PDF_PROCESS_MIN_PAGES", "64"))
+# Pages per range submitted to a worker process
+PAGES_PER_RANGE = int(os.getenv("THALA_PDF_PAGES_PER_RANGE", "32"))
+# Ranges per worker process before the pool is replaced
+WORKER_MAX_TASKS = int(os.getenv("THALA_PDF_WORKER_MAX_TASKS", "50"))
+
 
 @dataclass
 class ExtractionResult:
@@ -37,11 +57,34 @@ class CpuExtractor:
         await extractor.shutdown()
     """
 
-    def __init__(self, max_workers: int = 5):
+    def __init__(
+        self,
+        max_workers: int = 5,
+        process_workers: int | None = None,
+        process_min_pages: int | None = None,
+        pages_per_range: int | None = None,
+        worker_max_tasks: int | None = None,
+    ):
+        """Initialize the extractor.
+
+        Args:
+            max_workers: Threads for small documents
+            process_workers: Worker processes for large documents
+                (default: CPU count, capped at 8)
+            process_min_pages: Page count at which the process pool is used
+            pages_per_range: Pages per range handed to a worker process
+            worker_max_tasks: Ranges per worker before the pool is replaced
+        """
         self._executor = ThreadPoolExecutor(
             max_workers=max_workers,
             thread_name_prefix="pdf_cpu_",
         )
+        self._process_workers = process_workers or min(os.cpu_count() or 1, 8)
+        self._process_min_pages = process_min_pages or PROCESS_MIN_PAGES
+        self._pages_per_range = pages_per_range or PAGES_PER_RANGE
+        self._worker_max_tasks = worker_max_tasks or WORKER_MAX_TASKS
+        self._process_pool: ProcessPoolExecutor | None = None
+        self._pool_tasks = 0
         self._closed = False
 
     async def __aenter__(self) -> Self:
@@ -51,23 +94,95 @@ class CpuExtractor:
         await self.shutdown()
 
     async def shutdown(self) -> None:
-        """Shutdown executor gracefully."""
+        """Shutdown executors gracefully."""
         if not self._closed:
             self._executor.shutdown(wait=False)
+            if self._process_pool is not None:
+                self._process_pool.shutdown(wait=False, cancel_futures=True)
             self._closed = True
 
-    async def extract(self, pdf_content: bytes) -> ExtractionResult:
+    async def extract(self, pdf_content: bytes, page_count: int | None = None) -> ExtractionResult:
         """Extract text from PDF using PyMuPDF (CPU-only).
 
         Fast path for born-digital, text-heavy documents.
         Returns structured markdown with basic formatting.
+
+        Args:
+            pdf_content: Raw PDF bytes
+            page_count: Page count if already known (skips a document open)
         """
         if self._closed:
             raise RuntimeError("Extractor has been shut down")
 
         loop = asyncio.get_running_loop()
+        if page_count is None:
+            page_count = await loop.run_in_executor(self._executor, _count_pages, pdf_content)
+
+        if page_count >= self._process_min_pages:
+            try:
+                return await self._extract_in_processes(pdf_content, page_count)
+            except BrokenProcessPool:
+                # A worker died (MuPDF crash or OOM); start a fresh pool next time
+                logger.warning(f"PDF worker process died on a {page_count}-page document, retrying in-process")
+                self._reset_process_pool()
+
         return await loop.run_in_executor(self._executor, _extract_sync, pdf_content)
 
+    async def _extract_in_processes(self, pdf_content: bytes, page_count: int) -> ExtractionResult:
+        """Extract page ranges in worker processes and reassemble in order."""
+        loop = asyncio.get_running_loop()
+        ranges = [
+            (start, min(start + self._pages_per_range, page_count))
+            for start in range(0, page_count, self._pages_per_range)
+        ]
+        # Workers open the file themselves instead of each receiving a pickled copy
+        path = await loop.run_in_executor(self._executor, _write_temp_pdf, pdf_content)
+        try:
+            # Take the pool only after the last await before submitting, so a
+            # concurrent extraction cannot recycle (shut down) it in between
+            pool = self._get_process_pool()
+            self._pool_tasks += len(ranges)
+            chunks = await asyncio.gather(
+                *(loop.run_in_executor(pool, _extract_range_sync, path, start, stop) for start, stop in ranges)
+            )
+        finally:
+            os.unlink(path)
+
+        pages = [page for chunk_pages, _ in chunks for page in chunk_pages]
+        issues = sum(chunk_issues for _, chunk_issues in chunks)
+        logger.debug(f"Extracted {page_count} pages in {len(ranges)} ranges across worker processes")
+        return _build_result(pages, issues)
+
+    def _get_process_pool(self) -> ProcessPoolExecutor:
+        """Get or create the worker process pool, replacing a worn-out one.
+
+        Recycles the whole pool rather than using max_tasks_per_child, which
+        can deadlock the executor on some CPython releases (gh-115634).
+        Ranges already submitted to the old pool still complete.
+        """
+        if self._process_pool is not None and self._pool_tasks >= self._worker_max_tasks * self._process_workers:
+            logger.debug(f"Recycling PDF worker pool after {self._pool_tasks} ranges")
+            self._process_pool.shutdown(wait=False)
+            self._process_pool = None
+
+        if self._process_pool is None:
+            # Workers fork from a server process that has already imported
+            # this module, so new workers start without re-importing PyMuPDF
+            # and the scraping package.
+            context = multiprocessing.get_context("forkserver")
+            context.set_forkserver_preload([__name__])
+            self._process_pool = ProcessPoolExecutor(
+                max_workers=self._process_workers,
+                mp_context=context,
+            )
+            self._pool_tasks = 0
+        return self._process_pool
+
+    def _reset_process_pool(self) -> None:
+        if self._process_pool is not None:
+            self._process_pool.shutdown(wait=False, cancel_futures=True)
+            self._process_pool = None
+
 
 # Module-level singleton for convenience (created lazily)
 _default_extractor: CpuExtractor | None = None
@@ -82,15 +197,17 @@ def get_extractor() -> CpuExtractor:
     return _default_extractor
 
 
-async def extract_text_cpu(pdf_content: bytes) -> ExtractionResult:
+async def extract_text_cpu(pdf_content: bytes, page_count: int | None = None) -> ExtractionResult:
     """Convenience function using default extractor."""
-    return await get_extractor().extract(pdf_content)
+    return await get_extractor().extract(pdf_content, page_count=page_count)
 
 
 def _cleanup_extractor():
-    """Shutdown executor gracefully on process exit."""
+    """Shutdown executors gracefully on process exit."""
     if _default_extractor is not None:
         _default_extractor._executor.shutdown(wait=True)
+        if _default_extractor._process_pool is not None:
+            _default_extractor._process_pool.shutdown(wait=True, cancel_futures=True)
 
 
 atexit.register(_cleanup_extractor)
@@ -99,11 +216,49 @@ atexit.register(_cleanup_extractor)
 def _extract_sync(pdf_content: bytes) -> ExtractionResult:
     """Synchronous extraction in thread pool."""
     doc = fitz.open(stream=pdf_content, filetype="pdf")
+    pages, issues = _extract_pages(doc, first_page_num=1)
+    doc.close()
+
+    return _build_result(pages, issues)
+
 
+def _extract_range_sync(path: str, start: int, stop: int) -> tuple[list[str], int]:
+    """Extract pages [start, stop) of a PDF file in a worker process.
+
+    Returns:
+        (formatted non-empty pages, number of pages with layout issues)
+    """
+    doc = fitz.open(path)
+    try:
+        return _extract_pages(doc.pages(start, stop), first_page_num=start + 1)
+    finally:
+        doc.close()
+
+
+def _count_pages(pdf_content: bytes) -> int:
+    """Page count, or 0 if the document cannot be opened.
+
+    Unreadable documents take the in-thread path, which raises the real error.
+    """
+    try:
+        with fitz.open(stream=pdf_content, filetype="pdf") as doc:
+            return doc.page_count
+    except Exception:
+        return 0
+
+
+def _write_temp_pdf(pdf_content: bytes) -> str:
+    with tempfile.NamedTemporaryFile(prefix="thala_pdf_", suffix=".pdf", delete=False) as f:
+        f.write(pdf_content)
+        return f.name
+
+
+def _extract_pages(doc_pages: Iterable, first_page_num: int) -> tuple[list[str], int]:
+    """Format pages as markdown, counting pages with multi-column layouts."""
     pages = []
     issues = 0
 
-    for page_num, page in enumerate(doc, 1):
+    for page_num, page in enumerate(doc_pages, first_page_num):
         blocks = page.get_text("dict")["blocks"]
         text_blocks = [b for b in blocks if b.get("type") == 0]
 
@@ -119,8 +274,10 @@ def _extract_sync(pdf_content: bytes) -> ExtractionResult:
         if page_text.strip():
             pages.append(f"<!-- Page {page_num} -->\n\n{page_text}")
 
-    doc.close()
+    return pages, issues
+
 
+def _build_result(pages: list[str], issues: int) -> ExtractionResult:
     markdown = "\n\n---\n\n".join(pages)
     confidence = 1.0 - (issues / max(len(pages), 1))
 
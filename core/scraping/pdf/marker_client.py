@@ -0,0 +1,326 @@
+"""Pooled client for the Marker service API.
+
+One httpx.AsyncClient per event loop serves health checks, job submission
+and polling, so connections are reused instead of opened per request.
+
+Conversion requests made within MARKER_BATCH_WINDOW seconds of each other
+are coalesced into a single /convert/batch call. Jobs are polled on a
+schedule seeded by a page-count duration estimate: polls halve the
+remaining expected time down to the estimate, then back off exponentially
+if the job overruns.
+"""
+
+import asyncio
+import logging
+import os
+from typing import Any, Iterator, Optional
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+MARKER_BATCH_WINDOW = float(os.getenv("MARKER_BATCH_WINDOW", "0.05"))
+MARKER_MAX_BATCH_SIZE = int(os.getenv("MARKER_MAX_BATCH_SIZE", "16"))
+MARKER_MIN_POLL_INTERVAL = float(os.getenv("MARKER_MIN_POLL_INTERVAL", "1.0"))
+
+# Rough GPU conversion throughput per quality preset, used to seed polling.
+# Its keys are the presets the service accepts.
+SECONDS_PER_PAGE = {"fast": 0.5, "balanced": 1.0, "quality": 2.0}
+JOB_OVERHEAD_SECONDS = 5.0
+
+
+class MarkerProcessingError(Exception):
+    """Error during Marker PDF processing."""
+
+    pass
+
+
+def estimate_job_seconds(page_count: Optional[int], quality: str = "balanced") -> float:
+    """Expected conversion time for a document, excluding queue wait."""
+    per_page = SECONDS_PER_PAGE.get(quality, SECONDS_PER_PAGE["balanced"])
+    return JOB_OVERHEAD_SECONDS + per_page * (page_count or 0)
+
+
+def poll_schedule(estimate: float, min_interval: float, max_interval: float) -> Iterator[float]:
+    """Yield successive delays between job status polls.
+
+    Each delay is half the time remaining until the estimate (bounded by
+    the intervals), so polls are sparse early and dense near the expected
+    finish. Once the estimate has passed, delays double from min_interval
+    up to max_interval.
+    """
+    elapsed = 0.0
+    while elapsed < estimate:
+        delay = min(max(min_interval, (estimate - elapsed) / 2), max_interval)
+        elapsed += delay
+        yield delay
+
+    delay = min_interval
+    while True:
+        yield delay
+        delay = min(delay * 2, max_interval)
+
+
+class MarkerClient:
+    """Marker API client with batched submission and adaptive polling.
+
+    Usage:
+        client = MarkerClient("http://localhost:8001")
+        job_id = await client.submit({"file_path": "doc.pdf", "quality": "fast"})
+        markdown = await client.wait_for_job(job_id, estimate=30.0)
+        await client.aclose()
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        *,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        timeout: float = 60.0,
+        batch_window: float = MARKER_BATCH_WINDOW,
+        max_batch_size: int = MARKER_MAX_BATCH_SIZE,
+        min_poll_interval: float = MARKER_MIN_POLL_INTERVAL,
+        max_poll_interval: float = 15.0,
+        submit_backoff: tuple[float, ...] = (4.0, 10.0, 20.0),
+    ):
+        """Initialize the client.
+
+        Args:
+            base_url: Marker service URL
+            transport: Optional httpx transport (e.g. ASGITransport in tests)
+            timeout: Default request timeout in seconds
+            batch_window: Seconds to wait for more requests before submitting
+            max_batch_size: Submit immediately once this many requests are pending
+            min_poll_interval: Shortest delay between status polls
+            max_poll_interval: Longest delay between status polls
+            submit_backoff: Waits between submission retries on timeouts
+        """
+        self._client = httpx.AsyncClient(
+            base_url=base_url,
+            timeout=timeout,
+            transport=transport,
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+        )
+        self._batch_window = batch_window
+        self._max_batch_size = max_batch_size
+        self._min_poll_interval = min_poll_interval
+        self._max_poll_interval = max_poll_interval
+        self._submit_backoff = submit_backoff
+
+        self._pending: list[tuple[dict[str, Any], asyncio.Future]] = []
+        self._flush_timer: Optional[asyncio.TimerHandle] = None
+        self._sending: set[asyncio.Task] = set()
+        self.stats = {"submitted": 0, "batch_calls": 0, "single_calls": 0, "polls": 0}
+
+    async def health(self, timeout: float) -> bool:
+        """Single health check. Returns True if Marker answered 200."""
+        try:
+            response = await self._client.get("/health", timeout=timeout)
+            return response.status_code == 200
+        except (httpx.ConnectError, httpx.ConnectTimeout, httpx.ReadTimeout) as e:
+            logger.warning(f"Marker service unavailable: {e}")
+            return False
+        except Exception as e:
+            logger.warning(f"Marker health check failed: {e}")
+            return False
+
+    async def submit(self, payload: dict[str, Any]) -> str:
+        """Queue a conversion request and return its job ID.
+
+        Requests arriving within the batch window share one HTTP call.
+
+        Raises:
+            MarkerProcessingError: If the quality preset is unknown (checked
+                here so one bad request never fails a shared batch)
+        """
+        quality = payload.get("quality", "balanced")
+        if quality not in SECONDS_PER_PAGE:
+            raise MarkerProcessingError(
+                f"Invalid Marker quality preset {quality!r}. Must be one of: {list(SECONDS_PER_PAGE)}"
+            )
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((payload, future))
+        self.stats["submitted"] += 1
+
+        if len(self._pending) >= self._max_batch_size:
+            self._flush()
+        elif self._flush_timer is None:
+            self._flush_timer = loop.call_later(self._batch_window, self._flush)
+
+        return await future
+
+    def _flush(self) -> None:
+        """Send everything pending as one submission."""
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+
+        task = asyncio.create_task(self._send(batch))
+        self._sending.add(task)
+        task.add_done_callback(self._sending.discard)
+
+    async def _send(self, batch: list[tuple[dict[str, Any], asyncio.Future]]) -> None:
+        payloads = [payload for payload, _ in batch]
+        futures = [future for _, future in batch]
+
+        try:
+            if len(batch) == 1:
+                self.stats["single_calls"] += 1
+                job_ids = [(await self._post("/convert", payloads[0]))["job_id"]]
+            else:
+                self.stats["batch_calls"] += 1
+                logger.debug(f"Submitting {len(batch)} Marker jobs in one batch")
+                job_ids = [r["job_id"] for r in await self._post("/convert/batch", {"files": payloads})]
+        except httpx.HTTPStatusError as e:
+            if len(batch) == 1:
+                _settle(futures[0], error=MarkerProcessingError(f"Marker job submission failed: {e}"))
+                return
+            # The service validates the whole batch before queuing any of
+            # it, so nothing was submitted; resubmit individually so only
+            # the bad request fails
+            logger.warning(f"Marker batch submission rejected ({e.response.status_code}), submitting individually")
+            await asyncio.gather(*(self._send([item]) for item in batch))
+            return
+        except Exception as e:
+            for future in futures:
+                _settle(future, error=e)
+            return
+
+        for future, job_id in zip(futures, job_ids):
+            _settle(future, result=job_id)
+
+    async def _post(self, path: str, body: dict[str, Any]) -> Any:
+        """POST with retries on timeouts (the service may be busy)."""
+        attempts = len(self._submit_backoff) + 1
+        for attempt in range(attempts):
+            try:
+                response = await self._client.post(path, json=body)
+                response.raise_for_status()
+                return response.json()
+            except (httpx.ReadTimeout, httpx.ConnectTimeout) as e:
+                if attempt == attempts - 1:
+                    raise MarkerProcessingError(f"Marker job submission failed after {attempts} attempts: {e}") from e
+                wait_time = self._submit_backoff[attempt]
+                logger.warning(f"Marker submit timeout (attempt {attempt + 1}/{attempts}), retrying in {wait_time}s")
+                await asyncio.sleep(wait_time)
+
+    async def wait_for_job(
+        self,
+        job_id: str,
+        estimate: float = JOB_OVERHEAD_SECONDS,
+        max_wait: Optional[float] = None,
+        max_retries: int = 3,
+    ) -> str:
+        """Poll a job until it completes and return its markdown.
+
+        Args:
+            job_id: Job ID from submit()
+            estimate: Expected conversion time in seconds (seeds the schedule)
+            max_wait: Maximum wait time in seconds (None = no limit)
+            max_retries: Attempts per poll on transient network errors
+
+        Raises:
+            MarkerProcessingError: If the job fails, times out, or the
+                service becomes unavailable
+        """
+        loop = asyncio.get_running_loop()
+        deadline = None if max_wait is None else loop.time() + max_wait
+
+        for delay in poll_schedule(estimate, self._min_poll_interval, self._max_poll_interval):
+            if deadline is not None:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    raise MarkerProcessingError(f"Marker job {job_id} did not complete within {max_wait}s")
+                delay = min(delay, remaining)
+            await asyncio.sleep(delay)
+
+            data = await self._get_job(job_id, max_retries)
+            status = data["status"]
+            if status == "completed":
+                return data["result"].get("markdown", "")
+            if status == "failed":
+                raise MarkerProcessingError(f"Marker job {job_id} failed: {data.get('error', 'Unknown error')}")
+            if status not in ("pending", "processing"):
+                raise MarkerProcessingError(f"Unknown Marker job status: {status}")
+
+        raise AssertionError("unreachable: poll_schedule is infinite")
+
+    async def _get_job(self, job_id: str, max_retries: int) -> dict[str, Any]:
+        """Fetch job status, retrying transient network errors."""
+        for attempt in range(max_retries):
+            self.stats["polls"] += 1
+            try:
+                response = await self._client.get(f"/jobs/{job_id}")
+                response.raise_for_status()
+                return response.json()
+            except (httpx.ReadTimeout, httpx.ConnectTimeout, httpx.ConnectError) as e:
+                if attempt == max_retries - 1:
+                    logger.warning(
+                        f"Marker service unavailable during polling for job {job_id}: {type(e).__name__}: {e}"
+                    )
+                    raise MarkerProcessingError(f"Marker service unavailable: {type(e).__name__}") from e
+                wait_time = self._max_poll_interval * (attempt + 1)
+                logger.warning(
+                    f"Marker poll error for job {job_id} (attempt {attempt + 1}/{max_retries}): "
+                    f"{type(e).__name__}, retrying in {wait_time}s"
+                )
+                await asyncio.sleep(wait_time)
+        raise MarkerProcessingError(f"Marker poll for job {job_id} failed")
+
+    async def aclose(self) -> None:
+        """Submit anything pending, then close the HTTP client."""
+        self._flush()
+        if self._sending:
+            await asyncio.gather(*self._sending, return_exceptions=True)
+        await self._client.aclose()
+
+
+def _settle(future: asyncio.Future, result: Any = None, error: Optional[BaseException] = None) -> None:
+    """Resolve a submitter's future unless the caller has given up on it."""
+    if future.done():
+        return
+    if error is not None:
+        future.set_exception(error)
+    else:
+        future.set_result(result)
+
+
+_client: Optional[MarkerClient] = None
+_client_loop: Optional[asyncio.AbstractEventLoop] = None
+_retiring: set[asyncio.Task] = set()
+
+
+async def _close_stale_client(client: MarkerClient) -> None:
+    """Close the HTTP client of a MarkerClient left behind by an old event loop.
+
+    Its connections belong to that loop, so closing raises once the loop is
+    closed; the sockets are released regardless.
+    """
+    try:
+        await client._client.aclose()
+    except Exception as e:
+        logger.debug(f"Closed stale Marker client: {e}")
+
+
+def get_marker_client(base_url: str, max_poll_interval: float) -> MarkerClient:
+    """Get the Marker client for the running event loop.
+
+    httpx connections belong to the loop that opened them, so a new client
+    is created when called from a different loop (e.g. successive
+    asyncio.run() calls) and the old one is closed.
+    """
+    global _client, _client_loop
+    loop = asyncio.get_running_loop()
+    if _client is None or _client_loop is not loop:
+        if _client is not None:
+            task = loop.create_task(_close_stale_client(_client))
+            _retiring.add(task)
+            task.add_done_callback(_retiring.discard)
+        _client = MarkerClient(base_url, max_poll_interval=max_poll_interval)
+        _client_loop = loop
+    return _client
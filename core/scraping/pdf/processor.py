@@ -3,6 +3,8 @@
 Provides functions to convert PDFs to markdown using the Marker service.
 Includes Playwright fallback for sites that block direct downloads.
 Supports automatic chunking for large PDFs to prevent memory exhaustion.
+Talks to Marker through a shared MarkerClient (see marker_client.py), which
+batches concurrent submissions and polls on a page-count-based schedule.
 """
 
 import asyncio
@@ -18,11 +20,17 @@ import httpx
 
 from utils.pdf_chunking import (
     assemble_markdown_chunks,
-    should_chunk_pdf,
+    get_page_count,
     split_pdf_by_pages,
 )
 
 from .detector import validate_pdf_bytes
+from .marker_client import (
+    MarkerClient,
+    MarkerProcessingError,
+    estimate_job_seconds,
+    get_marker_client,
+)
 
 if TYPE_CHECKING:
     from playwright.async_api import Browser, Playwright
@@ -32,6 +40,7 @@ logger = logging.getLogger(__name__)
 # Marker service configuration
 MARKER_BASE_URL = os.getenv("MARKER_BASE_URL", "http://localhost:8001")
 MARKER_INPUT_DIR = Path(os.getenv("MARKER_INPUT_DIR", "/data/input"))
+# Longest delay between job status polls (polling adapts below this)
 MARKER_POLL_INTERVAL = float(os.getenv("MARKER_POLL_INTERVAL", "15.0"))
 MARKER_MAX_FILE_SIZE = int(os.getenv("MARKER_MAX_FILE_SIZE", str(1024 * 1024 * 1024)))  # 1GB
 
@@ -44,10 +53,9 @@ _playwright: "Playwright | None" = None
 _browser: "Browser | None" = None
 
 
-class MarkerProcessingError(Exception):
-    """Error during Marker PDF processing."""
-
-    pass
+def _get_client() -> MarkerClient:
+    """Shared Marker client for the running event loop."""
+    return get_marker_client(MARKER_BASE_URL, max_poll_interval=MARKER_POLL_INTERVAL)
 
 
 # Health check timeout - fail fast if Marker isn't available
@@ -60,18 +68,7 @@ async def _check_marker_health() -> bool:
     Returns:
         True if Marker is reachable, False otherwise
     """
-    try:
-        async with httpx.AsyncClient(
-            base_url=MARKER_BASE_URL, timeout=MARKER_HEALTH_TIMEOUT
-        ) as client:
-            response = await client.get("/health")
-            return response.status_code == 200
-    except (httpx.ConnectError, httpx.ConnectTimeout, httpx.ReadTimeout) as e:
-        logger.warning(f"Marker service unavailable: {e}")
-        return False
-    except Exception as e:
-        logger.warning(f"Marker health check failed: {e}")
-        return False
+    return await _get_client().health(timeout=MARKER_HEALTH_TIMEOUT)
 
 
 MARKER_HEALTH_RETRY_DELAYS = (15, 30, 90)
@@ -375,59 +372,41 @@ async def _submit_marker_job(
     file_path: str,
     quality: str = "balanced",
     langs: Optional[list[str]] = None,
-    max_retries: int = 3,
 ) -> str:
     """Submit a PDF conversion job to Marker.
 
+    Concurrent submissions are coalesced into one /convert/batch call.
+
     Args:
         file_path: Path relative to Marker input directory
         quality: Quality preset (fast, balanced, quality)
         langs: Languages for OCR
-        max_retries: Max retries for transient network errors
 
     Returns:
         Job ID for polling
     """
-    async with httpx.AsyncClient(base_url=MARKER_BASE_URL, timeout=60.0) as client:
-        payload = {
-            "file_path": file_path,
-            "quality": quality,
-            "markdown_only": False,
-            "langs": langs or ["English"],
-        }
-
-        backoff_multipliers = (2, 5, 10)  # Longer backoffs for busy service
-        for attempt in range(max_retries):
-            try:
-                response = await client.post("/convert", json=payload)
-                response.raise_for_status()
-                data = response.json()
-                return data["job_id"]
-            except (httpx.ReadTimeout, httpx.ConnectTimeout) as e:
-                if attempt < max_retries - 1:
-                    wait_time = 2.0 * backoff_multipliers[attempt]  # 4s, 10s, 20s
-                    logger.warning(
-                        f"Marker submit timeout (attempt {attempt + 1}/{max_retries}), retrying in {wait_time}s"
-                    )
-                    await asyncio.sleep(wait_time)
-                else:
-                    raise MarkerProcessingError(f"Marker job submission failed after {max_retries} retries: {e}") from e
-
-        # Should never reach here, but satisfy type checker
-        raise MarkerProcessingError("Marker job submission failed")
+    payload = {
+        "file_path": file_path,
+        "quality": quality,
+        "markdown_only": False,
+        "langs": langs or ["English"],
+    }
+    return await _get_client().submit(payload)
 
 
 async def _poll_marker_job(
     job_id: str,
     max_wait: Optional[float] = None,
-    max_retries: int = 3,
+    page_count: Optional[int] = None,
+    quality: str = "balanced",
 ) -> str:
     """Poll Marker job until completion.
 
     Args:
         job_id: Job ID to poll
         max_wait: Maximum wait time in seconds (None = no limit, waits until job completes or service unavailable)
-        max_retries: Max retries for transient network errors per poll attempt
+        page_count: Pages in the document, used to estimate when it will finish
+        quality: Quality preset the job was submitted with
 
     Returns:
         Markdown content
@@ -435,53 +414,11 @@ async def _poll_marker_job(
     Raises:
         MarkerProcessingError: If job fails, times out, or service becomes unavailable
     """
-    start_time = asyncio.get_event_loop().time()
-
-    # Use longer timeout for poll requests - Marker can be slow under load
-    async with httpx.AsyncClient(base_url=MARKER_BASE_URL, timeout=60.0) as client:
-        while True:
-            elapsed = asyncio.get_event_loop().time() - start_time
-            if max_wait is not None and elapsed > max_wait:
-                raise MarkerProcessingError(f"Marker job {job_id} did not complete within {max_wait}s")
-
-            # Retry transient network errors with backoffs
-            # Short backoffs to detect service unavailability quickly (~90s total)
-            backoff_multipliers = (1, 2, 3)  # 15s, 30s, 45s
-            for attempt in range(max_retries):
-                try:
-                    response = await client.get(f"/jobs/{job_id}")
-                    response.raise_for_status()
-                    break
-                except (httpx.ReadTimeout, httpx.ConnectTimeout, httpx.ConnectError) as e:
-                    if attempt < max_retries - 1:
-                        wait_time = MARKER_POLL_INTERVAL * backoff_multipliers[attempt]
-                        logger.warning(
-                            f"Marker poll error for job {job_id} (attempt {attempt + 1}/{max_retries}): "
-                            f"{type(e).__name__}, retrying in {wait_time}s"
-                        )
-                        await asyncio.sleep(wait_time)
-                    else:
-                        logger.warning(
-                            f"Marker service unavailable during polling for job {job_id}: "
-                            f"{type(e).__name__}: {e}"
-                        )
-                        raise MarkerProcessingError(
-                            f"Marker service unavailable: {type(e).__name__}"
-                        ) from e
-
-            data = response.json()
-            status = data["status"]
-
-            if status == "completed":
-                result = data["result"]
-                return result.get("markdown", "")
-            elif status == "failed":
-                error = data.get("error", "Unknown error")
-                raise MarkerProcessingError(f"Marker job {job_id} failed: {error}")
-            elif status in ("pending", "processing"):
-                await asyncio.sleep(MARKER_POLL_INTERVAL)
-            else:
-                raise MarkerProcessingError(f"Unknown Marker job status: {status}")
+    return await _get_client().wait_for_job(
+        job_id,
+        estimate=estimate_job_seconds(page_count, quality),
+        max_wait=max_wait,
+    )
 
 
 async def process_pdf_url(
@@ -557,8 +494,14 @@ async def process_pdf_bytes(
         limit_mb = MARKER_MAX_FILE_SIZE / (1024 * 1024)
         raise MarkerProcessingError(f"PDF too large ({size_mb:.1f}MB > {limit_mb:.0f}MB limit)")
 
+    try:
+        page_count = get_page_count(content)
+    except Exception as e:
+        logger.warning(f"Could not determine page count, skipping chunking: {e}")
+        page_count = None
+
     # Check if PDF needs chunking
-    if should_chunk_pdf(content, MARKER_CHUNK_PAGE_THRESHOLD):
+    if page_count is not None and page_count >= MARKER_CHUNK_PAGE_THRESHOLD:
         return await _process_chunked_pdf(
             content,
             quality=quality,
@@ -573,6 +516,7 @@ async def process_pdf_bytes(
         langs=langs,
         timeout=timeout,
         filename=filename,
+        page_count=page_count,
     )
 
 
@@ -582,6 +526,7 @@ async def _process_single_pdf(
     langs: Optional[list[str]] = None,
     timeout: Optional[float] = None,
     filename: Optional[str] = None,
+    page_count: Optional[int] = None,
 ) -> str:
     """Process a single PDF (internal helper).
 
@@ -591,6 +536,7 @@ async def _process_single_pdf(
         langs: Languages for OCR
         timeout: Maximum processing time
         filename: Optional filename
+        page_count: Page count if known (seeds the poll schedule)
 
     Returns:
         Markdown content
@@ -603,7 +549,7 @@ async def _process_single_pdf(
     logger.debug(f"Submitted Marker job: {job_id}")
 
     # Poll for completion
-    markdown = await _poll_marker_job(job_id, max_wait=timeout)
+    markdown = await _poll_marker_job(job_id, max_wait=timeout, page_count=page_count, quality=quality)
     logger.debug(f"Marker conversion complete: {len(markdown)} chars")
 
     return markdown
@@ -649,6 +595,7 @@ async def _process_chunked_pdf(
                 langs=langs,
                 timeout=timeout,
                 filename=chunk_filename,
+                page_count=page_range[1] - page_range[0] + 1,
             )
             markdown_chunks.append(markdown)
             page_ranges.append(page_range)
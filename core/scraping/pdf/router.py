@@ -167,7 +167,7 @@ async def process_document_smart(
         )
 
         processing_start = time.perf_counter()
-        result = await extract_text_cpu(pdf_content)
+        result = await extract_text_cpu(pdf_content, page_count=analysis.page_count)
         processing_duration = time.perf_counter() - processing_start
 
         record_route_decision("cpu_degraded", analysis.complexity.value, analysis.page_count)
@@ -225,7 +225,7 @@ async def process_document_smart(
         )
 
     # CPU fast-path
-    result = await extract_text_cpu(pdf_content)
+    result = await extract_text_cpu(pdf_content, page_count=analysis.page_count)
 
     # Check if CPU extraction flagged issues (double-check during extraction)
     if result.fallback_recommended:
@@ -4,12 +4,13 @@ import asyncio
 import logging
 import os
 import tempfile
-import time
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 import html2text
 
+from .browser_pool import BrowserContextPool, DomainPacer, wait_for_stable_content
+
 if TYPE_CHECKING:
     from playwright.async_api import Browser, Page, Playwright
 
@@ -35,7 +36,10 @@ class PlaywrightScraper:
 
     Features:
     - Lazy browser initialization (only starts when first needed)
-    - Rate limiting between requests
+    - Pool of reused browser contexts, so several pages load concurrently
+    - Per-domain rate limiting between requests
+    - Images, fonts, media and trackers blocked at the network layer
+    - Stops waiting once the main content is stable rather than on networkidle
     - Clean HTML to markdown conversion
     - Proper resource cleanup
     """
@@ -45,13 +49,17 @@ class PlaywrightScraper:
         timeout: int | None = None,
         delay: float | None = None,
         headless: bool | None = None,
+        max_concurrency: int | None = None,
+        block_resources: bool | None = None,
     ):
         """Initialize the Playwright scraper.
 
         Args:
             timeout: Page load timeout in milliseconds (default: 60000)
-            delay: Delay between requests in seconds (default: 1.5)
+            delay: Delay between requests to the same domain in seconds (default: 1.5)
             headless: Run browser in headless mode (default: True)
+            max_concurrency: Pooled browser contexts, i.e. pages loading at once (default: 4)
+            block_resources: Block images, fonts, media and trackers (default: True)
         """
         self._playwright: "Playwright | None" = None
         self._browser: "Browser | None" = None
@@ -65,7 +73,31 @@ class PlaywrightScraper:
             else (os.environ.get("SCRAPER_PLAYWRIGHT_HEADLESS", "true").lower() == "true")
         )
 
-        self._last_request: float = 0
+        max_concurrency = max_concurrency or int(os.environ.get("SCRAPER_PLAYWRIGHT_CONCURRENCY", "4"))
+        block_resources = (
+            block_resources
+            if block_resources is not None
+            else (os.environ.get("SCRAPER_PLAYWRIGHT_BLOCK_RESOURCES", "true").lower() == "true")
+        )
+
+        self._browser_lock = asyncio.Lock()
+        self._pacer = DomainPacer(self._delay)
+        # Realistic browser fingerprint; downloads enabled to handle PDF URLs gracefully
+        self._pool = BrowserContextPool(
+            self._get_browser,
+            size=max_concurrency,
+            context_options={
+                "user_agent": (
+                    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+                    "AppleWebKit/537.36 (KHTML, like Gecko) "
+                    "Chrome/120.0.0.0 Safari/537.36"
+                ),
+                "viewport": {"width": 1920, "height": 1080},
+                "locale": "en-US",
+                "accept_downloads": True,
+            },
+            block_resources=block_resources,
+        )
         self._solver: "CaptchaSolver | None" = None
 
         # Configure html2text
@@ -77,32 +109,23 @@ class PlaywrightScraper:
 
     async def _get_browser(self) -> "Browser":
         """Get or create browser instance (lazy initialization)."""
-        if self._browser is None:
-            from playwright.async_api import async_playwright
-
-            logger.debug("Initializing Playwright browser")
-            self._playwright = await async_playwright().start()
-            self._browser = await self._playwright.chromium.launch(
-                headless=self._headless,
-                args=[
-                    "--disable-blink-features=AutomationControlled",
-                    "--disable-dev-shm-usage",
-                    "--no-sandbox",
-                ],
-            )
-            logger.info("Playwright browser started")
+        async with self._browser_lock:
+            if self._browser is None:
+                from playwright.async_api import async_playwright
+
+                logger.debug("Initializing Playwright browser")
+                self._playwright = await async_playwright().start()
+                self._browser = await self._playwright.chromium.launch(
+                    headless=self._headless,
+                    args=[
+                        "--disable-blink-features=AutomationControlled",
+                        "--disable-dev-shm-usage",
+                        "--no-sandbox",
+                    ],
+                )
+                logger.info("Playwright browser started")
         return self._browser
 
-    async def _rate_limit(self) -> None:
-        """Enforce delay between requests."""
-        now = time.monotonic()
-        elapsed = now - self._last_request
-        if self._last_request > 0 and elapsed < self._delay:
-            wait_time = self._delay - elapsed
-            logger.debug(f"Rate limiting: waiting {wait_time:.2f}s")
-            await asyncio.sleep(wait_time)
-        self._last_request = time.monotonic()
-
     def _get_solver(self) -> "CaptchaSolver | None":
         """Get or create a shared CaptchaSolver (lazy singleton)."""
         if self._solver is None:
@@ -127,70 +150,42 @@ class PlaywrightScraper:
             PDFDownloadDetected: If the URL triggers a PDF download instead of a page.
                 The PDF content is available in the exception's `content` attribute.
         """
-        await self._rate_limit()
-
-        browser = await self._get_browser()
-
-        # Create context with realistic browser fingerprint
-        # Enable downloads to handle PDF URLs gracefully
-        context = await browser.new_context(
-            user_agent=(
-                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                "AppleWebKit/537.36 (KHTML, like Gecko) "
-                "Chrome/120.0.0.0 Safari/537.36"
-            ),
-            viewport={"width": 1920, "height": 1080},
-            locale="en-US",
-            accept_downloads=True,
-        )
-        page = await context.new_page()
-        download_path: str | None = None
-
-        try:
-            logger.debug(f"Playwright navigating to {url}")
-
-            # Try navigation with download detection
-            # Use expect_download to properly wait for downloads if they occur
-            download_content = await self._navigate_with_download_detection(page, url)
+        async with self._pool.page() as page:
+            # Pace after the pool wait so the spacing applies to the request itself
+            await self._pacer.wait(url)
+            try:
+                logger.debug(f"Playwright navigating to {url}")
 
-            if download_content:
-                raise PDFDownloadDetected(download_content, url)
+                # Try navigation with download detection
+                # Use expect_download to properly wait for downloads if they occur
+                download_content = await self._navigate_with_download_detection(page, url)
 
-            # Wait for network to settle
-            try:
-                await page.wait_for_load_state("networkidle", timeout=self._timeout // 2)
-            except Exception:
-                # If networkidle times out, proceed with what we have
-                logger.debug("networkidle timeout, proceeding with current content")
+                if download_content:
+                    raise PDFDownloadDetected(download_content, url)
 
-            # Attempt captcha detection and solving (if CapSolver configured)
-            await self._handle_captcha(page, url)
+                # Wait for the main content to settle; if it never does, proceed
+                # with what we have
+                if not await wait_for_stable_content(page, timeout=self._timeout / 2000):
+                    logger.debug("Content still changing at timeout, proceeding with current content")
 
-            # Get page HTML
-            html = await page.content()
+                # Attempt captcha detection and solving (if CapSolver configured)
+                await self._handle_captcha(page, url)
 
-            # Convert to markdown
-            markdown = self._html2text.handle(html)
+                # Get page HTML
+                html = await page.content()
 
-            logger.debug(f"Playwright scraped {len(markdown)} chars")
-            return markdown.strip()
+                # Convert to markdown
+                markdown = self._html2text.handle(html)
 
-        except PDFDownloadDetected:
-            raise
+                logger.debug(f"Playwright scraped {len(markdown)} chars")
+                return markdown.strip()
 
-        except Exception as e:
-            logger.error(f"Playwright scrape failed: {e}")
-            raise
+            except PDFDownloadDetected:
+                raise
 
-        finally:
-            # Cleanup download temp file
-            if download_path:
-                try:
-                    Path(download_path).unlink(missing_ok=True)
-                except OSError:
-                    pass
-            await page.close()
-            await context.close()
+            except Exception as e:
+                logger.error(f"Playwright scrape failed: {e}")
+                raise
 
     async def _handle_captcha(self, page: "Page", url: str) -> None:
         """Detect and solve captcha on the current page if CapSolver is configured."""
@@ -314,6 +309,8 @@ class PlaywrightScraper:
 
     async def close(self) -> None:
         """Clean up browser resources."""
+        await self._pool.close()
+
         if self._browser:
             logger.debug("Closing Playwright browser")
             await self._browser.close()
@@ -2,6 +2,7 @@ from .schema import (
     BaseRecord,
     CoherenceRecord,
     ForgottenRecord,
+    RecordView,
     SourceType,
     StoreRecord,
     WhoIWasRecord,
@@ -39,6 +40,7 @@ __all__ = [
     "BaseRecord",
     "CoherenceRecord",
     "ForgottenRecord",
+    "RecordView",
     "SourceType",
     "StoreRecord",
     "WhoIWasRecord",
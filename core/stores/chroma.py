@@ -7,6 +7,7 @@ ChromaDB 1.0.0 has no native async - all calls wrapped with asyncio.to_thread().
 import asyncio
 import json
 import logging
+from collections.abc import AsyncIterator, Sequence
 from typing import TYPE_CHECKING, Optional
 from uuid import UUID
 
@@ -254,6 +255,91 @@ class ChromaStore:
         logger.debug(f"Deleted record {record_id} from Chroma")
         return True
 
+    async def delete_many(
+        self,
+        record_ids: Sequence[UUID],
+        reason: str = "Deleted via API",
+        batch_size: int = 500,
+    ) -> int:
+        """
+        Delete records in batches with mandatory history tracking.
+
+        Each batch costs one Chroma get, one `_bulk` write to who_i_was and
+        one Chroma delete. Only records whose snapshot was archived are
+        deleted.
+
+        Args:
+            record_ids: UUIDs of records to delete
+            reason: Optional reason for the deletion
+            batch_size: Records per batch
+
+        Returns:
+            Number of records deleted
+
+        Raises:
+            RuntimeError: If es_stores not configured (archiving is mandatory)
+        """
+        if self._es_stores is None:
+            raise RuntimeError(
+                "ChromaStore.delete_many() requires es_stores for mandatory archiving."
+            )
+
+        collection = await self._get_collection()
+        deleted = 0
+        for start in range(0, len(record_ids), batch_size):
+            batch = [str(rid) for rid in record_ids[start : start + batch_size]]
+            existing = await asyncio.to_thread(
+                collection.get, ids=batch, include=["metadatas", "documents"]
+            )
+            if not existing["ids"]:
+                continue
+
+            count = len(existing["ids"])
+            snapshots = [
+                WhoIWasRecord(
+                    supersedes=UUID(rid),
+                    reason=reason,
+                    previous_data={"metadata": metadata, "document": document},
+                    original_store="top_of_mind",
+                )
+                for rid, metadata, document in zip(
+                    existing["ids"],
+                    existing["metadatas"] or [None] * count,
+                    existing["documents"] or [None] * count,
+                )
+            ]
+            supersedes = {snapshot.id: snapshot.supersedes for snapshot in snapshots}
+            archived = await self._es_stores.who_i_was.add_many(snapshots)
+            if not archived:
+                continue
+
+            ids = [str(supersedes[snapshot_id]) for snapshot_id in archived]
+            await asyncio.to_thread(collection.delete, ids=ids)
+            deleted += len(ids)
+            logger.debug(f"Deleted {len(ids)} records from Chroma")
+        return deleted
+
+    async def scan_metadata(
+        self, page_size: int = 1000
+    ) -> AsyncIterator[tuple[UUID, dict]]:
+        """
+        Stream (id, metadata) for every record, one page in memory at a time.
+
+        Pages by offset, so concurrent writes can shift rows between pages.
+        """
+        collection = await self._get_collection()
+        offset = 0
+        while True:
+            page = await asyncio.to_thread(
+                collection.get, include=["metadatas"], limit=page_size, offset=offset
+            )
+            ids = page["ids"]
+            for rid, metadata in zip(ids, page["metadatas"] or [None] * len(ids)):
+                yield UUID(rid), metadata or {}
+            if len(ids) < page_size:
+                return
+            offset += len(ids)
+
     async def count(self) -> int:
         """Get total document count in collection."""
         collection = await self._get_collection()
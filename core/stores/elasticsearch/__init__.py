@@ -11,6 +11,7 @@ Index structure:
 
 from .base import BaseElasticsearchStore
 from .client import ElasticsearchStores
+from .key_index import KeyIndexEntry, ZoteroKeyIndex
 from .stores import CoherenceStore, ForgottenStore, MainStore, WhoIWasStore
 
 __all__ = [
@@ -20,4 +21,6 @@ __all__ = [
     "MainStore",
     "WhoIWasStore",
     "ForgottenStore",
+    "KeyIndexEntry",
+    "ZoteroKeyIndex",
 ]
@@ -1,18 +1,57 @@
 """Base class for Elasticsearch-backed stores."""
 
 import logging
+from collections.abc import AsyncIterator, Sequence
 from typing import Any, Optional, TypeVar
 from uuid import UUID
 
 from elasticsearch import AsyncElasticsearch, NotFoundError
+from elasticsearch.helpers import async_scan
 
-from ..schema import BaseRecord, _utc_now
+from ..schema import BaseRecord, RecordView, _utc_now
 
 logger = logging.getLogger(__name__)
 
 T = TypeVar("T", bound=BaseRecord)
 
 
+def source_includes(fields: Sequence[str]) -> list[str]:
+    """Build an ES `_source_includes` list for a projection, always keeping `id`."""
+    includes = list(dict.fromkeys(fields))
+    if "id" not in includes:
+        includes.insert(0, "id")
+    return includes
+
+
+def hit_to_view(hit: dict[str, Any]) -> RecordView:
+    """Convert a projected ES hit into a RecordView, carrying its score."""
+    view = RecordView.model_validate(hit["_source"])
+    if hit.get("_score") is not None:
+        view.score = hit["_score"]
+    return view
+
+
+def bulk_succeeded(response: dict[str, Any], action: str) -> list[str]:
+    """
+    Document ids a `_bulk` request applied successfully.
+
+    Failed items are logged and left out. A delete of a document that was
+    already gone (404) is neither a success nor logged.
+    """
+    succeeded: list[str] = []
+    for item in response.get("items", []):
+        result = item.get(action, {})
+        status = result.get("status", 500)
+        if status < 300:
+            succeeded.append(result["_id"])
+        elif not (action == "delete" and status == 404):
+            logger.warning(
+                f"Bulk {action} failed for {result.get('_id')} in "
+                f"{result.get('_index')}: {result.get('error')}"
+            )
+    return succeeded
+
+
 class BaseElasticsearchStore:
     """Base class for ES-backed stores."""
 
@@ -37,17 +76,56 @@ class BaseElasticsearchStore:
         logger.debug(f"Added record {record.id} to {index}")
         return record.id
 
-    async def get(self, record_id: UUID, index: Optional[str] = None) -> Optional[T]:
-        """Get a record by UUID."""
+    async def add_many(self, records: Sequence[T]) -> list[UUID]:
+        """
+        Add several records with one `_bulk` request.
+
+        Returns:
+            Ids of the records that were indexed
+        """
+        if not records:
+            return []
+        operations: list[dict[str, Any]] = []
+        for record in records:
+            operations.append(
+                {"index": {"_index": self._get_index_name(record), "_id": str(record.id)}}
+            )
+            operations.append(record.model_dump(mode="json"))
+        response = await self._client.bulk(operations=operations)
+        added = [UUID(record_id) for record_id in bulk_succeeded(response, "index")]
+        logger.debug(f"Bulk added {len(added)}/{len(records)} records")
+        return added
+
+    async def get(
+        self,
+        record_id: UUID,
+        index: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> Optional[T | RecordView]:
+        """
+        Get a record by UUID.
+
+        Args:
+            record_id: UUID of the record
+            index: Optional index name override
+            fields: If given, fetch only these `_source` fields and return a
+                RecordView instead of the full record.
+        """
         index = index or self.index_name
+        kwargs: dict[str, Any] = {}
+        if fields is not None:
+            kwargs["source_includes"] = source_includes(fields)
         try:
             response = await self._client.get(
                 index=index,
                 id=str(record_id),
+                **kwargs,
             )
-            return self.record_class.model_validate(response["_source"])
         except NotFoundError:
             return None
+        if fields is not None:
+            return RecordView.model_validate(response["_source"])
+        return self.record_class.model_validate(response["_source"])
 
     async def update(
         self, record_id: UUID, updates: dict[str, Any], index: Optional[str] = None
@@ -94,7 +172,8 @@ class BaseElasticsearchStore:
         query: dict[str, Any],
         size: int = 10,
         index: Optional[str] = None,
-    ) -> list[T]:
+        fields: Optional[Sequence[str]] = None,
+    ) -> list[T] | list[RecordView]:
         """
         Search for records.
 
@@ -102,21 +181,56 @@ class BaseElasticsearchStore:
             query: Elasticsearch query DSL
             size: Max results to return
             index: Optional index name or pattern (e.g., "store_l*")
+            fields: If given, fetch only these `_source` fields and return
+                RecordViews (with `score` set) instead of full records.
 
         Returns:
             List of matching records as Pydantic models
         """
         index = index or self.index_name
+        kwargs: dict[str, Any] = {}
+        if fields is not None:
+            kwargs["source_includes"] = source_includes(fields)
         response = await self._client.search(
             index=index,
             query=query,
             size=size,
+            **kwargs,
         )
 
-        return [
-            self.record_class.model_validate(hit["_source"])
-            for hit in response["hits"]["hits"]
-        ]
+        hits = response["hits"]["hits"]
+        if fields is not None:
+            return [hit_to_view(hit) for hit in hits]
+        return [self.record_class.model_validate(hit["_source"]) for hit in hits]
+
+    async def scan(
+        self,
+        fields: Sequence[str],
+        query: Optional[dict[str, Any]] = None,
+        index: Optional[str] = None,
+        page_size: int = 1000,
+    ) -> AsyncIterator[RecordView]:
+        """
+        Stream every matching record as a projected RecordView.
+
+        Uses the scroll-based scan helper so bulk consumers (GC, indexing)
+        see one page in memory at a time.
+
+        Args:
+            fields: `_source` fields to fetch (`id` is always included)
+            query: Elasticsearch query DSL; defaults to match_all
+            index: Optional index name or pattern
+            page_size: Hits fetched per scroll page
+        """
+        index = index or self.index_name
+        async for hit in async_scan(
+            self._client,
+            index=index,
+            query={"query": query or {"match_all": {}}},
+            _source=source_includes(fields),
+            size=page_size,
+        ):
+            yield RecordView.model_validate(hit["_source"])
 
     async def exists(self, record_id: UUID, index: Optional[str] = None) -> bool:
         """Check if a record exists."""
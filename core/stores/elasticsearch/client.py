@@ -10,10 +10,12 @@ Index structure:
 """
 
 import logging
-from typing import Any
+from pathlib import Path
+from typing import Any, Optional
 
 from elasticsearch import AsyncElasticsearch
 
+from .key_index import ZoteroKeyIndex
 from .stores import CoherenceStore, ForgottenStore, MainStore, WhoIWasStore
 
 logger = logging.getLogger(__name__)
@@ -33,6 +35,7 @@ class ElasticsearchStores:
         coherence_host: str = "http://localhost:9201",
         forgotten_host: str = "http://localhost:9200",
         request_timeout: int = 30,
+        key_index_path: Optional[Path] = None,
     ):
         # ES instance for coherence and store indices
         self._coherence_client = AsyncElasticsearch(
@@ -54,7 +57,9 @@ class ElasticsearchStores:
 
         # Store instances
         self.coherence = CoherenceStore(self._coherence_client, self)
-        self.store = MainStore(self._coherence_client, self)
+        self.store = MainStore(
+            self._coherence_client, self, key_index=ZoteroKeyIndex(key_index_path)
+        )
         self.who_i_was = WhoIWasStore(self._forgotten_client)
         self.forgotten = ForgottenStore(self._forgotten_client)
 
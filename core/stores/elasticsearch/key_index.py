@@ -0,0 +1,269 @@
+"""
+Local zotero_key -> record-id index for the main store.
+
+Resolving a citation key to its L0/L1/L2 records otherwise takes one ES term
+query per level. MainStore keeps this SQLite index up to date from its write
+paths (add/update/delete) and fills misses from a single projected ES query, so
+callers resolve many keys with one local lookup.
+
+The index is a cache: a missing or stale entry only costs a fallback query,
+and `MainStore.rebuild_key_index()` repopulates it from the store.
+"""
+
+import logging
+import os
+import sqlite3
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+from uuid import UUID
+
+from ..schema import RecordView, StoreRecord
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_KEY_INDEX_PATH = (
+    Path(__file__).parent.parent.parent.parent
+    / ".thala"
+    / "state"
+    / "zotero_key_index.sqlite3"
+)
+
+# Fields fetched when filling the index from ES (no content or embeddings)
+INDEX_FIELDS = [
+    "zotero_key",
+    "compression_level",
+    "language_code",
+    "metadata.title",
+    "metadata.date",
+    "metadata.year",
+]
+
+_LEVEL_COLUMNS = {0: "l0_id", 1: "l1_id", 2: "l2_id"}
+
+# SQLite caps bound parameters per statement; stay well under it
+_QUERY_CHUNK = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS key_index (
+    zotero_key TEXT PRIMARY KEY,
+    l0_id TEXT,
+    l1_id TEXT,
+    l2_id TEXT,
+    title TEXT,
+    year INTEGER,
+    content_length INTEGER
+)
+"""
+
+
+@dataclass
+class KeyIndexEntry:
+    """Record ids and light metadata for one Zotero key."""
+
+    zotero_key: str
+    l0_id: Optional[UUID] = None
+    l1_id: Optional[UUID] = None
+    l2_id: Optional[UUID] = None
+    title: Optional[str] = None
+    year: Optional[int] = None
+    content_length: Optional[int] = None
+
+    def id_for_level(self, compression_level: int) -> Optional[UUID]:
+        """Get the record id stored for a compression level."""
+        return getattr(self, _LEVEL_COLUMNS[compression_level], None)
+
+
+def parse_year(metadata: dict) -> Optional[int]:
+    """Extract a publication year from record metadata."""
+    for value in (metadata.get("year"), metadata.get("date")):
+        if value in (None, ""):
+            continue
+        try:
+            return int(str(value)[:4])
+        except ValueError:
+            continue
+    return None
+
+
+def _row_to_entry(row: sqlite3.Row) -> KeyIndexEntry:
+    def _uuid(value: Optional[str]) -> Optional[UUID]:
+        return UUID(value) if value else None
+
+    return KeyIndexEntry(
+        zotero_key=row["zotero_key"],
+        l0_id=_uuid(row["l0_id"]),
+        l1_id=_uuid(row["l1_id"]),
+        l2_id=_uuid(row["l2_id"]),
+        title=row["title"],
+        year=row["year"],
+        content_length=row["content_length"],
+    )
+
+
+class ZoteroKeyIndex:
+    """
+    SQLite-backed map of zotero_key -> {l0_id, l1_id, l2_id, title, year,
+    content_length}.
+
+    Methods are synchronous and short; async callers run them via
+    `asyncio.to_thread`. Each call opens its own connection so the index is
+    safe to share across threads and processes (WAL mode).
+
+    When several L1/L2 records share a key (original language plus English
+    translation), an English (or untagged) record replaces an existing entry
+    but a non-English one never does, so lookups prefer English summaries.
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = Path(
+            path or os.getenv("THALA_KEY_INDEX_PATH", str(DEFAULT_KEY_INDEX_PATH))
+        )
+        self._initialized = False
+
+    def _connect(self) -> sqlite3.Connection:
+        if not self._initialized:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=30)
+        conn.row_factory = sqlite3.Row
+        if not self._initialized:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(_SCHEMA)
+            conn.commit()
+            self._initialized = True
+        return conn
+
+    def record_added(self, record: StoreRecord | RecordView) -> None:
+        """Index a record that was written to (or read from) the store."""
+        self.records_added([record])
+
+    def records_added(self, records: Iterable[StoreRecord | RecordView]) -> None:
+        """Index several records in one transaction."""
+        conn = self._connect()
+        try:
+            with conn:
+                for record in records:
+                    self._upsert(conn, record)
+        finally:
+            conn.close()
+
+    def _upsert(self, conn: sqlite3.Connection, record: StoreRecord | RecordView) -> None:
+        column = _LEVEL_COLUMNS.get(record.compression_level or 0)
+        if not record.zotero_key or column is None:
+            return
+
+        existing = conn.execute(
+            f"SELECT {column} FROM key_index WHERE zotero_key = ?",
+            (record.zotero_key,),
+        ).fetchone()
+        conn.execute(
+            "INSERT OR IGNORE INTO key_index (zotero_key) VALUES (?)",
+            (record.zotero_key,),
+        )
+
+        if column != "l0_id":
+            if (
+                existing is not None
+                and existing[column]
+                and record.language_code not in (None, "en")
+            ):
+                return
+            conn.execute(
+                f"UPDATE key_index SET {column} = ? WHERE zotero_key = ?",
+                (str(record.id), record.zotero_key),
+            )
+            return
+
+        metadata = record.metadata or {}
+        content_length = len(record.content) if record.content is not None else None
+        conn.execute(
+            """
+            UPDATE key_index
+            SET l0_id = ?,
+                title = COALESCE(?, title),
+                year = COALESCE(?, year),
+                content_length = COALESCE(?, content_length)
+            WHERE zotero_key = ?
+            """,
+            (
+                str(record.id),
+                metadata.get("title"),
+                parse_year(metadata),
+                content_length,
+                record.zotero_key,
+            ),
+        )
+
+    def record_deleted(self, record: StoreRecord) -> None:
+        """Drop a deleted record's id; remove the entry once no ids remain."""
+        self.records_deleted([record])
+
+    def records_deleted(self, records: Iterable[StoreRecord]) -> None:
+        """Drop several deleted records' ids in one transaction."""
+        indexed = [
+            (_LEVEL_COLUMNS[record.compression_level], record)
+            for record in records
+            if record.zotero_key and record.compression_level in _LEVEL_COLUMNS
+        ]
+        if not indexed:
+            return
+
+        conn = self._connect()
+        try:
+            with conn:
+                for column, record in indexed:
+                    conn.execute(
+                        f"UPDATE key_index SET {column} = NULL "
+                        f"WHERE zotero_key = ? AND {column} = ?",
+                        (record.zotero_key, str(record.id)),
+                    )
+                    conn.execute(
+                        "DELETE FROM key_index WHERE zotero_key = ? AND l0_id IS NULL "
+                        "AND l1_id IS NULL AND l2_id IS NULL",
+                        (record.zotero_key,),
+                    )
+        finally:
+            conn.close()
+
+    def resolve(self, zotero_key: str) -> Optional[KeyIndexEntry]:
+        """Look up a single key."""
+        return self.resolve_many([zotero_key]).get(zotero_key)
+
+    def resolve_many(self, zotero_keys: Sequence[str]) -> dict[str, KeyIndexEntry]:
+        """Look up many keys; missing keys are absent from the result."""
+        keys = list(dict.fromkeys(zotero_keys))
+        found: dict[str, KeyIndexEntry] = {}
+        if not keys:
+            return found
+
+        conn = self._connect()
+        try:
+            for start in range(0, len(keys), _QUERY_CHUNK):
+                chunk = keys[start : start + _QUERY_CHUNK]
+                placeholders = ",".join("?" * len(chunk))
+                rows = conn.execute(
+                    f"SELECT * FROM key_index WHERE zotero_key IN ({placeholders})",
+                    chunk,
+                ).fetchall()
+                for row in rows:
+                    found[row["zotero_key"]] = _row_to_entry(row)
+        finally:
+            conn.close()
+        return found
+
+    def clear(self) -> None:
+        """Remove every entry (used before a full rebuild)."""
+        conn = self._connect()
+        try:
+            with conn:
+                conn.execute("DELETE FROM key_index")
+        finally:
+            conn.close()
+
+    def __len__(self) -> int:
+        conn = self._connect()
+        try:
+            return conn.execute("SELECT COUNT(*) FROM key_index").fetchone()[0]
+        finally:
+            conn.close()
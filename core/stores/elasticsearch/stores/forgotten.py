@@ -1,6 +1,7 @@
 """ForgottenStore for archived/forgotten content."""
 
 import logging
+from collections.abc import Sequence
 from typing import Optional
 from uuid import UUID
 
@@ -52,3 +53,38 @@ class ForgottenStore(BaseElasticsearchStore):
         await self.add(forgotten)
         logger.debug(f"Archived record {forgotten.id} to forgotten: {reason}")
         return forgotten.id
+
+    async def forget_many(
+        self,
+        records: Sequence[BaseRecord],
+        reason: str,
+        original_store: str,
+    ) -> list[UUID]:
+        """
+        Archive several records with one `_bulk` request.
+
+        Args:
+            records: The records being forgotten
+            reason: Why they're being forgotten
+            original_store: Which store they came from
+
+        Returns:
+            Ids of the original records that were archived
+        """
+        originals: dict[UUID, UUID] = {}
+        forgotten: list[ForgottenRecord] = []
+        for record in records:
+            archived = ForgottenRecord(
+                source_type=record.source_type,
+                zotero_key=record.zotero_key,
+                content=record.content,
+                forgotten_reason=reason,
+                original_store=original_store,
+                previous_data=record.model_dump(mode="json"),
+            )
+            originals[archived.id] = record.id
+            forgotten.append(archived)
+
+        added = await self.add_many(forgotten)
+        logger.debug(f"Archived {len(added)} records to forgotten: {reason}")
+        return [originals[forgotten_id] for forgotten_id in added]
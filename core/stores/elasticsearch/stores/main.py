@@ -1,19 +1,30 @@
 """MainStore for all relevant content - originals and compressions."""
 
+import asyncio
 import logging
+from collections.abc import AsyncIterator, Sequence
 from typing import TYPE_CHECKING, Any, Optional
 from uuid import UUID
 
 from elasticsearch import AsyncElasticsearch, NotFoundError
 
-from ...schema import BaseRecord, StoreRecord
-from ..base import BaseElasticsearchStore
+from ...schema import BaseRecord, RecordView, StoreRecord
+from ..base import (
+    BaseElasticsearchStore,
+    bulk_succeeded,
+    hit_to_view,
+    source_includes,
+)
+from ..key_index import INDEX_FIELDS, KeyIndexEntry, ZoteroKeyIndex, parse_year
 
 if TYPE_CHECKING:
     from ..client import ElasticsearchStores
 
 logger = logging.getLogger(__name__)
 
+# Partial updates touching these fields refresh the record's key index entry
+_KEY_INDEX_UPDATE_FIELDS = {"zotero_key", "content", "language_code", "metadata"}
+
 
 class MainStore(BaseElasticsearchStore):
     """
@@ -35,9 +46,15 @@ class MainStore(BaseElasticsearchStore):
         2: "store_l2",
     }
 
-    def __init__(self, client: AsyncElasticsearch, stores: "ElasticsearchStores"):
+    def __init__(
+        self,
+        client: AsyncElasticsearch,
+        stores: "ElasticsearchStores",
+        key_index: Optional[ZoteroKeyIndex] = None,
+    ):
         super().__init__(client)
         self._stores = stores
+        self.key_index = key_index
 
     def _get_index_name(self, record: Optional[BaseRecord] = None) -> str:
         """Route to correct index based on compression_level."""
@@ -51,23 +68,37 @@ class MainStore(BaseElasticsearchStore):
         """Get index name for a compression level."""
         return self.COMPRESSION_INDICES.get(compression_level, "store_l0")
 
+    async def add(self, record: StoreRecord) -> UUID:
+        """Add a record to its level's index and update the key index."""
+        record_id = await super().add(record)
+        if self.key_index is not None and record.zotero_key:
+            try:
+                await asyncio.to_thread(self.key_index.record_added, record)
+            except Exception as e:
+                logger.warning(f"Key index update failed for {record.zotero_key}: {e}")
+        return record_id
+
     async def get(
-        self, record_id: UUID, compression_level: Optional[int] = None
-    ) -> Optional[StoreRecord]:
+        self,
+        record_id: UUID,
+        compression_level: Optional[int] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> Optional[StoreRecord | RecordView]:
         """
         Get a record by UUID.
 
         Args:
             record_id: UUID of the record
             compression_level: If known, speeds up lookup. Otherwise searches all store indices.
+            fields: If given, return a RecordView with only these fields.
         """
         if compression_level is not None:
             index = self._index_for_level(compression_level)
-            return await super().get(record_id, index=index)
+            return await super().get(record_id, index=index, fields=fields)
 
         # Search across all store indices
         for level in self.COMPRESSION_INDICES.values():
-            result = await super().get(record_id, index=level)
+            result = await super().get(record_id, index=level, fields=fields)
             if result:
                 return result
         return None
@@ -76,7 +107,8 @@ class MainStore(BaseElasticsearchStore):
         self,
         source_id: UUID,
         compression_level: int,
-    ) -> Optional[StoreRecord]:
+        fields: Optional[Sequence[str]] = None,
+    ) -> Optional[StoreRecord | RecordView]:
         """
         Get a compressed record by its source (L0) UUID.
 
@@ -86,13 +118,14 @@ class MainStore(BaseElasticsearchStore):
         Args:
             source_id: UUID of the source L0 record
             compression_level: Which compression level to search (1 or 2)
+            fields: If given, return a RecordView with only these fields.
 
         Returns:
             StoreRecord if found, None otherwise
         """
         if compression_level == 0:
             # For L0, use direct lookup
-            return await self.get(source_id, compression_level=0)
+            return await self.get(source_id, compression_level=0, fields=fields)
 
         index = self._index_for_level(compression_level)
         query = {
@@ -104,7 +137,7 @@ class MainStore(BaseElasticsearchStore):
             }
         }
 
-        results = await super().search(query, size=1, index=index)
+        results = await super().search(query, size=1, index=index, fields=fields)
         if results:
             return results[0]
         return None
@@ -121,7 +154,34 @@ class MainStore(BaseElasticsearchStore):
             compression_level: Which index to update in
         """
         index = self._index_for_level(compression_level)
-        return await super().update(record_id, updates, index=index)
+        updated = await super().update(record_id, updates, index=index)
+        if (
+            updated
+            and self.key_index is not None
+            and _KEY_INDEX_UPDATE_FIELDS & updates.keys()
+        ):
+            await self._reindex_updated(record_id, updates, compression_level)
+        return updated
+
+    async def _reindex_updated(
+        self, record_id: UUID, updates: dict[str, Any], compression_level: int
+    ) -> None:
+        """Refresh a partially updated record's key index entry.
+
+        The projection skips content; an updated content's length is taken
+        from `updates` rather than re-fetched.
+        """
+        try:
+            view = await self.get(
+                record_id, compression_level=compression_level, fields=INDEX_FIELDS
+            )
+            if view is None or not view.zotero_key:
+                return
+            if "content" in updates:
+                view = view.model_copy(update={"content": updates["content"]})
+            await asyncio.to_thread(self.key_index.record_added, view)
+        except Exception as e:
+            logger.warning(f"Key index update failed for {record_id}: {e}")
 
     async def delete(
         self, record_id: UUID, reason: str, compression_level: Optional[int] = None
@@ -160,16 +220,187 @@ class MainStore(BaseElasticsearchStore):
             logger.debug(
                 f"Deleted store record {record_id} from {index}, archived to forgotten"
             )
-            return True
         except NotFoundError:
             return False
 
+        if self.key_index is not None and current.zotero_key:
+            try:
+                await asyncio.to_thread(self.key_index.record_deleted, current)
+            except Exception as e:
+                logger.warning(f"Key index update failed for {current.zotero_key}: {e}")
+        return True
+
+    async def delete_many(
+        self,
+        record_ids: Sequence[UUID],
+        reason: str,
+        compression_level: int,
+        batch_size: int = 500,
+    ) -> int:
+        """
+        Delete records from one level in bulk, archiving each to forgotten_store.
+
+        Each batch costs one mget for the snapshots, one `_bulk` index into
+        forgotten and one `_bulk` delete. Only records whose archive write
+        succeeded are deleted, so nothing is lost without a snapshot.
+
+        Args:
+            record_ids: UUIDs of records to delete
+            reason: Required explanation for why these are being forgotten
+            compression_level: Level the records live in
+            batch_size: Records per bulk request
+
+        Returns:
+            Number of records deleted
+        """
+        index = self._index_for_level(compression_level)
+        deleted = 0
+        for start in range(0, len(record_ids), batch_size):
+            batch = record_ids[start : start + batch_size]
+            current = await self.mget([(rid, compression_level) for rid in batch])
+            if not current:
+                continue
+
+            archived = await self._stores.forgotten.forget_many(
+                list(current.values()), reason, index
+            )
+            if not archived:
+                continue
+
+            response = await self._client.bulk(
+                operations=[{"delete": {"_index": index, "_id": str(rid)}} for rid in archived]
+            )
+            removed = [current[UUID(rid)] for rid in bulk_succeeded(response, "delete")]
+            deleted += len(removed)
+            logger.debug(f"Bulk deleted {len(removed)} records from {index}, archived to forgotten")
+
+            if self.key_index is not None:
+                try:
+                    await asyncio.to_thread(self.key_index.records_deleted, removed)
+                except Exception as e:
+                    logger.warning(f"Key index update failed for {index} bulk delete: {e}")
+        return deleted
+
+    async def mget(
+        self,
+        refs: Sequence[tuple[UUID, int]],
+        fields: Optional[Sequence[str]] = None,
+    ) -> dict[UUID, StoreRecord | RecordView]:
+        """
+        Fetch several records, possibly from different levels, in one request.
+
+        Args:
+            refs: (record_id, compression_level) pairs
+            fields: If given, return RecordViews with only these fields.
+
+        Returns:
+            Dict of record_id -> record for every ref that was found
+        """
+        if not refs:
+            return {}
+
+        kwargs: dict[str, Any] = {}
+        if fields is not None:
+            kwargs["source_includes"] = source_includes(fields)
+
+        response = await self._client.mget(
+            docs=[
+                {"_index": self._index_for_level(level), "_id": str(record_id)}
+                for record_id, level in refs
+            ],
+            **kwargs,
+        )
+
+        found: dict[UUID, StoreRecord | RecordView] = {}
+        for doc in response["docs"]:
+            if not doc.get("found"):
+                continue
+            if fields is not None:
+                record = RecordView.model_validate(doc["_source"])
+            else:
+                record = self.record_class.model_validate(doc["_source"])
+            found[record.id] = record
+        return found
+
+    async def resolve_keys(self, zotero_keys: Sequence[str]) -> dict[str, KeyIndexEntry]:
+        """
+        Resolve Zotero keys to their L0/L1/L2 record ids.
+
+        Answers from the local key index; keys it does not know are looked up
+        with one projected ES query across all levels and written back.
+
+        Returns:
+            Dict of zotero_key -> KeyIndexEntry for keys found in the store
+        """
+        keys = list(dict.fromkeys(k for k in zotero_keys if k))
+        if not keys:
+            return {}
+
+        resolved: dict[str, KeyIndexEntry] = {}
+        if self.key_index is not None:
+            resolved = await asyncio.to_thread(self.key_index.resolve_many, keys)
+
+        missing = [k for k in keys if k not in resolved]
+        if not missing:
+            return resolved
+
+        views = await self.search(
+            {"terms": {"zotero_key": missing}},
+            # Each key has an L0 plus up to two L1/L2 records per language
+            size=min(len(missing) * 6, 10000),
+            fields=INDEX_FIELDS,
+        )
+        if not views:
+            return resolved
+
+        if self.key_index is not None:
+            await asyncio.to_thread(self.key_index.records_added, views)
+            resolved.update(
+                await asyncio.to_thread(self.key_index.resolve_many, missing)
+            )
+        else:
+            resolved.update(_entries_from_views(views))
+        return resolved
+
+    async def rebuild_key_index(self, page_size: int = 1000) -> int:
+        """
+        Repopulate the key index from every store level.
+
+        Returns:
+            Number of keys in the rebuilt index
+        """
+        if self.key_index is None:
+            raise ValueError("MainStore has no key index configured")
+
+        await asyncio.to_thread(self.key_index.clear)
+        # L0 carries content_length, so it is the one level that fetches content
+        for level in (0, 1, 2):
+            fields = INDEX_FIELDS + ["content"] if level == 0 else INDEX_FIELDS
+            batch: list[RecordView] = []
+            async for view in self.scan(
+                fields,
+                query={"exists": {"field": "zotero_key"}},
+                compression_level=level,
+                page_size=page_size,
+            ):
+                batch.append(view)
+                if len(batch) >= page_size:
+                    await asyncio.to_thread(self.key_index.records_added, batch)
+                    batch = []
+            if batch:
+                await asyncio.to_thread(self.key_index.records_added, batch)
+
+        count = await asyncio.to_thread(len, self.key_index)
+        logger.info(f"Rebuilt zotero key index: {count} keys")
+        return count
+
     async def search(
         self,
         query: dict[str, Any],
         size: int = 10,
         compression_level: Optional[int] = None,
-    ) -> list[StoreRecord]:
+        fields: Optional[Sequence[str]] = None,
+    ) -> list[StoreRecord] | list[RecordView]:
         """
         Search for records.
 
@@ -177,9 +408,10 @@ class MainStore(BaseElasticsearchStore):
             query: Elasticsearch query DSL
             size: Max results to return
             compression_level: If specified, search only that level. Otherwise search all.
+            fields: If given, return RecordViews with only these fields.
 
         Returns:
-            List of matching StoreRecords
+            List of matching StoreRecords (or RecordViews when projected)
         """
         if compression_level is not None:
             index = self._index_for_level(compression_level)
@@ -187,7 +419,33 @@ class MainStore(BaseElasticsearchStore):
             # Search across all store indices
             index = "store_l*"
 
-        return await super().search(query, size, index=index)
+        return await super().search(query, size, index=index, fields=fields)
+
+    async def scan(
+        self,
+        fields: Sequence[str],
+        query: Optional[dict[str, Any]] = None,
+        compression_level: Optional[int] = None,
+        page_size: int = 1000,
+    ) -> AsyncIterator[RecordView]:
+        """
+        Stream projected records from one level (or all levels).
+
+        Args:
+            fields: `_source` fields to fetch (`id` is always included)
+            query: Elasticsearch query DSL; defaults to match_all
+            compression_level: If specified, scan only that level. Otherwise scan all.
+            page_size: Hits fetched per scroll page
+        """
+        if compression_level is not None:
+            index = self._index_for_level(compression_level)
+        else:
+            index = "store_l*"
+
+        async for view in super().scan(
+            fields, query=query, index=index, page_size=page_size
+        ):
+            yield view
 
     async def knn_search(
         self,
@@ -195,7 +453,8 @@ class MainStore(BaseElasticsearchStore):
         k: int = 10,
         compression_level: Optional[int] = None,
         num_candidates: int = 100,
-    ) -> list[tuple[StoreRecord, float]]:
+        fields: Optional[Sequence[str]] = None,
+    ) -> list[tuple[StoreRecord, float]] | list[tuple[RecordView, float]]:
         """
         Perform KNN vector search on summaries.
 
@@ -204,6 +463,8 @@ class MainStore(BaseElasticsearchStore):
             k: Number of results to return
             compression_level: 1 or 2 (l0 has no embeddings). None searches both.
             num_candidates: Number of candidates to consider (higher = more accurate)
+            fields: If given, return RecordViews with only these fields
+                (skips transferring the embedding and content).
 
         Returns:
             List of (record, score) tuples sorted by similarity
@@ -217,6 +478,10 @@ class MainStore(BaseElasticsearchStore):
             # Search l1 and l2 (both have embeddings)
             index = "store_l1,store_l2"
 
+        kwargs: dict[str, Any] = {}
+        if fields is not None:
+            kwargs["source_includes"] = source_includes(fields)
+
         response = await self._client.search(
             index=index,
             knn={
@@ -225,12 +490,35 @@ class MainStore(BaseElasticsearchStore):
                 "k": k,
                 "num_candidates": num_candidates,
             },
+            **kwargs,
         )
 
         results = []
         for hit in response["hits"]["hits"]:
-            record = self.record_class.model_validate(hit["_source"])
+            if fields is not None:
+                record = hit_to_view(hit)
+            else:
+                record = self.record_class.model_validate(hit["_source"])
             score = hit["_score"]
             results.append((record, score))
 
         return results
+
+
+def _entries_from_views(views: Sequence[RecordView]) -> dict[str, KeyIndexEntry]:
+    """Build key entries in memory when no persistent index is configured."""
+    entries: dict[str, KeyIndexEntry] = {}
+    for view in views:
+        if not view.zotero_key:
+            continue
+        entry = entries.setdefault(view.zotero_key, KeyIndexEntry(view.zotero_key))
+        level = view.compression_level or 0
+        if level == 0:
+            entry.l0_id = view.id
+            entry.title = view.metadata.get("title")
+            entry.year = parse_year(view.metadata)
+        elif level in (1, 2) and (
+            entry.id_for_level(level) is None or view.language_code in (None, "en")
+        ):
+            setattr(entry, f"l{level}_id", view.id)
+    return entries
@@ -7,6 +7,12 @@ through the existing archival paths (forgotten / who_i_was).
 Single-hop dependency rule: an L1/L2 record is dropped iff any of its
 source_ids points at a dropped L0. Internal (non-Zotero-linked) records are
 never touched.
+
+The stores are streamed page by page and each record is classified as it
+arrives, so the plan holds only the ids to drop plus counters. Execution
+goes through the stores' bulk paths: ES `_bulk` requests, batched Chroma
+deletes and the Zotero plugin's multi-item delete. Both phases record
+per-stage throughput, so a dry run reports how fast the inventory scans.
 """
 
 from __future__ import annotations
@@ -14,20 +20,23 @@ from __future__ import annotations
 import asyncio
 import logging
 import re
+import time
+from collections.abc import Awaitable, Callable, Sequence
 from dataclasses import dataclass, field
 from pathlib import Path
 from uuid import UUID
 
-from elasticsearch.helpers import async_scan
-
 from .chroma import ChromaStore
 from .elasticsearch.client import ElasticsearchStores
+from .schema import SourceType
 from .zotero import ZoteroStore
 
 logger = logging.getLogger(__name__)
 
 CITATION_RE = re.compile(r"\[@([A-Za-z0-9]{8})\]")
-DEFAULT_CONCURRENCY = 10
+DEFAULT_CONCURRENCY = 4  # bulk batches in flight per stage
+DEFAULT_PAGE_SIZE = 1000  # records per inventory page
+DEFAULT_BATCH_SIZE = 500  # records per bulk delete
 
 
 def collect_cited_keys_from_files(files: list[Path]) -> set[str]:
@@ -50,27 +59,38 @@ def collect_cited_keys_from_dir(
 
 
 @dataclass
-class Inventory:
-    zotero_all: dict[str, str] = field(default_factory=dict)
-    l0_by_zkey: dict[str, UUID] = field(default_factory=dict)
-    l0_internal: int = 0
-    l1: list[tuple[UUID, list[UUID]]] = field(default_factory=list)
-    l2: list[tuple[UUID, list[UUID]]] = field(default_factory=list)
-    chroma_rows: list[tuple[UUID, str | None]] = field(default_factory=list)
+class Throughput:
+    """Records handled by one GC stage and the time it took."""
+
+    records: int = 0
+    seconds: float = 0.0
+
+    @property
+    def rate(self) -> float:
+        """Records per second."""
+        return self.records / self.seconds if self.seconds > 0 else 0.0
+
+    def __str__(self) -> str:
+        return f"{self.records} records in {self.seconds:.2f}s ({self.rate:,.0f}/s)"
 
 
 @dataclass
 class GCPlan:
     cited_keys: set[str]
-    keep_zotero: set[str]
-    drop_zotero: set[str]
-    keep_l0: dict[str, UUID]
-    drop_l0: dict[str, UUID]
-    drop_l1: list[UUID]
-    drop_l2: list[UUID]
-    drop_chroma: list[UUID]
-    l0_internal: int
-    l0_uncited_zkeys: set[str]
+    keep_zotero: set[str] = field(default_factory=set)
+    drop_zotero: set[str] = field(default_factory=set)
+    keep_l0: dict[str, UUID] = field(default_factory=dict)
+    drop_l0: dict[str, UUID] = field(default_factory=dict)
+    drop_l1: list[UUID] = field(default_factory=list)
+    drop_l2: list[UUID] = field(default_factory=list)
+    drop_chroma: list[UUID] = field(default_factory=list)
+    l0_internal: int = 0
+    l1_total: int = 0
+    l2_total: int = 0
+    chroma_linked: int = 0
+    chroma_unlinked: int = 0
+    # Inventory scan throughput per stage (zotero, es_l0, es_l1, es_l2, chroma)
+    scan: dict[str, Throughput] = field(default_factory=dict)
 
     @property
     def total_dropped(self) -> int:
@@ -82,107 +102,110 @@ class GCPlan:
             + len(self.drop_chroma)
         )
 
+    @property
+    def zotero_total(self) -> int:
+        return len(self.keep_zotero) + len(self.drop_zotero)
 
-# ---------- inventory loaders ----------
+    @property
+    def l0_external_total(self) -> int:
+        return len(self.keep_l0) + len(self.drop_l0)
+
+    @property
+    def l0_uncited_zkeys(self) -> set[str]:
+        """Cited keys with no L0 record (never ingested or already gone)."""
+        return self.cited_keys - self.keep_l0.keys()
+
+    @property
+    def cited_missing_from_zotero(self) -> set[str]:
+        return self.cited_keys - self.keep_zotero
 
 
-async def _load_zotero(zotero: ZoteroStore) -> dict[str, str]:
-    items = await zotero.get_all(limit=50000)
-    return {it.key: (it.title or "") for it in items}
+# ---------- streamed planning ----------
 
 
-async def _load_es(es: ElasticsearchStores) -> tuple[dict[str, UUID], int, list, list]:
-    l0_by_zkey: dict[str, UUID] = {}
-    internal = 0
-    l1: list[tuple[UUID, list[UUID]]] = []
-    l2: list[tuple[UUID, list[UUID]]] = []
+async def _plan_zotero(plan: GCPlan, zotero: ZoteroStore, page_size: int) -> None:
+    stats = plan.scan["zotero"] = Throughput()
+    start = time.perf_counter()
+    async for item in zotero.iter_all(page_size=page_size):
+        stats.records += 1
+        if item.key in plan.cited_keys:
+            plan.keep_zotero.add(item.key)
+        else:
+            plan.drop_zotero.add(item.key)
+    stats.seconds = time.perf_counter() - start
 
-    client = es._coherence_client
 
-    async for hit in async_scan(
-        client,
-        index="store_l0",
-        query={"query": {"match_all": {}}},
-        _source=["id", "zotero_key", "source_type"],
-        size=1000,
+async def _plan_es(plan: GCPlan, es: ElasticsearchStores, page_size: int) -> None:
+    stats = plan.scan["es_l0"] = Throughput()
+    start = time.perf_counter()
+    async for view in es.store.scan(
+        ["zotero_key", "source_type"], compression_level=0, page_size=page_size
     ):
-        src = hit["_source"]
-        rid = UUID(src["id"])
-        if src.get("source_type") == "external" and src.get("zotero_key"):
-            l0_by_zkey[src["zotero_key"]] = rid
+        stats.records += 1
+        if view.source_type == SourceType.EXTERNAL and view.zotero_key:
+            if view.zotero_key in plan.cited_keys:
+                plan.keep_l0[view.zotero_key] = view.id
+            else:
+                plan.drop_l0[view.zotero_key] = view.id
         else:
-            internal += 1
-
-    for level, bucket in ((1, l1), (2, l2)):
-        async for hit in async_scan(
-            client,
-            index=f"store_l{level}",
-            query={"query": {"match_all": {}}},
-            _source=["id", "source_ids"],
-            size=1000,
+            plan.l0_internal += 1
+    stats.seconds = time.perf_counter() - start
+
+    # L1/L2 need the complete set of dropped L0 ids, so they scan after L0
+    dropped_l0_ids = set(plan.drop_l0.values())
+    for level, drop in ((1, plan.drop_l1), (2, plan.drop_l2)):
+        stats = plan.scan[f"es_l{level}"] = Throughput()
+        start = time.perf_counter()
+        async for view in es.store.scan(
+            ["source_ids"], compression_level=level, page_size=page_size
         ):
-            src = hit["_source"]
-            rid = UUID(src["id"])
-            source_ids = [UUID(x) for x in (src.get("source_ids") or [])]
-            bucket.append((rid, source_ids))
-
-    return l0_by_zkey, internal, l1, l2
-
-
-async def _load_chroma(chroma: ChromaStore) -> list[tuple[UUID, str | None]]:
-    collection = await chroma._get_collection()
-    result = await asyncio.to_thread(collection.get, include=["metadatas"])
-    rows: list[tuple[UUID, str | None]] = []
-    for rid, meta in zip(result["ids"], result["metadatas"] or []):
-        zkey = (meta or {}).get("zotero_key")
-        rows.append((UUID(rid), zkey))
-    return rows
-
-
-async def build_inventory(
-    zotero: ZoteroStore, es: ElasticsearchStores, chroma: ChromaStore
-) -> Inventory:
-    zotero_all, es_tuple, chroma_rows = await asyncio.gather(
-        _load_zotero(zotero),
-        _load_es(es),
-        _load_chroma(chroma),
-    )
-    l0_by_zkey, l0_internal, l1, l2 = es_tuple
-    return Inventory(
-        zotero_all=zotero_all,
-        l0_by_zkey=l0_by_zkey,
-        l0_internal=l0_internal,
-        l1=l1,
-        l2=l2,
-        chroma_rows=chroma_rows,
-    )
+            stats.records += 1
+            if any(s in dropped_l0_ids for s in view.source_ids):
+                drop.append(view.id)
+        stats.seconds = time.perf_counter() - start
+    plan.l1_total = plan.scan["es_l1"].records
+    plan.l2_total = plan.scan["es_l2"].records
+
+
+async def _plan_chroma(plan: GCPlan, chroma: ChromaStore, page_size: int) -> None:
+    stats = plan.scan["chroma"] = Throughput()
+    start = time.perf_counter()
+    async for rid, metadata in chroma.scan_metadata(page_size=page_size):
+        stats.records += 1
+        zkey = metadata.get("zotero_key")
+        if not zkey:
+            plan.chroma_unlinked += 1
+            continue
+        plan.chroma_linked += 1
+        if zkey not in plan.cited_keys:
+            plan.drop_chroma.append(rid)
+    stats.seconds = time.perf_counter() - start
 
 
-def build_plan(cited: set[str], inv: Inventory) -> GCPlan:
-    zotero_keys = set(inv.zotero_all.keys())
-    keep_zotero = cited & zotero_keys
-    drop_zotero = zotero_keys - cited
-
-    keep_l0 = {k: v for k, v in inv.l0_by_zkey.items() if k in cited}
-    drop_l0 = {k: v for k, v in inv.l0_by_zkey.items() if k not in cited}
-    dropped_l0_ids = set(drop_l0.values())
-
-    drop_l1 = [rid for rid, srcs in inv.l1 if any(s in dropped_l0_ids for s in srcs)]
-    drop_l2 = [rid for rid, srcs in inv.l2 if any(s in dropped_l0_ids for s in srcs)]
-    drop_chroma = [rid for rid, zkey in inv.chroma_rows if zkey and zkey not in cited]
-
-    return GCPlan(
-        cited_keys=cited,
-        keep_zotero=keep_zotero,
-        drop_zotero=drop_zotero,
-        keep_l0=keep_l0,
-        drop_l0=drop_l0,
-        drop_l1=drop_l1,
-        drop_l2=drop_l2,
-        drop_chroma=drop_chroma,
-        l0_internal=inv.l0_internal,
-        l0_uncited_zkeys=cited - set(inv.l0_by_zkey.keys()),
+async def plan_gc(
+    cited: set[str],
+    zotero: ZoteroStore,
+    es: ElasticsearchStores,
+    chroma: ChromaStore,
+    *,
+    page_size: int = DEFAULT_PAGE_SIZE,
+) -> GCPlan:
+    """Stream every store and partition its records into keep/drop.
+
+    The three stores are scanned concurrently; nothing is deleted.
+    """
+    plan = GCPlan(cited_keys=cited)
+    await asyncio.gather(
+        _plan_zotero(plan, zotero, page_size),
+        _plan_es(plan, es, page_size),
+        _plan_chroma(plan, chroma, page_size),
     )
+    for stage, stats in plan.scan.items():
+        logger.info(f"GC scan {stage}: {stats}")
+    return plan
+
+
+# ---------- bulk execution ----------
 
 
 async def execute_plan(
@@ -192,47 +215,58 @@ async def execute_plan(
     chroma: ChromaStore,
     *,
     reason: str,
+    batch_size: int = DEFAULT_BATCH_SIZE,
     concurrency: int = DEFAULT_CONCURRENCY,
-) -> None:
+) -> dict[str, Throughput]:
+    """Delete everything the plan drops, in bulk batches.
+
+    Up to ``concurrency`` batches per stage are in flight. A failed batch is
+    logged and skipped so one bad request doesn't abort the run.
+
+    Returns:
+        Deletion throughput per stage
+    """
     sem = asyncio.Semaphore(concurrency)
+    stats: dict[str, Throughput] = {}
 
-    async def guarded(coro):
+    async def guarded(delete: Callable[[Sequence], Awaitable[int]], batch: Sequence) -> int:
         async with sem:
             try:
-                return await coro
+                return await delete(batch)
             except Exception as e:
-                logger.warning(f"delete failed: {e}")
-                return None
+                logger.warning(f"bulk delete failed: {e}")
+                return 0
+
+    async def stage(name: str, ids: Sequence, delete: Callable[[Sequence], Awaitable[int]]) -> None:
+        logger.info(f"GC: deleting {len(ids)} {name} records")
+        start = time.perf_counter()
+        counts = await asyncio.gather(*[
+            guarded(delete, ids[i : i + batch_size])
+            for i in range(0, len(ids), batch_size)
+        ])
+        stats[name] = Throughput(sum(counts), time.perf_counter() - start)
+        logger.info(f"GC delete {name}: {stats[name]}")
+
+    def es_level(level: int) -> Callable[[Sequence], Awaitable[int]]:
+        return lambda batch: es.store.delete_many(
+            batch, reason=reason, compression_level=level, batch_size=batch_size
+        )
 
     # Compressed layers first (they reference L0 via source_ids).
-    logger.info(f"GC: deleting {len(plan.drop_l1)} L1 records")
-    await asyncio.gather(*[
-        guarded(es.store.delete(rid, reason=reason, compression_level=1))
-        for rid in plan.drop_l1
-    ])
-
-    logger.info(f"GC: deleting {len(plan.drop_l2)} L2 records")
-    await asyncio.gather(*[
-        guarded(es.store.delete(rid, reason=reason, compression_level=2))
-        for rid in plan.drop_l2
-    ])
-
-    logger.info(f"GC: deleting {len(plan.drop_l0)} L0 records")
-    await asyncio.gather(*[
-        guarded(es.store.delete(rid, reason=reason, compression_level=0))
-        for rid in plan.drop_l0.values()
-    ])
-
-    logger.info(f"GC: deleting {len(plan.drop_chroma)} Chroma records")
-    await asyncio.gather(*[
-        guarded(chroma.delete(rid, reason=reason))
-        for rid in plan.drop_chroma
-    ])
-
-    logger.info(f"GC: deleting {len(plan.drop_zotero)} Zotero items")
-    await asyncio.gather(*[
-        guarded(zotero.delete(key)) for key in plan.drop_zotero
-    ])
+    await stage("es_l1", plan.drop_l1, es_level(1))
+    await stage("es_l2", plan.drop_l2, es_level(2))
+    await stage("es_l0", list(plan.drop_l0.values()), es_level(0))
+    await stage(
+        "chroma",
+        plan.drop_chroma,
+        lambda batch: chroma.delete_many(batch, reason=reason, batch_size=batch_size),
+    )
+    await stage(
+        "zotero",
+        sorted(plan.drop_zotero),
+        lambda batch: zotero.delete_many(batch, batch_size=batch_size),
+    )
+    return stats
 
 
 async def garbage_collect(
@@ -252,8 +286,7 @@ async def garbage_collect(
         reason: Archival reason recorded on the forgotten/who_i_was records.
         execute: When True, perform the deletions; otherwise return the plan only.
     """
-    inv = await build_inventory(zotero, es, chroma)
-    plan = build_plan(cited_keys, inv)
+    plan = await plan_gc(cited_keys, zotero, es, chroma)
     if execute:
         await execute_plan(plan, zotero, es, chroma, reason=reason)
     return plan
@@ -12,7 +12,7 @@ from enum import Enum
 from typing import Optional
 from uuid import UUID, uuid4
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 def _utc_now() -> datetime:
@@ -79,6 +79,8 @@ class WhoIWasRecord(BaseRecord):
     """
 
     source_type: SourceType = SourceType.INTERNAL
+    # The superseded state lives in previous_data; content is optional here
+    content: str = Field("", description="Main text content for embedding")
     supersedes: UUID = Field(description="UUID of the record this replaced")
     reason: Optional[str] = Field(None, description="Why this change occurred")
     previous_data: dict = Field(
@@ -116,3 +118,26 @@ class ForgottenRecord(BaseRecord):
     previous_data: dict = Field(
         default_factory=dict, description="Snapshot of the record before forgetting"
     )
+
+
+class RecordView(BaseModel):
+    """
+    Lightweight projection of a store record.
+
+    Returned by `fields=` reads on the Elasticsearch stores so callers that
+    only need keys, titles or ids skip transferring and validating `content`
+    and `embedding`. Only `id` is guaranteed; other fields are populated
+    when they were requested.
+    """
+
+    model_config = ConfigDict(extra="ignore")
+
+    id: UUID
+    source_type: Optional[SourceType] = None
+    zotero_key: Optional[str] = None
+    language_code: Optional[str] = None
+    compression_level: Optional[int] = None
+    source_ids: list[UUID] = Field(default_factory=list)
+    content: Optional[str] = None
+    metadata: dict = Field(default_factory=dict)
+    score: Optional[float] = Field(None, description="Search score, if any")
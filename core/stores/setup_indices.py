@@ -139,16 +139,32 @@ async def show_status() -> None:
         await forgotten_client.close()
 
 
+async def rebuild_key_index() -> None:
+    """Repopulate the local zotero_key index from the store indices."""
+    from .elasticsearch.client import ElasticsearchStores
+
+    async with ElasticsearchStores(coherence_host=ES_COHERENCE_HOST) as stores:
+        count = await stores.store.rebuild_key_index()
+        print(f"Rebuilt zotero key index: {count} keys")
+
+
 def main():
     parser = argparse.ArgumentParser(description="Setup Elasticsearch indices")
     parser.add_argument(
         "--reset", action="store_true", help="Delete and recreate indices"
     )
     parser.add_argument("--status", action="store_true", help="Show index status")
+    parser.add_argument(
+        "--rebuild-key-index",
+        action="store_true",
+        help="Repopulate the local zotero_key -> record-id index",
+    )
     args = parser.parse_args()
 
     if args.status:
         asyncio.run(show_status())
+    elif args.rebuild_key_index:
+        asyncio.run(rebuild_key_index())
     else:
         asyncio.run(setup_indices(reset=args.reset))
 
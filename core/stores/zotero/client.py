@@ -6,6 +6,7 @@ Uses httpx for native async HTTP requests.
 """
 
 import logging
+from collections.abc import AsyncIterator, Sequence
 from typing import Any, Optional
 
 import httpx
@@ -214,6 +215,43 @@ class ZoteroStore(BaseAsyncHttpClient):
         response.raise_for_status()
         return True
 
+    async def delete_many(self, zotero_keys: Sequence[str], batch_size: int = 100) -> int:
+        """
+        Delete several Zotero items, one transaction per batch.
+
+        Falls back to per-item deletes when the plugin predates the
+        multi-delete endpoint.
+
+        Args:
+            zotero_keys: 8-character Zotero item keys
+            batch_size: Keys per request
+
+        Returns:
+            Number of items deleted
+        """
+        client = await self._get_client()
+        keys = list(dict.fromkeys(zotero_keys))
+        deleted = 0
+
+        for start in range(0, len(keys), batch_size):
+            batch = keys[start : start + batch_size]
+            response = await client.post("/local-crud/items/delete", json={"keys": batch})
+
+            if response.status_code == 404:
+                logger.warning(
+                    "Zotero plugin has no multi-delete endpoint; deleting items one at a time"
+                )
+                for key in keys[start:]:
+                    if await self.delete(key):
+                        deleted += 1
+                return deleted
+
+            response.raise_for_status()
+            deleted += len(response.json().get("deleted", []))
+
+        logger.debug(f"Deleted {deleted} Zotero items")
+        return deleted
+
     async def exists(self, zotero_key: str) -> bool:
         """Check if a Zotero item exists."""
         item = await self.get(zotero_key)
@@ -320,6 +358,38 @@ class ZoteroStore(BaseAsyncHttpClient):
         """
         return await self.search(conditions=[], limit=limit)
 
+    async def iter_all(self, page_size: int = 1000) -> AsyncIterator[ZoteroSearchResult]:
+        """
+        Stream every item in the library, one page in memory at a time.
+
+        Plugin versions without paging don't echo `offset`; for those the
+        library is read in one get_all() call.
+
+        Args:
+            page_size: Items fetched per request
+        """
+        client = await self._get_client()
+        offset = 0
+        while True:
+            response = await client.post(
+                "/local-crud/search",
+                json={"conditions": [], "limit": page_size, "offset": offset},
+            )
+            response.raise_for_status()
+            data = response.json()
+
+            if "offset" not in data:
+                for item in await self.get_all(limit=50000):
+                    yield item
+                return
+
+            items = data.get("items", [])
+            for item in items:
+                yield ZoteroSearchResult.model_validate(item)
+            if len(items) < page_size:
+                return
+            offset += len(items)
+
     # ==================== Health Check ====================
 
     async def health_check(self) -> ZoteroHealthStatus:
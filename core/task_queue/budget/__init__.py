@@ -1,18 +1,30 @@
 """Budget tracking module for LLM cost management.
 
 This module provides budget tracking and enforcement capabilities for
-the task queue system. It fetches cost data from LangSmith, caches it
-with 1-hour TTL, and provides budget status checks.
+the task queue system. LLM calls are recorded in a local usage ledger
+whose rolling day/month counters answer budget checks; LangSmith remains
+available as an optional source and for reconciliation.
 
 Main interface:
     BudgetTracker: Facade for all budget tracking operations
 
 Components:
+    - UsageLedger: Append-only usage records with rolling counters
+    - track_usage: Token totals for the calls made within a block
+    - LedgerCostProvider: Cost data from the usage ledger
     - CostCacheManager: Cache persistence and validation
     - LangSmithCostProvider: Cost data from LangSmith API
     - BudgetCalculator: Budget status and decision logic
 """
 
+from .ledger import UsageLedger, UsageScope, get_usage_ledger, record_llm_usage, track_usage
 from .tracker import BudgetTracker
 
-__all__ = ["BudgetTracker"]
+__all__ = [
+    "BudgetTracker",
+    "UsageLedger",
+    "UsageScope",
+    "get_usage_ledger",
+    "record_llm_usage",
+    "track_usage",
+]
@@ -6,10 +6,9 @@ stagger times based on current spending pace.
 
 import logging
 from datetime import datetime
-from typing import Literal
+from typing import Literal, Protocol
 
 from ..pricing import format_cost
-from .langsmith_provider import LangSmithCostProvider
 
 logger = logging.getLogger(__name__)
 
@@ -17,12 +16,20 @@ logger = logging.getLogger(__name__)
 BudgetAction = Literal["pause", "slowdown", "warn", "ok"]
 
 
+class CostProvider(Protocol):
+    """Source of month-to-date cost (usage ledger or LangSmith)."""
+
+    def get_current_month_cost(self, force_refresh: bool = False, show_progress: bool = False) -> float: ...
+
+    def get_cost_breakdown(self) -> dict[str, float]: ...
+
+
 class BudgetCalculator:
     """Calculate budget status and make spending decisions."""
 
     def __init__(
         self,
-        cost_provider: LangSmithCostProvider,
+        cost_provider: CostProvider,
         monthly_budget: float,
         budget_action: str,
     ):
@@ -117,31 +124,4 @@ class BudgetCalculator:
         Returns:
             Dict mapping model name to cost in USD
         """
-        period = self.cost_provider.cache_manager.get_current_period()
-        cache = self.cost_provider.cache_manager.read_cache()
-
-        if period not in cache["periods"]:
-            self.cost_provider.get_current_month_cost()  # Refresh cache
-            cache = self.cost_provider.cache_manager.read_cache()
-
-        if period not in cache["periods"]:
-            return {}
-
-        entry = cache["periods"][period]
-        token_breakdown = entry.get("token_breakdown", {})
-
-        # Convert tokens to approximate cost
-        # This is rough since we don't track input/output separately in breakdown
-        breakdown = {}
-        for model, tokens in token_breakdown.items():
-            from ..pricing import get_model_pricing
-
-            pricing = get_model_pricing(model)
-            # Assume 70% input, 30% output tokens (rough estimate)
-            input_tokens = int(tokens * 0.7)
-            output_tokens = int(tokens * 0.3)
-            cost = (input_tokens / 1_000_000) * pricing["input"]
-            cost += (output_tokens / 1_000_000) * pricing["output"]
-            breakdown[model] = cost
-
-        return breakdown
+        return self.cost_provider.get_cost_breakdown()
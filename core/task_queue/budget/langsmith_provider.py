@@ -2,12 +2,15 @@
 
 Fetches monthly cost data from LangSmith API and aggregates costs
 from trace runs. Handles caching and graceful error handling.
+
+The usage ledger is the default budget source; this provider is used when
+THALA_BUDGET_SOURCE=langsmith and for reconciling the ledger.
 """
 
 import logging
 from datetime import datetime
 
-from ..pricing import format_cost
+from ..pricing import format_cost, get_model_pricing
 from .cache import CostCacheManager
 
 logger = logging.getLogger(__name__)
@@ -146,3 +149,35 @@ class LangSmithCostProvider:
 
         logger.info(f"Month-to-date cost: {format_cost(total_cost)} ({run_count} traces)")
         return total_cost
+
+    def get_cost_breakdown(self) -> dict[str, float]:
+        """Get approximate cost breakdown by run name for current month.
+
+        Returns:
+            Dict mapping run name to cost in USD
+        """
+        period = self.cache_manager.get_current_period()
+        cache = self.cache_manager.read_cache()
+
+        if period not in cache["periods"]:
+            self.get_current_month_cost()  # Refresh cache
+            cache = self.cache_manager.read_cache()
+
+        if period not in cache["periods"]:
+            return {}
+
+        token_breakdown = cache["periods"][period].get("token_breakdown", {})
+
+        # Convert tokens to approximate cost
+        # This is rough since we don't track input/output separately in breakdown
+        breakdown = {}
+        for model, tokens in token_breakdown.items():
+            pricing = get_model_pricing(model)
+            # Assume 70% input, 30% output tokens (rough estimate)
+            input_tokens = int(tokens * 0.7)
+            output_tokens = int(tokens * 0.3)
+            cost = (input_tokens / 1_000_000) * pricing["input"]
+            cost += (output_tokens / 1_000_000) * pricing["output"]
+            breakdown[model] = cost
+
+        return breakdown
@@ -0,0 +1,321 @@
+"""Local append-only ledger of LLM token usage and cost.
+
+Every LLM call made through invoke() or the LLM broker is recorded here with
+its model, token counts and computed cost. Each record also bumps rolling
+per-day and per-month counters in the same SQLite transaction, so budget
+queries are single primary-key lookups instead of a scan of LangSmith runs.
+
+Records are tagged with the LangSmith project active when the call was made
+(LANGSMITH_PROJECT), so queue spend stays separate from manual testing just
+as it does in LangSmith.
+
+`track_usage()` additionally totals the tokens of calls made within a block
+(including tasks it spawns), so a caller can learn what one piece of work
+actually used.
+"""
+
+import logging
+import os
+import sqlite3
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Literal, Optional
+
+from ..paths import STATE_DIR
+from ..pricing import calculate_usage_cost
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_LEDGER_PATH = STATE_DIR / "usage_ledger.sqlite3"
+DEFAULT_PROJECT = "default"
+
+# Model column value for the all-models counter row of a period
+ALL_MODELS = "*"
+
+Period = Literal["day", "month"]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS usage_events (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    recorded_at TEXT NOT NULL,
+    project TEXT NOT NULL,
+    model TEXT NOT NULL,
+    source TEXT NOT NULL,
+    batched INTEGER NOT NULL,
+    input_tokens INTEGER NOT NULL,
+    output_tokens INTEGER NOT NULL,
+    cache_read_tokens INTEGER NOT NULL,
+    cache_creation_tokens INTEGER NOT NULL,
+    cost_usd REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS usage_totals (
+    project TEXT NOT NULL,
+    period TEXT NOT NULL,
+    model TEXT NOT NULL,
+    calls INTEGER NOT NULL,
+    input_tokens INTEGER NOT NULL,
+    output_tokens INTEGER NOT NULL,
+    cache_read_tokens INTEGER NOT NULL,
+    cache_creation_tokens INTEGER NOT NULL,
+    cost_usd REAL NOT NULL,
+    PRIMARY KEY (project, period, model)
+);
+"""
+
+_UPSERT_TOTALS = """
+INSERT INTO usage_totals VALUES (?, ?, ?, 1, ?, ?, ?, ?, ?)
+ON CONFLICT (project, period, model) DO UPDATE SET
+    calls = calls + 1,
+    input_tokens = input_tokens + excluded.input_tokens,
+    output_tokens = output_tokens + excluded.output_tokens,
+    cache_read_tokens = cache_read_tokens + excluded.cache_read_tokens,
+    cache_creation_tokens = cache_creation_tokens + excluded.cache_creation_tokens,
+    cost_usd = cost_usd + excluded.cost_usd
+"""
+
+
+@dataclass(frozen=True)
+class UsageTotals:
+    """Aggregate usage for one project, period and model (or all models)."""
+
+    calls: int = 0
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cache_read_tokens: int = 0
+    cache_creation_tokens: int = 0
+    cost_usd: float = 0.0
+
+    @property
+    def total_tokens(self) -> int:
+        return self.input_tokens + self.output_tokens + self.cache_read_tokens + self.cache_creation_tokens
+
+
+def period_key(period: Period, at: Optional[datetime] = None) -> str:
+    """Counter key for the UTC day ("2026-01-31") or month ("2026-01")."""
+    at = at or datetime.now(timezone.utc)
+    return at.strftime("%Y-%m-%d" if period == "day" else "%Y-%m")
+
+
+class UsageLedger:
+    """SQLite-backed usage ledger with rolling day/month counters.
+
+    Methods are synchronous and short; each call opens its own connection so
+    the ledger is safe to share across threads and processes (WAL mode).
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = Path(path or os.getenv("THALA_USAGE_LEDGER_PATH", str(DEFAULT_LEDGER_PATH)))
+        self._initialized = False
+
+    def _connect(self) -> sqlite3.Connection:
+        if not self._initialized:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=30)
+        if not self._initialized:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+            self._initialized = True
+        return conn
+
+    def record(
+        self,
+        model: str,
+        input_tokens: int = 0,
+        output_tokens: int = 0,
+        cache_read_tokens: int = 0,
+        cache_creation_tokens: int = 0,
+        batched: bool = False,
+        source: str = "invoke",
+        project: Optional[str] = None,
+        at: Optional[datetime] = None,
+    ) -> float:
+        """Append a usage record and update its day/month counters.
+
+        Args:
+            model: Model identifier
+            input_tokens: Uncached input tokens
+            output_tokens: Output tokens
+            cache_read_tokens: Input tokens served from the prompt cache
+            cache_creation_tokens: Input tokens written to the prompt cache
+            batched: Whether the call went through the Batch API
+            source: Recording call site ("invoke", "broker")
+            project: Budget project (default: LANGSMITH_PROJECT)
+            at: Time of the call (default: now, UTC)
+
+        Returns:
+            Computed cost in USD
+        """
+        at = at or datetime.now(timezone.utc)
+        project = project or os.getenv("LANGSMITH_PROJECT", DEFAULT_PROJECT)
+        cost = calculate_usage_cost(
+            model, input_tokens, output_tokens, cache_read_tokens, cache_creation_tokens, batched
+        )
+        tokens = (input_tokens, output_tokens, cache_read_tokens, cache_creation_tokens)
+
+        conn = self._connect()
+        try:
+            with conn:
+                conn.execute(
+                    "INSERT INTO usage_events (recorded_at, project, model, source, batched, input_tokens, "
+                    "output_tokens, cache_read_tokens, cache_creation_tokens, cost_usd) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (at.isoformat(), project, model, source, int(batched), *tokens, cost),
+                )
+                for key in (period_key("day", at), period_key("month", at)):
+                    for model_key in (model, ALL_MODELS):
+                        conn.execute(_UPSERT_TOTALS, (project, key, model_key, *tokens, cost))
+        finally:
+            conn.close()
+        return cost
+
+    def totals(
+        self,
+        period: Period = "month",
+        project: Optional[str] = None,
+        model: str = ALL_MODELS,
+        at: Optional[datetime] = None,
+    ) -> UsageTotals:
+        """Read the rolling counter for a day or month."""
+        project = project or os.getenv("LANGSMITH_PROJECT", DEFAULT_PROJECT)
+        conn = self._connect()
+        try:
+            row = conn.execute(
+                "SELECT calls, input_tokens, output_tokens, cache_read_tokens, cache_creation_tokens, cost_usd "
+                "FROM usage_totals WHERE project = ? AND period = ? AND model = ?",
+                (project, period_key(period, at), model),
+            ).fetchone()
+        finally:
+            conn.close()
+        return UsageTotals(*row) if row else UsageTotals()
+
+    def cost(self, period: Period = "month", project: Optional[str] = None, at: Optional[datetime] = None) -> float:
+        """Total cost in USD for a day or month."""
+        return self.totals(period, project=project, at=at).cost_usd
+
+    def model_breakdown(
+        self,
+        period: Period = "month",
+        project: Optional[str] = None,
+        at: Optional[datetime] = None,
+    ) -> dict[str, UsageTotals]:
+        """Per-model counters for a day or month."""
+        project = project or os.getenv("LANGSMITH_PROJECT", DEFAULT_PROJECT)
+        conn = self._connect()
+        try:
+            rows = conn.execute(
+                "SELECT model, calls, input_tokens, output_tokens, cache_read_tokens, cache_creation_tokens, "
+                "cost_usd FROM usage_totals WHERE project = ? AND period = ? AND model != ?",
+                (project, period_key(period, at), ALL_MODELS),
+            ).fetchall()
+        finally:
+            conn.close()
+        return {row[0]: UsageTotals(*row[1:]) for row in rows}
+
+
+_ledger: Optional[UsageLedger] = None
+_ledger_lock = threading.Lock()
+
+
+def get_usage_ledger() -> UsageLedger:
+    """Get the process-wide usage ledger."""
+    global _ledger
+    if _ledger is None:
+        with _ledger_lock:
+            if _ledger is None:
+                _ledger = UsageLedger()
+    return _ledger
+
+
+def set_usage_ledger(ledger: Optional[UsageLedger]) -> None:
+    """Replace the process-wide ledger (None re-reads the path on next use)."""
+    global _ledger
+    _ledger = ledger
+
+
+@dataclass
+class UsageScope:
+    """Token totals of the LLM calls made within a track_usage() block."""
+
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cache_read_tokens: int = 0
+    cache_creation_tokens: int = 0
+    calls: int = 0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    @property
+    def total_tokens(self) -> int:
+        return self.input_tokens + self.output_tokens + self.cache_read_tokens + self.cache_creation_tokens
+
+    def add(self, usage: dict[str, Any]) -> None:
+        # Sync LangChain callbacks may report from executor threads
+        with self._lock:
+            self.input_tokens += usage.get("input_tokens") or 0
+            self.output_tokens += usage.get("output_tokens") or 0
+            self.cache_read_tokens += usage.get("cache_read_input_tokens") or 0
+            self.cache_creation_tokens += usage.get("cache_creation_input_tokens") or 0
+            self.calls += 1
+
+
+_usage_scopes: ContextVar[tuple[UsageScope, ...]] = ContextVar("usage_scopes", default=())
+
+
+@contextmanager
+def track_usage() -> Iterator[UsageScope]:
+    """Total the tokens of LLM calls made in this context until the block exits.
+
+    Scopes nest: a call counts towards every enclosing block.
+    """
+    scope = UsageScope()
+    token = _usage_scopes.set(_usage_scopes.get() + (scope,))
+    try:
+        yield scope
+    finally:
+        _usage_scopes.reset(token)
+
+
+def current_usage_scopes() -> tuple[UsageScope, ...]:
+    """Scopes a call made now counts towards (captured by the broker at enqueue)."""
+    return _usage_scopes.get()
+
+
+def record_llm_usage(
+    model: str,
+    usage: dict[str, Any],
+    batched: bool = False,
+    source: str = "broker",
+    scopes: Optional[tuple[UsageScope, ...]] = None,
+) -> None:
+    """Record an Anthropic-style usage dict; never raises.
+
+    Args:
+        model: Model identifier
+        usage: Dict with input_tokens (uncached), output_tokens and optional
+            cache_read_input_tokens / cache_creation_input_tokens
+        batched: Whether the call went through the Batch API
+        source: Recording call site
+        scopes: track_usage() totals to add to; defaults to the current
+            context's (pass the requester's when recording on its behalf)
+    """
+    for scope in current_usage_scopes() if scopes is None else scopes:
+        scope.add(usage)
+
+    if os.getenv("THALA_USAGE_LEDGER", "1") == "0":
+        return
+    try:
+        get_usage_ledger().record(
+            model=model,
+            input_tokens=usage.get("input_tokens") or 0,
+            output_tokens=usage.get("output_tokens") or 0,
+            cache_read_tokens=usage.get("cache_read_input_tokens") or 0,
+            cache_creation_tokens=usage.get("cache_creation_input_tokens") or 0,
+            batched=batched,
+            source=source,
+        )
+    except Exception as e:
+        logger.warning(f"Failed to record LLM usage for {model}: {e}")
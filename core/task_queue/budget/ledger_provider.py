@@ -0,0 +1,46 @@
+"""Usage-ledger cost provider.
+
+Answers budget queries from the local usage ledger's rolling counters:
+month-to-date cost is a single indexed lookup, always current, and needs
+no network access.
+"""
+
+from .ledger import UsageLedger
+
+
+class LedgerCostProvider:
+    """Read current costs from the local usage ledger."""
+
+    def __init__(self, ledger: UsageLedger, project: str):
+        """Initialize ledger cost provider.
+
+        Args:
+            ledger: Usage ledger to read from
+            project: Budget project (LANGSMITH_PROJECT at record time)
+        """
+        self.ledger = ledger
+        self.project = project
+
+    def get_current_month_cost(
+        self,
+        force_refresh: bool = False,
+        show_progress: bool = False,
+        max_runs: int = 10000,
+    ) -> float:
+        """Get total cost for current month.
+
+        Arguments match LangSmithCostProvider; the ledger is always current,
+        so they are ignored.
+        """
+        return self.ledger.cost("month", project=self.project)
+
+    def get_current_day_cost(self) -> float:
+        """Get total cost for the current UTC day."""
+        return self.ledger.cost("day", project=self.project)
+
+    def get_cost_breakdown(self) -> dict[str, float]:
+        """Get cost breakdown by model for current month."""
+        return {
+            model: totals.cost_usd
+            for model, totals in self.ledger.model_breakdown("month", project=self.project).items()
+        }
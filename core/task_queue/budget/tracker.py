@@ -1,8 +1,10 @@
 """Budget tracker facade for LLM cost management.
 
 Provides a unified interface to budget tracking by composing:
+- LedgerCostProvider: Cost data from the local usage ledger (default)
 - CostCacheManager: Cache persistence and validation
-- LangSmithCostProvider: Cost data from LangSmith API
+- LangSmithCostProvider: Cost data from LangSmith API (optional source,
+  and for reconciliation)
 - BudgetCalculator: Budget status and decision logic
 """
 
@@ -14,19 +16,22 @@ from ..paths import QUEUE_DIR
 from .cache import CostCacheManager
 from .calculator import BudgetCalculator
 from .langsmith_provider import LangSmithCostProvider
+from .ledger import UsageLedger, get_usage_ledger
+from .ledger_provider import LedgerCostProvider
 
 # Budget action types
 BudgetAction = Literal["pause", "slowdown", "warn", "ok"]
 
 
 class BudgetTracker:
-    """Track LLM costs via LangSmith and enforce budget limits."""
+    """Track LLM costs and enforce budget limits."""
 
-    def __init__(self, queue_dir: Optional[Path] = None):
+    def __init__(self, queue_dir: Optional[Path] = None, ledger: Optional[UsageLedger] = None):
         """Initialize the budget tracker.
 
         Args:
             queue_dir: Override queue directory (for testing)
+            ledger: Override usage ledger (for testing)
         """
         self.queue_dir = queue_dir or QUEUE_DIR
         self.cost_cache_file = self.queue_dir / "cost_cache.json"
@@ -38,16 +43,20 @@ class BudgetTracker:
         self.budget_action = os.getenv("THALA_BUDGET_ACTION", "pause")
         # Use dedicated queue project for budget isolation from manual testing
         self.langsmith_project = os.getenv("THALA_QUEUE_PROJECT", "thala-queue")
+        # "ledger" (local usage ledger) or "langsmith" (month scan of runs)
+        self.cost_source = os.getenv("THALA_BUDGET_SOURCE", "ledger")
 
         # Initialize components
         self.cache_manager = CostCacheManager(self.cost_cache_file, self.langsmith_project)
-        self.cost_provider = LangSmithCostProvider(self.cache_manager, self.langsmith_project)
+        self.langsmith_provider = LangSmithCostProvider(self.cache_manager, self.langsmith_project)
+        self.ledger_provider = LedgerCostProvider(ledger or get_usage_ledger(), self.langsmith_project)
+        self.cost_provider = self.langsmith_provider if self.cost_source == "langsmith" else self.ledger_provider
         self.calculator = BudgetCalculator(self.cost_provider, self.monthly_budget, self.budget_action)
 
     @property
     def client(self):
         """Lazy-load LangSmith client."""
-        return self.cost_provider.client
+        return self.langsmith_provider.client
 
     def get_current_month_cost(
         self,
@@ -57,12 +66,13 @@ class BudgetTracker:
     ) -> float:
         """Get total cost for current month.
 
-        Uses cached data if available and valid, otherwise queries LangSmith.
+        Reads the usage ledger's rolling counter, or (THALA_BUDGET_SOURCE=
+        langsmith) cached LangSmith data, querying LangSmith when stale.
 
         Args:
             force_refresh: Force refresh from LangSmith
             show_progress: Print progress while fetching
-            max_runs: Maximum runs to process (safety limit)
+            max_runs: Maximum LangSmith runs to process (safety limit)
 
         Returns:
             Total cost in USD for current month
@@ -106,3 +116,25 @@ class BudgetTracker:
             Dict mapping model name to cost in USD
         """
         return self.calculator.get_cost_breakdown()
+
+    def get_current_day_cost(self) -> float:
+        """Get total cost for the current UTC day from the usage ledger."""
+        return self.ledger_provider.get_current_day_cost()
+
+    def reconcile_with_langsmith(self, show_progress: bool = False) -> dict:
+        """Compare the ledger's month-to-date cost with LangSmith's.
+
+        LangSmith is queried fresh (full month scan), so this is slow and
+        intended for occasional checks, not budget decisions.
+
+        Returns:
+            Dict with ledger_cost, langsmith_cost and difference (ledger
+            minus LangSmith) in USD
+        """
+        ledger_cost = self.ledger_provider.get_current_month_cost()
+        langsmith_cost = self.langsmith_provider.get_current_month_cost(force_refresh=True, show_progress=show_progress)
+        return {
+            "ledger_cost": ledger_cost,
+            "langsmith_cost": langsmith_cost,
+            "difference": ledger_cost - langsmith_cost,
+        }
@@ -21,6 +21,7 @@ Usage:
 # ruff: noqa: E402  # Module imports after sys.path modification
 
 import argparse
+import importlib
 import sys
 from pathlib import Path
 
@@ -34,20 +35,23 @@ load_dotenv(PROJECT_ROOT / ".env")
 
 from core.config import configure_logging  # noqa: E402
 
-from .commands import (  # noqa: E402
-    cmd_add,
-    cmd_list,
-    cmd_parallel,
-    cmd_pause,
-    cmd_reorder,
-    cmd_resume,
-    cmd_run,
-    cmd_status,
-)
-from .daemon import cmd_daemon, cmd_start, cmd_stop  # noqa: E402
 from .workflows import DEFAULT_WORKFLOW_TYPE, get_available_types  # noqa: E402
 
 
+def _command(module: str, name: str):
+    """Defer importing a command until it runs.
+
+    Commands like `run` and `parallel` pull in the LLM broker, LangGraph
+    and the workflow modules; resolving them lazily keeps `list` and
+    `status` fast to start.
+    """
+
+    def run(args):
+        return getattr(importlib.import_module(module, __package__), name)(args)
+
+    return run
+
+
 def main():
     configure_logging()
     parser = argparse.ArgumentParser(description="Task queue management for literature review workflows")
@@ -81,37 +85,42 @@ def main():
     add_parser.add_argument("--to-year", type=int, help="End year for papers (lit_review_full only)")
     add_parser.add_argument("--notes", help="Notes for this task")
     add_parser.add_argument("--tags", help="Tags (comma-separated)")
-    add_parser.set_defaults(func=cmd_add)
+    add_parser.set_defaults(func=_command(".commands.task_commands", "cmd_add"))
 
     # list command
     list_parser = subparsers.add_parser("list", help="List queue")
     list_parser.add_argument("--status", "-s", help="Filter by status")
     list_parser.add_argument("--category", "-c", help="Filter by category")
-    list_parser.set_defaults(func=cmd_list)
+    list_parser.set_defaults(func=_command(".commands.task_commands", "cmd_list"))
 
     # run command
     run_parser = subparsers.add_parser("run", help="Run next eligible task")
     run_parser.add_argument("--yes", "-y", action="store_true", help="Skip confirmation")
     run_parser.add_argument("--skip-resume", action="store_true", help="Skip incomplete work and start fresh")
-    run_parser.set_defaults(func=cmd_run)
+    run_parser.set_defaults(func=_command(".commands.run_command", "cmd_run"))
 
     # status command
     status_parser = subparsers.add_parser("status", help="Show status")
-    status_parser.set_defaults(func=cmd_status)
+    status_parser.add_argument(
+        "--reconcile",
+        action="store_true",
+        help="Compare usage-ledger spend with LangSmith (slow: scans the month's runs)",
+    )
+    status_parser.set_defaults(func=_command(".commands.status_command", "cmd_status"))
 
     # reorder command
     reorder_parser = subparsers.add_parser("reorder", help="Reorder queue")
     reorder_parser.add_argument("--export", "-e", action="store_true", help="Export current order as JSON")
     reorder_parser.add_argument("--input", "-i", help="Import new order from JSON file")
-    reorder_parser.set_defaults(func=cmd_reorder)
+    reorder_parser.set_defaults(func=_command(".commands.task_commands", "cmd_reorder"))
 
     # start command
     start_parser = subparsers.add_parser("start", help="Start queue daemon")
-    start_parser.set_defaults(func=cmd_start)
+    start_parser.set_defaults(func=_command(".daemon", "cmd_start"))
 
     # stop command
     stop_parser = subparsers.add_parser("stop", help="Stop queue daemon")
-    stop_parser.set_defaults(func=cmd_stop)
+    stop_parser.set_defaults(func=_command(".daemon", "cmd_stop"))
 
     # daemon command (internal)
     daemon_parser = subparsers.add_parser("daemon", help="Run as daemon (internal)")
@@ -120,7 +129,7 @@ def main():
         "--check-interval", type=float, default=300.0, help="Seconds between queue checks (default: 300)"
     )
     daemon_parser.add_argument("--count", "-n", type=int, default=5, help="Tasks per batch (default: 5)")
-    daemon_parser.set_defaults(func=cmd_daemon)
+    daemon_parser.set_defaults(func=_command(".daemon", "cmd_daemon"))
 
     # parallel command
     parallel_parser = subparsers.add_parser("parallel", help="Run tasks in parallel")
@@ -130,7 +139,7 @@ def main():
     parallel_parser.add_argument(
         "--stagger", type=float, default=3.0, help="Minutes between workflow starts (default: 3.0)"
     )
-    parallel_parser.set_defaults(func=cmd_parallel)
+    parallel_parser.set_defaults(func=_command(".commands.parallel_command", "cmd_parallel"))
 
     # pause / resume: hold running workflows at the next checkpoint
     pause_parser = subparsers.add_parser(
@@ -138,10 +147,10 @@ def main():
         help="Block workflows at their next checkpoint (until `resume` is called)",
     )
     pause_parser.add_argument("--reason", help="Optional note stored in the flag file")
-    pause_parser.set_defaults(func=cmd_pause)
+    pause_parser.set_defaults(func=_command(".commands.pause_command", "cmd_pause"))
 
     resume_parser = subparsers.add_parser("resume", help="Clear the pause flag")
-    resume_parser.set_defaults(func=cmd_resume)
+    resume_parser.set_defaults(func=_command(".commands.pause_command", "cmd_resume"))
 
     args = parser.parse_args()
     args.func(args)
@@ -1,10 +1,29 @@
-"""Command implementations for CLI."""
+"""Command implementations for CLI.
+
+Commands are loaded on first access so that importing one command does not
+pull in the dependencies of the others (run/parallel load the LLM broker and
+workflow graphs).
+"""
+
+import importlib
+
+_COMMAND_MODULES = {
+    "cmd_add": ".task_commands",
+    "cmd_list": ".task_commands",
+    "cmd_parallel": ".parallel_command",
+    "cmd_pause": ".pause_command",
+    "cmd_reorder": ".task_commands",
+    "cmd_resume": ".pause_command",
+    "cmd_run": ".run_command",
+    "cmd_status": ".status_command",
+}
+
+
+def __getattr__(name: str):
+    if name in _COMMAND_MODULES:
+        return getattr(importlib.import_module(_COMMAND_MODULES[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-from .parallel_command import cmd_parallel
-from .pause_command import cmd_pause, cmd_resume
-from .run_command import cmd_run
-from .status_command import cmd_status
-from .task_commands import cmd_add, cmd_list, cmd_reorder
 
 __all__ = [
     "cmd_add",
@@ -26,6 +26,11 @@ def cmd_status(args):
         print(f"  Days left: {status['days_remaining']}")
         print(f"  Daily budget: {format_cost(status['daily_budget_remaining'])}")
         print(f"  Action: {status['action']}")
+        print(f"  Today: {format_cost(budget_tracker.get_current_day_cost())}")
+        if getattr(args, "reconcile", False):
+            reconciliation = budget_tracker.reconcile_with_langsmith(show_progress=True)
+            print(f"  LangSmith month-to-date: {format_cost(reconciliation['langsmith_cost'])}")
+            print(f"  Ledger - LangSmith: {reconciliation['difference']:+.4f} USD")
     except Exception as e:
         print(f"  Error getting budget: {e}")
         import traceback
@@ -2,7 +2,8 @@
 Model pricing map for cost calculation.
 
 Pricing per million tokens (USD) from Anthropic and DeepSeek docs.
-Used to calculate costs from LangSmith token counts.
+Used to calculate costs for the local usage ledger and from LangSmith
+token counts.
 """
 
 # Pricing per million tokens (USD)
@@ -11,7 +12,9 @@ MODEL_PRICING: dict[str, dict[str, float]] = {
     # Claude models (Anthropic)
     "claude-haiku-4-5-20251001": {"input": 1.00, "output": 5.00},
     "claude-sonnet-4-5-20250929": {"input": 3.00, "output": 15.00},
+    "claude-sonnet-4-6": {"input": 3.00, "output": 15.00},
     "claude-opus-4-5-20251101": {"input": 15.00, "output": 75.00},
+    "claude-opus-4-6": {"input": 5.00, "output": 25.00},
     # DeepSeek models (much cheaper)
     "deepseek-chat": {"input": 0.27, "output": 1.10},
     "deepseek-reasoner": {"input": 0.55, "output": 2.19},
@@ -20,6 +23,12 @@ MODEL_PRICING: dict[str, dict[str, float]] = {
     "text-embedding-3-large": {"input": 0.13, "output": 0.0},
 }
 
+# Multipliers on the input price for prompt-cache tokens (Anthropic: reads
+# at 10%, 5-minute cache writes at 125%) and for Batch API requests (50%)
+CACHE_READ_MULTIPLIER = 0.1
+CACHE_WRITE_MULTIPLIER = 1.25
+BATCH_DISCOUNT = 0.5
+
 # Aliases for common model name variations
 MODEL_ALIASES: dict[str, str] = {
     "claude-3-5-haiku-20251001": "claude-haiku-4-5-20251001",
@@ -84,6 +93,35 @@ def calculate_run_cost(
     return input_cost + output_cost
 
 
+def calculate_usage_cost(
+    model_name: str,
+    input_tokens: int,
+    output_tokens: int,
+    cache_read_tokens: int = 0,
+    cache_creation_tokens: int = 0,
+    batched: bool = False,
+) -> float:
+    """Calculate cost for a call including prompt-cache and batch pricing.
+
+    Args:
+        model_name: Model identifier
+        input_tokens: Uncached input tokens
+        output_tokens: Output tokens
+        cache_read_tokens: Input tokens served from the prompt cache
+        cache_creation_tokens: Input tokens written to the prompt cache
+        batched: Whether the call went through the Batch API
+
+    Returns:
+        Cost in USD
+    """
+    pricing = get_model_pricing(model_name)
+    input_equivalent = (
+        input_tokens + cache_read_tokens * CACHE_READ_MULTIPLIER + cache_creation_tokens * CACHE_WRITE_MULTIPLIER
+    )
+    cost = (input_equivalent * pricing["input"] + output_tokens * pricing["output"]) / 1_000_000
+    return cost * BATCH_DISCOUNT if batched else cost
+
+
 def format_cost(cost_usd: float) -> str:
     """Format cost for display.
 
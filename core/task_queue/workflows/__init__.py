@@ -16,26 +16,46 @@ Usage:
     phases = get_phases("web_research")
 """
 
-from typing import TYPE_CHECKING
+import importlib
+from collections.abc import Iterator, Mapping
 
 from .base import BaseWorkflow
 
-if TYPE_CHECKING:
-    pass
+# task_type -> (module, class). Workflow modules pull in LangGraph graphs,
+# tools and ML libraries, so they are imported only when a task of that
+# type is run - listing or inspecting the queue never loads them.
+_WORKFLOW_PATHS: dict[str, tuple[str, str]] = {
+    "lit_review_full": (".lit_review_full", "LitReviewFullWorkflow"),
+    "lit_review_web_augmented": (".lit_review_web_augmented", "LitReviewWebAugmentedWorkflow"),
+    "web_research": (".web_research", "WebResearchWorkflow"),
+    "illustrate_and_export": (".illustrate_and_export", "IllustrateAndExportWorkflow"),
+}
+
+_CLASS_PATHS = {class_name: module for module, class_name in _WORKFLOW_PATHS.values()}
+
+
+class _LazyWorkflowRegistry(Mapping[str, type[BaseWorkflow]]):
+    """Read-only task_type -> workflow class mapping that imports on lookup."""
+
+    def __init__(self, paths: dict[str, tuple[str, str]]):
+        self._paths = paths
+
+    def __getitem__(self, task_type: str) -> type[BaseWorkflow]:
+        module, class_name = self._paths[task_type]
+        return getattr(importlib.import_module(module, __name__), class_name)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._paths)
+
+    def __len__(self) -> int:
+        return len(self._paths)
+
+    def __contains__(self, task_type: object) -> bool:
+        return task_type in self._paths
 
-# Import workflow implementations
-from .illustrate_and_export import IllustrateAndExportWorkflow
-from .lit_review_full import LitReviewFullWorkflow
-from .lit_review_web_augmented import LitReviewWebAugmentedWorkflow
-from .web_research import WebResearchWorkflow
 
 # Registry mapping task_type -> workflow class
-WORKFLOW_REGISTRY: dict[str, type[BaseWorkflow]] = {
-    "lit_review_full": LitReviewFullWorkflow,
-    "lit_review_web_augmented": LitReviewWebAugmentedWorkflow,
-    "web_research": WebResearchWorkflow,
-    "illustrate_and_export": IllustrateAndExportWorkflow,
-}
+WORKFLOW_REGISTRY: Mapping[str, type[BaseWorkflow]] = _LazyWorkflowRegistry(_WORKFLOW_PATHS)
 
 # Default workflow type for backward compatibility
 DEFAULT_WORKFLOW_TYPE = "lit_review_full"
@@ -69,6 +89,13 @@ def get_available_types() -> list[str]:
     return list(WORKFLOW_REGISTRY.keys())
 
 
+def __getattr__(name: str):
+    # Workflow classes stay importable from this package, loaded on first access
+    if name in _CLASS_PATHS:
+        return getattr(importlib.import_module(_CLASS_PATHS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = [
     "BaseWorkflow",
     "WORKFLOW_REGISTRY",
@@ -223,10 +223,9 @@ class IllustrateAndExportWorkflow(BaseWorkflow):
         from core.stores.chroma import ChromaStore
         from core.stores.elasticsearch.client import ElasticsearchStores
         from core.stores.gc import (
-            build_inventory,
-            build_plan,
             collect_cited_keys_from_dir,
             execute_plan,
+            plan_gc,
         )
         from core.stores.zotero import ZoteroStore
         from core.task_queue.paths import EXPORT_DIR
@@ -243,8 +242,7 @@ class IllustrateAndExportWorkflow(BaseWorkflow):
             try:
                 async with ElasticsearchStores() as es:
                     chroma = ChromaStore(es_stores=es)
-                    inv = await build_inventory(zotero, es, chroma)
-                    plan = build_plan(cited, inv)
+                    plan = await plan_gc(cited, zotero, es, chroma)
                     logger.info(
                         "GC plan: drop zotero=%d l0=%d l1=%d l2=%d chroma=%d",
                         len(plan.drop_zotero), len(plan.drop_l0),
@@ -304,12 +302,14 @@ class IllustrateAndExportWorkflow(BaseWorkflow):
         Returns:
             Tuple of (illustrated_path, graph_result_dict).
         """
+        from workflows.output.illustrate import run_illustrate_graph
         from workflows.output.illustrate.config import IllustrateConfig as _IC
 
         source_path = Path(item["source_path"])
         content = source_path.read_text()
 
-        article_result = await illustrate_graph.ainvoke(
+        article_result = await run_illustrate_graph(
+            illustrate_graph,
             {
                 "input": {
                     "markdown_document": content,
@@ -317,7 +317,7 @@ class IllustrateAndExportWorkflow(BaseWorkflow):
                     "output_dir": str(output_dir / f"{item['id']}_images"),
                 },
                 "config": config or _IC(),
-            }
+            },
         )
 
         illustrated_content = article_result.get("illustrated_document", content)
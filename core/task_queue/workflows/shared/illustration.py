@@ -33,6 +33,8 @@ async def illustrate_articles(
     Returns:
         Dict mapping article ID to illustrated file path
     """
+    from workflows.output.illustrate import run_illustrate_graph
+
     output_dir = get_output_dir_fn()
     timestamp = generate_timestamp_fn()
     topic_slug = slugify_fn(task.get("topic", "unknown"))
@@ -54,14 +56,15 @@ async def illustrate_articles(
     for output in final_outputs:
         article_id = output["id"]
         try:
-            article_result = await illustrate_graph.ainvoke(
+            article_result = await run_illustrate_graph(
+                illustrate_graph,
                 {
                     "input": {
                         "markdown_document": output["content"],
                         "title": output["title"],
                         "output_dir": str(illust_dir / f"{article_id}_images"),
                     }
-                }
+                },
             )
 
             article_path = illust_dir / f"{article_id}.md"
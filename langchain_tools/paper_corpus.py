@@ -12,6 +12,7 @@ Tools:
 import asyncio
 import logging
 from typing import Any, Optional
+from uuid import UUID
 
 from langchain_core.tools import tool
 from pydantic import BaseModel, Field
@@ -26,6 +27,15 @@ logger = logging.getLogger(__name__)
 # RRF scoring with k=60 gives scores in 0.01-0.03 range for top results
 MINIMUM_RELEVANCE_THRESHOLD = 0.008
 
+# Fields needed to build a search result; skips content and embeddings
+_SEARCH_RESULT_FIELDS = [
+    "zotero_key",
+    "metadata.title",
+    "metadata.year",
+    "metadata.authors",
+]
+_CONTENT_FIELDS = ["zotero_key", "content", "metadata.title"]
+
 
 # ---------------------------------------------------------------------------
 # Output Models
@@ -76,6 +86,7 @@ async def _semantic_search(query: str, limit: int = 10) -> list[dict[str, Any]]:
             embedding=query_embedding,
             k=limit * 2,  # Get extra for deduplication
             compression_level=2,  # L2 has paper summaries with embeddings
+            fields=_SEARCH_RESULT_FIELDS,
         )
 
         search_results: list[dict[str, Any]] = []
@@ -113,6 +124,7 @@ async def _keyword_search(query: str, limit: int = 10) -> list[dict[str, Any]]:
         records = await store_manager.es_stores.store.search(
             query=es_query,
             size=limit * 2,
+            fields=_SEARCH_RESULT_FIELDS,
         )
 
         search_results: list[dict[str, Any]] = []
@@ -124,7 +136,7 @@ async def _keyword_search(query: str, limit: int = 10) -> list[dict[str, Any]]:
 
             seen_keys.add(r.zotero_key)
             # Normalize score to 0-1 range
-            score = min(1.0, getattr(r, "_score", 1.0) / 10.0)
+            score = min(1.0, (r.score if r.score is not None else 10.0) / 10.0)
 
             metadata = r.metadata or {}
             search_results.append({
@@ -257,6 +269,40 @@ async def _enrich_with_zotero_metadata(
     return results
 
 
+async def fetch_paper_summaries(
+    zotero_keys: list[str],
+) -> dict[str, tuple[str, str]]:
+    """Batch-fetch summary content for papers in the store.
+
+    Resolves keys through the store's key index, then fetches the L2 summary
+    (or L1 where no L2 exists) for every key with a single mget.
+
+    Returns:
+        Dict of zotero_key -> (title, content) for keys with a summary
+    """
+    store = get_store_manager().es_stores.store
+    entries = await store.resolve_keys(zotero_keys)
+
+    refs: dict[str, tuple[UUID, int]] = {}
+    for key, entry in entries.items():
+        for level in (2, 1):
+            record_id = entry.id_for_level(level)
+            if record_id is not None:
+                refs[key] = (record_id, level)
+                break
+
+    records = await store.mget(list(refs.values()), fields=_CONTENT_FIELDS)
+
+    summaries: dict[str, tuple[str, str]] = {}
+    for key, (record_id, _level) in refs.items():
+        record = records.get(record_id)
+        if record is None:
+            continue
+        title = entries[key].title or record.metadata.get("title", "Unknown")
+        summaries[key] = (title, record.content or "")
+    return summaries
+
+
 # ---------------------------------------------------------------------------
 # Tools
 # ---------------------------------------------------------------------------
@@ -344,25 +390,10 @@ async def get_paper_content(zotero_key: str, max_chars: int = 10000) -> dict:
     store_manager = get_store_manager()
 
     try:
-        # Try L2 first (10:1 compressed summaries)
-        es_query = {
-            "bool": {
-                "must": [
-                    {"term": {"zotero_key": zotero_key}},
-                ],
-                "filter": [
-                    {"term": {"compression_level": 2}},
-                ],
-            }
-        }
-
-        records = await store_manager.es_stores.store.search(query=es_query, size=1)
-
-        if records:
-            record = records[0]
-            content = record.content or ""
-            metadata = record.metadata or {}
-            title = metadata.get("title", "Unknown")
+        summaries = await fetch_paper_summaries([zotero_key])
+
+        if zotero_key in summaries:
+            title, content = summaries[zotero_key]
 
             truncated = len(content) > max_chars
             if truncated:
@@ -381,29 +412,6 @@ async def get_paper_content(zotero_key: str, max_chars: int = 10000) -> dict:
                 )
             )
 
-        # Fall back to L1 if L2 not available
-        es_query["bool"]["filter"] = [{"term": {"compression_level": 1}}]
-        records = await store_manager.es_stores.store.search(query=es_query, size=1)
-
-        if records:
-            record = records[0]
-            content = record.content or ""
-            metadata = record.metadata or {}
-            title = metadata.get("title", "Unknown")
-
-            truncated = len(content) > max_chars
-            if truncated:
-                content = content[:max_chars] + "\n\n[... content truncated ...]"
-
-            return output_dict(
-                PaperContentOutput(
-                    zotero_key=zotero_key,
-                    title=title,
-                    content=content,
-                    truncated=truncated,
-                )
-            )
-
         # Try to get metadata from Zotero as fallback
         item = await store_manager.zotero.get(zotero_key)
         if item:
@@ -2,10 +2,15 @@
 search_memory - Cross-store semantic search tool for LangChain.
 
 Searches across: top_of_mind, coherence, who_i_was, store
+
+Stores are queried concurrently, each under its own deadline. A store that
+times out or errors is reported in the output and the tool answers with
+whatever the other stores returned.
 """
 
+import asyncio
 import logging
-from typing import Literal, Optional
+from typing import Any, Awaitable, Callable, Literal, Optional
 
 from elasticsearch import NotFoundError as ESNotFoundError
 from langchain.tools import tool
@@ -25,6 +30,22 @@ MIN_VECTOR_SIMILARITY = 0.5
 # Records below this threshold are filtered out
 MIN_COHERENCE_CONFIDENCE = 0.3
 
+# Per-store deadline in seconds. top_of_mind includes the query embedding call.
+STORE_TIMEOUTS = {
+    "top_of_mind": 8.0,
+    "coherence": 5.0,
+    "store": 5.0,
+    "who_i_was": 5.0,
+}
+DEFAULT_STORE_TIMEOUT = 5.0
+
+# Stores whose scores are already 0-1 (vector similarity, coherence confidence).
+# Others return unbounded BM25 scores, normalized against their best hit.
+BOUNDED_SCORE_STORES = {"top_of_mind", "coherence"}
+
+# Fields fetched from the main store; skips embeddings in the response
+STORE_FIELDS = ["content", "zotero_key", "compression_level", "source_type"]
+
 
 class MemorySearchResult(BaseModel):
     """Individual search result from memory."""
@@ -33,6 +54,7 @@ class MemorySearchResult(BaseModel):
     source_store: str
     content: str
     score: Optional[float] = None
+    normalized_score: Optional[float] = None
     zotero_key: Optional[str] = None
     metadata: dict = Field(default_factory=dict)
 
@@ -43,15 +65,208 @@ class SearchMemoryOutput(BaseModel):
     query: str
     total_results: int
     results: list[MemorySearchResult]
+    stores_responded: list[str] = Field(default_factory=list)
+    stores_timed_out: list[str] = Field(default_factory=list)
+    stores_failed: list[str] = Field(default_factory=list)
+    partial: bool = False
+
+
+async def _search_top_of_mind(store_manager, query: str, limit: int) -> list[MemorySearchResult]:
+    """Semantic search in top_of_mind (vector similarity)."""
+    query_embedding = await store_manager.embedding.embed(query)
+    chroma_results = await store_manager.chroma.search(
+        query_embedding=query_embedding,
+        n_results=limit,
+    )
+    results = []
+    for r in chroma_results:
+        similarity = 1 - r["distance"]  # Convert distance to similarity
+
+        # Filter out low-relevance results
+        if similarity < MIN_VECTOR_SIMILARITY:
+            logger.debug(f"Filtered top_of_mind result with low similarity: {similarity:.3f} < {MIN_VECTOR_SIMILARITY}")
+            continue
+
+        results.append(
+            MemorySearchResult(
+                id=str(r["id"]),
+                source_store="top_of_mind",
+                content=r["document"] or "",
+                score=similarity,
+                zotero_key=r["metadata"].get("zotero_key") if r["metadata"] else None,
+                metadata=r["metadata"] or {},
+            )
+        )
+
+    logger.debug(
+        f"top_of_mind: {len(results)}/{len(chroma_results)} results passed similarity filter (>= {MIN_VECTOR_SIMILARITY})"
+    )
+    return results
+
+
+async def _search_coherence(store_manager, query: str, limit: int) -> list[MemorySearchResult]:
+    """Text search in coherence (beliefs/preferences)."""
+    try:
+        coherence_results = await store_manager.es_stores.coherence.search(
+            query={"match": {"content": query}},
+            size=limit,
+        )
+    except ESNotFoundError:
+        # Index doesn't exist yet - this is expected when coherence store hasn't been set up
+        logger.debug("coherence index not found - skipping")
+        return []
+
+    results = []
+    for r in coherence_results:
+        # Filter by confidence if available
+        confidence = r.confidence if hasattr(r, "confidence") else None
+        if confidence is not None and confidence < MIN_COHERENCE_CONFIDENCE:
+            logger.debug(
+                f"Filtered coherence result with low confidence: {confidence:.2f} < {MIN_COHERENCE_CONFIDENCE}"
+            )
+            continue
+
+        results.append(
+            MemorySearchResult(
+                id=str(r.id),
+                source_store="coherence",
+                content=r.content,
+                score=confidence,  # Use confidence as score for coherence records
+                zotero_key=r.zotero_key,
+                metadata={
+                    "category": r.category,
+                    "confidence": confidence,
+                },
+            )
+        )
+
+    logger.debug(
+        f"coherence: {len(results)}/{len(coherence_results)} results passed confidence filter (>= {MIN_COHERENCE_CONFIDENCE})"
+    )
+    return results
+
+
+async def _search_store(store_manager, query: str, limit: int) -> list[MemorySearchResult]:
+    """Text search in store (knowledge base)."""
+    store_results = await store_manager.es_stores.store.search(
+        query={"match": {"content": query}},
+        size=limit,
+        fields=STORE_FIELDS,
+    )
+    results = [
+        MemorySearchResult(
+            id=str(r.id),
+            source_store="store",
+            content=r.content or "",
+            score=r.score,
+            zotero_key=r.zotero_key,
+            metadata={
+                "compression_level": r.compression_level,
+                "source_type": r.source_type.value if hasattr(r.source_type, "value") else str(r.source_type),
+            },
+        )
+        for r in store_results
+    ]
+    logger.debug(f"store returned {len(results)} results")
+    return results
+
+
+async def _search_who_i_was(store_manager, query: str, limit: int) -> list[MemorySearchResult]:
+    """Historical search (previous versions of records)."""
+    history_results = await store_manager.es_stores.who_i_was.search(
+        query={"match": {"previous_data.content": query}},
+        size=limit,
+    )
+    results = [
+        MemorySearchResult(
+            id=str(r.id),
+            source_store="who_i_was",
+            content=r.previous_data.get("content", "") if r.previous_data else "",
+            score=None,
+            zotero_key=r.previous_data.get("zotero_key") if r.previous_data else None,
+            metadata={
+                "supersedes": str(r.supersedes),
+                "reason": r.reason,
+                "original_store": r.original_store,
+            },
+        )
+        for r in history_results
+    ]
+    logger.debug(f"who_i_was returned {len(results)} results")
+    return results
+
+
+_STORE_SEARCHES: dict[str, Callable[[Any, str, int], Awaitable[list[MemorySearchResult]]]] = {
+    "top_of_mind": _search_top_of_mind,
+    "coherence": _search_coherence,
+    "store": _search_store,
+    "who_i_was": _search_who_i_was,
+}
+
+
+async def _fan_out(
+    store_manager, query: str, limit: int, stores: list[str]
+) -> tuple[dict[str, list[MemorySearchResult]], list[str], list[str]]:
+    """Query stores concurrently, each under its own deadline.
+
+    Returns:
+        (results by store that responded, stores that timed out, stores that failed)
+    """
+    names = [name for name in _STORE_SEARCHES if name in stores]
+    outcomes = await asyncio.gather(
+        *(
+            asyncio.wait_for(
+                _STORE_SEARCHES[name](store_manager, query, limit),
+                timeout=STORE_TIMEOUTS.get(name, DEFAULT_STORE_TIMEOUT),
+            )
+            for name in names
+        ),
+        return_exceptions=True,
+    )
+
+    responded: dict[str, list[MemorySearchResult]] = {}
+    timed_out: list[str] = []
+    failed: list[str] = []
+    for name, outcome in zip(names, outcomes):
+        if isinstance(outcome, TimeoutError):
+            logger.warning(f"{name} search timed out after {STORE_TIMEOUTS.get(name, DEFAULT_STORE_TIMEOUT)}s")
+            timed_out.append(name)
+        elif isinstance(outcome, BaseException):
+            logger.warning(f"{name} search failed: {outcome}")
+            failed.append(name)
+        else:
+            responded[name] = outcome
+    return responded, timed_out, failed
+
+
+def _merge_by_score(results_by_store: dict[str, list[MemorySearchResult]]) -> list[MemorySearchResult]:
+    """Interleave results from all stores by normalized score.
+
+    Similarities and confidences are used as-is; BM25 scores are divided
+    by the best score from the same store so all stores share a 0-1 range.
+    Unscored results keep their store order after all scored ones.
+    """
+    scored: list[MemorySearchResult] = []
+    unscored: list[MemorySearchResult] = []
+    for store, results in results_by_store.items():
+        best = max((r.score for r in results if r.score is not None), default=0.0)
+        for r in results:
+            if r.score is None or best <= 0:
+                unscored.append(r)
+                continue
+            r.normalized_score = r.score if store in BOUNDED_SCORE_STORES else r.score / best
+            scored.append(r)
+
+    # Stable sort keeps store order for ties
+    scored.sort(key=lambda r: r.normalized_score, reverse=True)
+    return scored + unscored
 
 
 @tool
 async def search_memory(
     query: str,
     limit: int = 10,
-    stores: Optional[
-        list[Literal["top_of_mind", "coherence", "who_i_was", "store"]]
-    ] = None,
+    stores: Optional[list[Literal["top_of_mind", "coherence", "who_i_was", "store"]]] = None,
     include_historical: bool = False,
 ) -> dict:
     """Search across the memory system for relevant information.
@@ -61,7 +276,9 @@ async def search_memory(
     - Find beliefs, preferences, or identity information (coherence store)
     - Look up stored knowledge on a topic
 
-    Returns results from multiple memory stores with source attribution.
+    Returns results from multiple memory stores with source attribution,
+    best matches first. If a store is slow or unavailable, results from the
+    others are returned and `partial` is set.
 
     Args:
         query: What to search for in memory
@@ -70,7 +287,6 @@ async def search_memory(
         include_historical: Include who_i_was (historical versions). Defaults to False.
     """
     store_manager = get_store_manager()
-    results: list[MemorySearchResult] = []
 
     # Clamp limit
     limit = clamp_limit(limit, min_val=1, max_val=50)
@@ -80,155 +296,20 @@ async def search_memory(
         stores = ["top_of_mind", "coherence", "store"]
         if include_historical:
             stores.append("who_i_was")
+    elif not include_historical:
+        stores = [s for s in stores if s != "who_i_was"]
 
-    # 1. Semantic search in top_of_mind (vector similarity)
-    if "top_of_mind" in stores:
-        try:
-            query_embedding = await store_manager.embedding.embed(query)
-            chroma_results = await store_manager.chroma.search(
-                query_embedding=query_embedding,
-                n_results=limit,
-            )
-            filtered_count = 0
-            for r in chroma_results:
-                similarity = 1 - r["distance"]  # Convert distance to similarity
-
-                # Filter out low-relevance results
-                if similarity < MIN_VECTOR_SIMILARITY:
-                    filtered_count += 1
-                    logger.debug(
-                        f"Filtered top_of_mind result with low similarity: {similarity:.3f} < {MIN_VECTOR_SIMILARITY}"
-                    )
-                    continue
-
-                results.append(
-                    MemorySearchResult(
-                        id=str(r["id"]),
-                        source_store="top_of_mind",
-                        content=r["document"] or "",
-                        score=similarity,
-                        zotero_key=r["metadata"].get("zotero_key")
-                        if r["metadata"]
-                        else None,
-                        metadata=r["metadata"] or {},
-                    )
-                )
-
-            accepted = len(chroma_results) - filtered_count
-            logger.debug(
-                f"top_of_mind: {accepted}/{len(chroma_results)} results passed similarity filter (>= {MIN_VECTOR_SIMILARITY})"
-            )
-        except Exception as e:
-            logger.warning(f"top_of_mind search failed: {e}")
-
-    # 2. Text search in coherence (beliefs/preferences)
-    if "coherence" in stores:
-        try:
-            coherence_results = await store_manager.es_stores.coherence.search(
-                query={"match": {"content": query}},
-                size=limit,
-            )
-            filtered_count = 0
-            for r in coherence_results:
-                # Filter by confidence if available
-                confidence = r.confidence if hasattr(r, "confidence") else None
-                if confidence is not None and confidence < MIN_COHERENCE_CONFIDENCE:
-                    filtered_count += 1
-                    logger.debug(
-                        f"Filtered coherence result with low confidence: {confidence:.2f} < {MIN_COHERENCE_CONFIDENCE}"
-                    )
-                    continue
-
-                results.append(
-                    MemorySearchResult(
-                        id=str(r.id),
-                        source_store="coherence",
-                        content=r.content,
-                        score=confidence,  # Use confidence as score for coherence records
-                        zotero_key=r.zotero_key,
-                        metadata={
-                            "category": r.category,
-                            "confidence": confidence,
-                        },
-                    )
-                )
-
-            accepted = len(coherence_results) - filtered_count
-            logger.debug(
-                f"coherence: {accepted}/{len(coherence_results)} results passed confidence filter (>= {MIN_COHERENCE_CONFIDENCE})"
-            )
-        except ESNotFoundError:
-            # Index doesn't exist yet - this is expected when coherence store hasn't been set up
-            logger.debug("coherence index not found - skipping")
-        except Exception as e:
-            logger.warning(f"coherence search failed: {e}")
-
-    # 3. Text search in store (knowledge base)
-    if "store" in stores:
-        try:
-            store_results = await store_manager.es_stores.store.search(
-                query={"match": {"content": query}},
-                size=limit,
-            )
-            for r in store_results:
-                results.append(
-                    MemorySearchResult(
-                        id=str(r.id),
-                        source_store="store",
-                        content=r.content,
-                        score=None,
-                        zotero_key=r.zotero_key,
-                        metadata={
-                            "compression_level": r.compression_level,
-                            "source_type": r.source_type.value
-                            if hasattr(r.source_type, "value")
-                            else str(r.source_type),
-                        },
-                    )
-                )
-            logger.debug(f"store returned {len(store_results)} results")
-        except Exception as e:
-            logger.warning(f"store search failed: {e}")
-
-    # 4. Historical search (optional)
-    if include_historical and "who_i_was" in stores:
-        try:
-            history_results = await store_manager.es_stores.who_i_was.search(
-                query={"match": {"previous_data.content": query}},
-                size=limit,
-            )
-            for r in history_results:
-                results.append(
-                    MemorySearchResult(
-                        id=str(r.id),
-                        source_store="who_i_was",
-                        content=r.previous_data.get("content", "")
-                        if r.previous_data
-                        else "",
-                        score=None,
-                        zotero_key=r.previous_data.get("zotero_key")
-                        if r.previous_data
-                        else None,
-                        metadata={
-                            "supersedes": str(r.supersedes),
-                            "reason": r.reason,
-                            "original_store": r.original_store,
-                        },
-                    )
-                )
-            logger.debug(f"who_i_was returned {len(history_results)} results")
-        except Exception as e:
-            logger.warning(f"who_i_was search failed: {e}")
-
-    # Results are filtered by relevance thresholds (MIN_VECTOR_SIMILARITY, MIN_COHERENCE_CONFIDENCE)
-    # and grouped by store in search order. Future improvements could include:
-    # - Interleave by normalized score across all stores
-    # - Deduplicate by content hash
+    responded, timed_out, failed = await _fan_out(store_manager, query, limit, stores)
+    results = _merge_by_score(responded)
 
     output = SearchMemoryOutput(
         query=query,
         total_results=len(results),
         results=results,
+        stores_responded=list(responded),
+        stores_timed_out=timed_out,
+        stores_failed=failed,
+        partial=bool(timed_out or failed),
     )
 
     return output_dict(output)
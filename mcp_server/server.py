@@ -10,7 +10,7 @@ import json
 import logging
 import os
 import sys
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from dotenv import load_dotenv
 
@@ -28,18 +28,21 @@ from mcp.types import TextContent, Tool
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from core.stores.chroma import ChromaStore
-from core.stores.elasticsearch import ElasticsearchStores
-from core.stores.zotero import ZoteroStore
-
-from core.embedding import EmbeddingService
 from .errors import ToolError
 
+if TYPE_CHECKING:
+    from core.embedding import EmbeddingService
+
 logger = logging.getLogger(__name__)
 
 # Global store instances (initialized on startup)
 _stores: dict[str, Any] = {}
-_embedding_service: EmbeddingService | None = None
+_embedding_service: "EmbeddingService | None" = None
+
+# Store initialization runs in the background so the MCP handshake and
+# tools/list are answered without waiting for chromadb/elasticsearch/voyageai
+# to import and connect; tool calls wait for it.
+_init_task: asyncio.Task | None = None
 
 # Create MCP server
 server = Server("thala-stores")
@@ -49,6 +52,12 @@ async def init_stores():
     """Initialize all store connections."""
     global _stores, _embedding_service
 
+    # Store clients pull in heavy libraries; import them only once serving
+    from core.embedding import EmbeddingService
+    from core.stores.chroma import ChromaStore
+    from core.stores.elasticsearch import ElasticsearchStores
+    from core.stores.zotero import ZoteroStore
+
     logger.info("Initializing stores...")
 
     # Initialize embedding service first
@@ -133,7 +142,7 @@ def get_stores() -> dict[str, Any]:
     return _stores
 
 
-def get_embedding_service() -> EmbeddingService | None:
+def get_embedding_service() -> "EmbeddingService | None":
     """Get embedding service instance."""
     return _embedding_service
 
@@ -169,6 +178,9 @@ async def list_tools() -> list[Tool]:
 async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
     """Handle tool calls."""
     try:
+        if _init_task is not None:
+            await asyncio.shield(_init_task)
+
         # Route to appropriate handler
         if name.startswith("health."):
             result = await health.handle(name, arguments, _stores, _embedding_service)
@@ -215,7 +227,8 @@ async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
 
 async def main():
     """Run the MCP server."""
-    await init_stores()
+    global _init_task
+    _init_task = asyncio.create_task(init_stores())
 
     try:
         async with stdio_server() as (read_stream, write_stream):
@@ -225,6 +238,7 @@ async def main():
                 server.create_initialization_options(),
             )
     finally:
+        await _init_task
         await cleanup_stores()
 
 
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""Benchmark bulk broker enqueue against per-request submission.
+
+Queues N batch-routed requests into a fresh broker queue, once by awaiting
+broker.request() per request (one locked queue read/write each - the path
+InvokeBatch used before) and once with a single broker.request_many() call.
+No API calls are made: batch triggers are set above N and the background
+monitor is not started.
+
+Usage:
+    .venv/bin/python scripts/benchmark_broker_enqueue.py
+    .venv/bin/python scripts/benchmark_broker_enqueue.py --requests 500 --runs 5
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.llm_broker import BatchPolicy, BrokerConfig, LLMBroker, RequestSpec  # noqa: E402
+from workflows.shared.llm_utils import ModelTier  # noqa: E402
+
+
+async def make_broker(queue_dir: Path, n: int) -> LLMBroker:
+    config = BrokerConfig(
+        queue_dir=str(queue_dir),
+        max_queue_size=n * 2,
+        batch_threshold=n * 2,
+    )
+    broker = LLMBroker(config=config)
+    await broker._persistence.initialize()
+    broker._started = True
+    return broker
+
+
+def make_specs(n: int) -> list[RequestSpec]:
+    return [
+        RequestSpec(
+            prompt=f"Summarise paper {i} in three sentences.",
+            model=ModelTier.SONNET,
+            policy=BatchPolicy.FORCE_BATCH,
+            system="You are a careful research assistant.",
+        )
+        for i in range(n)
+    ]
+
+
+async def per_request(broker: LLMBroker, specs: list[RequestSpec]) -> None:
+    for spec in specs:
+        await broker.request(
+            prompt=spec.prompt,
+            model=spec.model,
+            policy=spec.policy,
+            system=spec.system,
+        )
+
+
+async def bulk(broker: LLMBroker, specs: list[RequestSpec]) -> None:
+    await broker.request_many(specs)
+
+
+async def time_ms(fn, n: int, runs: int) -> float:
+    samples = []
+    for _ in range(runs):
+        with tempfile.TemporaryDirectory() as tmp:
+            broker = await make_broker(Path(tmp), n)
+            specs = make_specs(n)
+            start = time.perf_counter()
+            await fn(broker, specs)
+            samples.append((time.perf_counter() - start) * 1000)
+            assert await broker._persistence.get_queue_size() == n
+    return statistics.median(samples)
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, nargs="+", default=[10, 100, 500], help="Requests per run")
+    parser.add_argument("--runs", type=int, default=3, help="Runs per measurement")
+    args = parser.parse_args()
+
+    print(f"{'requests':>9}{'request() (ms)':>17}{'request_many() (ms)':>22}{'speedup':>10}")
+    for n in args.requests:
+        single_ms = await time_ms(per_request, n, args.runs)
+        bulk_ms = await time_ms(bulk, n, args.runs)
+        print(f"{n:>9}{single_ms:>17.1f}{bulk_ms:>22.1f}{single_ms / bulk_ms:>9.1f}x")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
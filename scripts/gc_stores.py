@@ -24,11 +24,10 @@ from core.stores.chroma import ChromaStore  # noqa: E402
 from core.stores.elasticsearch.client import ElasticsearchStores  # noqa: E402
 from core.stores.gc import (  # noqa: E402
     GCPlan,
-    Inventory,
-    build_inventory,
-    build_plan,
+    Throughput,
     collect_cited_keys_from_dir,
     execute_plan,
+    plan_gc,
 )
 from core.stores.zotero import ZoteroStore  # noqa: E402
 
@@ -40,7 +39,17 @@ logging.getLogger("httpx").setLevel(logging.WARNING)
 DELETE_REASON = "GC: not cited by documents in incoming/"
 
 
-def report(plan: GCPlan, inv: Inventory, file_count: int) -> None:
+def report_throughput(label: str, stats: dict[str, Throughput]) -> None:
+    print(label)
+    for stage, stat in stats.items():
+        print(f"  {stage:<10} {stat}")
+    # Stages overlap in time, so overall rate uses the longest one
+    records = sum(s.records for s in stats.values())
+    seconds = max((s.seconds for s in stats.values()), default=0.0)
+    print(f"  {'overall':<10} {Throughput(records, seconds)}")
+
+
+def report(plan: GCPlan, file_count: int) -> None:
     print()
     print("=" * 72)
     print(f"Scanned {file_count} markdown files; found {len(plan.cited_keys)} unique citation keys.")
@@ -50,16 +59,15 @@ def report(plan: GCPlan, inv: Inventory, file_count: int) -> None:
         pct = (dropped / total * 100) if total else 0
         print(f"{label:<20} total={total:<6} keep={kept:<6} drop={dropped:<6} ({pct:.1f}% drop)")
 
-    section("Zotero items", len(plan.keep_zotero), len(plan.drop_zotero), len(inv.zotero_all))
-    section("ES store_l0 (ext)", len(plan.keep_l0), len(plan.drop_l0), len(inv.l0_by_zkey))
+    section("Zotero items", len(plan.keep_zotero), len(plan.drop_zotero), plan.zotero_total)
+    section("ES store_l0 (ext)", len(plan.keep_l0), len(plan.drop_l0), plan.l0_external_total)
     print(f"{'ES store_l0 (int)':<20} preserved={plan.l0_internal}")
-    section("ES store_l1", len(inv.l1) - len(plan.drop_l1), len(plan.drop_l1), len(inv.l1))
-    section("ES store_l2", len(inv.l2) - len(plan.drop_l2), len(plan.drop_l2), len(inv.l2))
-    section("Chroma (linked)", 0, len(plan.drop_chroma),
-            sum(1 for _, z in inv.chroma_rows if z))
-    chroma_unlinked = sum(1 for _, z in inv.chroma_rows if not z)
-    if chroma_unlinked:
-        print(f"{'Chroma (unlinked)':<20} preserved={chroma_unlinked}")
+    section("ES store_l1", plan.l1_total - len(plan.drop_l1), len(plan.drop_l1), plan.l1_total)
+    section("ES store_l2", plan.l2_total - len(plan.drop_l2), len(plan.drop_l2), plan.l2_total)
+    section("Chroma (linked)", plan.chroma_linked - len(plan.drop_chroma), len(plan.drop_chroma),
+            plan.chroma_linked)
+    if plan.chroma_unlinked:
+        print(f"{'Chroma (unlinked)':<20} preserved={plan.chroma_unlinked}")
 
     if plan.l0_uncited_zkeys:
         print()
@@ -70,7 +78,7 @@ def report(plan: GCPlan, inv: Inventory, file_count: int) -> None:
         if len(plan.l0_uncited_zkeys) > 10:
             print(f"  ... and {len(plan.l0_uncited_zkeys) - 10} more")
 
-    cited_not_in_zotero = plan.cited_keys - set(inv.zotero_all.keys())
+    cited_not_in_zotero = plan.cited_missing_from_zotero
     if cited_not_in_zotero:
         print()
         print(f"Warning: {len(cited_not_in_zotero)} citation keys missing from Zotero library:")
@@ -78,6 +86,8 @@ def report(plan: GCPlan, inv: Inventory, file_count: int) -> None:
             print(f"  - {k}")
 
     print()
+    report_throughput("Inventory scan throughput:", plan.scan)
+    print()
 
 
 async def run(source: Path, do_execute: bool) -> None:
@@ -93,10 +103,9 @@ async def run(source: Path, do_execute: bool) -> None:
         async with ElasticsearchStores() as es:
             chroma = ChromaStore(es_stores=es)
 
-            logger.info("Loading inventories (Zotero, ES, Chroma)...")
-            inv = await build_inventory(zotero, es, chroma)
-            plan = build_plan(cited, inv)
-            report(plan, inv, len(files))
+            logger.info("Streaming inventories (Zotero, ES, Chroma)...")
+            plan = await plan_gc(cited, zotero, es, chroma)
+            report(plan, len(files))
 
             if not do_execute:
                 print("Dry-run only. Pass --execute to perform deletions.")
@@ -111,7 +120,9 @@ async def run(source: Path, do_execute: bool) -> None:
                 logger.info("Aborted.")
                 return
 
-            await execute_plan(plan, zotero, es, chroma, reason=DELETE_REASON)
+            stats = await execute_plan(plan, zotero, es, chroma, reason=DELETE_REASON)
+            print()
+            report_throughput("Deletion throughput:", stats)
             logger.info("Done.")
     finally:
         await zotero.close()
@@ -14,7 +14,6 @@ Usage:
 import argparse
 import asyncio
 import json
-import gzip
 import sys
 from datetime import datetime
 from pathlib import Path
@@ -32,7 +31,6 @@ from core.task_queue.lifecycle import cleanup_supervisor_resources  # noqa: E402
 
 QUEUE_DIR = PROJECT_ROOT / ".thala" / "queue"
 OUTPUT_DIR = PROJECT_ROOT / ".thala" / "output"
-STATE_STORE_DIR = Path.home() / ".thala" / "workflow_states" / "academic_lit_review"
 
 
 def _find_task(prefix: str) -> dict:
@@ -46,29 +44,19 @@ def _find_task(prefix: str) -> dict:
 
 def _load_workflow_state(topic: str) -> dict:
     """Find the most recent workflow state matching this topic."""
-    if not STATE_STORE_DIR.exists():
-        raise SystemExit(f"No workflow states directory: {STATE_STORE_DIR}")
-
-    # Sort by modification time, newest first
-    state_files = sorted(STATE_STORE_DIR.iterdir(), key=lambda p: p.stat().st_mtime, reverse=True)
-
-    for path in state_files:
-        try:
-            if path.suffix == ".gz":
-                data = json.loads(gzip.open(path).read())
-            else:
-                data = json.loads(path.read_text())
-
-            state_topic = data.get("input", {}).get("topic", "")
-            if state_topic == topic:
-                return data
-        except (json.JSONDecodeError, OSError):
-            continue
-
-    raise SystemExit(
-        f"No saved workflow state found for topic '{topic[:60]}...'\n"
-        f"Searched {len(state_files)} files in {STATE_STORE_DIR}"
-    )
+    from workflows.shared.workflow_state_store import list_workflow_states, load_workflow_state
+
+    # Newest first
+    states = list_workflow_states("academic_lit_review", limit=10000)
+    if not states:
+        raise SystemExit("No saved academic_lit_review workflow states")
+
+    for info in states:
+        data = load_workflow_state("academic_lit_review", info["run_id"])
+        if data and data.get("input", {}).get("topic", "") == topic:
+            return data
+
+    raise SystemExit(f"No saved workflow state found for topic '{topic[:60]}...'\nSearched {len(states)} states")
 
 
 def _save_output(report: str, topic: str) -> Path:
@@ -123,17 +123,20 @@ async def submit_convert(request: ConvertRequest) -> JobSubmitResponse:
 
 @app.post("/convert/batch", response_model=list[JobSubmitResponse])
 async def submit_batch_convert(request: BatchConvertRequest) -> list[JobSubmitResponse]:
-    """Submit multiple documents for conversion."""
-    responses = []
+    """Submit multiple documents for conversion.
+
+    Every entry is validated before any is queued, so a rejected batch
+    submits nothing and can safely be retried entry by entry.
+    """
     for file_request in request.files:
-        # Validate each request
         if file_request.quality not in QUALITY_PRESETS:
             raise HTTPException(
                 status_code=400,
                 detail=f"Invalid quality preset for {file_request.file_path}",
             )
 
-        # Submit task
+    responses = []
+    for file_request in request.files:
         task = convert_document.delay(
             file_path=file_request.file_path,
             quality=file_request.quality,
@@ -8,6 +8,7 @@
  *   GET  /local-crud/ping    - Health check
  *   POST /local-crud/items   - Create item
  *   POST /local-crud/item    - Get/Update/Delete item (action in body)
+ *   POST /local-crud/items/delete - Delete several items
  *   POST /local-crud/search  - Search items
  */
 
@@ -44,14 +45,16 @@ function registerEndpoints() {
     Zotero.Server.Endpoints["/local-crud/ping"] = PingEndpoint;
     Zotero.Server.Endpoints["/local-crud/items"] = CreateItemEndpoint;
     Zotero.Server.Endpoints["/local-crud/item"] = ItemEndpoint;
+    Zotero.Server.Endpoints["/local-crud/items/delete"] = DeleteItemsEndpoint;
     Zotero.Server.Endpoints["/local-crud/search"] = SearchEndpoint;
-    Zotero.debug("Local CRUD API: Registered 4 endpoints");
+    Zotero.debug("Local CRUD API: Registered 5 endpoints");
 }
 
 function unregisterEndpoints() {
     delete Zotero.Server.Endpoints["/local-crud/ping"];
     delete Zotero.Server.Endpoints["/local-crud/items"];
     delete Zotero.Server.Endpoints["/local-crud/item"];
+    delete Zotero.Server.Endpoints["/local-crud/items/delete"];
     delete Zotero.Server.Endpoints["/local-crud/search"];
     Zotero.debug("Local CRUD API: Unregistered endpoints");
 }
@@ -382,6 +385,65 @@ ItemEndpoint.prototype = {
     }
 };
 
+/**
+ * POST /local-crud/items/delete
+ * Delete several items in one transaction
+ *
+ * Request body:
+ * {
+ *   "keys": ["XXXXXXXX", "YYYYYYYY"]
+ * }
+ *
+ * Response: { "deleted": [...keys], "missing": [...keys] }
+ */
+var DeleteItemsEndpoint = function() {};
+DeleteItemsEndpoint.prototype = {
+    supportedMethods: ["POST"],
+    supportedDataTypes: ["application/json"],
+    permitBookmarklet: false,
+
+    init: async function(request) {
+        try {
+            var data = parseJSON(request.data);
+
+            if (data === null) {
+                return jsonResponse(400, { error: "Invalid JSON in request body" });
+            }
+
+            if (!Array.isArray(data.keys)) {
+                return jsonResponse(400, { error: "keys must be an array" });
+            }
+
+            var libraryID = Zotero.Libraries.userLibraryID;
+            var itemIDs = [];
+            var deleted = [];
+            var missing = [];
+            for (let key of data.keys) {
+                var itemID = Zotero.Items.getIDFromLibraryAndKey(libraryID, key);
+                if (itemID) {
+                    itemIDs.push(itemID);
+                    deleted.push(key);
+                } else {
+                    missing.push(key);
+                }
+            }
+
+            // Items.erase() wraps every deletion in a single transaction
+            if (itemIDs.length > 0) {
+                await Zotero.Items.erase(itemIDs);
+            }
+
+            Zotero.debug("Local CRUD API: Deleted " + itemIDs.length + " items");
+
+            return jsonResponse(200, { deleted: deleted, missing: missing });
+
+        } catch (e) {
+            Zotero.debug("Local CRUD API Error (delete items): " + e.message);
+            return jsonResponse(500, { error: e.message });
+        }
+    }
+};
+
 /**
  * POST /local-crud/search
  * Search for items
@@ -393,9 +455,12 @@ ItemEndpoint.prototype = {
  *     { "condition": "tag", "operator": "is", "value": "mytag" }
  *   ],
  *   "limit": 100,
+ *   "offset": 0,
  *   "includeFullData": false
  * }
  *
+ * Results are ordered by itemID, so offset/limit pages through a stable list.
+ *
  * Condition operators: is, isNot, contains, doesNotContain, isLessThan, isGreaterThan, isBefore, isAfter, etc.
  * Special conditions: quicksearch-everything, quicksearch-titleCreatorYear
  */
@@ -415,6 +480,7 @@ SearchEndpoint.prototype = {
 
             var conditions = data.conditions || [];
             var limit = data.limit || 100;
+            var offset = data.offset || 0;
             var includeFullData = data.includeFullData || false;
 
             // Create search object
@@ -442,10 +508,9 @@ SearchEndpoint.prototype = {
             // Execute search
             var itemIDs = await search.search();
 
-            // Apply limit
-            if (itemIDs.length > limit) {
-                itemIDs = itemIDs.slice(0, limit);
-            }
+            // Apply offset and limit
+            itemIDs.sort((a, b) => a - b);
+            itemIDs = itemIDs.slice(offset, offset + limit);
 
             // Get items
             var items = await Zotero.Items.getAsync(itemIDs);
@@ -469,6 +534,7 @@ SearchEndpoint.prototype = {
             return jsonResponse(200, {
                 total: results.length,
                 limit: limit,
+                offset: offset,
                 items: results
             });
 
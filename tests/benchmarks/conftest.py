@@ -0,0 +1,56 @@
+"""Configuration for the pytest-benchmark suite.
+
+Benchmarks use synthetic data and temp directories only, so they run
+offline. Results are stored under .thala/benchmarks (override with
+--benchmark-storage). When comparing against a stored run without an
+explicit --benchmark-compare-fail, a median regression above
+THALA_BENCHMARK_MAX_REGRESSION percent (integer, default 25) fails the run.
+"""
+
+import os
+
+import pytest
+
+try:
+    import pytest_benchmark  # noqa: F401
+except ImportError:
+    # pytest-benchmark is a dev dependency; without it there is nothing to run
+    collect_ignore_glob = ["test_*.py"]
+else:
+    from pytest_benchmark.storage.file import FileStorage
+    from pytest_benchmark.utils import parse_compare_fail
+
+from core.task_queue.paths import THALA_DIR
+
+BASELINE_DIR = THALA_DIR / "benchmarks"
+DEFAULT_MAX_REGRESSION = 25
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_configure(config):
+    session = getattr(config, "_benchmarksession", None)
+    if session is None:
+        return
+
+    if config.getoption("benchmark_storage") == "file://./.benchmarks":
+        session.storage = FileStorage(
+            BASELINE_DIR,
+            logger=session.logger,
+            default_machine_id=session.machine_id,
+        )
+        # The plugin already loaded --benchmark-compare runs from the default path
+        session.handle_loading()
+
+    if session.compare and not session.compare_fail:
+        threshold = int(os.getenv("THALA_BENCHMARK_MAX_REGRESSION", DEFAULT_MAX_REGRESSION))
+        session.compare_fail = [parse_compare_fail(f"median:{threshold}%")]
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    """Point the persistent cache at a temp directory."""
+    from workflows.shared import persistent_cache
+
+    monkeypatch.setattr(persistent_cache, "CACHE_DIR", tmp_path / "cache")
+    monkeypatch.setattr(persistent_cache, "CACHE_DISABLED", False)
+    return tmp_path / "cache"
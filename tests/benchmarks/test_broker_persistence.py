@@ -0,0 +1,62 @@
+"""Benchmarks for the LLM broker's file-backed queue."""
+
+import asyncio
+
+import pytest
+
+from core.llm_broker.persistence import BrokerPersistence
+from core.llm_broker.schemas import LLMRequest
+
+MODEL = "claude-sonnet-4-5-20250929"
+
+
+def _requests(n: int) -> list[LLMRequest]:
+    return [LLMRequest.create(prompt=f"Summarise document {i}. " * 10, model=MODEL) for i in range(n)]
+
+
+@pytest.fixture
+def run():
+    loop = asyncio.new_event_loop()
+    yield loop.run_until_complete
+    loop.close()
+
+
+@pytest.fixture
+def persistence(tmp_path, run):
+    store = BrokerPersistence(tmp_path / "broker")
+    run(store.initialize())
+    return store
+
+
+def _seed(persistence: BrokerPersistence, run, n: int) -> None:
+    run(persistence.add_requests(_requests(n)))
+
+
+def test_add_request_to_populated_queue(benchmark, persistence, run):
+    _seed(persistence, run, 500)
+
+    benchmark(lambda: run(persistence.add_request(_requests(1)[0])))
+
+
+def test_add_requests_bulk(benchmark, persistence, run):
+    batch = _requests(100)
+
+    def setup():
+        run(persistence.write_queue(persistence._empty_queue()))
+        return (), {}
+
+    benchmark.pedantic(lambda: run(persistence.add_requests(batch)), setup=setup, rounds=20)
+
+
+def test_dequeue_for_submission(benchmark, persistence, run):
+    def setup():
+        run(persistence.write_queue(persistence._empty_queue()))
+        _seed(persistence, run, 500)
+        return (), {}
+
+    async def dequeue():
+        queued = await persistence.get_queued_requests()
+        await persistence.mark_requests_submitted([r.request_id for r in queued], "batch-bench")
+        return len(queued)
+
+    assert benchmark.pedantic(lambda: run(dequeue()), setup=setup, rounds=20) == 500
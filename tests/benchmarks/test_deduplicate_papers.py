@@ -0,0 +1,58 @@
+"""Benchmark for paper deduplication over 5k synthetic papers."""
+
+import logging
+import random
+
+import pytest
+
+from tests.factories import make_paper_metadata
+from workflows.research.academic_lit_review.utils.conversion import deduplicate_papers
+
+N_PAPERS = 5000
+
+
+@pytest.fixture(scope="module")
+def papers():
+    rng = random.Random(42)
+    unique = [
+        make_paper_metadata(
+            doi=f"10.1000/bench.{i}",
+            title=f"Study {i} of {rng.choice(['soil', 'river', 'urban', 'coastal'])} ecosystems",
+            authors=[f"Author{i} Smith", f"Coauthor{i % 97} Jones"],
+            year=2000 + i % 25,
+        )
+        for i in range(int(N_PAPERS * 0.85))
+    ]
+    # ~10% exact DOI duplicates, ~5% title+author duplicates under another DOI
+    doi_dups = [dict(p) for p in rng.sample(unique, int(N_PAPERS * 0.10))]
+    title_dups = [
+        {**p, "doi": f"10.2000/preprint.{i}", "title": p["title"].upper()}
+        for i, p in enumerate(rng.sample(unique, N_PAPERS - len(unique) - len(doi_dups)))
+    ]
+    mixed = unique + doi_dups + title_dups
+    rng.shuffle(mixed)
+    return mixed
+
+
+@pytest.fixture(autouse=True)
+def _quiet_logs():
+    logger = logging.getLogger("workflows.research.academic_lit_review.utils.conversion")
+    previous = logger.level
+    logger.setLevel(logging.WARNING)
+    yield
+    logger.setLevel(previous)
+
+
+def test_deduplicate_5k(benchmark, papers):
+    result = benchmark(deduplicate_papers, papers)
+
+    assert len(result) == int(N_PAPERS * 0.85)
+
+
+def test_deduplicate_against_existing(benchmark, papers):
+    existing = papers[:1000]
+    existing_dois = {p["doi"] for p in existing}
+
+    result = benchmark(deduplicate_papers, papers[1000:], existing_dois, existing)
+
+    assert all(p["doi"] not in existing_dois for p in result)
@@ -0,0 +1,53 @@
+"""Benchmarks for DocumentModel parsing and transactions on a 200-section doc."""
+
+import pytest
+
+from workflows.enhance.editing.document_model import ContentBlock
+from workflows.enhance.editing.parser import parse_markdown_to_model
+
+N_SECTIONS = 200
+
+
+def _name(i: int) -> str:
+    # Letters only: the parser merges headings that normalise to the same text
+    return "".join("abcdefghijklmnopqrstuvwxyz"[int(d)] for d in str(i)).title()
+
+
+def _markdown(n_sections: int) -> str:
+    parts = ["# Synthetic Review", "", "An introductory paragraph before any section.", ""]
+    for i in range(n_sections):
+        level = "##" if i % 4 == 0 else "###"
+        parts += [f"{level} Topic {_name(i)}", ""]
+        for j in range(3):
+            parts += [f"Paragraph {j} of section {i} discusses finding {i * 3 + j} in some detail. " * 3, ""]
+    return "\n".join(parts)
+
+
+@pytest.fixture(scope="module")
+def markdown():
+    return _markdown(N_SECTIONS)
+
+
+def test_parse_markdown(benchmark, markdown):
+    model = benchmark(parse_markdown_to_model, markdown)
+
+    assert len(model.get_all_sections()) >= N_SECTIONS
+
+
+def test_transaction_insert_and_replace(benchmark, markdown):
+    def setup():
+        model = parse_markdown_to_model(markdown)
+        sections = model.get_all_sections()
+        targets = [sections[i].blocks[0].block_id for i in range(0, len(sections), 20) if sections[i].blocks]
+        return (model, targets), {}
+
+    def edit(model, targets):
+        with model.transaction() as txn:
+            for i, block_id in enumerate(targets):
+                txn.insert_block_after(block_id, ContentBlock.from_content(f"Inserted paragraph {i}."))
+                txn.replace_block(block_id, ContentBlock.from_content(f"Rewritten paragraph {i}."))
+        return model
+
+    model = benchmark.pedantic(edit, setup=setup, rounds=10)
+
+    assert "Rewritten paragraph 0." in model.to_markdown()
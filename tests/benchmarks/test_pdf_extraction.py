@@ -0,0 +1,44 @@
+"""Benchmarks for CPU PDF extraction on a generated 300-page document."""
+
+import asyncio
+
+import pytest
+
+from core.scraping.pdf.cpu_extractor import CpuExtractor, _extract_sync
+
+N_PAGES = 300
+
+
+@pytest.fixture(scope="module")
+def pdf():
+    import fitz
+
+    doc = fitz.open()
+    for i in range(N_PAGES):
+        page = doc.new_page()
+        text = f"Page {i + 1}. " + "Born-digital body text with a reasonable amount of prose. " * 40
+        page.insert_textbox(fitz.Rect(72, 72, 540, 720), text, fontsize=10)
+    data = doc.tobytes()
+    doc.close()
+    return data
+
+
+def test_extract_in_thread(benchmark, pdf):
+    result = benchmark(_extract_sync, pdf)
+
+    assert result.page_count == N_PAGES
+
+
+def test_extract_in_process_pool(benchmark, pdf):
+    loop = asyncio.new_event_loop()
+    extractor = CpuExtractor(max_workers=1, process_min_pages=1)
+    try:
+        # Warm up: start the forkserver and workers outside the timed rounds
+        loop.run_until_complete(extractor.extract(pdf))
+
+        result = benchmark(lambda: loop.run_until_complete(extractor.extract(pdf)))
+    finally:
+        loop.run_until_complete(extractor.shutdown())
+        loop.close()
+
+    assert result.page_count == N_PAGES
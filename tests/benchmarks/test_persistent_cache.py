@@ -0,0 +1,35 @@
+"""Benchmarks for the file-backed persistent cache."""
+
+import itertools
+
+import pytest
+
+from workflows.shared import persistent_cache
+
+PAYLOAD = {
+    "title": "Synthetic cached response",
+    "results": [{"id": i, "score": i / 100, "text": "lorem ipsum " * 20} for i in range(50)],
+}
+
+
+@pytest.mark.parametrize("fmt", ["pickle", "json"])
+def test_set_cached(benchmark, cache_dir, fmt):
+    # Rotate over a fixed key set so the cache directory does not grow per round
+    keys = itertools.cycle([f"key-{i}" for i in range(100)])
+
+    benchmark(lambda: persistent_cache.set_cached("bench", next(keys), PAYLOAD, format=fmt))
+
+
+@pytest.mark.parametrize("fmt", ["pickle", "json"])
+def test_get_cached_hit(benchmark, cache_dir, fmt):
+    persistent_cache.set_cached("bench", "hot", PAYLOAD, format=fmt)
+
+    result = benchmark(persistent_cache.get_cached, "bench", "hot", format=fmt)
+
+    assert result == PAYLOAD
+
+
+def test_get_cached_miss(benchmark, cache_dir):
+    result = benchmark(persistent_cache.get_cached, "bench", "absent")
+
+    assert result is None
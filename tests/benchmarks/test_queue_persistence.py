@@ -0,0 +1,74 @@
+"""Benchmarks for the task queue's queue.json persistence at 1k tasks."""
+
+import uuid
+from datetime import datetime, timezone
+
+import pytest
+
+from core.task_queue.persistence import QueuePersistence
+
+N_TASKS = 1000
+
+
+def _task(i: int) -> dict:
+    now = datetime.now(timezone.utc).isoformat()
+    return {
+        "id": str(uuid.uuid4()),
+        "task_type": "lit_review_full",
+        "topic": f"Synthetic research topic number {i}",
+        "research_questions": [f"How does factor {j} affect outcome {i}?" for j in range(3)],
+        "category": "science",
+        "priority": i % 4 + 1,
+        "status": "pending" if i % 3 else "completed",
+        "quality": "standard",
+        "language": "en",
+        "date_range": None,
+        "web_scan_window_days": None,
+        "created_at": now,
+        "started_at": now if i % 3 == 0 else None,
+        "completed_at": now if i % 3 == 0 else None,
+        "langsmith_run_id": None,
+        "current_phase": "supervision" if i % 5 == 0 else None,
+        "error_message": None,
+        "notes": None,
+        "tags": ["synthetic", f"batch-{i // 100}"],
+    }
+
+
+@pytest.fixture
+def queue():
+    return {
+        "version": "2.0",
+        "categories": ["science", "philosophy", "technology"],
+        "last_category_index": 0,
+        "research_tasks": [_task(i) for i in range(N_TASKS)],
+        "publish_tasks": [],
+        "last_updated": datetime.now(timezone.utc).isoformat(),
+    }
+
+
+@pytest.fixture
+def persistence(tmp_path, queue):
+    store = QueuePersistence(tmp_path / "queue.json", tmp_path / "queue.lock")
+    store.write_queue(queue)
+    return store
+
+
+def test_read_queue(benchmark, persistence):
+    result = benchmark(persistence.read_queue)
+
+    assert len(result["research_tasks"]) == N_TASKS
+
+
+def test_write_queue(benchmark, persistence, queue):
+    benchmark(persistence.write_queue, queue)
+
+
+def test_locked_read_modify_write(benchmark, persistence):
+    def update():
+        with persistence.lock():
+            data = persistence.read_queue()
+            data["research_tasks"][0]["status"] = "in_progress"
+            persistence.write_queue(data)
+
+    benchmark(update)
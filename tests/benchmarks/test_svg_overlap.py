@@ -0,0 +1,35 @@
+"""Benchmarks for SVG text overlap checks on a dense synthetic diagram."""
+
+import random
+
+import pytest
+
+from workflows.shared.diagram_utils.overlap import check_text_overlaps, check_text_shape_overlaps
+
+N_LABELS = 200
+
+
+@pytest.fixture(scope="module")
+def svg():
+    rng = random.Random(7)
+    elements = []
+    for i in range(N_LABELS):
+        x, y = rng.randint(20, 1180), rng.randint(20, 780)
+        elements.append(f'<text x="{x}" y="{y}" font-size="14">Label number {i}</text>')
+        elements.append(f'<circle cx="{x + rng.randint(-40, 40)}" cy="{y + rng.randint(-20, 20)}" r="6"/>')
+    body = "\n  ".join(elements)
+    return (
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="1200" height="800" viewBox="0 0 1200 800">\n  {body}\n</svg>'
+    )
+
+
+def test_check_text_overlaps(benchmark, svg):
+    result = benchmark(check_text_overlaps, svg)
+
+    assert result.has_overlaps
+
+
+def test_check_text_shape_overlaps(benchmark, svg):
+    result = benchmark(check_text_shape_overlaps, svg)
+
+    assert isinstance(result, list)
@@ -0,0 +1,95 @@
+"""Benchmarks for the token counting service on paper-sized markdown.
+
+Uses the real cl100k_base vocabulary when tiktoken has it cached, otherwise
+an offline encoding with the same pre-tokenizer (tests/factories/tokenizers).
+"""
+
+import pytest
+import tiktoken
+
+from tests.factories.tokenizers import make_offline_encoding, paper_markdown
+from workflows.shared.token_utils import TokenCounter
+
+N_PAPERS = 16
+
+
+@pytest.fixture(scope="module")
+def encoding():
+    try:
+        return tiktoken.get_encoding("cl100k_base")
+    except Exception:
+        return make_offline_encoding()
+
+
+@pytest.fixture(scope="module")
+def papers():
+    return [paper_markdown(seed=i) for i in range(N_PAPERS)]
+
+
+def test_count_uncached(benchmark, encoding, papers):
+    counter = TokenCounter(encoding=encoding)
+
+    def setup():
+        counter.clear_cache()
+        return (papers[0],), {}
+
+    benchmark.pedantic(counter.count, setup=setup, rounds=30)
+
+
+def test_count_cached(benchmark, encoding, papers):
+    counter = TokenCounter(encoding=encoding)
+    counter.count(papers[0])
+
+    benchmark(counter.count, papers[0])
+
+
+def test_count_papers_sequentially(benchmark, encoding, papers):
+    counter = TokenCounter(encoding=encoding)
+
+    def setup():
+        counter.clear_cache()
+        return (), {}
+
+    benchmark.pedantic(lambda: [counter.count(p) for p in papers], setup=setup, rounds=10)
+
+
+def test_count_papers_batched(benchmark, encoding, papers):
+    counter = TokenCounter(encoding=encoding)
+
+    def setup():
+        counter.clear_cache()
+        return (papers,), {}
+
+    counts = benchmark.pedantic(counter.count_many, setup=setup, rounds=10)
+
+    assert counts == [len(encoding.encode(p, disallowed_special=())) for p in papers]
+
+
+def test_recount_after_appending_section(benchmark, encoding, papers):
+    # Growing a document section by section: recount the whole thing
+    counter = TokenCounter(encoding=encoding)
+    sections = papers[0].split("\n## ")
+
+    def setup():
+        counter.clear_cache()
+        counter.count_many(sections)
+        return (), {}
+
+    benchmark.pedantic(lambda: counter.count("\n## ".join(sections) + "\n## Appendix"), setup=setup, rounds=30)
+
+
+def test_count_concat_after_appending_section(benchmark, encoding, papers):
+    # Same document counted incrementally from cached section counts
+    counter = TokenCounter(encoding=encoding)
+    sections = papers[0].split("\n## ")
+
+    def setup():
+        counter.clear_cache()
+        counter.count_many(sections)
+        return (), {}
+
+    total = benchmark.pedantic(
+        lambda: counter.count_concat([*sections, "Appendix"], separator="\n## "), setup=setup, rounds=30
+    )
+
+    assert total == len(encoding.encode("\n## ".join(sections) + "\n## Appendix", disallowed_special=()))
@@ -0,0 +1,85 @@
+"""Benchmarks for workflow state serializers on a synthetic lit-review state.
+
+Each save benchmark records the file size and the peak Python allocation
+of one save (tracemalloc) in extra_info, so formats can be compared on
+memory as well as time.
+"""
+
+import tracemalloc
+from datetime import datetime, timedelta
+
+import pytest
+
+from workflows.shared import workflow_state_store as store
+
+N_PAPERS = 1500
+FORMATS = ["json", "msgpack"]
+
+
+def _state(n_papers: int) -> dict:
+    start = datetime(2026, 1, 1)
+    corpus = {
+        f"10.1234/paper.{i}": {
+            "title": f"Synthetic paper {i} on soil carbon sequestration",
+            "authors": [f"Author {i}-{j}" for j in range(4)],
+            "year": 1990 + i % 35,
+            "abstract": "We study the long-term effects of cover cropping on soil organic carbon. " * 8,
+            "retrieved_at": start + timedelta(minutes=i),
+        }
+        for i in range(n_papers)
+    }
+    summaries = {
+        doi: {"summary": "Key findings and methods, summarised. " * 15, "themes": ["carbon", "tillage"]}
+        for doi in corpus
+    }
+    return {
+        "input": {"topic": "soil carbon", "quality": "standard"},
+        "paper_corpus": corpus,
+        "paper_summaries": summaries,
+        "final_review": "# Review\n\n" + "Synthesis paragraph. " * 5000,
+        "started_at": start,
+    }
+
+
+@pytest.fixture(scope="module")
+def state():
+    return _state(N_PAPERS)
+
+
+@pytest.fixture
+def store_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(store, "STATE_STORE_DIR", tmp_path)
+    monkeypatch.setenv("THALA_PERSIST_STATE", "1")
+    return tmp_path
+
+
+@pytest.mark.parametrize("fmt", FORMATS)
+def test_save_state(benchmark, store_dir, state, fmt):
+    tracemalloc.start()
+    path = store.save_workflow_state("bench", "run", state, format=fmt)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    benchmark.extra_info["file_bytes"] = path.stat().st_size
+    benchmark.extra_info["peak_alloc_bytes"] = peak
+
+    benchmark(store.save_workflow_state, "bench", "run", state, format=fmt)
+
+
+@pytest.mark.parametrize("fmt", FORMATS)
+def test_load_state(benchmark, store_dir, state, fmt):
+    store.save_workflow_state("bench", "run", state, format=fmt)
+
+    loaded = benchmark(store.load_workflow_state, "bench", "run")
+
+    assert loaded["started_at"] == state["started_at"]
+    assert len(loaded["paper_corpus"]) == N_PAPERS
+
+
+def test_list_states(benchmark, store_dir):
+    for i in range(200):
+        store.save_workflow_state("bench", f"run{i}", {"i": i, "keys": list(range(10))})
+
+    states = benchmark(store.list_workflow_states, "bench", 1000)
+
+    assert len(states) == 200
@@ -110,6 +110,24 @@ def configure_llm_broker_fast_mode():
     reset_broker_config()
 
 
+@pytest.fixture(scope="session", autouse=True)
+def isolate_usage_ledger(tmp_path_factory: pytest.TempPathFactory) -> Generator[None, None, None]:
+    """Record LLM usage from tests in a throwaway ledger, not .thala/state."""
+    from core.task_queue.budget.ledger import set_usage_ledger
+
+    orig_path = os.environ.get("THALA_USAGE_LEDGER_PATH")
+    os.environ["THALA_USAGE_LEDGER_PATH"] = str(tmp_path_factory.mktemp("ledger") / "usage_ledger.sqlite3")
+    set_usage_ledger(None)
+
+    yield
+
+    if orig_path is None:
+        os.environ.pop("THALA_USAGE_LEDGER_PATH", None)
+    else:
+        os.environ["THALA_USAGE_LEDGER_PATH"] = orig_path
+    set_usage_ledger(None)
+
+
 @pytest.fixture(autouse=True)
 def logging_run(request: pytest.FixtureRequest) -> Generator[None, None, None]:
     """Rotate logs at test module boundaries.
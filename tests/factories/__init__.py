@@ -377,6 +377,59 @@ def make_academic_paper_content(
     return "\n".join(content_parts)
 
 
+def make_paper_metadata(
+    doi: str | None = None,
+    title: str | None = None,
+    authors: list[str] | None = None,
+    year: int = 2020,
+    cited_by_count: int = 0,
+    **overrides: Any,
+) -> dict[str, Any]:
+    """Generate a PaperMetadata dict (academic lit review) for testing.
+
+    Args:
+        doi: Paper DOI (auto-generated if not provided)
+        title: Paper title (auto-generated if not provided)
+        authors: Author display names (two auto-generated if not provided)
+        year: Publication year
+        cited_by_count: Citation count
+        **overrides: Any other PaperMetadata fields
+
+    Returns:
+        PaperMetadata-shaped dict
+    """
+    n = _next_counter()
+
+    if authors is None:
+        authors = [f"Alice Author{n}", f"Bob Writer{n}"]
+
+    paper = {
+        "doi": doi or f"10.1234/test.{n}",
+        "title": title or f"A Study of Test Phenomena in Domain {n}",
+        "authors": [{"name": name} for name in authors],
+        "publication_date": f"{year}-01-01",
+        "year": year,
+        "venue": "Journal of Testing",
+        "cited_by_count": cited_by_count,
+        "abstract": f"Abstract for test paper {n}.",
+        "openalex_id": f"W{n}",
+        "primary_topic": None,
+        "is_oa": False,
+        "oa_url": None,
+        "oa_urls": [],
+        "pmcid": None,
+        "oa_status": None,
+        "referenced_works": [],
+        "citing_works_count": cited_by_count,
+        "retrieved_at": None,
+        "discovery_stage": 0,
+        "discovery_method": "keyword",
+        "relevance_score": None,
+    }
+    paper.update(overrides)
+    return paper
+
+
 # Export all factory functions
 __all__ = [
     "make_zotero_item_create",
@@ -385,4 +438,5 @@ __all__ = [
     "make_coherence_record",
     "make_base_record",
     "make_academic_paper_content",
+    "make_paper_metadata",
 ]
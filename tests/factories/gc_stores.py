@@ -0,0 +1,115 @@
+"""In-memory stand-ins for the stores core.stores.gc streams and deletes.
+
+Each fake implements only the paged-read and bulk-delete surface the GC
+engine uses, and appends to a shared ``log`` so tests can check the order
+in which stages ran and how many requests each made.
+"""
+
+from uuid import UUID, uuid4
+
+from core.stores.schema import RecordView, SourceType
+from core.stores.zotero.schemas import ZoteroSearchResult
+
+
+class FakeZotero:
+    def __init__(self, keys, log):
+        self.items = {key: f"Title {key}" for key in keys}
+        self.log = log
+        self.fail_batches = 0
+
+    async def iter_all(self, page_size=1000):
+        keys = sorted(self.items)
+        for start in range(0, len(keys), page_size):
+            self.log.append(("zotero.page", len(keys[start : start + page_size])))
+            for i, key in enumerate(keys[start : start + page_size]):
+                yield ZoteroSearchResult(key=key, itemID=start + i, itemType="journalArticle", title=self.items[key])
+
+    async def delete_many(self, zotero_keys, batch_size=100):
+        if self.fail_batches:
+            self.fail_batches -= 1
+            raise RuntimeError("zotero unavailable")
+        self.log.append(("zotero.delete", len(zotero_keys)))
+        return sum(self.items.pop(key, None) is not None for key in zotero_keys)
+
+
+class FakeMainStore:
+    def __init__(self, log):
+        self.levels: dict[int, dict[UUID, RecordView]] = {0: {}, 1: {}, 2: {}}
+        self.forgotten: list[tuple[UUID, int, str]] = []
+        self.log = log
+
+    async def scan(self, fields, query=None, compression_level=None, page_size=1000):
+        records = list(self.levels[compression_level].values())
+        for start in range(0, len(records), page_size):
+            self.log.append((f"es_l{compression_level}.page", len(records[start : start + page_size])))
+            for record in records[start : start + page_size]:
+                yield record
+
+    async def delete_many(self, record_ids, reason, compression_level, batch_size=500):
+        self.log.append((f"es_l{compression_level}.delete", len(record_ids)))
+        level = self.levels[compression_level]
+        deleted = 0
+        for rid in record_ids:
+            if level.pop(rid, None) is not None:
+                self.forgotten.append((rid, compression_level, reason))
+                deleted += 1
+        return deleted
+
+
+class FakeES:
+    def __init__(self, log):
+        self.store = FakeMainStore(log)
+
+
+class FakeChroma:
+    def __init__(self, log):
+        self.rows: dict[UUID, dict] = {}
+        self.who_i_was: list[tuple[UUID, str]] = []
+        self.log = log
+
+    async def scan_metadata(self, page_size=1000):
+        rows = list(self.rows.items())
+        for start in range(0, len(rows), page_size):
+            self.log.append(("chroma.page", len(rows[start : start + page_size])))
+            for rid, metadata in rows[start : start + page_size]:
+                yield rid, metadata
+
+    async def delete_many(self, record_ids, reason="Deleted via API", batch_size=500):
+        self.log.append(("chroma.delete", len(record_ids)))
+        deleted = 0
+        for rid in record_ids:
+            if self.rows.pop(rid, None) is not None:
+                self.who_i_was.append((rid, reason))
+                deleted += 1
+        return deleted
+
+
+def make_gc_stores(n_papers: int, n_internal: int = 0, n_unlinked_chroma: int = 0):
+    """Build a corpus of ``n_papers`` Zotero items, each with L0/L1/L2 records and a Chroma row.
+
+    Returns:
+        (zotero, es, chroma, log, keys) where keys are the papers' Zotero keys
+        in creation order
+    """
+    log: list[tuple[str, int]] = []
+    keys = [f"K{i:07d}" for i in range(n_papers)]
+    zotero, es, chroma = FakeZotero(keys, log), FakeES(log), FakeChroma(log)
+    levels = es.store.levels
+
+    for key in keys:
+        l0 = RecordView(id=uuid4(), zotero_key=key, source_type=SourceType.EXTERNAL)
+        levels[0][l0.id] = l0
+        for level in (1, 2):
+            summary = RecordView(id=uuid4(), source_ids=[l0.id])
+            levels[level][summary.id] = summary
+        chroma.rows[uuid4()] = {"zotero_key": key}
+
+    for _ in range(n_internal):
+        internal = RecordView(id=uuid4(), source_type=SourceType.INTERNAL)
+        levels[0][internal.id] = internal
+        summary = RecordView(id=uuid4(), source_ids=[internal.id])
+        levels[1][summary.id] = summary
+    for _ in range(n_unlinked_chroma):
+        chroma.rows[uuid4()] = {}
+
+    return zotero, es, chroma, log, keys
@@ -0,0 +1,79 @@
+"""Offline tiktoken encodings for token counting tests.
+
+tiktoken downloads the cl100k_base vocabulary on first use, which tests and
+benchmarks can't rely on. make_offline_encoding() builds an Encoding with
+cl100k's exact pre-tokenizer regex and a small BPE vocabulary trained on
+synthetic markdown, so piece boundaries behave exactly as in production.
+"""
+
+from collections import Counter
+from functools import lru_cache
+
+import regex
+import tiktoken
+
+# Pre-tokenizer pattern of tiktoken's cl100k_base
+CL100K_PAT_STR = (
+    r"""'(?i:[sdmt]|ll|ve|re)|[^\r\n\p{L}\p{N}]?+\p{L}++|\p{N}{1,3}+| ?[^\s\p{L}\p{N}]++[\r\n]*+|\s++$|\s*[\r\n]|"""
+    r"""\s+(?!\S)|\s"""
+)
+
+
+def paper_markdown(seed: int = 0, sections: int = 20, paragraphs: int = 6) -> str:
+    """Synthetic paper-sized markdown (about 60k characters by default)."""
+    parts = [f"# Effects of Cover Cropping on Soil Organic Carbon: Study {seed}", ""]
+    for s in range(sections):
+        parts += [f"## {s + 1}. Section on tillage regime {seed}-{s}", ""]
+        for p in range(paragraphs):
+            parts += [
+                f"Across {12 + p} field trials (n = {340 + s * 7}), cover cropping increased soil organic "
+                f"carbon by {0.3 + p / 10:.2f} Mg C ha⁻¹ yr⁻¹ relative to bare fallow [{s}{p}]. "
+                "The effect was strongest in the top 30 cm, where root exudates and residue inputs "
+                "dominate; deeper horizons showed no significant change (p > 0.05). Legume mixtures "
+                "outperformed cereal monocultures, although the difference narrowed after year five. "
+                "See Table 2 for the full breakdown by climate zone, texture class and rotation length.",
+                "",
+            ]
+        parts += ["| Zone | Δ SOC | CI |", "|---|---|---|", f"| Temperate | {s}.4 | ±0.{p} |", ""]
+    return "\n".join(parts)
+
+
+@lru_cache(maxsize=1)
+def make_offline_encoding(n_merges: int = 400) -> tiktoken.Encoding:
+    """cl100k-style Encoding trained offline on synthetic markdown."""
+    pattern = regex.compile(CL100K_PAT_STR)
+    words = Counter(
+        tuple(bytes([b]) for b in piece.encode("utf-8"))
+        for piece in pattern.findall(paper_markdown(seed=99, sections=4))
+    )
+    ranks = {bytes([i]): i for i in range(256)}
+
+    for _ in range(n_merges):
+        pairs: Counter = Counter()
+        for word, freq in words.items():
+            for pair in zip(word, word[1:]):
+                pairs[pair] += freq
+        if not pairs:
+            break
+        (a, b), _ = pairs.most_common(1)[0]
+        ranks[a + b] = len(ranks)
+
+        merged: Counter = Counter()
+        for word, freq in words.items():
+            out, i = [], 0
+            while i < len(word):
+                if i + 1 < len(word) and word[i] == a and word[i + 1] == b:
+                    out.append(a + b)
+                    i += 2
+                else:
+                    out.append(word[i])
+                    i += 1
+            merged[tuple(out)] += freq
+        words = merged
+
+    return tiktoken.Encoding(
+        name="cl100k_offline",
+        pat_str=CL100K_PAT_STR,
+        mergeable_ranks=ranks,
+        special_tokens={"<|endoftext|>": len(ranks), "<|endofprompt|>": len(ranks) + 1},
+    )
@@ -15,6 +15,7 @@ from core.llm_broker.exceptions import (
 )
 from core.llm_broker.schemas import (
     BatchPolicy,
+    RequestSpec,
     UserMode,
 )
 from workflows.shared.llm_utils import ModelTier
@@ -349,6 +350,84 @@ class TestQueueOverflow:
             reset_shutdown_coordinator()
 
 
+class TestRequestMany:
+    """Tests for bulk request submission."""
+
+    @pytest.mark.asyncio
+    async def test_futures_returned_in_order(self, broker):
+        """Test batch and sync routed requests keep their spec order."""
+        broker._execute_sync = AsyncMock()
+        specs = [
+            RequestSpec(prompt="a", model=ModelTier.SONNET, policy=BatchPolicy.FORCE_BATCH),
+            RequestSpec(prompt="b", model=ModelTier.SONNET, policy=BatchPolicy.REQUIRE_SYNC),
+            RequestSpec(prompt="c", model=ModelTier.HAIKU, policy=BatchPolicy.FORCE_BATCH),
+        ]
+
+        futures = await broker.request_many(specs)
+        await asyncio.sleep(0)
+
+        assert len(futures) == 3
+        queued = await broker._persistence.get_queued_requests()
+        assert [r.prompt for r in queued] == ["a", "c"]
+        assert broker._execute_sync.call_args.args[0].prompt == "b"
+        ids = list(broker._pending_futures)
+        assert [broker._pending_futures[i] for i in ids] == futures
+
+    @pytest.mark.asyncio
+    async def test_batch_requests_enqueued_in_one_transaction(self, broker):
+        """Test batch-routed requests share one persistence call."""
+        broker._persistence.add_request = AsyncMock(side_effect=AssertionError("per-request enqueue"))
+        add_requests = broker._persistence.add_requests
+        broker._persistence.add_requests = AsyncMock(side_effect=add_requests)
+
+        specs = [RequestSpec(prompt=str(i), model=ModelTier.SONNET, policy=BatchPolicy.FORCE_BATCH) for i in range(4)]
+        await broker.request_many(specs)
+
+        broker._persistence.add_requests.assert_awaited_once()
+        assert await broker._persistence.get_queue_size() == 4
+
+    @pytest.mark.asyncio
+    async def test_invalid_spec_queues_nothing(self, broker):
+        """Test validation happens before any request is queued."""
+        specs = [
+            RequestSpec(prompt="ok", model=ModelTier.SONNET, policy=BatchPolicy.FORCE_BATCH),
+            RequestSpec(prompt="bad", model=ModelTier.SONNET, max_tokens=0),
+        ]
+
+        with pytest.raises(ValueError, match="Request 1"):
+            await broker.request_many(specs)
+
+        assert await broker._persistence.get_queue_size() == 0
+        assert broker._pending_futures == {}
+
+    @pytest.mark.asyncio
+    async def test_reject_overflow_is_all_or_nothing(self, broker):
+        """Test a bulk request that overflows the queue queues nothing."""
+        broker._config.overflow_behavior = "reject"
+        specs = [RequestSpec(prompt=str(i), model=ModelTier.SONNET, policy=BatchPolicy.FORCE_BATCH) for i in range(11)]
+
+        with pytest.raises(QueueOverflowError):
+            await broker.request_many(specs)
+
+        assert await broker._persistence.get_queue_size() == 0
+        assert broker._pending_futures == {}
+
+    @pytest.mark.asyncio
+    async def test_sync_overflow_falls_back_for_excess(self, broker):
+        """Test requests beyond the queue cap run via the sync API."""
+        broker._config.overflow_behavior = "sync"
+        broker._config.batch_threshold = 100
+        broker._execute_sync = AsyncMock()
+        specs = [RequestSpec(prompt=str(i), model=ModelTier.SONNET, policy=BatchPolicy.FORCE_BATCH) for i in range(12)]
+
+        futures = await broker.request_many(specs)
+        await asyncio.sleep(0)
+
+        assert len(futures) == 12
+        assert await broker._persistence.get_queue_size() == 10
+        assert sorted(c.args[0].prompt for c in broker._execute_sync.call_args_list) == ["10", "11"]
+
+
 class TestFutureResolution:
     """Tests for Future resolution mechanics."""
 
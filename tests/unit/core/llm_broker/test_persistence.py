@@ -213,6 +213,41 @@ class TestBrokerPersistence:
 
         assert await persistence.get_queue_size() == 1
 
+    @pytest.mark.asyncio
+    async def test_add_requests_single_write(self, persistence):
+        """Test bulk add persists all requests with one queue write."""
+        await persistence.initialize()
+        requests = [LLMRequest.create(prompt=str(i), model="m") for i in range(5)]
+
+        writes = 0
+        write_queue = persistence.write_queue
+
+        async def counting_write(queue):
+            nonlocal writes
+            writes += 1
+            await write_queue(queue)
+
+        persistence.write_queue = counting_write
+        added, queued = await persistence.add_requests(requests)
+
+        assert (added, queued, writes) == (5, 5, 1)
+        stored = await persistence.get_queued_requests()
+        assert [r.request_id for r in stored] == [r.request_id for r in requests]
+
+    @pytest.mark.asyncio
+    async def test_add_requests_respects_max_queue_size(self, persistence):
+        """Test bulk add keeps the prefix that fits, or nothing if not partial."""
+        await persistence.initialize()
+        await persistence.add_request(LLMRequest.create(prompt="0", model="m"))
+        requests = [LLMRequest.create(prompt=str(i), model="m") for i in range(1, 4)]
+
+        assert await persistence.add_requests(requests, max_queue_size=3, partial=False) == (0, 1)
+        assert await persistence.get_queue_size() == 1
+
+        assert await persistence.add_requests(requests, max_queue_size=3) == (2, 3)
+        stored = await persistence.get_queued_requests()
+        assert [r.prompt for r in stored] == ["0", "1", "2"]
+
     @pytest.mark.asyncio
     async def test_atomic_write(self, persistence, temp_dir):
         """Test that writes are atomic (temp file + rename)."""
@@ -0,0 +1,74 @@
+"""FastAPI stand-in for the Marker service API used by the client tests.
+
+Mirrors the request/response shapes of services/marker/app/main.py without
+Celery or a GPU. A job completes `job_seconds` after submission with
+markdown naming its file; file paths containing "fail" produce a failed
+job and the quality "bogus" is rejected with 400 like the real service.
+Every request is recorded in `app.state.calls`.
+"""
+
+import time
+import uuid
+
+from fastapi import FastAPI, HTTPException
+from pydantic import BaseModel
+
+QUALITY_PRESETS = {"fast", "balanced", "quality"}
+
+
+class ConvertRequest(BaseModel):
+    file_path: str
+    quality: str = "balanced"
+    markdown_only: bool = False
+    langs: list[str] = ["English"]
+
+
+class BatchConvertRequest(BaseModel):
+    files: list[ConvertRequest]
+
+
+def create_app(job_seconds: float = 0.05) -> FastAPI:
+    app = FastAPI()
+    app.state.calls = []
+    jobs: dict[str, tuple[ConvertRequest, float]] = {}
+
+    def _submit(request: ConvertRequest) -> dict:
+        if request.quality not in QUALITY_PRESETS:
+            raise HTTPException(status_code=400, detail=f"Invalid quality preset for {request.file_path}")
+        job_id = str(uuid.uuid4())
+        jobs[job_id] = (request, time.monotonic() + job_seconds)
+        return {"job_id": job_id, "status": "pending"}
+
+    @app.get("/health")
+    async def health():
+        app.state.calls.append(("health", None))
+        return {"status": "healthy", "gpu_available": True, "gpu_name": None, "queue_depth": 0, "active_workers": 0}
+
+    @app.post("/convert")
+    async def convert(request: ConvertRequest):
+        app.state.calls.append(("convert", [request.file_path]))
+        return _submit(request)
+
+    @app.post("/convert/batch")
+    async def convert_batch(request: BatchConvertRequest):
+        app.state.calls.append(("batch", [f.file_path for f in request.files]))
+        for file_request in request.files:
+            if file_request.quality not in QUALITY_PRESETS:
+                raise HTTPException(status_code=400, detail=f"Invalid quality preset for {file_request.file_path}")
+        return [_submit(f) for f in request.files]
+
+    @app.get("/jobs/{job_id}")
+    async def job_status(job_id: str):
+        app.state.calls.append(("poll", job_id))
+        request, ready_at = jobs[job_id]
+        if time.monotonic() < ready_at:
+            return {"job_id": job_id, "status": "processing"}
+        if "fail" in request.file_path:
+            return {"job_id": job_id, "status": "failed", "error": "conversion crashed"}
+        return {
+            "job_id": job_id,
+            "status": "completed",
+            "result": {"markdown": f"# Converted {request.file_path}", "metadata": {}},
+        }
+
+    return app
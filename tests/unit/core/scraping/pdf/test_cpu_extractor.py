@@ -1,5 +1,6 @@
 """Unit tests for CPU extractor module."""
 
+import asyncio
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -391,3 +392,82 @@ class TestFormatPageBlocks:
         """Test formatting empty block list."""
         result = _format_page_blocks([])
         assert result == ""
+
+
+def _make_pdf(n_pages: int) -> bytes:
+    """Generate a born-digital PDF with one numbered paragraph per page."""
+    import fitz
+
+    doc = fitz.open()
+    for i in range(n_pages):
+        page = doc.new_page()
+        page.insert_text((72, 72), f"Content of page {i + 1}", fontsize=12)
+    data = doc.tobytes()
+    doc.close()
+    return data
+
+
+class TestProcessPoolExtraction:
+    """Tests for page-range extraction in worker processes."""
+
+    @pytest.mark.asyncio
+    async def test_matches_in_thread_extraction(self):
+        """Ranges are reassembled in page order, identical to a single pass."""
+        pdf = _make_pdf(25)
+
+        async with CpuExtractor(max_workers=1, process_workers=2, process_min_pages=10, pages_per_range=4) as extractor:
+            result = await extractor.extract(pdf)
+            assert extractor._process_pool is not None
+
+        assert result == _extract_sync(pdf)
+        assert result.page_count == 25
+        assert result.markdown.index("<!-- Page 9 -->") < result.markdown.index("<!-- Page 10 -->")
+
+    @pytest.mark.asyncio
+    async def test_pool_recycled_after_max_tasks(self):
+        """The worker pool is replaced once each worker has had its quota of ranges."""
+        pdf = _make_pdf(12)
+
+        async with CpuExtractor(
+            max_workers=1, process_workers=1, process_min_pages=10, pages_per_range=4, worker_max_tasks=3
+        ) as extractor:
+            first = await extractor.extract(pdf)
+            first_pool = extractor._process_pool
+            second = await extractor.extract(pdf)
+
+            assert extractor._process_pool is not first_pool
+            assert first == second
+
+    @pytest.mark.asyncio
+    async def test_concurrent_extractions_survive_pool_recycling(self):
+        """A pool recycled by a concurrent extraction is never submitted to afterwards."""
+        pdf = _make_pdf(12)
+
+        async with CpuExtractor(
+            max_workers=2, process_workers=1, process_min_pages=10, pages_per_range=4, worker_max_tasks=3
+        ) as extractor:
+            results = await asyncio.gather(*(extractor.extract(pdf) for _ in range(3)))
+
+        assert all(result == _extract_sync(pdf) for result in results)
+
+    @pytest.mark.asyncio
+    async def test_small_documents_stay_in_thread(self):
+        """Documents below the page threshold do not start worker processes."""
+        async with CpuExtractor(max_workers=1, process_min_pages=10) as extractor:
+            result = await extractor.extract(_make_pdf(3))
+            assert extractor._process_pool is None
+
+        assert result.page_count == 3
+
+    @pytest.mark.asyncio
+    async def test_broken_pool_falls_back_to_thread(self):
+        """A dead worker pool is discarded and the document extracted in-thread."""
+        from concurrent.futures.process import BrokenProcessPool
+
+        pdf = _make_pdf(12)
+        async with CpuExtractor(max_workers=1, process_min_pages=10) as extractor:
+            with patch.object(extractor, "_extract_in_processes", side_effect=BrokenProcessPool("worker died")):
+                result = await extractor.extract(pdf)
+
+            assert result.page_count == 12
+            assert extractor._process_pool is None
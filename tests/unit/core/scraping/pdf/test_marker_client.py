@@ -0,0 +1,179 @@
+"""Tests for the pooled Marker client against a local FastAPI stand-in."""
+
+import asyncio
+import itertools
+from contextlib import asynccontextmanager
+
+import httpx
+import pytest
+
+pytest.importorskip("fastapi")
+
+from core.scraping.pdf import marker_client, processor  # noqa: E402
+from core.scraping.pdf.marker_client import (  # noqa: E402
+    MarkerClient,
+    MarkerProcessingError,
+    estimate_job_seconds,
+    get_marker_client,
+    poll_schedule,
+)
+
+from .fake_marker_service import create_app  # noqa: E402
+
+
+@asynccontextmanager
+async def make_client(job_seconds: float = 0.05, **kwargs):
+    app = create_app(job_seconds=job_seconds)
+    options = dict(batch_window=0.02, min_poll_interval=0.01, max_poll_interval=0.05, submit_backoff=())
+    client = MarkerClient("http://marker", transport=httpx.ASGITransport(app=app), **{**options, **kwargs})
+    try:
+        yield client, app.state.calls
+    finally:
+        await client.aclose()
+
+
+def _payload(name: str, quality: str = "fast") -> dict:
+    return {"file_path": name, "quality": quality, "markdown_only": False, "langs": ["English"]}
+
+
+def _calls(calls, kind):
+    return [args for k, args in calls if k == kind]
+
+
+class TestPollSchedule:
+    def test_halves_towards_estimate_then_backs_off(self):
+        delays = list(itertools.islice(poll_schedule(estimate=8.0, min_interval=1.0, max_interval=3.0), 8))
+
+        # 3 (capped), 2.5, 1.25, 1, 1 -> first poll after the estimate, then doubling
+        assert delays[:5] == [3.0, 2.5, 1.25, 1.0, 1.0]
+        assert delays[5:] == [1.0, 2.0, 3.0]
+
+    def test_estimate_grows_with_pages_and_quality(self):
+        assert (
+            estimate_job_seconds(100, "quality") > estimate_job_seconds(100, "fast") > estimate_job_seconds(10, "fast")
+        )
+        assert estimate_job_seconds(None) == estimate_job_seconds(0)
+
+
+class TestBatchedSubmission:
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_share_one_batch_call(self):
+        async with make_client() as (client, calls):
+            job_ids = await asyncio.gather(*(client.submit(_payload(f"doc{i}.pdf")) for i in range(5)))
+
+            assert len(set(job_ids)) == 5
+            assert _calls(calls, "batch") == [[f"doc{i}.pdf" for i in range(5)]]
+            assert not _calls(calls, "convert")
+
+    @pytest.mark.asyncio
+    async def test_lone_request_uses_single_endpoint(self):
+        async with make_client() as (client, calls):
+            await client.submit(_payload("only.pdf"))
+
+            assert _calls(calls, "convert") == [["only.pdf"]]
+            assert not _calls(calls, "batch")
+
+    @pytest.mark.asyncio
+    async def test_full_batch_is_sent_without_waiting_for_window(self):
+        async with make_client(batch_window=10, max_batch_size=3) as (client, calls):
+            await asyncio.wait_for(asyncio.gather(*(client.submit(_payload(f"d{i}.pdf")) for i in range(3))), 1)
+
+            assert len(_calls(calls, "batch")) == 1
+
+    @pytest.mark.asyncio
+    async def test_unknown_quality_rejected_before_batching(self):
+        async with make_client() as (client, calls):
+            results = await asyncio.gather(
+                client.submit(_payload("good.pdf")),
+                client.submit(_payload("bad.pdf", quality="bogus")),
+                return_exceptions=True,
+            )
+
+            assert isinstance(results[0], str)
+            assert isinstance(results[1], MarkerProcessingError)
+            assert _calls(calls, "batch") == []
+            assert [args[0] for args in _calls(calls, "convert")] == ["good.pdf"]
+
+    @pytest.mark.asyncio
+    async def test_rejected_batch_falls_back_to_individual_submissions(self):
+        async with make_client() as (client, calls):
+            malformed = {"quality": "fast"}  # no file_path: the batch fails validation as a whole
+            results = await asyncio.gather(
+                client.submit(_payload("good.pdf")),
+                client.submit(malformed),
+                return_exceptions=True,
+            )
+
+            assert isinstance(results[0], str)
+            assert isinstance(results[1], MarkerProcessingError)
+            assert [args[0] for args in _calls(calls, "convert")] == ["good.pdf"]
+
+
+class TestWaitForJob:
+    @pytest.mark.asyncio
+    async def test_returns_markdown_when_complete(self):
+        async with make_client() as (client, calls):
+            job_id = await client.submit(_payload("paper.pdf"))
+            markdown = await client.wait_for_job(job_id, estimate=0.05)
+
+            assert markdown == "# Converted paper.pdf"
+            # Seeded with an accurate estimate, the job is found done within a few polls
+            assert len(_calls(calls, "poll")) <= 4
+
+    @pytest.mark.asyncio
+    async def test_failed_job_raises(self):
+        async with make_client() as (client, _):
+            job_id = await client.submit(_payload("fail.pdf"))
+            with pytest.raises(MarkerProcessingError, match="conversion crashed"):
+                await client.wait_for_job(job_id, estimate=0.05)
+
+    @pytest.mark.asyncio
+    async def test_max_wait_exceeded_raises(self):
+        async with make_client(job_seconds=60) as (client, _):
+            job_id = await client.submit(_payload("slow.pdf"))
+            with pytest.raises(MarkerProcessingError, match="did not complete"):
+                await client.wait_for_job(job_id, estimate=0.05, max_wait=0.2)
+
+
+class TestProcessorUsesSharedClient:
+    @pytest.mark.asyncio
+    async def test_concurrent_pdfs_batch_through_one_client(self, tmp_path, monkeypatch):
+        import fitz
+
+        def make_pdf(label: str) -> bytes:
+            doc = fitz.open()
+            doc.new_page().insert_text((72, 72), label)
+            data = doc.tobytes()
+            doc.close()
+            return data
+
+        monkeypatch.setattr(processor, "MARKER_INPUT_DIR", tmp_path)
+        async with make_client() as (client, calls):
+            monkeypatch.setattr(processor, "_get_client", lambda: client)
+
+            results = await asyncio.gather(
+                *(processor.process_pdf_bytes(make_pdf(f"pdf {i}"), quality="fast") for i in range(3))
+            )
+
+        assert all(r.startswith("# Converted pdf_") for r in results)
+        assert len(_calls(calls, "batch")) == 1
+        assert len(_calls(calls, "health")) == 3
+
+
+class TestGetMarkerClient:
+    def test_new_event_loop_replaces_and_closes_client(self, monkeypatch):
+        monkeypatch.setattr(marker_client, "_client", None)
+        monkeypatch.setattr(marker_client, "_client_loop", None)
+
+        async def get():
+            client = get_marker_client("http://marker", max_poll_interval=1.0)
+            assert get_marker_client("http://marker", max_poll_interval=1.0) is client
+            await asyncio.gather(*marker_client._retiring)
+            return client
+
+        first = asyncio.run(get())
+        second = asyncio.run(get())
+
+        assert second is not first
+        assert first._client.is_closed and not second._client.is_closed
+        asyncio.run(second._client.aclose())
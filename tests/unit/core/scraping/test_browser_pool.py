@@ -0,0 +1,354 @@
+"""Tests for core.scraping.browser_pool and the pooled PlaywrightScraper."""
+
+import asyncio
+import threading
+import time
+from contextlib import asynccontextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from core.scraping.browser_pool import (
+    BrowserContextPool,
+    DomainPacer,
+    block_unneeded_resources,
+    is_tracker_host,
+    should_block_request,
+    wait_for_stable_content,
+)
+from core.scraping.playwright_scraper import PlaywrightScraper
+
+
+class FakePage:
+    def __init__(self, context):
+        self.context = context
+        self.closed = False
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeContext:
+    def __init__(self, options):
+        self.options = options
+        self.routes = []
+        self.pages = []
+        self.closed = False
+
+    async def route(self, pattern, handler):
+        self.routes.append((pattern, handler))
+
+    async def new_page(self):
+        page = FakePage(self)
+        self.pages.append(page)
+        return page
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeBrowser:
+    def __init__(self):
+        self.contexts: list[FakeContext] = []
+
+    async def new_context(self, **options):
+        context = FakeContext(options)
+        self.contexts.append(context)
+        return context
+
+
+class FakeRoute:
+    def __init__(self, resource_type, url):
+        self.request = type("Request", (), {"resource_type": resource_type, "url": url})()
+        self.action = None
+
+    async def abort(self):
+        self.action = "abort"
+
+    async def continue_(self):
+        self.action = "continue"
+
+
+def _pool(size=2, **kwargs) -> tuple[BrowserContextPool, FakeBrowser]:
+    browser = FakeBrowser()
+
+    async def get_browser():
+        return browser
+
+    return BrowserContextPool(get_browser, size=size, context_options={"locale": "en-US"}, **kwargs), browser
+
+
+class TestRequestBlocking:
+    @pytest.mark.parametrize("resource_type", ["image", "font", "media"])
+    def test_blocks_heavy_resource_types(self, resource_type):
+        assert should_block_request(resource_type, "https://example.com/asset")
+
+    @pytest.mark.parametrize("resource_type", ["document", "script", "stylesheet", "xhr", "fetch"])
+    def test_allows_content_resource_types(self, resource_type):
+        assert not should_block_request(resource_type, "https://example.com/asset")
+
+    def test_matches_tracker_subdomains_only_on_label_boundaries(self):
+        assert is_tracker_host("www.google-analytics.com")
+        assert is_tracker_host("stats.g.doubleclick.net.")
+        assert not is_tracker_host("notdoubleclick.net")
+        assert should_block_request("script", "https://www.googletagmanager.com/gtm.js?id=X")
+
+    def test_tracker_host_pages_themselves_still_load(self):
+        assert not should_block_request("document", "https://docs.newrelic.com/docs/apm/")
+        assert should_block_request("script", "https://js-agent.newrelic.com/nr-loader.js")
+
+    @pytest.mark.asyncio
+    async def test_route_handler(self):
+        image = FakeRoute("image", "https://example.com/a.png")
+        doc = FakeRoute("document", "https://example.com/")
+
+        await block_unneeded_resources(image)
+        await block_unneeded_resources(doc)
+
+        assert (image.action, doc.action) == ("abort", "continue")
+
+
+class TestDomainPacer:
+    @pytest.mark.asyncio
+    async def test_same_domain_spaced_other_domains_immediate(self):
+        pacer = DomainPacer(delay=0.2)
+        starts = {}
+
+        async def request(name, url):
+            await pacer.wait(url)
+            starts[name] = time.monotonic()
+
+        t0 = time.monotonic()
+        await asyncio.gather(
+            request("a1", "https://a.example/1"),
+            request("a2", "https://A.example/2"),
+            request("a3", "https://a.example/3"),
+            request("b1", "https://b.example/1"),
+        )
+
+        assert starts["b1"] - t0 < 0.1
+        assert starts["a2"] - starts["a1"] >= 0.19
+        assert starts["a3"] - starts["a2"] >= 0.19
+
+    @pytest.mark.asyncio
+    async def test_scraper_paces_after_getting_a_page(self):
+        events = []
+        scraper = PlaywrightScraper(delay=0.01)
+
+        class Pool:
+            @asynccontextmanager
+            async def page(self):
+                events.append("page")
+                yield FakePage(None)
+
+        class Pacer:
+            async def wait(self, url):
+                events.append("pace")
+
+        async def navigate(page, url):
+            events.append("goto")
+            raise RuntimeError("stop")
+
+        scraper._pool, scraper._pacer = Pool(), Pacer()
+        scraper._navigate_with_download_detection = navigate
+        with pytest.raises(RuntimeError):
+            await scraper.scrape("https://a.example/1")
+
+        assert events == ["page", "pace", "goto"]
+
+
+class TestBrowserContextPool:
+    @pytest.mark.asyncio
+    async def test_reuses_warm_contexts_with_routing(self):
+        pool, browser = _pool(size=2)
+
+        for _ in range(3):
+            async with pool.page() as page:
+                assert not page.closed
+
+        [context] = browser.contexts
+        assert context.options == {"locale": "en-US"}
+        assert context.routes == [("**/*", block_unneeded_resources)]
+        assert len(context.pages) == 3 and all(p.closed for p in context.pages)
+        assert not context.closed
+
+    @pytest.mark.asyncio
+    async def test_concurrency_bounded_by_size(self):
+        pool, browser = _pool(size=2)
+        active = max_active = 0
+
+        async def use():
+            nonlocal active, max_active
+            async with pool.page():
+                active += 1
+                max_active = max(max_active, active)
+                await asyncio.sleep(0.02)
+                active -= 1
+
+        await asyncio.gather(*(use() for _ in range(6)))
+
+        assert max_active == 2
+        assert len(browser.contexts) == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_page_discards_context(self):
+        pool, browser = _pool(size=1)
+
+        with pytest.raises(RuntimeError):
+            async with pool.page():
+                raise RuntimeError("navigation crashed")
+        async with pool.page():
+            pass
+
+        first, second = browser.contexts
+        assert first.closed and not second.closed
+
+    @pytest.mark.asyncio
+    async def test_recycles_after_max_uses(self):
+        pool, browser = _pool(size=1, max_uses=2)
+
+        for _ in range(3):
+            async with pool.page():
+                pass
+
+        assert len(browser.contexts) == 2
+        assert browser.contexts[0].closed
+
+    @pytest.mark.asyncio
+    async def test_close_closes_idle_and_returning_contexts(self):
+        pool, browser = _pool(size=2, block_resources=False)
+        async with pool.page():
+            pass
+
+        async with pool.page():
+            await pool.close()
+
+        assert all(c.closed for c in browser.contexts)
+        assert browser.contexts[0].routes == []
+
+
+class TestWaitForStableContent:
+    @pytest.mark.asyncio
+    async def test_returns_once_length_settles(self):
+        lengths = iter([0, 120, 480, 480, 480, 999])
+
+        class Page:
+            async def evaluate(self, script):
+                return next(lengths)
+
+        assert await wait_for_stable_content(Page(), timeout=5, interval=0.01) is True
+
+    @pytest.mark.asyncio
+    async def test_times_out_while_content_keeps_changing(self):
+        counter = iter(range(1, 10_000))
+
+        class Page:
+            async def evaluate(self, script):
+                return next(counter)
+
+        start = time.monotonic()
+        assert await wait_for_stable_content(Page(), timeout=0.1, interval=0.01) is False
+        assert time.monotonic() - start < 0.5
+
+
+# --- Real browser against a local stand-in server ---------------------------
+
+ARTICLE = b"""<!doctype html>
+<html><head>
+<style>@font-face { font-family: X; src: url(/font.woff2); } body { font-family: X; }</style>
+<script src="https://www.google-analytics.com/analytics.js"></script>
+</head><body><main>
+<h1>Soil carbon</h1>
+<img src="/figure.png">
+<p id="lead">Cover crops increase soil organic carbon.</p>
+</main>
+<script>
+  setTimeout(() => {
+    const p = document.createElement("p");
+    p.textContent = "Loaded by script after render.";
+    document.querySelector("main").appendChild(p);
+    fetch("/poll");  // long poll that keeps the network busy
+  }, 200);
+</script>
+</body></html>"""
+
+
+class _Handler(BaseHTTPRequestHandler):
+    requested: list[str] = []
+
+    def do_GET(self):
+        type(self).requested.append(self.path)
+        if self.path == "/poll":
+            time.sleep(10)
+        elif self.path.startswith("/slow"):
+            time.sleep(1)
+        body = ARTICLE if self.path.startswith(("/article", "/slow")) else b"x"
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html" if body is ARTICLE else "application/octet-stream")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        try:
+            self.wfile.write(body)
+        except OSError:
+            pass
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def local_site():
+    _Handler.requested = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}", _Handler.requested
+    server.shutdown()
+    server.server_close()
+
+
+async def _launched_scraper(**kwargs) -> PlaywrightScraper:
+    scraper = PlaywrightScraper(timeout=20000, headless=True, **kwargs)
+    try:
+        await scraper._get_browser()
+    except Exception as e:
+        await scraper.close()
+        pytest.skip(f"Chromium not available: {e}")
+    return scraper
+
+
+class TestPooledScraperAgainstLocalServer:
+    @pytest.mark.asyncio
+    async def test_blocks_assets_and_returns_once_content_is_stable(self, local_site):
+        base, requested = local_site
+        scraper = await _launched_scraper(delay=0.01)
+        try:
+            start = time.monotonic()
+            markdown = await scraper.scrape(f"{base}/article")
+            elapsed = time.monotonic() - start
+        finally:
+            await scraper.close()
+
+        assert "Cover crops increase soil organic carbon." in markdown
+        assert "Loaded by script after render." in markdown
+        # networkidle would have waited on the 10s long poll
+        assert elapsed < 5
+        assert "/figure.png" not in requested
+        assert "/font.woff2" not in requested
+
+    @pytest.mark.asyncio
+    async def test_pages_load_concurrently_in_reused_contexts(self, local_site):
+        base, _ = local_site
+        scraper = await _launched_scraper(delay=0.01, max_concurrency=3)
+        try:
+            start = time.monotonic()
+            results = await asyncio.gather(*(scraper.scrape(f"{base}/slow/{i}") for i in range(6)))
+            elapsed = time.monotonic() - start
+        finally:
+            await scraper.close()
+
+        assert all("Soil carbon" in md for md in results)
+        # Six 1s documents through three contexts: two waves, not six
+        assert elapsed < 5
+        assert scraper._pool.contexts_created == 3
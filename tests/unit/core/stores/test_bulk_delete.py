@@ -0,0 +1,218 @@
+"""Unit tests for the stores' bulk delete and paged read paths."""
+
+import json
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import httpx
+import pytest
+
+from core.stores import chroma as chroma_module
+from core.stores.elasticsearch.base import bulk_succeeded
+from core.stores.elasticsearch.key_index import ZoteroKeyIndex
+from core.stores.elasticsearch.stores.forgotten import ForgottenStore
+from core.stores.elasticsearch.stores.main import MainStore
+from core.stores.schema import SourceType, StoreRecord
+from core.stores.zotero.client import ZoteroStore
+
+
+def _record(level: int = 0, key: str = "ABCD1234") -> StoreRecord:
+    return StoreRecord(
+        source_type=SourceType.EXTERNAL,
+        zotero_key=key,
+        content="text",
+        compression_level=level,
+    )
+
+
+def _bulk_response(action: str, results: list[tuple[str, int]]) -> dict:
+    return {
+        "errors": any(status >= 300 for _, status in results),
+        "items": [
+            {action: {"_id": rid, "_index": "idx", "status": status, **({"error": "boom"} if status >= 300 else {})}}
+            for rid, status in results
+        ],
+    }
+
+
+class TestBulkSucceeded:
+    def test_skips_failures_and_missing_deletes(self, caplog):
+        response = _bulk_response("delete", [("a", 200), ("b", 404), ("c", 429)])
+
+        assert bulk_succeeded(response, "delete") == ["a"]
+        assert [r.getMessage() for r in caplog.records] == ["Bulk delete failed for c in idx: boom"]
+
+
+class TestForgetMany:
+    @pytest.mark.asyncio
+    async def test_returns_only_archived_originals(self):
+        client = MagicMock()
+        store = ForgottenStore(client)
+        records = [_record(), _record(key="EFGH5678")]
+
+        async def bulk(operations):
+            ids = [op["index"]["_id"] for op in operations[::2]]
+            return _bulk_response("index", [(ids[0], 201), (ids[1], 500)])
+
+        client.bulk = AsyncMock(side_effect=bulk)
+
+        archived = await store.forget_many(records, "gc", "store_l0")
+
+        assert archived == [records[0].id]
+        [call] = client.bulk.await_args_list
+        docs = call.kwargs["operations"][1::2]
+        assert [d["forgotten_reason"] for d in docs] == ["gc", "gc"]
+        assert docs[0]["previous_data"]["id"] == str(records[0].id)
+
+
+class TestMainStoreDeleteMany:
+    @pytest.mark.asyncio
+    async def test_archives_then_bulk_deletes_per_batch(self, tmp_path):
+        records = [_record(key=f"KEY0000{i}") for i in range(5)]
+        index = ZoteroKeyIndex(tmp_path / "keys.sqlite3")
+        index.records_added(records)
+
+        client = MagicMock()
+        client.mget = AsyncMock(
+            side_effect=lambda docs, **kw: {
+                "docs": [
+                    {"found": True, "_source": r.model_dump(mode="json")}
+                    for r in records
+                    if str(r.id) in {d["_id"] for d in docs}
+                ]
+            }
+        )
+        client.bulk = AsyncMock(
+            side_effect=lambda operations: _bulk_response("delete", [(op["delete"]["_id"], 200) for op in operations])
+        )
+        stores = MagicMock()
+        # Archiving records[1] fails, so it must survive
+        stores.forgotten.forget_many = AsyncMock(
+            side_effect=lambda recs, reason, original_store: [r.id for r in recs if r.id != records[1].id]
+        )
+        store = MainStore(client, stores, key_index=index)
+
+        deleted = await store.delete_many([r.id for r in records], reason="gc", compression_level=0, batch_size=2)
+
+        assert deleted == 4
+        assert client.mget.await_count == 3
+        assert client.bulk.await_count == 3
+        deleted_ids = {op["delete"]["_id"] for call in client.bulk.await_args_list for op in call.kwargs["operations"]}
+        assert deleted_ids == {str(r.id) for r in records} - {str(records[1].id)}
+        assert stores.forgotten.forget_many.await_args_list[0].args[2] == "store_l0"
+        assert set(index.resolve_many([r.zotero_key for r in records])) == {"KEY00001"}
+
+
+class TestChromaDeleteMany:
+    @pytest.fixture
+    def chroma(self, monkeypatch):
+        monkeypatch.setattr(chroma_module.chromadb, "HttpClient", MagicMock())
+        es_stores = MagicMock()
+        es_stores.who_i_was.add_many = AsyncMock(side_effect=lambda snaps: [s.id for s in snaps])
+        store = chroma_module.ChromaStore(es_stores=es_stores)
+        store._collection = MagicMock()
+        return store
+
+    @pytest.mark.asyncio
+    async def test_snapshots_then_deletes_existing_rows(self, chroma):
+        present, missing = uuid4(), uuid4()
+        chroma._collection.get.return_value = {
+            "ids": [str(present)],
+            "metadatas": [{"zotero_key": "ABCD1234"}],
+            "documents": ["doc"],
+        }
+
+        assert await chroma.delete_many([present, missing], reason="gc") == 1
+
+        [snapshots] = chroma._es_stores.who_i_was.add_many.await_args.args
+        assert snapshots[0].supersedes == present
+        assert snapshots[0].previous_data == {"metadata": {"zotero_key": "ABCD1234"}, "document": "doc"}
+        chroma._collection.delete.assert_called_once_with(ids=[str(present)])
+
+    @pytest.mark.asyncio
+    async def test_scan_metadata_pages_by_offset(self, chroma):
+        ids = [str(uuid4()) for _ in range(5)]
+
+        def get(include, limit, offset):
+            page = ids[offset : offset + limit]
+            return {"ids": page, "metadatas": [{"n": ids.index(i)} for i in page]}
+
+        chroma._collection.get.side_effect = get
+
+        rows = [row async for row in chroma.scan_metadata(page_size=2)]
+
+        assert [meta["n"] for _, meta in rows] == [0, 1, 2, 3, 4]
+        assert chroma._collection.get.call_count == 3
+
+
+def _zotero(handler) -> ZoteroStore:
+    store = ZoteroStore()
+    store._client = httpx.AsyncClient(base_url=store.base_url, transport=httpx.MockTransport(handler))
+    return store
+
+
+class TestZoteroBulk:
+    @pytest.mark.asyncio
+    async def test_delete_many_batches_keys(self):
+        requests = []
+
+        def handler(request):
+            body = json.loads(request.content)
+            requests.append((request.url.path, body))
+            return httpx.Response(200, json={"deleted": body["keys"][:-1], "missing": body["keys"][-1:]})
+
+        store = _zotero(handler)
+
+        deleted = await store.delete_many([f"KEY0000{i}" for i in range(5)] + ["KEY00000"], batch_size=2)
+
+        assert deleted == 2
+        assert [len(body["keys"]) for _, body in requests] == [2, 2, 1]
+        assert {path for path, _ in requests} == {"/local-crud/items/delete"}
+
+    @pytest.mark.asyncio
+    async def test_delete_many_falls_back_on_old_plugin(self):
+        single = []
+
+        def handler(request):
+            if request.url.path == "/local-crud/items/delete":
+                return httpx.Response(404, text="No endpoint found")
+            single.append(json.loads(request.content)["key"])
+            return httpx.Response(204)
+
+        store = _zotero(handler)
+
+        assert await store.delete_many(["AAAA0001", "AAAA0002"]) == 2
+        assert single == ["AAAA0001", "AAAA0002"]
+
+    @pytest.mark.asyncio
+    async def test_iter_all_pages_with_offset(self):
+        library = [{"key": f"KEY{i:05d}", "itemID": i, "itemType": "book"} for i in range(5)]
+        offsets = []
+
+        def handler(request):
+            body = json.loads(request.content)
+            offsets.append(body["offset"])
+            page = library[body["offset"] : body["offset"] + body["limit"]]
+            return httpx.Response(
+                200, json={"total": len(page), "limit": body["limit"], "offset": body["offset"], "items": page}
+            )
+
+        items = [item.key async for item in _zotero(handler).iter_all(page_size=2)]
+
+        assert items == [item["key"] for item in library]
+        assert offsets == [0, 2, 4]
+
+    @pytest.mark.asyncio
+    async def test_iter_all_reads_whole_library_from_old_plugin(self):
+        library = [{"key": f"KEY{i:05d}", "itemID": i, "itemType": "book"} for i in range(3)]
+        limits = []
+
+        def handler(request):
+            body = json.loads(request.content)
+            limits.append(body["limit"])
+            return httpx.Response(200, json={"total": 3, "limit": body["limit"], "items": library[: body["limit"]]})
+
+        items = [item.key async for item in _zotero(handler).iter_all(page_size=2)]
+
+        assert items == [item["key"] for item in library]
+        assert limits == [2, 50000]
@@ -0,0 +1,114 @@
+"""Tests for streamed GC planning and bulk execution, against in-memory fake stores."""
+
+import pytest
+
+from core.stores.gc import execute_plan, garbage_collect, plan_gc
+from tests.factories.gc_stores import make_gc_stores
+
+REASON = "GC: test"
+
+
+def _stage_requests(log, suffix: str) -> dict[str, list[int]]:
+    requests: dict[str, list[int]] = {}
+    for event, size in log:
+        stage, _, kind = event.partition(".")
+        if kind == suffix:
+            requests.setdefault(stage, []).append(size)
+    return requests
+
+
+class TestPlanGC:
+    @pytest.mark.asyncio
+    async def test_partitions_stores_and_cascades_to_summaries(self):
+        zotero, es, chroma, _, keys = make_gc_stores(10, n_internal=3, n_unlinked_chroma=2)
+        cited = set(keys[:4]) | {"NOTINLIB"}
+
+        plan = await plan_gc(cited, zotero, es, chroma, page_size=4)
+
+        assert plan.keep_zotero == set(keys[:4])
+        assert plan.drop_zotero == set(keys[4:])
+        assert set(plan.keep_l0) == set(keys[:4]) and set(plan.drop_l0) == set(keys[4:])
+        assert plan.l0_internal == 3
+        # Summaries of dropped papers go; summaries of internal records stay
+        dropped_l0 = set(plan.drop_l0.values())
+        for level, drop in ((1, plan.drop_l1), (2, plan.drop_l2)):
+            assert len(drop) == 6
+            assert all(es.store.levels[level][rid].source_ids[0] in dropped_l0 for rid in drop)
+        assert (plan.l1_total, plan.l2_total) == (13, 10)
+        assert (plan.chroma_linked, plan.chroma_unlinked, len(plan.drop_chroma)) == (10, 2, 6)
+        assert plan.l0_uncited_zkeys == {"NOTINLIB"}
+        assert plan.cited_missing_from_zotero == {"NOTINLIB"}
+        assert plan.total_dropped == 6 * 5
+
+    @pytest.mark.asyncio
+    async def test_streams_every_store_in_pages_and_reports_throughput(self):
+        zotero, es, chroma, log, keys = make_gc_stores(25)
+
+        plan = await plan_gc(set(keys), zotero, es, chroma, page_size=10)
+
+        pages = _stage_requests(log, "page")
+        assert pages == {stage: [10, 10, 5] for stage in ("zotero", "es_l0", "es_l1", "es_l2", "chroma")}
+        assert {stage: stats.records for stage, stats in plan.scan.items()} == {
+            "zotero": 25,
+            "es_l0": 25,
+            "es_l1": 25,
+            "es_l2": 25,
+            "chroma": 25,
+        }
+        assert all(stats.seconds > 0 and stats.rate > 0 for stats in plan.scan.values())
+        assert plan.total_dropped == 0
+
+
+class TestExecutePlan:
+    @pytest.mark.asyncio
+    async def test_deletes_in_bulk_batches_summaries_first(self):
+        zotero, es, chroma, log, keys = make_gc_stores(12)
+        plan = await plan_gc(set(keys[:2]), zotero, es, chroma)
+        log.clear()
+
+        stats = await execute_plan(plan, zotero, es, chroma, reason=REASON, batch_size=4)
+
+        requests = _stage_requests(log, "delete")
+        assert requests == {stage: [4, 4, 2] for stage in ("es_l1", "es_l2", "es_l0", "chroma", "zotero")}
+        stage_order = list(dict.fromkeys(event.partition(".")[0] for event, _ in log))
+        assert stage_order == ["es_l1", "es_l2", "es_l0", "chroma", "zotero"]
+        assert {stage: s.records for stage, s in stats.items()} == dict.fromkeys(stage_order, 10)
+
+        assert set(zotero.items) == set(keys[:2])
+        assert all(len(es.store.levels[level]) == 2 for level in (0, 1, 2))
+        assert len(chroma.rows) == 2
+        assert {reason for *_, reason in es.store.forgotten} == {REASON}
+        assert len(chroma.who_i_was) == 10
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_is_skipped_not_fatal(self):
+        zotero, es, chroma, _, keys = make_gc_stores(8)
+        plan = await plan_gc(set(), zotero, es, chroma)
+        zotero.fail_batches = 1
+
+        stats = await execute_plan(plan, zotero, es, chroma, reason=REASON, batch_size=4, concurrency=1)
+
+        assert stats["zotero"].records == 4
+        assert len(zotero.items) == 4
+        assert stats["chroma"].records == 8
+
+
+class TestGarbageCollect:
+    @pytest.mark.asyncio
+    async def test_dry_run_deletes_nothing(self):
+        zotero, es, chroma, log, keys = make_gc_stores(5)
+
+        plan = await garbage_collect({keys[0]}, zotero, es, chroma, reason=REASON)
+
+        assert plan.total_dropped == 4 * 5
+        assert _stage_requests(log, "delete") == {}
+        assert len(zotero.items) == 5
+
+    @pytest.mark.asyncio
+    async def test_execute_deletes_plan(self):
+        zotero, es, chroma, _, keys = make_gc_stores(5)
+
+        await garbage_collect({keys[0]}, zotero, es, chroma, reason=REASON, execute=True)
+
+        assert list(zotero.items) == [keys[0]]
+        assert len(chroma.rows) == 1
@@ -0,0 +1,172 @@
+"""Unit tests for the zotero_key -> record-id index."""
+
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from core.stores.elasticsearch.key_index import ZoteroKeyIndex
+from core.stores.elasticsearch.stores.main import MainStore
+from core.stores.schema import SourceType, StoreRecord
+
+
+def _record(level: int, key: str = "ABCD1234", **kwargs) -> StoreRecord:
+    return StoreRecord(
+        source_type=SourceType.EXTERNAL if level == 0 else SourceType.INTERNAL,
+        zotero_key=key,
+        content=kwargs.pop("content", "text"),
+        compression_level=level,
+        **kwargs,
+    )
+
+
+@pytest.fixture
+def index(tmp_path):
+    return ZoteroKeyIndex(tmp_path / "keys.sqlite3")
+
+
+class TestZoteroKeyIndex:
+    def test_tracks_all_levels(self, index):
+        l0 = _record(0, content="x" * 42, metadata={"title": "Paper", "date": "2019-04-01"})
+        l1 = _record(1, source_ids=[l0.id])
+        l2 = _record(2, source_ids=[l0.id])
+        index.records_added([l0, l1, l2])
+
+        entry = index.resolve("ABCD1234")
+
+        assert (entry.l0_id, entry.l1_id, entry.l2_id) == (l0.id, l1.id, l2.id)
+        assert entry.title == "Paper"
+        assert entry.year == 2019
+        assert entry.content_length == 42
+
+    def test_english_summary_preferred(self, index):
+        original = _record(2, language_code="de")
+        english = _record(2, language_code="en")
+        later_original = _record(2, language_code="fr")
+        index.records_added([original, english, later_original])
+
+        assert index.resolve("ABCD1234").l2_id == english.id
+
+    def test_delete_clears_level_and_drops_empty_entries(self, index):
+        l0 = _record(0)
+        l2 = _record(2)
+        index.records_added([l0, l2])
+
+        index.record_deleted(l2)
+        assert index.resolve("ABCD1234").l2_id is None
+
+        index.record_deleted(l0)
+        assert index.resolve("ABCD1234") is None
+
+    def test_resolve_many_skips_unknown_keys(self, index):
+        index.records_added([_record(0, key=f"KEY0000{i}") for i in range(3)])
+
+        found = index.resolve_many(["KEY00000", "KEY00002", "MISSING1"])
+
+        assert set(found) == {"KEY00000", "KEY00002"}
+
+
+class TestMainStoreKeyIndex:
+    @pytest.fixture
+    def client(self):
+        client = MagicMock()
+        client.index = AsyncMock()
+        client.delete = AsyncMock()
+        return client
+
+    @pytest.fixture
+    def store(self, client, index):
+        stores = MagicMock()
+        stores.forgotten.forget = AsyncMock()
+        return MainStore(client, stores, key_index=index)
+
+    @pytest.mark.asyncio
+    async def test_add_and_delete_maintain_index(self, store, client, index):
+        record = _record(0, metadata={"title": "T"})
+        await store.add(record)
+        assert index.resolve("ABCD1234").l0_id == record.id
+
+        client.get = AsyncMock(return_value={"_source": record.model_dump(mode="json")})
+        assert await store.delete(record.id, reason="test", compression_level=0)
+        assert index.resolve("ABCD1234") is None
+
+    @pytest.mark.asyncio
+    async def test_update_refreshes_content_length_and_metadata(self, store, client, index):
+        # Pipeline papers are added as empty stubs and filled in via update()
+        stub = _record(0, content="")
+        await store.add(stub)
+        assert index.resolve("ABCD1234").content_length == 0
+
+        client.update = AsyncMock()
+        client.get = AsyncMock(
+            return_value={
+                "_source": {
+                    "id": str(stub.id),
+                    "zotero_key": "ABCD1234",
+                    "compression_level": 0,
+                    "metadata": {"title": "Filled", "year": 2021},
+                }
+            }
+        )
+        assert await store.update(stub.id, {"content": "x" * 300, "metadata": {"title": "Filled"}})
+
+        entry = index.resolve("ABCD1234")
+        assert (entry.l0_id, entry.content_length, entry.title, entry.year) == (stub.id, 300, "Filled", 2021)
+        assert "content" not in client.get.call_args.kwargs["source_includes"]
+
+    @pytest.mark.asyncio
+    async def test_update_of_unindexed_fields_skips_index(self, store, client):
+        client.update = AsyncMock()
+        client.get = AsyncMock()
+
+        assert await store.update(uuid4(), {"embedding_model": "m"})
+        client.get.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_resolve_keys_fills_misses_with_one_query(self, store, client, index):
+        known = _record(0, key="KNOWN001")
+        index.record_added(known)
+        l0_id, l2_id = uuid4(), uuid4()
+        client.search = AsyncMock(
+            return_value={
+                "hits": {
+                    "hits": [
+                        {"_source": {"id": str(l0_id), "zotero_key": "NEWKEY01", "compression_level": 0}},
+                        {"_source": {"id": str(l2_id), "zotero_key": "NEWKEY01", "compression_level": 2}},
+                    ]
+                }
+            }
+        )
+
+        entries = await store.resolve_keys(["KNOWN001", "NEWKEY01", "MISSING1"])
+
+        assert client.search.await_count == 1
+        assert client.search.call_args.kwargs["query"] == {
+            "terms": {"zotero_key": ["NEWKEY01", "MISSING1"]}
+        }
+        assert entries["KNOWN001"].l0_id == known.id
+        assert (entries["NEWKEY01"].l0_id, entries["NEWKEY01"].l2_id) == (l0_id, l2_id)
+        assert "MISSING1" not in entries
+
+        # Second resolution is served entirely from the index
+        await store.resolve_keys(["NEWKEY01"])
+        assert client.search.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_mget_spans_levels(self, store, client):
+        l0_id, l2_id = uuid4(), uuid4()
+        client.mget = AsyncMock(
+            return_value={
+                "docs": [
+                    {"found": True, "_source": {"id": str(l0_id), "content": "orig"}},
+                    {"found": False},
+                ]
+            }
+        )
+
+        records = await store.mget([(l0_id, 0), (l2_id, 2)], fields=["content"])
+
+        docs = client.mget.call_args.kwargs["docs"]
+        assert [d["_index"] for d in docs] == ["store_l0", "store_l2"]
+        assert records[l0_id].content == "orig"
+        assert l2_id not in records
@@ -0,0 +1,132 @@
+"""Unit tests for projected (fields=) reads on the Elasticsearch stores."""
+
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from core.stores.elasticsearch import base as es_base
+from core.stores.elasticsearch.stores.main import MainStore
+from core.stores.schema import RecordView, SourceType, StoreRecord
+
+
+def _full_source(**overrides) -> dict:
+    record = StoreRecord(
+        source_type=SourceType.EXTERNAL,
+        zotero_key="ABCD1234",
+        content="x" * 1000,
+        compression_level=2,
+        metadata={"title": "A Paper", "year": 2021},
+        embedding=[0.1] * 8,
+    )
+    return {**record.model_dump(mode="json"), **overrides}
+
+
+@pytest.fixture
+def client():
+    return MagicMock()
+
+
+@pytest.fixture
+def store(client):
+    return MainStore(client, stores=MagicMock())
+
+
+class TestSearchProjection:
+    @pytest.mark.asyncio
+    async def test_fields_passes_source_includes_and_returns_views(self, store, client):
+        rid = uuid4()
+        client.search = AsyncMock(
+            return_value={
+                "hits": {
+                    "hits": [
+                        {
+                            "_source": {"id": str(rid), "zotero_key": "ABCD1234"},
+                            "_score": 3.5,
+                        }
+                    ]
+                }
+            }
+        )
+
+        results = await store.search(
+            {"match_all": {}}, compression_level=0, fields=["zotero_key"]
+        )
+
+        kwargs = client.search.call_args.kwargs
+        assert kwargs["source_includes"] == ["id", "zotero_key"]
+        assert kwargs["index"] == "store_l0"
+        assert results == [RecordView(id=rid, zotero_key="ABCD1234", score=3.5)]
+
+    @pytest.mark.asyncio
+    async def test_without_fields_returns_full_records(self, store, client):
+        client.search = AsyncMock(
+            return_value={"hits": {"hits": [{"_source": _full_source(), "_score": 1.0}]}}
+        )
+
+        results = await store.search({"match_all": {}})
+
+        assert "source_includes" not in client.search.call_args.kwargs
+        assert isinstance(results[0], StoreRecord)
+        assert results[0].embedding == [0.1] * 8
+
+
+class TestGetProjection:
+    @pytest.mark.asyncio
+    async def test_get_with_fields(self, store, client):
+        rid = uuid4()
+        client.get = AsyncMock(
+            return_value={"_source": {"id": str(rid), "metadata": {"title": "T"}}}
+        )
+
+        view = await store.get(rid, compression_level=0, fields=["metadata.title"])
+
+        assert client.get.call_args.kwargs["source_includes"] == ["id", "metadata.title"]
+        assert isinstance(view, RecordView)
+        assert view.metadata == {"title": "T"}
+        assert view.content is None
+
+
+class TestKnnProjection:
+    @pytest.mark.asyncio
+    async def test_knn_with_fields_skips_embedding(self, store, client):
+        rid = uuid4()
+        client.search = AsyncMock(
+            return_value={
+                "hits": {
+                    "hits": [
+                        {"_source": {"id": str(rid), "zotero_key": "ABCD1234"}, "_score": 0.9}
+                    ]
+                }
+            }
+        )
+
+        results = await store.knn_search(
+            [0.0] * 8, k=5, compression_level=2, fields=["zotero_key"]
+        )
+
+        assert client.search.call_args.kwargs["source_includes"] == ["id", "zotero_key"]
+        view, score = results[0]
+        assert view.zotero_key == "ABCD1234"
+        assert score == 0.9
+
+
+class TestScan:
+    @pytest.mark.asyncio
+    async def test_scan_streams_views(self, store, monkeypatch):
+        ids = [uuid4() for _ in range(3)]
+        captured = {}
+
+        async def fake_scan(client, **kwargs):
+            captured.update(kwargs)
+            for rid in ids:
+                yield {"_source": {"id": str(rid), "source_ids": [str(ids[0])]}}
+
+        monkeypatch.setattr(es_base, "async_scan", fake_scan)
+
+        views = [v async for v in store.scan(["source_ids"], compression_level=1)]
+
+        assert captured["index"] == "store_l1"
+        assert captured["_source"] == ["id", "source_ids"]
+        assert [v.id for v in views] == ids
+        assert views[1].source_ids == [ids[0]]
@@ -89,6 +89,7 @@ def _mock_illustrate_graph():
     )
 
     async def mock_ainvoke(input_dict):
+        assert input_dict["run_id"]
         content = input_dict["input"]["markdown_document"]
         return {"illustrated_document": f"[ILLUSTRATED]\n{content}", "visual_identity": vi}
 
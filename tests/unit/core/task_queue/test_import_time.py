@@ -0,0 +1,79 @@
+"""Cold-start import budget for the task-queue CLI.
+
+`list` and `status` should not load the LLM layer, LangGraph workflows or
+ML libraries; those are imported only when a task runs. Each check runs a
+fresh interpreter under `python -X importtime`.
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).parents[4]
+
+# Generous for slow CI machines; a cold `list` imports in well under 200ms.
+# A regression that reloads the workflows or LLM stack costs 2-3s.
+IMPORT_BUDGET_MS = float(os.getenv("THALA_CLI_IMPORT_BUDGET_MS", "1000"))
+
+HEAVY_MODULES = {
+    "anthropic",
+    "langgraph",
+    "langchain_core",
+    "langchain_anthropic",
+    "numpy",
+    "networkx",
+    "bertopic",
+    "chromadb",
+    "elasticsearch",
+}
+
+
+def _importtime(*modules: str) -> tuple[float, set[str]]:
+    """Import modules in a fresh interpreter; return (total ms, top-level packages loaded)."""
+    code = "; ".join(f"import {m}" for m in modules)
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+    assert proc.returncode == 0, proc.stderr[-2000:]
+
+    total_us = 0
+    loaded = set()
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if not cumulative.strip().isdigit():
+            continue  # header
+        loaded.add(name.strip().split(".")[0])
+        # Top-level entries (no indentation) sum to the total import cost
+        if not name.startswith("  "):
+            total_us += int(cumulative)
+    return total_us / 1000, loaded
+
+
+@pytest.mark.parametrize(
+    "command_module",
+    ["core.task_queue.commands.task_commands", "core.task_queue.commands.status_command"],
+    ids=["list", "status"],
+)
+def test_cli_command_cold_start(command_module):
+    elapsed_ms, loaded = _importtime("core.task_queue.cli", command_module)
+
+    assert not loaded & HEAVY_MODULES, f"heavy imports on cold start: {sorted(loaded & HEAVY_MODULES)}"
+    assert elapsed_ms < IMPORT_BUDGET_MS, f"cold start took {elapsed_ms:.0f}ms (budget {IMPORT_BUDGET_MS:.0f}ms)"
+
+
+def test_workflow_registry_resolves_lazily():
+    from core.task_queue.workflows import WORKFLOW_REGISTRY, get_available_types
+
+    assert "lit_review_full" in get_available_types()
+    assert WORKFLOW_REGISTRY["web_research"].__name__ == "WebResearchWorkflow"
+    with pytest.raises(KeyError):
+        WORKFLOW_REGISTRY["nope"]
@@ -0,0 +1,177 @@
+"""Tests for the local LLM usage ledger and ledger-backed budget tracking."""
+
+import asyncio
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+from langchain_core.messages import AIMessage
+from langchain_core.outputs import ChatGeneration, LLMResult
+
+from core.llm_broker.schemas import LLMResponse
+from core.task_queue.budget import BudgetTracker, UsageLedger
+from core.task_queue.budget.ledger import record_llm_usage, set_usage_ledger, track_usage
+from core.task_queue.pricing import calculate_usage_cost
+from workflows.shared.llm_utils.usage import UsageLedgerCallback
+
+OPUS = "claude-opus-4-6"
+HAIKU = "claude-haiku-4-5-20251001"
+
+
+@pytest.fixture
+def ledger(tmp_path):
+    ledger = UsageLedger(tmp_path / "usage.sqlite3")
+    set_usage_ledger(ledger)
+    yield ledger
+    set_usage_ledger(None)
+
+
+class TestUsageLedger:
+    def test_rolling_counters_aggregate_by_day_and_month(self, ledger):
+        day1 = datetime(2026, 3, 1, 12, tzinfo=timezone.utc)
+        day2 = datetime(2026, 3, 2, 12, tzinfo=timezone.utc)
+
+        c1 = ledger.record(OPUS, 1000, 500, project="q", at=day1)
+        c2 = ledger.record(HAIKU, 2000, 100, cache_read_tokens=4000, project="q", at=day1)
+        c3 = ledger.record(OPUS, 100, 50, batched=True, project="q", at=day2)
+
+        assert ledger.cost("day", project="q", at=day1) == pytest.approx(c1 + c2)
+        assert ledger.cost("day", project="q", at=day2) == pytest.approx(c3)
+        month = ledger.totals("month", project="q", at=day2)
+        assert month.calls == 3
+        assert month.input_tokens == 3100
+        assert month.cache_read_tokens == 4000
+        assert month.cost_usd == pytest.approx(c1 + c2 + c3)
+
+        breakdown = ledger.model_breakdown("month", project="q", at=day1)
+        assert set(breakdown) == {OPUS, HAIKU}
+        assert breakdown[OPUS].calls == 2
+
+    def test_projects_and_months_are_isolated(self, ledger):
+        march = datetime(2026, 3, 31, 23, 59, tzinfo=timezone.utc)
+        april = datetime(2026, 4, 1, 0, 1, tzinfo=timezone.utc)
+
+        ledger.record(OPUS, 1000, 1000, project="thala-queue", at=march)
+        ledger.record(OPUS, 1000, 1000, project="thala-dev", at=march)
+
+        assert ledger.totals("month", project="thala-queue", at=march).calls == 1
+        assert ledger.cost("month", project="thala-queue", at=april) == 0.0
+
+    def test_cost_includes_cache_and_batch_pricing(self):
+        base = calculate_usage_cost(OPUS, 1_000_000, 0)
+        assert calculate_usage_cost(OPUS, 0, 0, cache_read_tokens=1_000_000) == pytest.approx(base * 0.1)
+        assert calculate_usage_cost(OPUS, 0, 0, cache_creation_tokens=1_000_000) == pytest.approx(base * 1.25)
+        assert calculate_usage_cost(OPUS, 1_000_000, 0, batched=True) == pytest.approx(base / 2)
+
+
+class TestRecording:
+    def test_broker_records_resolved_responses(self, ledger, monkeypatch):
+        monkeypatch.setenv("LANGSMITH_PROJECT", "thala-queue")
+        from core.llm_broker.broker import LLMBroker
+
+        broker = LLMBroker.__new__(LLMBroker)
+        broker._pending_futures = {}
+        broker._usage_scopes = {}
+        broker._resolve_future(
+            "r1",
+            LLMResponse(
+                request_id="r1",
+                content="ok",
+                success=True,
+                usage={"input_tokens": 100, "output_tokens": 20, "cache_read_input_tokens": 900},
+                model=OPUS,
+                batched=True,
+            ),
+        )
+        broker._resolve_future("r2", LLMResponse(request_id="r2", content=None, success=False, error="boom"))
+
+        totals = ledger.totals("month", project="thala-queue")
+        assert totals.calls == 1
+        assert totals.cache_read_tokens == 900
+        assert totals.cost_usd == pytest.approx(
+            calculate_usage_cost(OPUS, 100, 20, cache_read_tokens=900, batched=True)
+        )
+
+    def test_callback_separates_cached_input(self, ledger, monkeypatch):
+        monkeypatch.setenv("LANGSMITH_PROJECT", "thala-queue")
+        message = AIMessage(
+            content="hi",
+            usage_metadata={
+                "input_tokens": 1500,
+                "output_tokens": 40,
+                "total_tokens": 1540,
+                "input_token_details": {"cache_read": 1000, "cache_creation": 200},
+            },
+        )
+
+        UsageLedgerCallback(HAIKU).on_llm_end(LLMResult(generations=[[ChatGeneration(message=message)]]))
+
+        totals = ledger.totals("month", project="thala-queue", model=HAIKU)
+        assert (totals.input_tokens, totals.cache_read_tokens, totals.cache_creation_tokens) == (300, 1000, 200)
+
+
+class TestTrackUsage:
+    @pytest.mark.asyncio
+    async def test_totals_calls_in_scope_and_spawned_tasks(self, ledger):
+        usage = {"input_tokens": 10, "output_tokens": 5, "cache_read_input_tokens": 100}
+
+        with track_usage() as outer:
+            record_llm_usage(HAIKU, usage, source="invoke")
+            with track_usage() as inner:
+                await asyncio.create_task(asyncio.to_thread(record_llm_usage, HAIKU, usage))
+        record_llm_usage(HAIKU, usage)
+
+        assert (outer.calls, outer.total_tokens) == (2, 230)
+        assert (inner.calls, inner.total_tokens) == (1, 115)
+
+    def test_broker_credits_the_requesters_scope(self, ledger):
+        from core.llm_broker.broker import LLMBroker
+
+        with track_usage() as requester:
+            pass
+        broker = LLMBroker.__new__(LLMBroker)
+        broker._pending_futures = {}
+        broker._usage_scopes = {"r1": (requester,)}
+
+        with track_usage() as broker_task:
+            broker._resolve_future(
+                "r1",
+                LLMResponse(request_id="r1", content="ok", success=True, usage={"input_tokens": 7}, model=HAIKU),
+            )
+
+        assert requester.total_tokens == 7
+        assert broker_task.calls == 0
+        assert broker._usage_scopes == {}
+
+
+class TestBudgetTrackerFromLedger:
+    def test_budget_status_reads_ledger_without_langsmith(self, ledger, tmp_path, monkeypatch):
+        monkeypatch.setenv("THALA_MONTHLY_BUDGET", "10")
+        monkeypatch.delenv("THALA_BUDGET_SOURCE", raising=False)
+        monkeypatch.delenv("THALA_QUEUE_PROJECT", raising=False)
+        ledger.record(OPUS, 1_000_000, 200_000, project="thala-queue")  # $10
+
+        tracker = BudgetTracker(queue_dir=tmp_path, ledger=ledger)
+        tracker.langsmith_provider._client = MagicMock(list_runs=MagicMock(side_effect=AssertionError("LangSmith queried")))
+
+        status = tracker.get_budget_status()
+        assert status["current_cost"] == pytest.approx(10.0)
+        assert status["action"] == "pause"
+        assert tracker.should_proceed()[0] is False
+        assert tracker.get_cost_breakdown() == {OPUS: pytest.approx(10.0)}
+        assert tracker.get_current_day_cost() == pytest.approx(10.0)
+
+    def test_reconcile_compares_with_langsmith(self, ledger, tmp_path, monkeypatch):
+        monkeypatch.delenv("THALA_QUEUE_PROJECT", raising=False)
+        ledger.record(OPUS, 1_000_000, 0, project="thala-queue")  # $5
+
+        run = SimpleNamespace(id="run-1", total_cost=4.5, total_tokens=10, name="lit_review")
+        tracker = BudgetTracker(queue_dir=tmp_path, ledger=ledger)
+        tracker.langsmith_provider._client = MagicMock(list_runs=MagicMock(return_value=[run]))
+
+        result = tracker.reconcile_with_langsmith()
+
+        assert result["ledger_cost"] == pytest.approx(5.0)
+        assert result["langsmith_cost"] == pytest.approx(4.5)
+        assert result["difference"] == pytest.approx(0.5)
@@ -0,0 +1,146 @@
+"""Tests for the concurrent search_memory fan-out, using in-process fake stores."""
+
+import asyncio
+import importlib
+import time
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+
+from core.stores.schema import RecordView, SourceType
+from langchain_tools.search_memory import search_memory
+
+# The package re-exports the tool under the module's name
+search_memory_module = importlib.import_module("langchain_tools.search_memory")
+
+
+class FakeESStore:
+    def __init__(self, results, delay: float = 0.0, error: Exception | None = None):
+        self.results = results
+        self.delay = delay
+        self.error = error
+        self.calls = []
+
+    async def search(self, query, size=10, fields=None):
+        self.calls.append({"query": query, "size": size, "fields": fields})
+        await asyncio.sleep(self.delay)
+        if self.error:
+            raise self.error
+        return self.results[:size]
+
+
+class FakeChroma(FakeESStore):
+    async def search(self, query_embedding, n_results=10):
+        return await super().search(query_embedding, size=n_results)
+
+
+class FakeEmbedding:
+    async def embed(self, text):
+        return [0.1, 0.2, 0.3]
+
+
+def _coherence(content: str, confidence: float):
+    return SimpleNamespace(id=uuid4(), content=content, confidence=confidence, zotero_key=None, category="belief")
+
+
+def _store_view(content: str, score: float):
+    return RecordView(id=uuid4(), content=content, score=score, source_type=SourceType.EXTERNAL, compression_level=0)
+
+
+def _chroma(content: str, distance: float):
+    return {"id": str(uuid4()), "document": content, "distance": distance, "metadata": {}}
+
+
+@pytest.fixture
+def stores(monkeypatch):
+    fakes = SimpleNamespace(
+        chroma=FakeChroma([_chroma("vector hit", 0.2), _chroma("weak vector hit", 0.9)]),
+        coherence=FakeESStore([_coherence("belief hit", 0.7), _coherence("unsure", 0.1)]),
+        store=FakeESStore([_store_view("bm25 best", 12.0), _store_view("bm25 half", 6.0)]),
+        who_i_was=FakeESStore([]),
+    )
+    manager = SimpleNamespace(
+        embedding=FakeEmbedding(),
+        chroma=fakes.chroma,
+        es_stores=SimpleNamespace(coherence=fakes.coherence, store=fakes.store, who_i_was=fakes.who_i_was),
+    )
+    monkeypatch.setattr(search_memory_module, "get_store_manager", lambda: manager)
+    monkeypatch.setattr(
+        search_memory_module,
+        "STORE_TIMEOUTS",
+        {"top_of_mind": 0.3, "coherence": 0.3, "store": 0.3, "who_i_was": 0.3},
+    )
+    return fakes
+
+
+async def _search(**kwargs):
+    return await search_memory.ainvoke({"query": "memory", **kwargs})
+
+
+class TestFanOut:
+    @pytest.mark.asyncio
+    async def test_stores_are_queried_concurrently(self, stores):
+        stores.chroma.delay = stores.coherence.delay = stores.store.delay = 0.2
+
+        start = time.monotonic()
+        output = await _search()
+
+        assert time.monotonic() - start < 0.45
+        assert set(output["stores_responded"]) == {"top_of_mind", "coherence", "store"}
+        assert output["partial"] is False
+
+    @pytest.mark.asyncio
+    async def test_slow_store_is_cut_off_and_reported(self, stores):
+        stores.store.delay = 5
+
+        start = time.monotonic()
+        output = await _search()
+
+        assert time.monotonic() - start < 1
+        assert output["stores_timed_out"] == ["store"]
+        assert output["partial"] is True
+        assert {r["source_store"] for r in output["results"]} == {"top_of_mind", "coherence"}
+
+    @pytest.mark.asyncio
+    async def test_failing_store_is_reported(self, stores):
+        stores.coherence.error = ConnectionError("es down")
+
+        output = await _search()
+
+        assert output["stores_failed"] == ["coherence"]
+        assert "coherence" not in output["stores_responded"]
+        assert output["total_results"] == 3
+
+    @pytest.mark.asyncio
+    async def test_historical_only_when_requested(self, stores):
+        output = await _search(stores=["store", "who_i_was"])
+        assert output["stores_responded"] == ["store"]
+        assert not stores.who_i_was.calls
+
+        output = await _search(include_historical=True)
+        assert "who_i_was" in output["stores_responded"]
+
+
+class TestMerge:
+    @pytest.mark.asyncio
+    async def test_results_interleaved_by_normalized_score(self, stores):
+        output = await _search()
+
+        ranked = [(r["content"], r["normalized_score"]) for r in output["results"]]
+        assert ranked == [
+            ("bm25 best", 1.0),
+            ("vector hit", pytest.approx(0.8)),
+            ("belief hit", 0.7),
+            ("bm25 half", 0.5),
+        ]
+        # Raw scores are kept alongside
+        assert output["results"][0]["score"] == 12.0
+
+    @pytest.mark.asyncio
+    async def test_main_store_fetches_projected_fields(self, stores):
+        await _search(stores=["store"], limit=5)
+
+        (call,) = stores.store.calls
+        assert call["size"] == 5
+        assert "embedding" not in call["fields"]
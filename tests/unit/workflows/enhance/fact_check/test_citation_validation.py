@@ -0,0 +1,99 @@
+"""Tests for batched, cached fact-check citation validation."""
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from workflows.enhance.fact_check import citation_validation
+from workflows.enhance.fact_check.citation_validation import (
+    citation_cache_scope,
+    clear_shared_citation_cache,
+    get_cached_citation,
+    validate_citations,
+)
+
+
+class FakeZotero:
+    """Zotero stand-in that records peak concurrency."""
+
+    def __init__(self, existing: set[str], delay: float = 0.01):
+        self.existing = existing
+        self.delay = delay
+        self.calls: list[str] = []
+        self.active = 0
+        self.peak = 0
+
+    async def exists(self, key: str) -> bool:
+        self.calls.append(key)
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(self.delay)
+        self.active -= 1
+        return key in self.existing
+
+
+@pytest.fixture
+def backends(monkeypatch):
+    clear_shared_citation_cache()
+    summary_calls: list[list[str]] = []
+    summaries = {"STORED01": ("Title", "summary text"), "STORED02": ("T2", "more")}
+
+    async def fake_fetch(keys):
+        summary_calls.append(list(keys))
+        return {k: summaries[k] for k in keys if k in summaries}
+
+    zotero = FakeZotero(existing={"ZOTONLY1"})
+    manager = MagicMock()
+    manager.zotero = zotero
+
+    monkeypatch.setattr("langchain_tools.paper_corpus.fetch_paper_summaries", fake_fetch)
+    monkeypatch.setattr("langchain_tools.base.get_store_manager", lambda: manager)
+    yield summary_calls, zotero
+    clear_shared_citation_cache()
+
+
+class TestValidateCitations:
+    @pytest.mark.asyncio
+    async def test_single_store_batch_and_bounded_zotero_checks(self, backends):
+        summary_calls, zotero = backends
+        missing = [f"MISSING{i}" for i in range(6)]
+
+        with citation_cache_scope():
+            result = await validate_citations(
+                ["STORED01", "STORED02", "ZOTONLY1", *missing], concurrency=3
+            )
+
+        assert len(summary_calls) == 1
+        assert result["STORED01"] == {"exists": True, "content_preview": "summary text"}
+        assert result["ZOTONLY1"]["exists"] is True
+        assert all(not result[k]["exists"] for k in missing)
+        assert sorted(zotero.calls) == sorted(["ZOTONLY1", *missing])
+        assert 1 < zotero.peak <= 3
+
+    @pytest.mark.asyncio
+    async def test_positive_results_shared_across_runs(self, backends):
+        summary_calls, zotero = backends
+
+        with citation_cache_scope():
+            await validate_citations(["STORED01", "MISSING1"])
+        with citation_cache_scope():
+            await validate_citations(["STORED01", "MISSING1"])
+
+        # STORED01 came from the shared cache; MISSING1 was re-checked
+        assert summary_calls == [["STORED01", "MISSING1"], ["MISSING1"]]
+        assert zotero.calls == ["MISSING1", "MISSING1"]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_runs_keep_separate_caches(self, backends):
+        async def run(keys: list[str]) -> dict | None:
+            with citation_cache_scope():
+                await validate_citations(keys)
+                await asyncio.sleep(0.02)
+                return get_cached_citation("MISSING1")
+
+        first, second = await asyncio.gather(run(["MISSING1"]), run(["STORED01"]))
+
+        assert first == {"exists": False, "content_preview": ""}
+        assert second is None
+        assert citation_validation._run_cache.get() is None
@@ -0,0 +1,215 @@
+"""Tests for speculative Loop 2 mini-review scheduling."""
+
+import asyncio
+import time
+
+import pytest
+
+from core.task_queue.budget.ledger import record_llm_usage
+from workflows.enhance.supervision.shared.mini_review import (
+    MiniReviewScheduler,
+    TokenBudget,
+    run_mini_review,
+)
+from workflows.enhance.supervision.shared.mini_review import graph as mini_review_graph
+from workflows.enhance.supervision.shared.types import LiteratureBase
+
+
+def _base(name: str) -> LiteratureBase:
+    return LiteratureBase(
+        name=name,
+        rationale="r",
+        perspective_type="supportive",
+        search_queries=[name],
+        integration_strategy="weave",
+    )
+
+
+class StubMiniReview:
+    """Stub run_mini_review recording start/end times per base."""
+
+    def __init__(self, delay: float = 0.05, tokens_used: int | None = None, papers: tuple[str, ...] = ()):
+        self.delay = delay
+        self.tokens_used = tokens_used
+        self.papers = papers
+        self.started: dict[str, float] = {}
+        self.finished: dict[str, float] = {}
+        self.cancelled: list[str] = []
+
+    async def __call__(self, literature_base, parent_topic, quality_settings, exclude_dois):
+        name = literature_base.name
+        self.started[name] = time.monotonic()
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled.append(name)
+            raise
+        self.finished[name] = time.monotonic()
+        found = [doi for doi in self.papers if doi not in exclude_dois]
+        result = {
+            "mini_review_text": f"review of {name}",
+            "exclude": exclude_dois,
+            "paper_summaries": {doi: {"title": doi} for doi in found},
+            "paper_corpus": {doi: {"doi": doi} for doi in found},
+            "zotero_keys": {doi: doi.upper() for doi in found},
+            "references": [{"doi": doi, "citation_text": doi, "zotero_key": doi.upper()} for doi in found],
+        }
+        if self.tokens_used is not None:
+            result["tokens_used"] = self.tokens_used
+        return result
+
+    def max_concurrency(self) -> int:
+        events = sorted(
+            [(t, 1) for t in self.started.values()] + [(t, -1) for t in self.finished.values()],
+            key=lambda e: (e[0], e[1]),
+        )
+        current = peak = 0
+        for _, delta in events:
+            current += delta
+            peak = max(peak, current)
+        return peak
+
+
+def _scheduler(stub: StubMiniReview, **kwargs) -> MiniReviewScheduler:
+    return MiniReviewScheduler(
+        parent_topic="urban heat",
+        quality_settings={},
+        run_fn=stub,
+        estimated_tokens=100,
+        **kwargs,
+    )
+
+
+class TestMiniReviewScheduler:
+    @pytest.mark.asyncio
+    async def test_runner_ups_run_concurrently_up_to_limit(self):
+        stub = StubMiniReview(delay=0.2)
+        scheduler = _scheduler(stub, max_concurrent=2)
+        a, b, c = _base("A"), _base("B"), _base("C")
+
+        scheduler.schedule([a, b, c], exclude_dois={"10.1/x"})
+        first = await scheduler.result(a, exclude_dois={"10.1/x"})
+        # B was started alongside A and is ready without waiting another delay
+        waited_from = time.monotonic()
+        second = await scheduler.result(b, exclude_dois={"10.1/x"})
+
+        assert first["mini_review_text"] == "review of A"
+        assert second["mini_review_text"] == "review of B"
+        assert "C" not in stub.started
+        assert stub.max_concurrency() == 2
+        assert abs(stub.started["A"] - stub.started["B"]) < 0.05
+        assert time.monotonic() - waited_from < 0.05
+        await scheduler.aclose()
+
+    @pytest.mark.asyncio
+    async def test_base_losing_ranking_is_cancelled(self):
+        stub = StubMiniReview(delay=1.0)
+        scheduler = _scheduler(stub, max_concurrent=2)
+        a, b, c = _base("A"), _base("B"), _base("C")
+
+        scheduler.schedule([a, b], exclude_dois=set())
+        await asyncio.sleep(0)
+        scheduler.schedule([a, c], exclude_dois=set())
+        await asyncio.sleep(0)
+
+        assert stub.cancelled == ["B"]
+        assert set(stub.started) == {"A", "B", "C"}
+        assert set(scheduler.jobs) == {"a", "c"}
+        await scheduler.aclose()
+        assert sorted(stub.cancelled) == ["A", "B", "C"]
+
+    @pytest.mark.asyncio
+    async def test_finished_job_losing_ranking_is_dropped(self):
+        stub = StubMiniReview(delay=0.01)
+        scheduler = _scheduler(stub, max_concurrent=2)
+        a, b, c = _base("A"), _base("B"), _base("C")
+
+        scheduler.schedule([a, b], exclude_dois=set())
+        await asyncio.sleep(0.05)
+        scheduler.schedule([a, c], exclude_dois=set())
+
+        assert stub.cancelled == []
+        assert set(scheduler.jobs) == {"a", "c"}
+        await scheduler.aclose()
+
+    @pytest.mark.asyncio
+    async def test_speculative_result_drops_papers_added_since_launch(self):
+        stub = StubMiniReview(delay=0.01, papers=("10.1/a", "10.1/b", "10.1/c"))
+        scheduler = _scheduler(stub, max_concurrent=2)
+        a, b = _base("A"), _base("B")
+
+        scheduler.schedule([a, b], exclude_dois={"10.1/a"})
+        await scheduler.result(a, exclude_dois={"10.1/a"})
+        # A's integration added 10.1/b to the corpus after B was launched
+        result = await scheduler.result(b, exclude_dois={"10.1/a", "10.1/b"})
+
+        assert set(result["paper_corpus"]) == {"10.1/c"}
+        assert set(result["paper_summaries"]) == {"10.1/c"}
+        assert result["zotero_keys"] == {"10.1/c": "10.1/C"}
+        assert [ref["doi"] for ref in result["references"]] == ["10.1/c"]
+        assert result["mini_review_text"] == "review of B"
+
+    @pytest.mark.asyncio
+    async def test_budget_limits_speculation_but_not_primary(self):
+        stub = StubMiniReview(delay=0.01)
+        scheduler = _scheduler(stub, max_concurrent=3, token_budget=TokenBudget(150))
+        a, b, c = _base("A"), _base("B"), _base("C")
+
+        scheduler.schedule([a, b, c], exclude_dois=set())
+
+        # A reserves 100; speculating on B or C would exceed 150
+        assert set(scheduler.jobs) == {"a"}
+        await scheduler.result(a, exclude_dois=set())
+
+        # Once B is the chosen base it runs even past the budget
+        result = await scheduler.result(b, exclude_dois=set())
+        assert result["mini_review_text"] == "review of B"
+        assert scheduler.budget.remaining == 0
+
+    @pytest.mark.asyncio
+    async def test_reported_usage_settles_budget(self):
+        stub = StubMiniReview(delay=0.01, tokens_used=30)
+        budget = TokenBudget(1000)
+        scheduler = _scheduler(stub, max_concurrent=2, token_budget=budget)
+        a, b = _base("A"), _base("B")
+
+        scheduler.schedule([a, b], exclude_dois=set())
+        assert budget.committed == 200
+        await scheduler.result(a, exclude_dois=set())
+        await scheduler.result(b, exclude_dois=set())
+
+        assert budget.committed == 60
+
+    @pytest.mark.asyncio
+    async def test_results_consumed_in_priority_order(self):
+        stub = StubMiniReview(delay=0.01)
+        scheduler = _scheduler(stub, max_concurrent=3)
+        bases = [_base("A"), _base("B"), _base("C")]
+        scheduler.schedule(bases, exclude_dois=set())
+
+        integrated = []
+        for base in bases:
+            result = await scheduler.result(base, exclude_dois=set())
+            integrated.append(result["mini_review_text"])
+
+        assert integrated == ["review of A", "review of B", "review of C"]
+        assert scheduler.jobs == {}
+
+
+class TestRunMiniReview:
+    @pytest.mark.asyncio
+    async def test_reports_tokens_of_its_llm_calls(self, monkeypatch):
+        monkeypatch.setenv("THALA_USAGE_LEDGER", "0")
+
+        async def fake_run(literature_base, parent_topic, quality_settings, exclude_dois):
+            usage = {"input_tokens": 40, "output_tokens": 2, "cache_read_input_tokens": 8}
+            record_llm_usage("claude-sonnet-4-6", usage, source="invoke")
+            await asyncio.to_thread(record_llm_usage, "claude-sonnet-4-6", usage, source="invoke")
+            return {"mini_review_text": "review"}
+
+        monkeypatch.setattr(mini_review_graph, "_run_mini_review", fake_run)
+        record_llm_usage("claude-sonnet-4-6", {"input_tokens": 1000}, source="invoke")
+
+        result = await run_mini_review(_base("A"), "urban heat", {}, set())
+
+        assert result["tokens_used"] == 100
@@ -0,0 +1,206 @@
+"""Tests for section-scoped patch integration in supervision Loop 2."""
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from workflows.enhance.editing.parser import parse_markdown_to_model
+from workflows.enhance.supervision.loop2 import graph as loop2_graph
+from workflows.enhance.supervision.shared.section_patches import (
+    PatchApplicationError,
+    apply_section_patches,
+    split_section_spans,
+)
+from workflows.enhance.supervision.shared.types import SectionPatch, SectionPatchSet
+
+REVIEW = """# Urban Heat and Public Health
+
+A review of urban heat exposure.
+
+## 1. Introduction
+
+Cities are warming faster than rural areas [@AAAA1111].
+Heat waves   are increasing in frequency.
+
+Vulnerable groups face the greatest risk [@BBBB2222].
+
+## 2. Methods
+
+We reviewed sixty studies published since 2000.
+
+### 2.1 Search Strategy
+
+Databases searched: Scopus, Web of Science.
+
+
+## 3. Findings
+
+Green infrastructure lowers surface temperatures [@CCCC3333].
+
+```python
+# Not a heading: code blocks are left alone
+```
+
+## 4. Conclusion
+
+Policy should prioritise shade and cooling centres.
+"""
+
+
+def _spans(text: str) -> dict[str, str]:
+    return dict(split_section_spans(text))
+
+
+def _ids(text: str) -> dict[str, str]:
+    """Map section heading -> section id."""
+    model = parse_markdown_to_model(text)
+    return {s.heading: s.section_id for s in model.get_all_sections()}
+
+
+def _block_id(text: str, heading: str, index: int = 0) -> str:
+    model = parse_markdown_to_model(text)
+    return model.get_section_by_heading(heading).blocks[index].block_id
+
+
+class TestSplitSectionSpans:
+    def test_spans_reassemble_input_exactly(self):
+        assert "".join(t for _, t in split_section_spans(REVIEW)) == REVIEW
+
+    def test_span_ids_match_parsed_sections(self):
+        span_ids = [sid for sid, _ in split_section_spans(REVIEW)[1:]]
+        model_ids = [s.section_id for s in parse_markdown_to_model(REVIEW).get_all_sections()]
+        assert span_ids == model_ids
+
+
+class TestApplySectionPatches:
+    def test_untouched_sections_are_byte_identical(self):
+        ids = _ids(REVIEW)
+        patches = [
+            SectionPatch(
+                operation="insert_after_block",
+                target_id=_block_id(REVIEW, "3. Findings"),
+                content="Cool roofs offer complementary benefits [@DDDD4444].",
+            ),
+            SectionPatch(
+                operation="replace_block",
+                target_id=_block_id(REVIEW, "2. Methods"),
+                content="We reviewed sixty-four studies published since 2000.",
+            ),
+        ]
+
+        result = apply_section_patches(REVIEW, patches)
+
+        assert result.applied == 2
+        assert set(result.touched_sections) == {ids["2. Methods"], ids["3. Findings"]}
+        before, after = _spans(REVIEW), _spans(result.text)
+        for section_id in set(before) - set(result.touched_sections):
+            assert after[section_id] == before[section_id]
+        assert "sixty-four studies" in after[ids["2. Methods"]]
+        assert "sixty studies" not in result.text
+        assert "[@DDDD4444]" in after[ids["3. Findings"]]
+
+    def test_insert_section_after_places_new_section_after_subsections(self):
+        ids = _ids(REVIEW)
+        patch = SectionPatch(
+            operation="insert_section_after",
+            target_id=ids["2. Methods"],
+            heading="2.5 Adjacent Literature: Urban Ecology",
+            content="First paragraph [@EEEE5555].\n\nSecond paragraph.",
+        )
+
+        result = apply_section_patches(REVIEW, [patch])
+
+        text = result.text
+        assert (
+            text.index("### 2.1 Search Strategy")
+            < text.index("## 2.5 Adjacent Literature")
+            < text.index("## 3. Findings")
+        )
+        # No existing section was re-rendered
+        assert result.touched_sections == []
+        before, after = _spans(REVIEW), _spans(text)
+        for section_id, raw in before.items():
+            assert after[section_id] == raw
+
+    def test_invalid_patches_are_skipped(self):
+        patches = [
+            SectionPatch(operation="replace_block", target_id="blk_missing", content="x"),
+            SectionPatch(
+                operation="append_to_section",
+                target_id=_ids(REVIEW)["4. Conclusion"],
+                content="## Sneaky heading\n\nText",
+            ),
+        ]
+
+        result = apply_section_patches(REVIEW, patches)
+
+        assert result.applied == 0
+        assert len(result.skipped) == 2
+        assert result.text == REVIEW
+
+    def test_merged_duplicate_headings_raise(self):
+        text = "## 1. Introduction\n\n## Introduction\n\nBody text here.\n"
+
+        with pytest.raises(PatchApplicationError):
+            apply_section_patches(text, [])
+
+
+class TestLoop2PatchIntegration:
+    @pytest.mark.asyncio
+    async def test_stubbed_integrator_patches_only_target_section(self, monkeypatch):
+        target = _block_id(REVIEW, "1. Introduction", index=1)
+        stub = AsyncMock(
+            return_value=SectionPatchSet(
+                patches=[
+                    SectionPatch(
+                        operation="replace_block",
+                        target_id=target,
+                        content="Vulnerable groups, including outdoor workers, face the greatest risk [@BBBB2222] [@FFFF6666].",
+                    )
+                ]
+            )
+        )
+        monkeypatch.setattr(loop2_graph, "invoke", stub)
+
+        updated = await loop2_graph._integrate_with_patches(
+            REVIEW,
+            {
+                "word_budget": "",
+                "literature_base_name": "Occupational health",
+                "mini_review": "...",
+                "integration_strategy": "weave",
+                "new_citation_keys": "[@FFFF6666] - Heat at work",
+            },
+            "test",
+        )
+
+        assert stub.await_args.kwargs["schema"] is SectionPatchSet
+        assert f'<block id="{target}">' in stub.await_args.kwargs["user"]
+        ids = _ids(REVIEW)
+        before, after = _spans(REVIEW), _spans(updated)
+        assert "[@FFFF6666]" in after[ids["1. Introduction"]]
+        for section_id, raw in before.items():
+            if section_id != ids["1. Introduction"]:
+                assert after[section_id] == raw
+
+    @pytest.mark.asyncio
+    async def test_no_applicable_patches_falls_back(self, monkeypatch):
+        monkeypatch.setattr(
+            loop2_graph,
+            "invoke",
+            AsyncMock(return_value=SectionPatchSet(patches=[])),
+        )
+
+        updated = await loop2_graph._integrate_with_patches(
+            REVIEW,
+            {
+                "word_budget": "",
+                "literature_base_name": "x",
+                "mini_review": "",
+                "integration_strategy": "",
+                "new_citation_keys": "None",
+            },
+            "test",
+        )
+
+        assert updated is None
@@ -0,0 +1,193 @@
+"""Tests for out-of-band image storage in illustrate graph state."""
+
+import os
+
+import pytest
+
+from workflows.output.illustrate import blob_store, run_illustrate_graph
+from workflows.output.illustrate.blob_store import get_blob_store, load_image, offload_image
+from workflows.output.illustrate.config import IllustrateConfig
+from workflows.output.illustrate.graph import sync_after_selection
+from workflows.output.illustrate.nodes import generate_candidate as generate_candidate_module
+from workflows.output.illustrate.nodes.finalize import finalize_node
+from workflows.output.illustrate.nodes.generate_candidate import generate_candidate_node
+from workflows.output.illustrate.state import LocationSelection
+
+from .conftest import _make_brief, _make_gen_result, _make_plan
+
+RUN_ID = "run123"
+
+
+@pytest.fixture(autouse=True)
+def blob_root(tmp_path, monkeypatch):
+    root = tmp_path / "blobs"
+    monkeypatch.setattr(blob_store, "BLOB_ROOT", root)
+    return root
+
+
+def _png(seed: int, size: int = 512 * 1024) -> bytes:
+    return b"\x89PNG\r\n\x1a\n" + os.urandom(size) + bytes([seed])
+
+
+def _selection(location_id: str, brief_id: str) -> LocationSelection:
+    return LocationSelection(
+        location_id=location_id,
+        selected_brief_id=brief_id,
+        quality_tier="excellent",
+        reasoning="better",
+    )
+
+
+class TestImageBlobStore:
+    def test_put_get_roundtrip_and_dedup(self, blob_root):
+        store = get_blob_store(RUN_ID)
+        data = _png(1, size=64)
+
+        digest = store.put(data)
+
+        assert store.put(data) == digest
+        assert store.get(digest) == data
+        assert list((blob_root / RUN_ID).iterdir()) == [blob_root / RUN_ID / digest]
+
+    def test_missing_blob_raises_key_error(self):
+        with pytest.raises(KeyError):
+            get_blob_store(RUN_ID).get("0" * 64)
+
+    def test_rejects_non_digest_keys(self):
+        with pytest.raises(ValueError):
+            get_blob_store(RUN_ID).get("../secrets")
+
+    def test_delete_and_clear(self, blob_root):
+        store = get_blob_store(RUN_ID)
+        a, b = store.put(b"a"), store.put(b"b")
+
+        assert store.delete([a, a, "f" * 64]) == 1
+        assert not (blob_root / RUN_ID / a).exists()
+
+        store.clear()
+        assert not (blob_root / RUN_ID).exists()
+        with pytest.raises(KeyError):
+            store.get(b)
+
+    @pytest.mark.asyncio
+    async def test_load_image_accepts_inline_legacy_results(self):
+        assert await load_image(_make_gen_result(image_bytes=b"INLINE")) == b"INLINE"
+        assert await load_image(_make_gen_result(image_bytes=None)) is None
+
+
+class TestRunNamespace:
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("fail", [False, True])
+    async def test_each_run_gets_its_own_namespace_cleared_at_exit(self, blob_root, fail):
+        seen = []
+
+        class FakeGraph:
+            async def ainvoke(self, state):
+                seen.append(state["run_id"])
+                get_blob_store(state["run_id"]).put(b"candidate")
+                if fail:
+                    raise RuntimeError("generation failed")
+                return {"illustrated_document": state["input"]["markdown_document"]}
+
+        graph_input = {"input": {"markdown_document": "# Doc"}}
+        for _ in range(2):
+            try:
+                await run_illustrate_graph(FakeGraph(), graph_input)
+            except RuntimeError:
+                assert fail
+
+        assert len(set(seen)) == 2
+        assert blob_store.DEFAULT_RUN_ID not in seen
+        assert not blob_root.exists() or not any(blob_root.iterdir())
+
+
+class TestOffloadInGraph:
+    @pytest.mark.asyncio
+    async def test_generated_candidate_carries_only_digest(self, monkeypatch):
+        image = _png(1, size=1024)
+
+        async def fake_imagen(**kwargs):
+            return {"generation_results": [_make_gen_result(brief_id=kwargs["brief_id"], image_bytes=image)]}
+
+        monkeypatch.setattr(generate_candidate_module, "_generate_imagen", fake_imagen)
+
+        result = await generate_candidate_node(
+            {
+                "location": _make_plan(),
+                "brief": _make_brief(),
+                "brief_id": "section_1_1",
+                "document_context": "doc",
+                "config": IllustrateConfig(),
+                "run_id": RUN_ID,
+            }
+        )
+
+        gen = result["generation_results"][0]
+        assert gen["image_bytes"] is None
+        assert get_blob_store(RUN_ID).get(gen["image_ref"]) == image
+
+    @pytest.mark.asyncio
+    async def test_sync_after_selection_deletes_loser_blobs_only(self):
+        store = get_blob_store(RUN_ID)
+        winner = await offload_image(_make_gen_result(location_id="s1", brief_id="s1_1", image_bytes=b"W"), RUN_ID)
+        loser = await offload_image(_make_gen_result(location_id="s1", brief_id="s1_2", image_bytes=b"L"), RUN_ID)
+        # Same image as the winner, produced by another brief
+        twin = await offload_image(_make_gen_result(location_id="s2", brief_id="s2_2", image_bytes=b"W"), RUN_ID)
+        loser_ref = loser["image_ref"]
+
+        sync_after_selection(
+            {
+                "run_id": RUN_ID,
+                "generation_results": [winner, loser, twin],
+                "selection_results": [_selection("s1", "s1_1")],
+            }
+        )
+
+        assert loser["image_ref"] is None and twin["image_ref"] is None
+        assert store.get(winner["image_ref"]) == b"W"
+        with pytest.raises(KeyError):
+            store.get(loser_ref)
+
+    @pytest.mark.asyncio
+    async def test_finalize_writes_from_blob_then_collects(self, tmp_path, blob_root):
+        image = _png(1, size=128)
+        gen = await offload_image(_make_gen_result(location_id="s0", brief_id="s0_1", image_bytes=image), RUN_ID)
+
+        result = await finalize_node(
+            {
+                "input": {"markdown_document": "# Section 0\n\nText"},
+                "config": IllustrateConfig(output_dir=str(tmp_path / "out")),
+                "run_id": RUN_ID,
+                "image_plan": [_make_plan(location_id="s0", insertion_after_header="Section 0")],
+                "generation_results": [gen],
+                "selection_results": [_selection("s0", "s0_1")],
+                "errors": [],
+            }
+        )
+
+        [final] = result["final_images"]
+        with open(final["file_path"], "rb") as f:
+            assert f.read() == image
+        assert list((blob_root / RUN_ID).iterdir()) == []
+
+
+class TestCheckpointSize:
+    @pytest.mark.asyncio
+    async def test_offloading_shrinks_serialized_state(self):
+        from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
+
+        serde = JsonPlusSerializer()
+        # 6 locations x 2 candidates of 512 KB, as in a default run
+        inline = [
+            _make_gen_result(location_id=f"s{loc}", brief_id=f"s{loc}_{i}", image_bytes=_png(loc * 2 + i))
+            for loc in range(6)
+            for i in range(2)
+        ]
+        offloaded = [await offload_image(r, RUN_ID) for r in inline]
+
+        _, inline_blob = serde.dumps_typed({"generation_results": inline})
+        _, offloaded_blob = serde.dumps_typed({"generation_results": offloaded})
+
+        assert len(inline_blob) > 6 * 1024 * 1024
+        assert len(offloaded_blob) < 4 * 1024
+        assert len(inline_blob) / len(offloaded_blob) > 1000
@@ -0,0 +1,49 @@
+"""Stand-in for `claude -p --input-format stream-json` used by the pool tests.
+
+Reads JSON user messages from stdin, one per line, and answers each with a
+system/assistant/result event sequence like the real CLI. The result
+echoes the prompt along with this process's pid and request count, so
+tests can tell which worker served a request. Prompts control behaviour:
+
+    "crash"        exit(1) with a message on stderr
+    "hang"         never answer
+    "limit"        an is_error result carrying the usage-limit marker
+    "slow:<secs>"  sleep before answering
+"""
+
+import json
+import os
+import sys
+import time
+
+structured = "--json-schema" in sys.argv
+print(json.dumps({"type": "system", "subtype": "init", "pid": os.getpid()}), flush=True)
+
+count = 0
+for line in sys.stdin:
+    prompt = json.loads(line)["message"]["content"]
+    count += 1
+
+    if prompt == "crash":
+        print("fatal: worker crashed", file=sys.stderr, flush=True)
+        sys.exit(1)
+    if prompt == "hang":
+        time.sleep(3600)
+    if prompt.startswith("slow:"):
+        time.sleep(float(prompt.split(":", 1)[1]))
+
+    result = {
+        "type": "result",
+        "subtype": "success",
+        "is_error": False,
+        "result": f"echo: {prompt}",
+        "usage": {"input_tokens": 10, "output_tokens": 5},
+    }
+    if prompt == "limit":
+        result.update(is_error=True, result="Claude AI usage limit reached|1700000000")
+    if structured:
+        result["structured_output"] = {"summary": prompt, "score": float(os.getpid()), "count": count}
+
+    print("not json: progress noise", flush=True)
+    print(json.dumps({"type": "assistant", "message": {"content": [{"type": "text", "text": prompt}]}}), flush=True)
+    print(json.dumps(result), flush=True)
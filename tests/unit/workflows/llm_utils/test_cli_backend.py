@@ -31,6 +31,12 @@ def _mock_waitpid():
         yield
 
 
+# These tests mock one-shot subprocesses; the worker pool has its own tests.
+@pytest.fixture(autouse=True)
+def _disable_worker_pool(monkeypatch):
+    monkeypatch.setenv("THALA_CLI_POOL", "0")
+
+
 # -- Test schema for structured output --
 
 
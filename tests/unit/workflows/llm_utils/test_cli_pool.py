@@ -0,0 +1,178 @@
+"""Tests for the claude CLI worker pool, driven by a fake CLI script."""
+
+import asyncio
+import os
+import sys
+import time
+from contextlib import asynccontextmanager
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from pydantic import BaseModel
+
+from workflows.shared.llm_utils.cli_backend import _RateLimitError, invoke_structured_via_cli
+from workflows.shared.llm_utils.cli_pool import CLIWorkerError, CLIWorkerPool, get_cli_pool, stream_json_cmd
+from workflows.shared.llm_utils.models import ModelTier
+
+FAKE_CLI = str(Path(__file__).parent / "fake_claude_cli.py")
+CMD = [sys.executable, FAKE_CLI, "--model", "sonnet"]
+STRUCTURED_CMD = CMD + ["--json-schema", "{}"]
+
+
+class MockAnalysis(BaseModel):
+    summary: str
+    score: float
+
+
+@asynccontextmanager
+async def make_pool(**kwargs):
+    # Created inside each test so workers belong to the test's event loop
+    options = dict(max_concurrency=2, max_requests_per_worker=1, idle_ttl=60, max_idle=2)
+    pool = CLIWorkerPool(**{**options, **kwargs})
+    try:
+        yield pool
+    finally:
+        await pool.aclose()
+
+
+def _pid(result: dict) -> int:
+    return int(result["structured_output"]["score"])
+
+
+async def _settle(pool: CLIWorkerPool) -> None:
+    """Wait for background spare spawning to finish."""
+    while pool._spawning:
+        await asyncio.gather(*pool._spawning.values(), return_exceptions=True)
+
+
+class TestStreamJsonCmd:
+    def test_swaps_output_format(self):
+        cmd = ["claude", "-p", "--output-format", "json", "--model", "haiku"]
+        assert stream_json_cmd(cmd) == [
+            "claude",
+            "-p",
+            "--input-format",
+            "stream-json",
+            "--output-format",
+            "stream-json",
+            "--verbose",
+            "--model",
+            "haiku",
+        ]
+
+
+class TestCLIWorkerPool:
+    @pytest.mark.asyncio
+    async def test_returns_result_event(self):
+        async with make_pool() as pool:
+            result = await pool.run(STRUCTURED_CMD, "hello")
+
+            assert result["result"] == "echo: hello"
+            assert result["structured_output"]["summary"] == "hello"
+
+    @pytest.mark.asyncio
+    async def test_next_request_uses_prewarmed_worker(self):
+        async with make_pool() as pool:
+            first = await pool.run(STRUCTURED_CMD, "a")
+            await _settle(pool)
+            second = await pool.run(STRUCTURED_CMD, "b")
+
+            assert _pid(first) != _pid(second)
+            assert pool.stats["warm_hits"] == 1
+            # Single-request workers each see a fresh session
+            assert second["structured_output"]["count"] == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent_finishes_share_one_spare(self):
+        async with make_pool() as pool:
+            await asyncio.gather(pool.run(CMD, "a"), pool.run(CMD, "b"))
+            await _settle(pool)
+
+            assert len(pool._idle) == 1
+            # Two request workers plus a single spare
+            assert pool.stats["spawned"] == 3
+
+    @pytest.mark.asyncio
+    async def test_recycles_after_max_requests(self):
+        async with make_pool(max_requests_per_worker=2, max_idle=1) as pool:
+            results = [await pool.run(STRUCTURED_CMD, str(i)) for i in range(3)]
+
+        pids = [_pid(r) for r in results]
+        assert pids[0] == pids[1] != pids[2]
+        assert [r["structured_output"]["count"] for r in results] == [1, 2, 1]
+        assert pool.stats["recycled"] == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(self):
+        async with make_pool() as pool:
+            start = time.monotonic()
+            await asyncio.gather(*(pool.run(CMD, "slow:0.3") for _ in range(4)))
+
+            assert pool.stats["peak_active"] == 2
+            assert time.monotonic() - start >= 0.6
+
+    @pytest.mark.asyncio
+    async def test_crash_is_reported_and_worker_replaced(self):
+        async with make_pool() as pool:
+            with pytest.raises(CLIWorkerError, match="worker crashed") as exc_info:
+                await pool.run(CMD, "crash")
+            assert "fatal" in exc_info.value.stderr
+
+            result = await pool.run(CMD, "after")
+            assert result["result"] == "echo: after"
+            assert pool.stats["crashed"] == 1
+
+    @pytest.mark.asyncio
+    async def test_timeout_kills_worker(self):
+        async with make_pool() as pool:
+            with pytest.raises(TimeoutError):
+                await pool.run(CMD, "hang", timeout=0.5)
+
+            assert pool.stats["timeouts"] == 1
+            result = await pool.run(CMD, "after")
+            assert result["result"] == "echo: after"
+
+    @pytest.mark.asyncio
+    async def test_dead_idle_worker_is_not_handed_out(self):
+        async with make_pool() as pool:
+            await pool.run(STRUCTURED_CMD, "a")
+            await _settle(pool)
+            (spare,) = pool._idle
+            os.kill(spare.proc.pid, 9)
+            # The child watcher reaps it; is_healthy only reads returncode
+            await asyncio.wait_for(spare.proc.wait(), timeout=5)
+            assert not spare.is_healthy(pool.idle_ttl)
+
+            result = await pool.run(STRUCTURED_CMD, "b")
+
+            assert _pid(result) != spare.proc.pid
+            assert pool.stats["unhealthy"] == 1
+
+
+class TestInvokeViaPool:
+    @pytest.fixture(autouse=True)
+    def _pooled(self, monkeypatch):
+        monkeypatch.setenv("THALA_CLI_POOL", "1")
+        monkeypatch.setattr(
+            "workflows.shared.llm_utils.cli_backend._build_base_cmd",
+            lambda *args, **kwargs: [sys.executable, FAKE_CLI, "--json-schema", "{}", "--output-format", "json"],
+        )
+
+    @pytest.mark.asyncio
+    async def test_structured_call_through_pool(self):
+        try:
+            result = await invoke_structured_via_cli(ModelTier.SONNET, "sys", "summarise", MockAnalysis)
+        finally:
+            await get_cli_pool().aclose()
+
+        assert result.summary == "summarise"
+
+    @pytest.mark.asyncio
+    async def test_usage_limit_result_raises_rate_limit(self):
+        try:
+            with patch("workflows.shared.llm_utils.cli_backend._CLI_RATE_LIMIT_MAX_WAIT", 0):
+                with pytest.raises(_RateLimitError):
+                    await invoke_structured_via_cli(ModelTier.SONNET, "sys", "limit", MockAnalysis)
+        finally:
+            await get_cli_pool().aclose()
@@ -573,7 +573,7 @@ class TestInvokeBatchContextManager:
         mock_broker = MagicMock()
         mock_broker.batch_group.return_value.__aenter__ = AsyncMock()
         mock_broker.batch_group.return_value.__aexit__ = AsyncMock()
-        mock_broker.request = AsyncMock(side_effect=futures)
+        mock_broker.request_many = AsyncMock(return_value=futures)
 
         with (
             patch("workflows.shared.llm_utils.cli_backend.is_cli_backend_enabled", return_value=False),
@@ -588,7 +588,42 @@ class TestInvokeBatchContextManager:
             results = await batch.results()
 
         assert len(results) == 3
-        assert mock_broker.request.call_count == 3
+        # Submitted in a single bulk enqueue
+        mock_broker.request_many.assert_awaited_once()
+        specs = mock_broker.request_many.await_args.args[0]
+        assert [(s.model, s.system, s.prompt) for s in specs] == [
+            (ModelTier.HAIKU, "S1", "U1"),
+            (ModelTier.HAIKU, "S2", "U2"),
+            (ModelTier.SONNET, "S3", "U3"),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_return_exceptions_keeps_successful_responses(self):
+        """With return_exceptions, a failed request does not fail the batch."""
+        from core.llm_broker import LLMResponse
+
+        futures = [asyncio.Future() for _ in range(2)]
+        futures[0].set_result(LLMResponse(request_id="ok", content="fine", success=True))
+        futures[1].set_result(LLMResponse(request_id="bad", content="", success=False, error="overloaded"))
+
+        mock_broker = MagicMock()
+        mock_broker.batch_group.return_value.__aenter__ = AsyncMock()
+        mock_broker.batch_group.return_value.__aexit__ = AsyncMock()
+        mock_broker.request_many = AsyncMock(return_value=futures)
+
+        with (
+            patch("workflows.shared.llm_utils.cli_backend.is_cli_backend_enabled", return_value=False),
+            patch("core.llm_broker.is_broker_enabled", return_value=True),
+            patch("core.llm_broker.get_broker", return_value=mock_broker),
+        ):
+            async with invoke_batch(return_exceptions=True) as batch:
+                batch.add(tier=ModelTier.HAIKU, system="S1", user="U1")
+                batch.add(tier=ModelTier.HAIKU, system="S2", user="U2")
+
+            ok, failed = await batch.results()
+
+        assert ok.content == "fine"
+        assert isinstance(failed, RuntimeError) and "overloaded" in str(failed)
 
     @pytest.mark.asyncio
     async def test_results_not_available_before_exit(self):
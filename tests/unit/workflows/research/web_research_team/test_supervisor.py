@@ -0,0 +1,151 @@
+"""Tests for the streaming research loop, using fake researchers with scripted delays."""
+
+import asyncio
+import time
+
+import pytest
+
+from workflows.research.web_research_team import supervisor
+from workflows.research.web_research_team.researcher import ResearchFinding
+
+BRIEF = {"topic": "heat pumps", "key_questions": ["cost", "efficiency", "adoption"]}
+
+
+def _q(name: str) -> dict:
+    return {"question": name, "context": "", "search_hints": []}
+
+
+class FakeTeam:
+    """Scripted planner and researchers that record dispatch timing."""
+
+    def __init__(self, plans: list, delays: dict[str, float], failures: set[str] = frozenset()):
+        self.plans = list(plans)
+        self.delays = delays
+        self.failures = failures
+        self.plan_calls: list[dict] = []
+        self.started: dict[str, float] = {}
+        self.finished: dict[str, float] = {}
+        self.cancelled: list[str] = []
+        self.active = 0
+        self.max_active = 0
+        self.t0 = time.monotonic()
+
+    async def plan(self, brief, findings, iteration, max_iterations, in_progress=None):
+        self.plan_calls.append({"findings": len(findings), "in_progress": list(in_progress or [])})
+        return self.plans.pop(0) if self.plans else "RESEARCH_COMPLETE"
+
+    async def research(self, question, context, search_hints, recency_info, max_turns):
+        self.started[question] = time.monotonic() - self.t0
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await asyncio.sleep(self.delays.get(question, 0.05))
+        except asyncio.CancelledError:
+            self.cancelled.append(question)
+            raise
+        finally:
+            self.active -= 1
+        self.finished[question] = time.monotonic() - self.t0
+        if question in self.failures:
+            raise RuntimeError(f"{question} crashed")
+        return ResearchFinding(finding=f"answer to {question}", sources=[], confidence="high", gaps=[])
+
+
+@pytest.fixture
+def team(monkeypatch):
+    def install(plans, delays, failures=frozenset()):
+        fake = FakeTeam(plans, delays, failures)
+
+        async def brief(query):
+            return BRIEF
+
+        async def report(query, brief, findings):
+            return "\n".join(f.finding for f in findings)
+
+        monkeypatch.setattr(supervisor, "_generate_brief", brief)
+        monkeypatch.setattr(supervisor, "_plan_iteration", fake.plan)
+        monkeypatch.setattr(supervisor, "_generate_report", report)
+        monkeypatch.setattr(supervisor, "run_researcher", fake.research)
+        return fake
+
+    return install
+
+
+async def _run(**kwargs):
+    options = {"query": "heat pumps", "max_iterations": 5, "max_researcher_turns": 10, **kwargs}
+    return await supervisor.run_research(**options)
+
+
+class TestStreamingDispatch:
+    @pytest.mark.asyncio
+    async def test_follow_up_dispatched_before_slow_researcher_finishes(self, team):
+        fake = team(
+            plans=[{"questions": [_q("slow"), _q("fast")]}, {"questions": [_q("follow-up")]}],
+            delays={"slow": 0.4, "fast": 0.05, "follow-up": 0.05},
+        )
+
+        result = await _run(max_concurrent_researchers=2, cancel_stragglers=False)
+
+        assert fake.started["follow-up"] < fake.finished["slow"]
+        assert fake.plan_calls[1] == {"findings": 1, "in_progress": ["slow"]}
+        assert result["source_count"] == 3
+
+    @pytest.mark.asyncio
+    async def test_concurrency_cap_holds_queued_questions(self, team):
+        fake = team(plans=[{"questions": [_q(f"q{i}") for i in range(5)]}], delays={})
+
+        result = await _run(max_concurrent_researchers=2)
+
+        assert fake.max_active == 2
+        assert result["source_count"] == 5
+        # All five were dispatched from one plan before replanning
+        assert len(fake.plan_calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_turn_budget_limits_dispatches(self, team):
+        fake = team(plans=[{"questions": [_q(f"q{i}") for i in range(5)]}], delays={})
+
+        result = await _run(max_concurrent_researchers=5, turn_budget=30)
+
+        assert result["researchers_dispatched"] == 3
+        assert sorted(fake.started) == ["q0", "q1", "q2"]
+
+    @pytest.mark.asyncio
+    async def test_stragglers_cancelled_when_questions_covered(self, team):
+        fake = team(
+            plans=[{"questions": [_q("straggler"), _q("quick")]}, "RESEARCH_COMPLETE"],
+            delays={"straggler": 10, "quick": 0.05},
+        )
+
+        start = time.monotonic()
+        result = await _run(max_concurrent_researchers=2)
+        await asyncio.sleep(0)
+
+        assert time.monotonic() - start < 1
+        assert fake.cancelled == ["straggler"]
+        assert result["final_report"] == "answer to quick"
+        assert result["errors"] == []
+
+    @pytest.mark.asyncio
+    async def test_failed_researcher_frees_slot_and_is_reported(self, team):
+        fake = team(
+            plans=[{"questions": [_q("broken"), _q("fine")]}, {"questions": [_q("retry")]}],
+            delays={},
+            failures={"broken"},
+        )
+
+        result = await _run(max_concurrent_researchers=2)
+
+        assert "retry" in fake.started
+        assert result["source_count"] == 2
+        assert result["status"] == "partial"
+        assert any("broken crashed" in e["error"] for e in result["errors"])
+
+    @pytest.mark.asyncio
+    async def test_planning_rounds_bounded_by_max_iterations(self, team):
+        fake = team(plans=[{"questions": [_q(f"q{i}")]} for i in range(10)], delays={})
+
+        result = await _run(max_iterations=3, max_concurrent_researchers=1)
+
+        assert len(fake.plan_calls) == 3
+        assert result["researchers_dispatched"] == 3
@@ -0,0 +1,74 @@
+"""Tests for sampled, cached language detection."""
+
+from unittest.mock import patch
+
+import pytest
+
+from workflows.shared.language import detection
+from workflows.shared.language.detection import (
+    WINDOW_SIZE,
+    clear_detection_cache,
+    detect_language,
+    sample_windows,
+)
+
+GERMAN = (
+    "Die Ergebnisse dieser Studie deuten darauf hin, dass gemeindebasierte "
+    "Maßnahmen die langfristigen Ergebnisse für die Teilnehmenden verbessern. "
+)
+ENGLISH = (
+    "The results of this study suggest that community-based interventions "
+    "improve long-term outcomes for participants across most regions. "
+)
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    clear_detection_cache()
+    yield
+    clear_detection_cache()
+
+
+class TestSampleWindows:
+    def test_short_text_is_not_split(self):
+        assert sample_windows(GERMAN) == [GERMAN]
+
+    def test_long_text_windows_span_document(self):
+        text = "start " + "x " * 50_000 + " end"
+
+        windows = sample_windows(text)
+
+        assert len(windows) == 3
+        assert all(len(w) <= WINDOW_SIZE for w in windows)
+        assert windows[0].startswith("start")
+        assert windows[-1].endswith("end")
+
+
+class TestDetectLanguage:
+    def test_long_document_detected_from_windows(self):
+        lang, confidence = detect_language(GERMAN * 400)
+
+        assert lang == "de"
+        assert confidence > 0.9
+
+    def test_deterministic_across_cache_clears(self):
+        mixed = (GERMAN + ENGLISH) * 3
+        first = detect_language(mixed)
+        clear_detection_cache()
+
+        assert detect_language(mixed) == first
+
+    def test_results_cached_by_content(self):
+        with patch.object(detection, "_detect_window", wraps=detection._detect_window) as spy:
+            detect_language(ENGLISH * 3)
+            detect_language(ENGLISH * 3)
+
+        assert spy.call_count == 1
+
+    def test_windows_vote_by_average_probability(self):
+        votes = [[("de", 0.9)], [("en", 0.6), ("de", 0.4)], []]
+
+        assert detection._vote(votes) == ("de", pytest.approx(0.65))
+
+    def test_short_text_returns_none(self):
+        assert detect_language("kurz") == (None, 0.0)
@@ -0,0 +1,116 @@
+"""Tests for the persistent, pre-warmable prompt translation cache."""
+
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from langchain_core.messages import AIMessage
+
+from workflows.shared import persistent_cache
+from workflows.shared.language import translator
+from workflows.shared.language.prompt_registry import load_registered_prompts
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    """Isolate the disk cache and start each test with an empty memory cache."""
+    monkeypatch.setattr(persistent_cache, "CACHE_DIR", tmp_path)
+    monkeypatch.setattr(persistent_cache, "CACHE_DISABLED", False)
+    translator.clear_translation_cache()
+    yield tmp_path
+    translator.clear_translation_cache()
+
+
+@pytest.fixture
+def mock_invoke(monkeypatch):
+    mock = AsyncMock(side_effect=lambda **kw: AIMessage(content=f"ES: {kw['user'][-5:]}"))
+    monkeypatch.setattr(translator, "invoke", mock)
+    return mock
+
+
+class TestTranslatePrompt:
+    @pytest.mark.asyncio
+    async def test_translation_survives_restart(self, mock_invoke):
+        first = await translator.translate_prompt("Be concise.", "Spanish")
+
+        # Simulate a new process: memory cache gone, disk cache kept
+        translator.clear_translation_cache()
+        second = await translator.translate_prompt("Be concise.", "Spanish")
+
+        assert first == second
+        assert mock_invoke.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_edited_prompt_is_retranslated(self, mock_invoke):
+        await translator.translate_prompt("Be concise.", "Spanish", cache_key="p_es")
+        await translator.translate_prompt("Be brief.", "Spanish", cache_key="p_es")
+        await translator.translate_prompt("Be brief.", "German", cache_key="p_de")
+
+        assert mock_invoke.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_failed_translation_is_not_cached(self, monkeypatch):
+        failing = AsyncMock(side_effect=RuntimeError("overloaded"))
+        monkeypatch.setattr(translator, "invoke", failing)
+
+        result = await translator.translate_prompt("Be concise.", "Spanish")
+
+        assert result == "Be concise."
+        assert translator.get_cached_translation("Be concise.", "Spanish") is None
+
+
+class TestPretranslatePrompts:
+    @pytest.mark.asyncio
+    async def test_batches_only_missing_pairs(self, mock_invoke, monkeypatch):
+        await translator.translate_prompt("one", "Spanish")
+        batch = MagicMock()
+        batch.results = AsyncMock(
+            return_value=[AIMessage(content="uno-de"), AIMessage(content="dos-es"), AIMessage(content="dos-de")]
+        )
+
+        @asynccontextmanager
+        async def fake_invoke_batch(return_exceptions=False):
+            yield batch
+
+        monkeypatch.setattr(translator, "invoke_batch", fake_invoke_batch)
+
+        stats = await translator.pretranslate_prompts({"a": "one", "b": "two", "empty": ""}, ["Spanish", "German"])
+
+        assert stats == {"cached": 1, "translated": 3, "failed": 0}
+        assert batch.add.call_count == 3
+        translator.clear_translation_cache()
+        assert translator.get_cached_translation("two", "German") == "dos-de"
+
+    @pytest.mark.asyncio
+    async def test_one_failed_request_keeps_the_others(self, monkeypatch):
+        batch = MagicMock()
+        batch.results = AsyncMock(
+            return_value=[
+                AIMessage(content="uno"),
+                RuntimeError("Batch request failed: overloaded"),
+                AIMessage(content=""),
+            ]
+        )
+        options = {}
+
+        @asynccontextmanager
+        async def fake_invoke_batch(**kwargs):
+            options.update(kwargs)
+            yield batch
+
+        monkeypatch.setattr(translator, "invoke_batch", fake_invoke_batch)
+
+        stats = await translator.pretranslate_prompts({"a": "one", "b": "two", "c": "three"}, ["Spanish"])
+
+        assert options == {"return_exceptions": True}
+        assert stats == {"cached": 0, "translated": 1, "failed": 2}
+        assert translator.get_cached_translation("one", "Spanish") == "uno"
+        assert translator.get_cached_translation("two", "Spanish") is None
+
+
+def test_registered_prompts_resolve():
+    prompts = load_registered_prompts()
+
+    assert prompts["supervisor_system"]
+    assert prompts["book_finding_header_summary"] == "Summary"
+    assert all(isinstance(text, str) for text in prompts.values())
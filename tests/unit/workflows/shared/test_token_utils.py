@@ -0,0 +1,172 @@
+"""Tests for the cached, batched token counting service."""
+
+import asyncio
+import random
+import threading
+
+import pytest
+
+from tests.factories.tokenizers import make_offline_encoding, paper_markdown
+from workflows.shared import token_utils
+from workflows.shared.token_utils import TokenCounter
+
+
+@pytest.fixture
+def encoding():
+    return make_offline_encoding()
+
+
+@pytest.fixture
+def counter(encoding):
+    return TokenCounter(encoding=encoding, cache_size=64)
+
+
+def _exact(encoding, text: str) -> int:
+    return len(encoding.encode(text, disallowed_special=()))
+
+
+class TestCount:
+    def test_matches_encoding_and_caches_by_content(self, counter, encoding):
+        doc = paper_markdown(sections=2)
+
+        assert counter.count(doc) == _exact(encoding, doc)
+        assert counter.count(doc[:]) == _exact(encoding, doc)
+        assert counter.cache_info()["hits"] == 1
+        assert counter.cache_info()["misses"] == 1
+
+    def test_special_token_strings_are_counted_as_text(self, counter):
+        assert counter.count("scraped <|endofprompt|> text") > 3
+
+    def test_empty_text_is_zero_without_caching(self, counter):
+        assert counter.count("") == 0
+        assert counter.cache_info()["size"] == 0
+
+    def test_cache_is_bounded(self, counter):
+        for i in range(100):
+            counter.count(f"text {i}")
+
+        assert counter.cache_info()["size"] == 64
+
+    def test_module_function_uses_shared_counter(self, counter, monkeypatch):
+        monkeypatch.setattr(token_utils, "get_token_counter", lambda: counter)
+
+        assert token_utils.count_tokens_accurate("hello world") == counter.count("hello world")
+        assert counter.cache_info()["hits"] == 1
+
+
+class TestCountMany:
+    def test_batch_matches_individual_counts(self, counter, encoding):
+        texts = [paper_markdown(seed=i, sections=1) for i in range(5)] + ["", "short"]
+
+        assert counter.count_many(texts) == [_exact(encoding, t) for t in texts]
+
+    def test_only_unique_misses_are_encoded(self, encoding, monkeypatch):
+        counter = TokenCounter(encoding=encoding, num_threads=2)
+        counter.count("cached")
+        encoded_batches = []
+        original = encoding.encode_batch
+
+        def spy(texts, **kwargs):
+            encoded_batches.append(list(texts))
+            return original(texts, **kwargs)
+
+        monkeypatch.setattr(encoding, "encode_batch", spy)
+
+        counts = counter.count_many(["a b", "cached", "c d", "a b"])
+
+        assert encoded_batches == [["a b", "c d"]]
+        assert counts[0] == counts[3]
+
+    def test_single_thread_encodes_sequentially(self, encoding, monkeypatch):
+        counter = TokenCounter(encoding=encoding, num_threads=1)
+        monkeypatch.setattr(encoding, "encode_batch", lambda *a, **kw: pytest.fail("encode_batch used"))
+
+        assert counter.count_many(["a b", "c d"]) == [_exact(encoding, "a b"), _exact(encoding, "c d")]
+
+    @pytest.mark.asyncio
+    async def test_async_variants_run_off_the_event_loop(self, counter, monkeypatch):
+        threads = []
+        original = counter.count_many
+
+        def record(texts):
+            threads.append(threading.current_thread())
+            return original(texts)
+
+        monkeypatch.setattr(counter, "count_many", record)
+
+        counts = await counter.acount_many(["one", "two"])
+
+        assert counts == [counter.count("one"), counter.count("two")]
+        assert threads[0] is not threading.main_thread()
+        assert await counter.acount("one") == counts[0]
+
+
+class TestCountConcat:
+    def test_matches_full_encode_on_paper_sections(self, counter, encoding):
+        sections = paper_markdown().split("\n## ")
+
+        assert counter.count_concat(sections, separator="\n## ") == _exact(encoding, "\n## ".join(sections))
+
+    def test_reuses_cached_segment_counts(self, counter, encoding):
+        sections = [paper_markdown(seed=i, sections=1) for i in range(4)]
+        counter.count_many(sections)
+        counter.clear_cache()
+        counter.count_many(sections)
+        misses = counter.cache_info()["misses"]
+
+        total = counter.count_concat(sections, separator="\n\n")
+
+        assert total == _exact(encoding, "\n\n".join(sections))
+        # Only the short boundary windows are encoded, not the sections again
+        assert counter.cache_info()["misses"] - misses <= 3 * len(sections)
+
+    @pytest.mark.parametrize(
+        "segments,separator",
+        [
+            (["foo", "bar"], ""),
+            (["end.", "\n\nNext"], ""),
+            (["trailing  ", "\n", "x"], ""),
+            (["a\n", "b\n", "c"], ""),
+            (["123", "456"], ""),
+            (["don", "'t"], ""),
+            (["", "x", ""], "\n"),
+            (["x"], "\n\n"),
+        ],
+    )
+    def test_exact_at_tricky_joins(self, counter, encoding, segments, separator):
+        assert counter.count_concat(segments, separator) == _exact(encoding, separator.join(segments))
+
+    def test_exact_on_random_joins(self, counter, encoding):
+        rng = random.Random(7)
+        alphabet = [
+            "foo",
+            " bar",
+            " ",
+            "\n",
+            "\n\n",
+            ".",
+            "!",
+            "123",
+            "é",
+            "\t",
+            "'s",
+            "#",
+            "\r\n",
+            " \n",
+            "<|endoftext|>",
+        ]
+        for _ in range(300):
+            segments = ["".join(rng.choices(alphabet, k=rng.randint(0, 10))) for _ in range(rng.randint(1, 5))]
+            separator = rng.choice(["", " ", "\n", "\n\n"])
+
+            assert counter.count_concat(segments, separator) == _exact(encoding, separator.join(segments))
+
+
+@pytest.mark.asyncio
+async def test_concurrent_counts_share_cache(counter):
+    doc = paper_markdown(sections=3)
+
+    counts = await asyncio.gather(*(counter.acount(doc) for _ in range(8)))
+
+    assert len(set(counts)) == 1
+    assert counter.cache_info()["size"] == 1
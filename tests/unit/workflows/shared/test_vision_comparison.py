@@ -1,11 +1,23 @@
 """Tests for shared vision pair comparison utility."""
 
+import asyncio
+import io
 from unittest.mock import patch
 
 import pytest
 from langchain_core.messages import AIMessage
 
-from workflows.shared.vision_comparison import vision_pair_select, _compare_pair
+from workflows.shared import vision_comparison
+from workflows.shared.vision_comparison import VISION_MAX_DIMENSION, _compare_pair, _normalize_image, vision_pair_select
+
+Image = pytest.importorskip("PIL.Image")
+
+
+def _png(size: tuple[int, int], mode: str = "RGB") -> bytes:
+    color = (10, 120, 200, 128) if mode == "RGBA" else (10, 120, 200)
+    out = io.BytesIO()
+    Image.new(mode, size, color).save(out, format="PNG")
+    return out.getvalue()
 
 
 @pytest.fixture
@@ -45,8 +57,8 @@ class TestVisionPairSelect:
     @pytest.mark.asyncio
     @patch("workflows.shared.vision_comparison._compare_pair")
     async def test_three_candidates_tournament(self, mock_compare, fake_candidates):
-        # First comparison: 0 vs 1 -> B wins (idx 1)
-        # Second comparison: 1 vs 2 -> A wins (idx 1 stays)
+        # Round 1: 0 vs 1 -> B wins (idx 1), idx 2 gets a bye
+        # Round 2: 1 vs 2 -> A wins (idx 1 stays)
         mock_compare.side_effect = ["B", "A"]
         result = await vision_pair_select(fake_candidates, "criteria")
         assert result == 1
@@ -55,8 +67,8 @@ class TestVisionPairSelect:
     @pytest.mark.asyncio
     @patch("workflows.shared.vision_comparison._compare_pair")
     async def test_three_candidates_last_wins(self, mock_compare, fake_candidates):
-        # First comparison: 0 vs 1 -> A wins (idx 0)
-        # Second comparison: 0 vs 2 -> B wins (idx 2)
+        # Round 1: 0 vs 1 -> A wins (idx 0), idx 2 gets a bye
+        # Round 2: 0 vs 2 -> B wins (idx 2)
         mock_compare.side_effect = ["A", "B"]
         result = await vision_pair_select(fake_candidates, "criteria")
         assert result == 2
@@ -68,6 +80,87 @@ class TestVisionPairSelect:
         result = await vision_pair_select([b"a", b"b"], "criteria")
         assert result == 0
 
+    @pytest.mark.asyncio
+    async def test_rounds_compare_pairs_concurrently(self, monkeypatch):
+        active = 0
+        max_active = 0
+        calls = []
+
+        async def judge(image_a, image_b, criteria, model_tier):
+            nonlocal active, max_active
+            calls.append((image_a, image_b))
+            active += 1
+            max_active = max(max_active, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            # Higher-numbered candidate always wins
+            return "B" if image_b > image_a else "A"
+
+        monkeypatch.setattr(vision_comparison, "_compare_pair", judge)
+        candidates = [f"img{i}".encode() for i in range(8)]
+
+        result = await vision_pair_select(candidates, "criteria")
+
+        assert result == 7
+        # 4 + 2 + 1 comparisons; the first round runs all four at once
+        assert len(calls) == 7
+        assert max_active == 4
+
+    @pytest.mark.asyncio
+    async def test_failed_pair_advances_image_a(self, monkeypatch):
+        async def judge(image_a, image_b, criteria, model_tier):
+            if image_a == b"img0":
+                raise RuntimeError("timeout")
+            return "B"
+
+        monkeypatch.setattr(vision_comparison, "_compare_pair", judge)
+
+        # Round 1: 0 vs 1 fails -> 0 advances; 2 vs 3 -> 3. Round 2: 0 vs 3 fails -> 0
+        result = await vision_pair_select([b"img0", b"img1", b"img2", b"img3"], "criteria")
+        assert result == 0
+
+    @pytest.mark.asyncio
+    async def test_candidates_are_downscaled_before_comparison(self, monkeypatch):
+        seen = []
+
+        async def judge(image_a, image_b, criteria, model_tier):
+            seen.extend([image_a, image_b])
+            return "A"
+
+        monkeypatch.setattr(vision_comparison, "_compare_pair", judge)
+
+        await vision_pair_select([_png((4000, 3000)), _png((200, 100))], "criteria")
+
+        sizes = [Image.open(io.BytesIO(b)).size for b in seen]
+        assert sizes == [(VISION_MAX_DIMENSION, 1176), (200, 100)]
+
+
+class TestNormalizeImage:
+    """Test downscaling and re-encoding before comparison."""
+
+    def test_large_opaque_image_becomes_bounded_jpeg(self):
+        result = _normalize_image(_png((3000, 6000)))
+
+        img = Image.open(io.BytesIO(result))
+        assert img.format == "JPEG"
+        assert max(img.size) == VISION_MAX_DIMENSION
+        assert img.size == (784, VISION_MAX_DIMENSION)
+
+    def test_transparent_image_stays_png(self):
+        result = _normalize_image(_png((2000, 2000), mode="RGBA"))
+
+        img = Image.open(io.BytesIO(result))
+        assert img.format == "PNG"
+        assert img.mode == "RGBA"
+        assert img.size == (VISION_MAX_DIMENSION, VISION_MAX_DIMENSION)
+
+    def test_small_compact_image_is_unchanged(self):
+        original = _png((64, 64))
+        assert _normalize_image(original) == original
+
+    def test_undecodable_bytes_pass_through(self):
+        assert _normalize_image(b"not an image") == b"not an image"
+
 
 class TestComparePair:
     """Test individual pair comparison."""
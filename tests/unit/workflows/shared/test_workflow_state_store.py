@@ -0,0 +1,140 @@
+"""Tests for workflow state store serializers, legacy formats and the sidecar index."""
+
+import gzip
+import json
+from datetime import datetime
+from pathlib import Path
+from uuid import uuid4
+
+import pytest
+
+from workflows.shared import workflow_state_store as store
+from workflows.shared.workflow_state_store import (
+    INDEX_FILENAME,
+    cleanup_old_states,
+    list_workflow_states,
+    load_workflow_state,
+    save_workflow_state,
+    state_exists,
+)
+
+WORKFLOW = "academic_lit_review"
+
+
+@pytest.fixture(autouse=True)
+def store_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(store, "STATE_STORE_DIR", tmp_path)
+    monkeypatch.setenv("THALA_PERSIST_STATE", "1")
+    return tmp_path / WORKFLOW
+
+
+def _state() -> dict:
+    return {
+        "input": {"topic": "soil carbon"},
+        "started_at": datetime(2026, 1, 2, 3, 4, 5),
+        "run_uuid": uuid4(),
+        "output_dir": Path("/tmp/out"),
+        "paper_corpus": {f"10.1/{i}": {"title": f"Paper {i}", "year": 2000 + i % 20} for i in range(200)},
+        "counts": {1: "one"},
+    }
+
+
+class TestFormats:
+    @pytest.mark.parametrize("fmt", ["msgpack", "json"])
+    def test_roundtrip_restores_special_types(self, fmt):
+        state = _state()
+
+        path = save_workflow_state(WORKFLOW, "run1", state, format=fmt)
+        loaded = load_workflow_state(WORKFLOW, "run1")
+
+        assert path.name == {"msgpack": "run1.msgpack.zst", "json": "run1.json"}[fmt]
+        assert loaded["started_at"] == state["started_at"]
+        assert loaded["run_uuid"] == state["run_uuid"]
+        assert loaded["output_dir"] == state["output_dir"]
+        assert loaded["paper_corpus"] == state["paper_corpus"]
+
+    def test_msgpack_is_default_and_smaller_than_json(self):
+        path = save_workflow_state(WORKFLOW, "run1", _state())
+        json_path = save_workflow_state(WORKFLOW, "run2", _state(), format="json", compress=False)
+
+        assert path.suffixes == [".msgpack", ".zst"]
+        assert path.stat().st_size < json_path.stat().st_size / 4
+
+    def test_uncompressed_msgpack(self):
+        path = save_workflow_state(WORKFLOW, "run1", _state(), compress=False)
+
+        assert path.name == "run1.msgpack"
+        assert load_workflow_state(WORKFLOW, "run1")["input"] == {"topic": "soil carbon"}
+
+    def test_resave_in_new_format_replaces_old_file(self, store_dir):
+        save_workflow_state(WORKFLOW, "run1", {"v": 1}, format="json")
+        save_workflow_state(WORKFLOW, "run1", {"v": 2}, format="msgpack")
+
+        assert sorted(p.name for p in store_dir.iterdir()) == [INDEX_FILENAME, "run1.msgpack.zst"]
+        assert load_workflow_state(WORKFLOW, "run1") == {"v": 2}
+
+    def test_truncated_file_fails_to_load(self, store_dir):
+        path = save_workflow_state(WORKFLOW, "run1", _state(), compress=False)
+        path.write_bytes(path.read_bytes()[:-10])
+
+        assert load_workflow_state(WORKFLOW, "run1") is None
+
+    def test_unknown_format_is_not_saved(self):
+        assert save_workflow_state(WORKFLOW, "run1", {}, format="yaml") is None
+
+
+class TestLegacyFiles:
+    def test_loads_files_written_by_previous_versions(self, store_dir):
+        store_dir.mkdir(parents=True)
+        payload = {"when": {"__type__": "datetime", "value": "2025-05-01T00:00:00"}, "n": 1}
+        (store_dir / "plain.json").write_text(json.dumps(payload, indent=2))
+        with gzip.open(store_dir / "packed.json.gz", "wt", encoding="utf-8") as f:
+            f.write(json.dumps(payload, indent=2))
+
+        for run_id in ("plain", "packed"):
+            assert state_exists(WORKFLOW, run_id)
+            assert load_workflow_state(WORKFLOW, run_id) == {"when": datetime(2025, 5, 1), "n": 1}
+
+    def test_listing_includes_unindexed_legacy_files(self, store_dir):
+        store_dir.mkdir(parents=True)
+        (store_dir / "legacy.json.gz").write_bytes(gzip.compress(b"{}"))
+        save_workflow_state(WORKFLOW, "new", {"a": 1})
+
+        states = {s["run_id"]: s for s in list_workflow_states(WORKFLOW)}
+
+        assert states["legacy"]["format"] == "json"
+        assert states["new"]["format"] == "msgpack"
+        assert list(states) == ["new", "legacy"]
+
+
+class TestIndex:
+    def test_listing_reads_metadata_without_opening_states(self, monkeypatch):
+        save_workflow_state(WORKFLOW, "run1", _state())
+        save_workflow_state(WORKFLOW, "run2", {"only": 1})
+
+        def no_load(self, path):
+            raise AssertionError("listing must not decode state files")
+
+        monkeypatch.setattr(store.MsgpackZstdStateSerializer, "load", no_load)
+        states = list_workflow_states(WORKFLOW)
+
+        assert [s["run_id"] for s in states] == ["run2", "run1"]
+        assert states[1]["keys"] == list(_state())
+        assert states[1]["raw_bytes"] > states[1]["size_bytes"]
+
+    def test_cleanup_deletes_old_states_and_compacts_index(self, store_dir):
+        for i in range(4):
+            save_workflow_state(WORKFLOW, f"run{i}", {"i": i})
+        save_workflow_state(WORKFLOW, "run3", {"i": 3, "resaved": True})
+
+        assert cleanup_old_states(WORKFLOW, keep_count=2) == 2
+
+        assert sorted(s["run_id"] for s in list_workflow_states(WORKFLOW)) == ["run2", "run3"]
+        lines = (store_dir / INDEX_FILENAME).read_text().splitlines()
+        assert sorted(json.loads(line)["run_id"] for line in lines) == ["run2", "run3"]
+
+    def test_disabled_persistence_writes_nothing(self, store_dir, monkeypatch):
+        monkeypatch.setenv("THALA_PERSIST_STATE", "0")
+
+        assert save_workflow_state(WORKFLOW, "run1", {"a": 1}) is None
+        assert not store_dir.exists()
@@ -0,0 +1,168 @@
+"""Tests for tree-reduce Opus integration, using a fake LLM backend."""
+
+import asyncio
+import time
+
+import pytest
+
+from workflows.wrappers.multi_lang.nodes import opus_integrator
+from workflows.wrappers.multi_lang.nodes.opus_integrator import (
+    FinalEnhancementOutput,
+    InitialSynthesisOutput,
+    IntegrationOutput,
+    MergeFindingsOutput,
+)
+
+CALL_DELAY = 0.05
+LANGUAGES = ["en", "es", "de", "fr", "ja", "zh", "pt", "ru", "ko"]
+
+
+class FakeOpus:
+    """Echoes its prompt back, so outputs never shrink below their inputs."""
+
+    def __init__(self):
+        self.calls: list[type] = []
+        self.spans: list[tuple[float, float]] = []
+        self.active = 0
+        self.max_active = 0
+        self.fail_merges_with: str | None = None
+        self.fail_integration = False
+
+    async def __call__(self, *, tier, system, user, schema, config):
+        self.calls.append(schema)
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        started = time.monotonic()
+        try:
+            await asyncio.sleep(CALL_DELAY)
+        finally:
+            self.active -= 1
+            self.spans.append((started, time.monotonic()))
+
+        if schema is InitialSynthesisOutput:
+            return InitialSynthesisOutput(synthesis_document="Baseline synthesis. " * 50)
+        if schema is MergeFindingsOutput:
+            if self.fail_merges_with and self.fail_merges_with in user:
+                raise ValueError("merge response malformed")
+            return MergeFindingsOutput(merged_findings=user, enhancement_notes="merged")
+        if schema is IntegrationOutput:
+            if self.fail_integration:
+                raise ValueError("integration response malformed")
+            return IntegrationOutput(updated_document=user, enhancement_notes="integrated")
+        return FinalEnhancementOutput(finalized_document=user)
+
+
+@pytest.fixture
+def opus(monkeypatch):
+    fake = FakeOpus()
+    monkeypatch.setattr(opus_integrator, "invoke", fake)
+    return fake
+
+
+def _chain_length(spans: list[tuple[float, float]]) -> int:
+    """Longest run of calls where each starts only after the previous one finished."""
+    depth: dict[int, int] = {}
+    for i, (start, _) in sorted(enumerate(spans), key=lambda item: item[1][0]):
+        depth[i] = 1 + max((depth[j] for j in depth if spans[j][1] <= start), default=0)
+    return max(depth.values(), default=0)
+
+
+def _state(strategy: str, languages=LANGUAGES) -> dict:
+    results = [
+        {
+            "language_code": code,
+            "language_name": code.upper(),
+            "full_report": f"{code} findings [@{code.upper()}1]. " * 40,
+            "findings_summary": f"{code} summary",
+            "workflows_run": ["web"],
+        }
+        for code in languages
+    ]
+    others = [code for code in languages if code != "en"]
+    return {
+        "input": {"topic": "urban planning", "research_questions": None, "integration_strategy": strategy},
+        "language_results": results,
+        "sonnet_analysis": {
+            "integration_priority": others,
+            "unique_contributions": {code: [f"{code} insight"] for code in others},
+        },
+    }
+
+
+class TestTreeIntegration:
+    @pytest.mark.asyncio
+    async def test_merges_pairwise_with_concurrent_levels(self, opus):
+        result = await opus_integrator.run_opus_integration(_state("tree"))
+
+        steps = result["integration_steps"]
+        # 8 languages: 4 + 2 + 1 merges, then one integration into the baseline
+        assert [step["level"] for step in steps] == [1, 1, 1, 1, 2, 2, 3, 4]
+        assert opus.calls.count(MergeFindingsOutput) == 7
+        assert opus.calls.count(IntegrationOutput) == 1
+        # Initial synthesis runs alongside the four leaf merges
+        assert opus.max_active == 5
+        # Critical path: 3 merge levels, root integration, final pass (sequential: 10 calls)
+        assert len(opus.spans) == 10
+        assert _chain_length(opus.spans) == 5
+
+    @pytest.mark.asyncio
+    async def test_root_covers_languages_in_priority_order(self, opus):
+        result = await opus_integrator.run_opus_integration(_state("tree"))
+
+        root = result["integration_steps"][-1]
+        assert root["language_code"] == "es+de+fr+ja+zh+pt+ru+ko"
+        assert "[@KO1]" in result["final_synthesis"] and "[@ES1]" in result["final_synthesis"]
+
+    @pytest.mark.asyncio
+    async def test_reports_savings_against_sequential_fold(self, opus):
+        result = await opus_integrator.run_opus_integration(_state("tree"))
+
+        steps = result["integration_steps"]
+        savings = steps[-1]["savings"]
+        assert all(step["savings"] is None for step in steps[:-1])
+        assert savings["input_tokens"] == sum(step["input_tokens"] for step in steps)
+        assert savings["input_tokens"] < savings["sequential_input_tokens"]
+        assert savings["critical_path_seconds"] < savings["sequential_seconds"]
+
+    @pytest.mark.asyncio
+    async def test_failed_merge_keeps_findings_by_concatenating(self, opus):
+        opus.fail_merges_with = "[@DE1]"
+
+        result = await opus_integrator.run_opus_integration(_state("tree", ["en", "es", "de", "fr"]))
+
+        assert "[@DE1]" in result["final_synthesis"] and "[@ES1]" in result["final_synthesis"]
+        assert result["integration_steps"][-1]["language_code"] == "es+de+fr"
+
+    @pytest.mark.asyncio
+    async def test_failed_root_integration_keeps_baseline(self, opus):
+        opus.fail_integration = True
+
+        result = await opus_integrator.run_opus_integration(_state("tree", ["en", "es", "de"]))
+
+        assert "Baseline synthesis." in result["final_synthesis"]
+        assert "[@ES1]" not in result["final_synthesis"]
+        assert result["integration_steps"] == []
+        assert [(e["language"], e["error_type"]) for e in result["errors"]] == [("es+de", "ValueError")]
+        assert opus.calls[-1] is FinalEnhancementOutput
+
+    @pytest.mark.asyncio
+    async def test_english_only_skips_integration(self, opus):
+        result = await opus_integrator.run_opus_integration(_state("tree", ["en"]))
+
+        assert result["integration_steps"] == []
+        assert opus.calls == [InitialSynthesisOutput, FinalEnhancementOutput]
+
+
+class TestSequentialIntegration:
+    @pytest.mark.asyncio
+    async def test_folds_one_language_at_a_time(self, opus):
+        result = await opus_integrator.run_opus_integration(_state("sequential", ["en", "es", "de", "fr"]))
+
+        steps = result["integration_steps"]
+        assert [step["language_code"] for step in steps] == ["es", "de", "fr"]
+        assert [step["level"] for step in steps] == [1, 2, 3]
+        assert opus.max_active == 1
+        # The whole growing document is re-sent every call
+        tokens = [step["input_tokens"] for step in steps]
+        assert tokens == sorted(tokens) and tokens[0] < tokens[-1]
+        assert all(step["savings"] is None for step in steps)
@@ -0,0 +1,186 @@
+"""Tests for parallel per-language execution, using stubbed language workflows."""
+
+import asyncio
+import time
+from datetime import datetime, timezone
+
+import pytest
+
+from workflows.wrappers.multi_lang.graph import construction
+from workflows.wrappers.multi_lang.nodes import language_executor
+from workflows.wrappers.multi_lang.state import merge_language_results
+
+LANGUAGES = ["en", "es", "de", "fr"]
+
+
+class StubWorkflow:
+    """Per-language workflow that records how many languages run at once."""
+
+    def __init__(self, delays: dict[str, float] | None = None, fail: set[str] = frozenset()):
+        self.delays = delays or {}
+        self.fail = fail
+        self.active = 0
+        self.max_active = 0
+        self.started: list[str] = []
+        self.started_at: dict[str, float] = {}
+        self.finished_at: dict[str, float] = {}
+
+    async def __call__(self, topic, language_config, quality):
+        code = language_config["code"]
+        self.started.append(code)
+        self.started_at[code] = time.monotonic()
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await asyncio.sleep(self.delays.get(code, 0.1))
+            if code in self.fail:
+                raise RuntimeError(f"{code} workflow crashed")
+        finally:
+            self.active -= 1
+            self.finished_at[code] = time.monotonic()
+        return {"final_report": f"report {code}", "source_count": 3, "status": "success", "errors": []}
+
+
+@pytest.fixture
+def workflow(monkeypatch):
+    stub = StubWorkflow()
+    monkeypatch.setitem(
+        language_executor.WORKFLOW_REGISTRY,
+        "stub",
+        {"name": "Stub Research", "runner": stub, "requires_questions": False},
+    )
+
+    async def compress(workflow_results, language_config):
+        return (f"summary {language_config['code']}", [], [])
+
+    monkeypatch.setattr(language_executor, "_compress_language_findings", compress)
+    monkeypatch.setattr(language_executor, "MAX_CONCURRENT_LANGUAGES", len(LANGUAGES))
+    return stub
+
+
+@pytest.fixture
+def synthesis_orders(monkeypatch):
+    """Stub synthesis nodes, recording the language order each one sees."""
+    seen = {}
+
+    def recorder(name):
+        async def node(state):
+            seen[name] = [r["language_code"] for r in state["language_results"]]
+            return {}
+
+        return node
+
+    monkeypatch.setattr(construction, "run_sonnet_analysis", recorder("sonnet"))
+    monkeypatch.setattr(construction, "run_opus_integration", recorder("opus"))
+    monkeypatch.setattr(construction, "save_multi_lang_results", recorder("save"))
+    return seen
+
+
+async def _run(execution_mode="parallel", time_budget_seconds=None, languages=LANGUAGES):
+    graph = construction.create_multi_lang_graph()
+    return await graph.ainvoke(
+        {
+            "input": {
+                "topic": "urban planning",
+                "research_questions": None,
+                "brief": None,
+                "mode": "set_languages",
+                "languages": languages,
+                "workflow": "stub",
+                "quality": "test",
+                "execution_mode": execution_mode,
+                "time_budget_seconds": time_budget_seconds,
+            },
+            "language_results": [],
+            "relevance_checks": [],
+            "integration_steps": [],
+            "errors": [],
+            "started_at": datetime.now(timezone.utc),
+        }
+    )
+
+
+class TestParallelExecution:
+    @pytest.mark.asyncio
+    async def test_languages_run_concurrently(self, workflow, synthesis_orders):
+        workflow.delays = {code: 0.2 for code in LANGUAGES}
+
+        state = await _run()
+
+        assert workflow.max_active == len(LANGUAGES)
+        # Every language had started before the first one finished
+        assert max(workflow.started_at.values()) < min(workflow.finished_at.values())
+        assert sorted(state["languages_completed"]) == sorted(LANGUAGES)
+
+    @pytest.mark.asyncio
+    async def test_concurrency_cap_limits_overlap(self, workflow, synthesis_orders, monkeypatch):
+        monkeypatch.setattr(language_executor, "MAX_CONCURRENT_LANGUAGES", 2)
+
+        state = await _run()
+
+        assert workflow.max_active == 2
+        assert len(state["language_results"]) == len(LANGUAGES)
+
+    @pytest.mark.asyncio
+    async def test_results_keep_language_order_regardless_of_finish_order(self, workflow, synthesis_orders):
+        # First language finishes last
+        workflow.delays = {"en": 0.2, "es": 0.15, "de": 0.1, "fr": 0.05}
+
+        state = await _run()
+
+        assert [r["language_code"] for r in state["language_results"]] == LANGUAGES
+        assert synthesis_orders["sonnet"] == LANGUAGES
+        assert synthesis_orders["opus"] == LANGUAGES
+
+    @pytest.mark.asyncio
+    async def test_failed_language_does_not_cancel_siblings(self, workflow, synthesis_orders):
+        workflow.fail = {"de"}
+
+        state = await _run()
+
+        assert state["languages_failed"] == ["de"]
+        assert [r["language_code"] for r in state["language_results"]] == ["en", "es", "fr"]
+        assert any("de workflow crashed" in e["error"] for e in state["errors"])
+
+    @pytest.mark.asyncio
+    async def test_languages_queued_past_time_budget_are_skipped(self, workflow, synthesis_orders, monkeypatch):
+        monkeypatch.setattr(language_executor, "MAX_CONCURRENT_LANGUAGES", 1)
+        workflow.delays = {code: 0.2 for code in LANGUAGES}
+
+        state = await _run(time_budget_seconds=0.1)
+
+        assert workflow.started == ["en"]
+        assert sorted(state["languages_failed"]) == sorted(LANGUAGES[1:])
+        assert sum("Time budget exhausted" in e["error"] for e in state["errors"]) == 3
+        assert synthesis_orders["opus"] == ["en"]
+
+
+class TestSequentialExecution:
+    @pytest.mark.asyncio
+    async def test_runs_one_language_at_a_time(self, workflow, synthesis_orders):
+        state = await _run(execution_mode="sequential")
+
+        assert workflow.max_active == 1
+        assert workflow.started == LANGUAGES
+        assert state["languages_completed"] == LANGUAGES
+        assert synthesis_orders["opus"] == LANGUAGES
+
+    @pytest.mark.asyncio
+    async def test_time_budget_applies(self, workflow, synthesis_orders):
+        workflow.delays = {code: 0.2 for code in LANGUAGES}
+
+        state = await _run(execution_mode="sequential", time_budget_seconds=0.1)
+
+        assert workflow.started == ["en"]
+        assert state["languages_failed"] == LANGUAGES[1:]
+
+
+def test_full_update_reorders_results():
+    def result(code):
+        return {"language_code": code}
+
+    existing = merge_language_results([], [result("de"), result("en")])
+    assert [r["language_code"] for r in merge_language_results(existing, [result("es")])] == ["de", "en", "es"]
+
+    reordered = merge_language_results(existing, [result("en"), result("de")])
+    assert [r["language_code"] for r in reordered] == ["en", "de"]
@@ -0,0 +1,159 @@
+"""Tests for concurrent relevance checks, using fake search and LLM backends."""
+
+import asyncio
+
+import pytest
+
+from workflows.wrappers.multi_lang.nodes import relevance_checker
+from workflows.wrappers.multi_lang.nodes.relevance_checker import RelevanceDecision
+
+SEARCH_DELAY = 0.1
+LANGUAGES = ["en", "es", "de", "fr", "ja", "zh", "pt", "it", "ar", "ko"]
+
+
+class FakeSearch:
+    def __init__(self):
+        self.queries: list[str] = []
+        self.fail: set[str] = set()
+        self.active = 0
+        self.max_active = 0
+
+    async def __call__(self, query, limit, locale=None, preferred_domains=None):
+        self.queries.append(query)
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await asyncio.sleep(SEARCH_DELAY)
+        finally:
+            self.active -= 1
+        if any(query.endswith(f"[{code}]") for code in self.fail):
+            raise ConnectionError("search down")
+        return {"results": [{"title": f"hit for {query}", "url": "https://example.org", "description": ""}]}
+
+
+class FakeLLM:
+    def __init__(self):
+        self.calls: list = []
+        self.fail_batches = False
+
+    async def __call__(self, *, tier, system, user, schema, config):
+        self.calls.append(user)
+        await asyncio.sleep(SEARCH_DELAY)
+        if isinstance(user, list):
+            if self.fail_batches:
+                raise ValueError("malformed batch response")
+            return [self._decide(prompt) for prompt in user]
+        return self._decide(user)
+
+    @staticmethod
+    def _decide(prompt: str) -> RelevanceDecision:
+        if "Language: Russian" in prompt:
+            raise ValueError("unparseable")
+        return RelevanceDecision(
+            has_meaningful_discussion="Language: Japanese" not in prompt,
+            confidence=0.9,
+            reasoning="fake",
+            suggested_depth="standard",
+        )
+
+
+@pytest.fixture
+def backends(monkeypatch):
+    search, llm = FakeSearch(), FakeLLM()
+
+    async def translate(query, target_language_code, target_language_name):
+        return f"{query} [{target_language_code}]"
+
+    monkeypatch.setattr(relevance_checker, "web_search", search)
+    monkeypatch.setattr(relevance_checker, "translate_query", translate)
+    monkeypatch.setattr(relevance_checker, "invoke", llm)
+    monkeypatch.setattr(relevance_checker, "_search_cache", {})
+    return search, llm
+
+
+def _state(languages=LANGUAGES):
+    from workflows.shared.language import get_language_config
+
+    return {
+        "target_languages": languages,
+        "language_configs": {code: get_language_config(code) for code in languages},
+        "input": {"topic": "urban planning", "research_questions": None},
+    }
+
+
+class TestCheckRelevanceBatch:
+    @pytest.mark.asyncio
+    async def test_languages_checked_concurrently_with_one_llm_call(self, backends):
+        search, llm = backends
+
+        result = await relevance_checker.check_relevance_batch(_state())
+
+        assert len(result["relevance_checks"]) == len(LANGUAGES)
+        # Searches for the 9 non-English languages run up to the cap at once
+        assert search.max_active == relevance_checker.MAX_CONCURRENT_RELEVANCE_CHECKS
+        assert len(search.queries) == len(LANGUAGES) - 1
+        assert len(llm.calls) == 1 and len(llm.calls[0]) == len(LANGUAGES) - 1
+
+    @pytest.mark.asyncio
+    async def test_checks_keep_target_language_order(self, backends):
+        search, llm = backends
+
+        checks = (await relevance_checker.check_relevance_batch(_state(["en", "ja", "de"])))["relevance_checks"]
+
+        assert [c["language_code"] for c in checks] == ["en", "ja", "de"]
+        assert [c["has_meaningful_discussion"] for c in checks] == [True, False, True]
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_falls_back_to_individual_calls(self, backends):
+        search, llm = backends
+        llm.fail_batches = True
+
+        checks = (await relevance_checker.check_relevance_batch(_state(["en", "de", "ru"])))["relevance_checks"]
+
+        assert len(llm.calls) == 3
+        by_code = {c["language_code"]: c for c in checks}
+        assert by_code["de"]["has_meaningful_discussion"] is True
+        assert by_code["ru"]["suggested_depth"] == "skip"
+        assert "unparseable" in by_code["ru"]["reasoning"]
+
+    @pytest.mark.asyncio
+    async def test_search_failure_still_judges_language(self, backends):
+        search, llm = backends
+        search.fail = {"de"}
+
+        checks = (await relevance_checker.check_relevance_batch(_state(["de"])))["relevance_checks"]
+
+        assert "(No search results found)" in llm.calls[0][0]
+        assert checks[0]["has_meaningful_discussion"] is True
+
+
+class TestQuickSearchCache:
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_searches_share_one_request(self, backends):
+        search, _ = backends
+        config = {"code": "es", "name": "Spanish"}
+
+        results = await asyncio.gather(*(relevance_checker._quick_web_search("q", config) for _ in range(5)))
+
+        assert search.queries == ["q"]
+        assert all(r == results[0] for r in results)
+
+    @pytest.mark.asyncio
+    async def test_repeat_run_uses_cached_searches(self, backends):
+        search, _ = backends
+
+        await relevance_checker.check_relevance_batch(_state(["en", "es", "de"]))
+        await relevance_checker.check_relevance_batch(_state(["en", "es", "de"]))
+
+        assert len(search.queries) == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_search_is_not_cached(self, backends):
+        search, _ = backends
+        search.fail = {"es"}
+        config = {"code": "es", "name": "Spanish"}
+
+        assert await relevance_checker._quick_web_search("q [es]", config) == []
+        search.fail = set()
+        assert await relevance_checker._quick_web_search("q [es]", config)
+        assert len(search.queries) == 2
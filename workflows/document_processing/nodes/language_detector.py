@@ -18,16 +18,14 @@ from workflows.shared.language.detection import detect_language
 
 logger = logging.getLogger(__name__)
 
-# Use first 5000 chars for detection (enough for accuracy, fast processing)
-MAX_DETECTION_SAMPLE = 5000
-
 
 @traceable(run_type="chain", name="DetectLanguage")
 async def detect_document_language(state: DocumentProcessingState) -> dict[str, Any]:
     """
     Detect original language from L0 content.
 
-    Uses first ~5000 chars of markdown for detection.
+    Samples windows across the full markdown, so front matter in another
+    language (e.g. an English abstract) does not decide the result.
     Updates L0 record with language_code.
     Returns original_language (ISO 639-1) and confidence.
     """
@@ -43,11 +41,8 @@ async def detect_document_language(state: DocumentProcessingState) -> dict[str,
 
         markdown = processing_result["markdown"]
 
-        # Get detection sample from content
-        sample = markdown[:MAX_DETECTION_SAMPLE]
-
-        # Detect language
-        detected_lang, confidence = detect_language(sample)
+        # Detect language (detect_language samples long texts itself)
+        detected_lang, confidence = detect_language(markdown)
 
         if detected_lang is None:
             logger.warning("Could not detect language, defaulting to 'en'")
@@ -14,7 +14,7 @@ from core.llm_broker import BatchPolicy
 from workflows.document_processing.state import DocumentProcessingState
 from workflows.shared.llm_utils import ModelTier, invoke, invoke_batch, InvokeConfig
 from workflows.shared.retry_utils import with_retry
-from workflows.shared.token_utils import SONNET_SAFE_LIMIT, count_tokens_accurate
+from workflows.shared.token_utils import SONNET_SAFE_LIMIT, acount_tokens_accurate, acount_tokens_many
 
 from .chunking import MAX_CHAPTER_CHARS, chunk_large_content
 from .prompts import CHAPTER_SUMMARIZATION_SYSTEM, TRANSLATION_SYSTEM
@@ -49,7 +49,7 @@ Content:
 
     # Estimate tokens to select appropriate model
     # Use SONNET_1M for large content to avoid token limit errors
-    estimated_tokens = count_tokens_accurate(user_prompt + CHAPTER_SUMMARIZATION_SYSTEM)
+    estimated_tokens = await acount_tokens_accurate(user_prompt + CHAPTER_SUMMARIZATION_SYSTEM)
 
     if estimated_tokens > SONNET_SAFE_LIMIT:
         logger.info(
@@ -182,41 +182,46 @@ async def summarize_chapters(state: DocumentProcessingState) -> dict[str, Any]:
 
         logger.info(f"Submitting {len(chapters)} chapters for summarization")
 
-        # Use invoke_batch for efficient batching
-        async with invoke_batch() as batch:
-            for i, chapter in enumerate(chapters):
-                chapters_metadata[i] = chapter
-                chapter_content = markdown[chapter["start_position"] : chapter["end_position"]]
-                target_words = max(50, chapter["word_count"] // 10)
-
-                chapter_context = f"Chapter: {chapter['title']}"
-                if chapter.get("author"):
-                    chapter_context += f" (by {chapter['author']})"
-
-                # Check if needs chunking (by character count) or SONNET_1M (by token count)
-                if len(chapter_content) > MAX_CHAPTER_CHARS:
-                    large_chapter_indices.add(i)
-                    logger.info(
-                        f"Chapter '{chapter['title']}' is large ({len(chapter_content)} chars), "
-                        "will process with chunking"
-                    )
-                    continue
+        # Build prompts for chapters small enough to batch
+        batch_prompts: dict[int, str] = {}
+        for i, chapter in enumerate(chapters):
+            chapters_metadata[i] = chapter
+            chapter_content = markdown[chapter["start_position"] : chapter["end_position"]]
+            target_words = max(50, chapter["word_count"] // 10)
+
+            chapter_context = f"Chapter: {chapter['title']}"
+            if chapter.get("author"):
+                chapter_context += f" (by {chapter['author']})"
+
+            # Check if needs chunking (by character count) or SONNET_1M (by token count)
+            if len(chapter_content) > MAX_CHAPTER_CHARS:
+                large_chapter_indices.add(i)
+                logger.info(
+                    f"Chapter '{chapter['title']}' is large ({len(chapter_content)} chars), "
+                    "will process with chunking"
+                )
+                continue
 
-                # Short summaries should be prose-only without headings
-                if target_words < 800:
-                    format_instruction = " Use text-only prose with no headings."
-                else:
-                    format_instruction = ""
+            # Short summaries should be prose-only without headings
+            if target_words < 800:
+                format_instruction = " Use text-only prose with no headings."
+            else:
+                format_instruction = ""
 
-                user_prompt = f"""Summarize this chapter in approximately {target_words} words.{format_instruction}
+            batch_prompts[i] = f"""Summarize this chapter in approximately {target_words} words.{format_instruction}
 
 Context: {chapter_context}
 
 Chapter content:
 {chapter_content}"""
 
-                # Check token count
-                estimated_tokens = count_tokens_accurate(user_prompt + CHAPTER_SUMMARIZATION_SYSTEM)
+        # Count tokens for every prompt in one batch, off the event loop
+        token_counts = await acount_tokens_many([p + CHAPTER_SUMMARIZATION_SYSTEM for p in batch_prompts.values()])
+
+        # Use invoke_batch for efficient batching
+        async with invoke_batch() as batch:
+            for (i, user_prompt), estimated_tokens in zip(batch_prompts.items(), token_counts):
+                chapter = chapters_metadata[i]
 
                 if estimated_tokens > SONNET_SAFE_LIMIT:
                     # Too many tokens for Sonnet - process individually with SONNET_1M
@@ -239,7 +239,9 @@ class DocumentModel:
         self._build_indexes()
 
     def _build_indexes(self):
-        """Build lookup indexes."""
+        """Build lookup indexes (from scratch, so removed ids are dropped)."""
+        self._section_index.clear()
+        self._block_index.clear()
 
         def index_section(section: Section):
             self._section_index[section.section_id] = section
@@ -674,12 +676,21 @@ class DocumentTransaction:
     def insert_section_after(self, after_section_id: str, new_section: Section) -> bool:
         """Insert a new section after the specified section.
 
+        The new section becomes the next sibling of the target (after the
+        target's own subsections), at any nesting depth.
+
         Returns True if successful.
         """
-        # Find the section to insert after
-        for i, section in enumerate(self._working_copy.sections):
+        target = self._working_copy.get_section(after_section_id)
+        if not target:
+            return False
+
+        parent = self._working_copy.get_section(target.parent_id) if target.parent_id else None
+        siblings = parent.subsections if parent else self._working_copy.sections
+        for i, section in enumerate(siblings):
             if section.section_id == after_section_id:
-                self._working_copy.sections.insert(i + 1, new_section)
+                new_section.parent_id = target.parent_id
+                siblings.insert(i + 1, new_section)
                 self._operations.append(
                     {
                         "type": "insert_section",
@@ -689,8 +700,6 @@ class DocumentTransaction:
                 )
                 self._working_copy._build_indexes()
                 return True
-            # Check subsections recursively
-            # (For simplicity, only handle top-level insertion for now)
 
         return False
 
@@ -728,6 +737,50 @@ class DocumentTransaction:
             return True
         return False
 
+    def insert_block_after(self, after_block_id: str, block: ContentBlock) -> bool:
+        """Insert a block directly after another block in the same section."""
+        context = self._working_copy.get_block_context(after_block_id)
+        if not context or context[1] == "__preamble__":
+            return False
+
+        section = self._working_copy.get_section(context[1])
+        for i, b in enumerate(section.blocks):
+            if b.block_id == after_block_id:
+                section.blocks.insert(i + 1, block)
+                self._operations.append(
+                    {
+                        "type": "insert_block",
+                        "section_id": section.section_id,
+                        "block_id": block.block_id,
+                        "position": f"after:{after_block_id}",
+                    }
+                )
+                self._working_copy._build_indexes()
+                return True
+        return False
+
+    def replace_block(self, block_id: str, new_block: ContentBlock) -> bool:
+        """Replace a section block in place, keeping its position."""
+        context = self._working_copy.get_block_context(block_id)
+        if not context or context[1] == "__preamble__":
+            return False
+
+        section = self._working_copy.get_section(context[1])
+        for i, b in enumerate(section.blocks):
+            if b.block_id == block_id:
+                section.blocks[i] = new_block
+                self._operations.append(
+                    {
+                        "type": "replace_block",
+                        "section_id": section.section_id,
+                        "block_id": block_id,
+                        "new_block_id": new_block.block_id,
+                    }
+                )
+                self._working_copy._build_indexes()
+                return True
+        return False
+
     def delete_section(self, section_id: str) -> bool:
         """Delete a section by ID."""
         for i, section in enumerate(self._working_copy.sections):
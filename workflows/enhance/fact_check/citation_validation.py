@@ -0,0 +1,124 @@
+"""Batch citation validation with run-scoped and cross-run caches.
+
+Validates `[@KEY]` citations in a handful of bulk calls: one key-index
+resolution plus one mget against the store, then bounded-concurrency Zotero
+checks for keys without a stored summary.
+
+Results are cached at two levels:
+- Run cache: a dict bound to a ContextVar by `citation_cache_scope()`, so
+  concurrent fact-check runs in the parallel daemon never clear each other.
+- Shared cache: a process-wide TTLCache of positive results, reused across
+  runs. Misses are only cached per run, since a paper may be ingested later.
+"""
+
+import asyncio
+import logging
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any
+
+from cachetools import TTLCache
+
+logger = logging.getLogger(__name__)
+
+PRE_VALIDATION_CONCURRENCY = 10
+CONTENT_PREVIEW_CHARS = 500
+
+_shared_cache: TTLCache = TTLCache(maxsize=5000, ttl=3600)
+_run_cache: ContextVar[dict[str, dict[str, Any]] | None] = ContextVar(
+    "fact_check_citation_cache", default=None
+)
+
+
+@contextmanager
+def citation_cache_scope() -> Iterator[dict[str, dict[str, Any]]]:
+    """Bind a fresh run-scoped citation cache for the duration of a run."""
+    cache: dict[str, dict[str, Any]] = {}
+    token = _run_cache.set(cache)
+    try:
+        yield cache
+    finally:
+        _run_cache.reset(token)
+
+
+def get_cached_citation(citation_key: str) -> dict[str, Any] | None:
+    """Get a cached validation result from the run cache or shared cache."""
+    run_cache = _run_cache.get()
+    if run_cache is not None and citation_key in run_cache:
+        return run_cache[citation_key]
+    return _shared_cache.get(citation_key)
+
+
+def clear_shared_citation_cache() -> None:
+    """Drop all cross-run cached results."""
+    _shared_cache.clear()
+
+
+async def validate_citations(
+    citation_keys: list[str],
+    concurrency: int = PRE_VALIDATION_CONCURRENCY,
+) -> dict[str, dict[str, Any]]:
+    """Validate citation keys, reusing cached results where possible.
+
+    Args:
+        citation_keys: Zotero keys to validate
+        concurrency: Max concurrent Zotero lookups for keys missing from the store
+
+    Returns:
+        Dict of key -> {"exists": bool, "content_preview": str}
+    """
+    from langchain_tools.base import get_store_manager
+    from langchain_tools.paper_corpus import fetch_paper_summaries
+
+    keys = list(dict.fromkeys(citation_keys))
+    validated: dict[str, dict[str, Any]] = {}
+    for key in keys:
+        cached = get_cached_citation(key)
+        if cached is not None:
+            validated[key] = cached
+
+    pending = [k for k in keys if k not in validated]
+    if pending:
+        logger.debug(
+            f"Validating {len(pending)} citations ({len(validated)} served from cache)"
+        )
+
+        try:
+            summaries = await fetch_paper_summaries(pending)
+        except Exception as e:
+            logger.warning(f"Batch citation lookup failed: {e}")
+            summaries = {}
+
+        fresh: dict[str, dict[str, Any]] = {}
+        for key, (_title, content) in summaries.items():
+            fresh[key] = {
+                "exists": True,
+                "content_preview": content[:CONTENT_PREVIEW_CHARS],
+            }
+
+        # Papers without a summary may still exist in the Zotero library
+        zotero = get_store_manager().zotero
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def check_zotero(key: str) -> tuple[str, bool]:
+            async with semaphore:
+                try:
+                    return key, await zotero.exists(key)
+                except Exception as e:
+                    logger.debug(f"Citation {key} validation failed: {e}")
+                    return key, False
+
+        unresolved = [k for k in pending if k not in fresh]
+        for key, exists in await asyncio.gather(*[check_zotero(k) for k in unresolved]):
+            fresh[key] = {"exists": exists, "content_preview": ""}
+
+        run_cache = _run_cache.get()
+        for key, result in fresh.items():
+            if run_cache is not None:
+                run_cache[key] = result
+            if result["exists"]:
+                _shared_cache[key] = result
+        validated.update(fresh)
+
+    return validated
@@ -10,6 +10,7 @@ from langsmith import traceable
 from core.task_queue.task_context import get_trace_metadata, get_trace_tags
 from workflows.shared.quality_config import QualityTier
 
+from ..citation_validation import citation_cache_scope
 from ..quality_presets import FACT_CHECK_QUALITY_PRESETS
 from ..state import build_initial_state
 from .construction import fact_check_graph
@@ -107,25 +108,27 @@ async def fact_check(
 
     try:
         run_id = uuid.UUID(langsmith_run_id)
-        result = await fact_check_graph.ainvoke(
-            initial_state,
-            config={
-                "run_id": run_id,
-                "run_name": f"fact_check:{topic[:60]}",
-                "recursion_limit": 100,  # Higher limit for many parallel sections
-                "tags": [
-                    f"quality:{quality}",
-                    "workflow:fact_check",
-                    *get_trace_tags(),
-                ],
-                "metadata": {
-                    **get_trace_metadata(),
-                    "topic": topic[:100],
-                    "quality_tier": quality,
-                    "has_citations": has_citations,
+        # Citation validation results are scoped to this run
+        with citation_cache_scope():
+            result = await fact_check_graph.ainvoke(
+                initial_state,
+                config={
+                    "run_id": run_id,
+                    "run_name": f"fact_check:{topic[:60]}",
+                    "recursion_limit": 100,  # Higher limit for many parallel sections
+                    "tags": [
+                        f"quality:{quality}",
+                        "workflow:fact_check",
+                        *get_trace_tags(),
+                    ],
+                    "metadata": {
+                        **get_trace_metadata(),
+                        "topic": topic[:100],
+                        "quality_tier": quality,
+                        "has_citations": has_citations,
+                    },
                 },
-            },
-        )
+            )
 
         final_document = result.get("final_document", "")
         errors = result.get("errors", [])
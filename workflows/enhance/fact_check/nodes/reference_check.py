@@ -8,6 +8,7 @@ from langsmith import traceable
 from langgraph.types import Send
 
 from workflows.enhance.editing.document_model import DocumentModel
+from workflows.enhance.fact_check.citation_validation import validate_citations
 from workflows.enhance.fact_check.schemas import (
     ReferenceCheckResult,
 )
@@ -22,9 +23,6 @@ logger = logging.getLogger(__name__)
 # Zotero citation pattern: [@8ALPHANUMERIC]
 ZOTERO_CITATION_PATTERN = re.compile(r"\[@([A-Za-z0-9]{8})\]")
 
-# Module-level citation cache (cleared between workflow runs)
-_citation_validation_cache: dict[str, dict] = {}
-
 
 def extract_section_citations(text: str) -> list[str]:
     """Extract citation keys from section text."""
@@ -43,14 +41,12 @@ async def pre_validate_citations(state: dict) -> dict[str, Any]:
     """Pre-validate all unique citations in the document.
 
     This caches citation existence checks to avoid redundant validation
-    when the same citation appears in multiple sections.
+    when the same citation appears in multiple sections. Lookups are batched
+    and cached per run and across runs (see citation_validation).
 
     Returns:
         State update with citation_cache containing validation results.
     """
-    global _citation_validation_cache
-    _citation_validation_cache.clear()  # Clear cache for new workflow run
-
     document_model_dict = state.get("updated_document_model", state.get("document_model"))
     if not document_model_dict:
         return {"citation_cache": {}}
@@ -70,25 +66,7 @@ async def pre_validate_citations(state: dict) -> dict[str, Any]:
 
     logger.debug(f"Pre-validating {len(all_citations)} unique citations")
 
-    # Validate each citation's existence
-    from langchain_tools import get_paper_content
-
-    validated = {}
-    for citation_key in all_citations:
-        try:
-            # Just check if paper exists and get basic info
-            content = await get_paper_content.ainvoke({"zotero_key": citation_key})
-            exists = bool(content and "not found" not in content.lower())
-            validated[citation_key] = {
-                "exists": exists,
-                "content_preview": content[:500] if content else "",
-            }
-        except Exception as e:
-            logger.debug(f"Citation {citation_key} validation failed: {e}")
-            validated[citation_key] = {"exists": False, "content_preview": ""}
-
-    # Cache results for section workers
-    _citation_validation_cache.update(validated)
+    validated = await validate_citations(sorted(all_citations))
 
     exists_count = sum(1 for v in validated.values() if v.get("exists"))
     logger.info(
@@ -98,11 +76,6 @@ async def pre_validate_citations(state: dict) -> dict[str, Any]:
     return {"citation_cache": validated}
 
 
-def get_cached_citation(citation_key: str) -> dict | None:
-    """Get cached validation result for a citation."""
-    return _citation_validation_cache.get(citation_key)
-
-
 def route_to_reference_check_sections(state: dict) -> list[Send] | str:
     """Route to reference-check workers for sections with citations.
 
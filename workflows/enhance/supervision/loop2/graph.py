@@ -9,7 +9,7 @@ prompts, and mini_review from the original supervised_lit_review location.
 
 import logging
 from operator import add
-from typing import Annotated, Any, Optional
+from typing import Annotated, Any, Literal, Optional
 
 from langgraph.graph import END, START, StateGraph
 from langsmith import traceable
@@ -26,6 +26,8 @@ from workflows.shared.llm_utils import InvokeConfig, ModelTier, invoke
 from workflows.shared.llm_utils.integration_guard import call_text_with_guards
 
 from workflows.enhance.supervision.shared.mini_review import (
+    MiniReviewScheduler,
+    TokenBudget,
     run_mini_review,
 )
 from workflows.enhance.supervision.shared.prompts import (
@@ -33,8 +35,15 @@ from workflows.enhance.supervision.shared.prompts import (
     LOOP2_ANALYZER_USER,
     LOOP2_INTEGRATOR_SYSTEM,
     LOOP2_INTEGRATOR_USER,
+    LOOP2_PATCH_INTEGRATOR_SYSTEM,
+    LOOP2_PATCH_INTEGRATOR_USER,
     build_word_budget_guidance,
 )
+from workflows.enhance.supervision.shared.section_patches import (
+    apply_section_patches,
+    render_with_ids,
+)
+from workflows.enhance.editing.parser import parse_markdown_to_model
 from workflows.shared.reference_utils import (
     append_new_references,
     reattach,
@@ -43,6 +52,7 @@ from workflows.shared.reference_utils import (
 from workflows.enhance.supervision.shared.types import (
     LiteratureBase,
     LiteratureBaseDecision,
+    SectionPatchSet,
 )
 
 logger = logging.getLogger(__name__)
@@ -51,6 +61,12 @@ logger = logging.getLogger(__name__)
 # shared/nodes/integrate_content.py for the overall budget rationale.
 LOOP2_WORD_ALLOWANCE_PER_ITER = 2000
 
+# "patch": the integrator returns section-level edits that are applied to the
+# DocumentModel, falling back to "rewrite" (full-review regeneration through
+# call_text_with_guards) if no edit can be applied.
+IntegrationMode = Literal["patch", "rewrite"]
+DEFAULT_INTEGRATION_MODE: IntegrationMode = "patch"
+
 
 # =============================================================================
 # State Definition
@@ -77,6 +93,9 @@ class Loop2State(TypedDict, total=False):
     consecutive_failures: int
     integration_failed: bool
     mini_review_failed: bool
+    integration_mode: IntegrationMode
+    # Speculative mini-reviews for the analyzer's runner-up bases
+    mini_review_scheduler: Optional[MiniReviewScheduler]
     # Checkpointing (for task queue interruption handling)
     checkpoint_callback: Optional[IncrementalCheckpointCallback]
 
@@ -119,6 +138,9 @@ async def analyze_for_bases_node(state: Loop2State) -> dict:
         logger.debug(f"Analyzer decision: {response.action}")
         if response.action == "expand_base":
             logger.info(f"Identified literature base: {response.literature_base.name}")
+            scheduler = state.get("mini_review_scheduler")
+            if scheduler:
+                _schedule_ranked_bases(scheduler, response, state)
 
         return {"decision": response.model_dump()}
 
@@ -144,6 +166,30 @@ async def analyze_for_bases_node(state: Loop2State) -> dict:
         }
 
 
+def _schedule_ranked_bases(
+    scheduler: MiniReviewScheduler,
+    response: LiteratureBaseDecision,
+    state: Loop2State,
+) -> None:
+    """Start mini-reviews for the chosen base and its runner-ups.
+
+    Speculation is capped by the iterations left, since a base can only be
+    integrated in a later iteration. Speculative runs exclude the corpus as
+    it stands now; papers that reach the corpus before their result is
+    used are dropped from it.
+    """
+    ranking = [response.literature_base]
+    seen = {base.lower() for base in state.get("explored_bases", [])}
+    seen.add(response.literature_base.name.lower())
+    for base in response.alternative_bases:
+        if base.name.lower() not in seen:
+            seen.add(base.name.lower())
+            ranking.append(base)
+
+    remaining = state["max_iterations"] - state["iteration"]
+    scheduler.schedule(ranking[: max(remaining, 1)], set(state["paper_corpus"].keys()))
+
+
 async def run_mini_review_node(state: Loop2State) -> dict:
     """Execute mini-review on identified literature base."""
     decision = state.get("decision")
@@ -188,12 +234,16 @@ async def run_mini_review_node(state: Loop2State) -> dict:
     exclude_dois = set(state["paper_corpus"].keys())
     parent_topic = state["input"]["topic"]
 
-    mini_review_result = await run_mini_review(
-        literature_base=literature_base,
-        parent_topic=parent_topic,
-        quality_settings=state["quality_settings"],
-        exclude_dois=exclude_dois,
-    )
+    scheduler = state.get("mini_review_scheduler")
+    if scheduler:
+        mini_review_result = await scheduler.result(literature_base, exclude_dois)
+    else:
+        mini_review_result = await run_mini_review(
+            literature_base=literature_base,
+            parent_topic=parent_topic,
+            quality_settings=state["quality_settings"],
+            exclude_dois=exclude_dois,
+        )
 
     new_paper_summaries = mini_review_result.get("paper_summaries", {})
     new_paper_corpus = mini_review_result.get("paper_corpus", {})
@@ -311,32 +361,37 @@ async def integrate_findings_node(state: Loop2State) -> dict:
             phase_label=f"Loop 2 literature-expansion integration (iteration {iteration + 1})",
         )
 
-        user_prompt = LOOP2_INTEGRATOR_USER.format(
-            word_budget=word_budget,
-            current_review=body,
-            literature_base_name=literature_base.name,
-            mini_review=mini_review_text,
-            integration_strategy=literature_base.integration_strategy,
-            new_citation_keys=citation_keys or "None",
-        )
-
-        # Guarded integrator: handles max_tokens continuations and retries
-        # if the model self-condenses. Raises IntegrationShrinkageError on
-        # unrecoverable shrinkage — we let it propagate (see except below).
-        # Note: shrinkage floor is measured on BODY length.
-        updated_body = await call_text_with_guards(
-            input_content=body,
-            tier=ModelTier.OPUS,
-            system=LOOP2_INTEGRATOR_SYSTEM,
-            user=user_prompt,
-            config=InvokeConfig(
-                effort="high",
-                max_tokens=64000,
-                cache=False,
-                batch_policy=BatchPolicy.PREFER_SPEED,
-            ),
-            label=f"loop2_integrator[{literature_base.name[:40]}]",
-        )
+        prompt_fields = {
+            "word_budget": word_budget,
+            "literature_base_name": literature_base.name,
+            "mini_review": mini_review_text,
+            "integration_strategy": literature_base.integration_strategy,
+            "new_citation_keys": citation_keys or "None",
+        }
+        label = f"loop2_integrator[{literature_base.name[:40]}]"
+
+        updated_body = None
+        if state.get("integration_mode", DEFAULT_INTEGRATION_MODE) == "patch":
+            updated_body = await _integrate_with_patches(body, prompt_fields, label)
+
+        if updated_body is None:
+            # Guarded integrator: handles max_tokens continuations and retries
+            # if the model self-condenses. Raises IntegrationShrinkageError on
+            # unrecoverable shrinkage — we let it propagate (see except below).
+            # Note: shrinkage floor is measured on BODY length.
+            updated_body = await call_text_with_guards(
+                input_content=body,
+                tier=ModelTier.OPUS,
+                system=LOOP2_INTEGRATOR_SYSTEM,
+                user=LOOP2_INTEGRATOR_USER.format(current_review=body, **prompt_fields),
+                config=InvokeConfig(
+                    effort="high",
+                    max_tokens=64000,
+                    cache=False,
+                    batch_policy=BatchPolicy.PREFER_SPEED,
+                ),
+                label=label,
+            )
 
         merged_summaries = {**state["paper_summaries"], **new_paper_summaries}
         merged_zotero = {**state["zotero_keys"], **new_zotero_keys}
@@ -424,8 +479,51 @@ async def integrate_findings_node(state: Loop2State) -> dict:
         }
 
 
+async def _integrate_with_patches(
+    body: str,
+    prompt_fields: dict[str, str],
+    label: str,
+) -> Optional[str]:
+    """Integrate via section-level edits; return None to fall back to a rewrite."""
+    try:
+        model = parse_markdown_to_model(body)
+        patch_set = await invoke(
+            tier=ModelTier.OPUS,
+            system=LOOP2_PATCH_INTEGRATOR_SYSTEM,
+            user=LOOP2_PATCH_INTEGRATOR_USER.format(
+                current_review=render_with_ids(model), **prompt_fields
+            ),
+            schema=SectionPatchSet,
+            config=InvokeConfig(
+                effort="high",
+                max_tokens=16000,
+                cache=False,
+                batch_policy=BatchPolicy.PREFER_SPEED,
+            ),
+        )
+        result = apply_section_patches(body, patch_set.patches)
+    except Exception as e:
+        logger.warning(f"{label}: patch integration failed ({e}), falling back to rewrite")
+        return None
+
+    if not result.applied:
+        logger.warning(
+            f"{label}: no patches applied ({len(result.skipped)} skipped), falling back to rewrite"
+        )
+        return None
+
+    logger.info(
+        f"{label}: applied {result.applied} patches to {len(result.touched_sections)} sections "
+        f"({len(result.skipped)} skipped)"
+    )
+    return result.text
+
+
 async def finalize_node(state: Loop2State) -> dict:
     """Mark loop as complete and return final state."""
+    scheduler = state.get("mini_review_scheduler")
+    if scheduler:
+        await scheduler.aclose()
     logger.debug("Loop 2 finalized")
     return {"is_complete": True}
 
@@ -532,6 +630,9 @@ async def run_loop2_standalone(
     config: dict | None = None,
     checkpoint_callback: IncrementalCheckpointCallback | None = None,
     incremental_state: dict[str, Any] | None = None,
+    integration_mode: IntegrationMode = DEFAULT_INTEGRATION_MODE,
+    max_concurrent_mini_reviews: int = 1,
+    mini_review_token_budget: int | None = None,
 ) -> dict:
     """Run Loop 2 as standalone operation for testing.
 
@@ -548,6 +649,15 @@ async def run_loop2_standalone(
             Called with (iteration_count, partial_results_dict) after each iteration.
         incremental_state: Optional checkpoint state for resumption.
             Contains iteration_count and partial_results from previous run.
+        integration_mode: "patch" (section-level edits, default) or
+            "rewrite" (full-review regeneration)
+        max_concurrent_mini_reviews: Mini-reviews run at once (default 1).
+            Above 1, the analyzer's runner-up bases are reviewed
+            speculatively while the current base is reviewed and integrated;
+            a speculative review whose base is never chosen is paid for anyway.
+        mini_review_token_budget: Token cap on speculative mini-reviews (the
+            chosen base always runs). Required when
+            max_concurrent_mini_reviews is above 1.
 
     Returns:
         Dict with:
@@ -584,6 +694,17 @@ async def run_loop2_standalone(
                 f"{len(resumed_explored_bases)} bases already explored"
             )
 
+    scheduler = None
+    if max_concurrent_mini_reviews > 1:
+        if mini_review_token_budget is None:
+            raise ValueError("mini_review_token_budget is required when max_concurrent_mini_reviews > 1")
+        scheduler = MiniReviewScheduler(
+            parent_topic=input_data["topic"],
+            quality_settings=quality_settings,
+            max_concurrent=max_concurrent_mini_reviews,
+            token_budget=TokenBudget(mini_review_token_budget),
+        )
+
     initial_state = Loop2State(
         current_review=resumed_review,
         paper_corpus=resumed_paper_corpus,
@@ -602,6 +723,8 @@ async def run_loop2_standalone(
         consecutive_failures=0,
         integration_failed=False,
         mini_review_failed=False,
+        integration_mode=integration_mode,
+        mini_review_scheduler=scheduler,
         # Checkpointing
         checkpoint_callback=checkpoint_callback,
     )
@@ -612,10 +735,14 @@ async def run_loop2_standalone(
             f"review length={len(resumed_review)} chars, corpus size={len(resumed_paper_corpus)}"
         )
 
-    if config:
-        result = await loop2_graph.ainvoke(initial_state, config=config)
-    else:
-        result = await loop2_graph.ainvoke(initial_state)
+    try:
+        if config:
+            result = await loop2_graph.ainvoke(initial_state, config=config)
+        else:
+            result = await loop2_graph.ainvoke(initial_state)
+    finally:
+        if scheduler:
+            await scheduler.aclose()
 
     return {
         "current_review": result.get("current_review", review),
@@ -21,6 +21,11 @@ from workflows.enhance.supervision.shared.nodes import (
 )
 from workflows.enhance.supervision.shared.focused_expansion import run_focused_expansion
 from workflows.enhance.supervision.shared.mini_review import run_mini_review
+from workflows.enhance.supervision.shared.section_patches import (
+    PatchApplicationError,
+    apply_section_patches,
+    render_with_ids,
+)
 
 __all__ = [
     # Types
@@ -38,4 +43,7 @@ __all__ = [
     # Utilities
     "run_focused_expansion",
     "run_mini_review",
+    "apply_section_patches",
+    "render_with_ids",
+    "PatchApplicationError",
 ]
@@ -1,5 +1,9 @@
 """Mini-review for Loop 2 literature base expansion."""
 
 from workflows.enhance.supervision.shared.mini_review.graph import run_mini_review
+from workflows.enhance.supervision.shared.mini_review.scheduler import (
+    MiniReviewScheduler,
+    TokenBudget,
+)
 
-__all__ = ["run_mini_review"]
+__all__ = ["run_mini_review", "MiniReviewScheduler", "TokenBudget"]
@@ -7,6 +7,7 @@ literature base, excluding DOIs already in parent corpus.
 import logging
 from typing import Any
 
+from core.task_queue.budget.ledger import track_usage
 from workflows.research.academic_lit_review.keyword_search import (
     run_keyword_search,
 )
@@ -55,7 +56,20 @@ async def run_mini_review(
             - zotero_keys: DOI -> Zotero key mapping
             - clusters: List of ThematicClusters
             - references: List of FormattedCitations
+            - tokens_used: API tokens the review's LLM calls used
     """
+    with track_usage() as usage:
+        result = await _run_mini_review(literature_base, parent_topic, quality_settings, exclude_dois)
+    result["tokens_used"] = usage.total_tokens
+    return result
+
+
+async def _run_mini_review(
+    literature_base: LiteratureBase,
+    parent_topic: str,
+    quality_settings: QualitySettings,
+    exclude_dois: set[str],
+) -> dict[str, Any]:
     logger.info(f"Mini-review starting: {literature_base.name} (excluding {len(exclude_dois)} parent DOIs)")
 
     search_topic = f"{parent_topic} - {literature_base.name} perspective"
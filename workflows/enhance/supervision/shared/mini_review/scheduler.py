@@ -0,0 +1,234 @@
+"""Speculative scheduler for Loop 2 mini-reviews.
+
+Mini-reviews for different literature bases are independent until they are
+integrated, so while one base is being reviewed the analyzer's runner-up
+candidates can be reviewed concurrently. The scheduler:
+
+- runs up to `max_concurrent` mini-reviews for the top-ranked bases,
+- admits speculative (non-primary) runs only while a shared token budget
+  has room for their estimated cost,
+- cancels running reviews (and drops finished ones) whose base falls out
+  of the ranking, and
+- hands results back on request, so integration consumes them in the
+  analyzer's priority order, minus papers that reached the corpus after
+  the run started.
+"""
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from workflows.research.academic_lit_review.state import QualitySettings
+
+from ..types import LiteratureBase
+from .graph import run_mini_review
+
+logger = logging.getLogger(__name__)
+
+# Rough token cost of one mini-review (search, processing, clustering,
+# synthesis), used to reserve budget before a speculative run starts
+DEFAULT_ESTIMATED_TOKENS = 1_000_000
+
+MiniReviewFn = Callable[..., Awaitable[dict[str, Any]]]
+
+
+def base_key(literature_base: LiteratureBase) -> str:
+    """Identity of a literature base across analyzer calls."""
+    return " ".join(literature_base.name.lower().split())
+
+
+class TokenBudget:
+    """Token budget shared by concurrent mini-reviews.
+
+    Runs reserve their estimated cost up front. When a run finishes, the
+    reservation is swapped for its reported usage (`tokens_used` in the
+    result) or kept as-is if it reports none; cancelled runs release it.
+    """
+
+    def __init__(self, total: Optional[int] = None):
+        self.total = total
+        self.committed = 0
+
+    @property
+    def remaining(self) -> Optional[int]:
+        return None if self.total is None else max(self.total - self.committed, 0)
+
+    def try_reserve(self, tokens: int, force: bool = False) -> bool:
+        """Reserve tokens if they fit (or unconditionally with force)."""
+        if not force and self.total is not None and self.committed + tokens > self.total:
+            return False
+        self.committed += tokens
+        return True
+
+    def settle(self, reserved: int, actual: Optional[int]) -> None:
+        """Replace a reservation with actual usage when known."""
+        if actual is not None:
+            self.committed += actual - reserved
+
+    def release(self, reserved: int) -> None:
+        self.committed -= reserved
+
+
+@dataclass
+class MiniReviewJob:
+    """A scheduled mini-review and its timing."""
+
+    literature_base: LiteratureBase
+    task: asyncio.Task
+    reserved_tokens: int
+    speculative: bool
+    started_at: float
+    finished_at: Optional[float] = None
+
+
+def drop_known_papers(result: dict[str, Any], exclude_dois: set[str]) -> dict[str, Any]:
+    """Remove papers already in the corpus from a mini-review result.
+
+    The review text is kept as-is: its citations of a dropped paper resolve
+    to the corpus's own copy.
+    """
+    known = exclude_dois.intersection({*result.get("paper_corpus", {}), *result.get("paper_summaries", {})})
+    if not known:
+        return result
+
+    filtered = dict(result)
+    for field in ("paper_summaries", "paper_corpus", "zotero_keys"):
+        if field in result:
+            filtered[field] = {doi: v for doi, v in result[field].items() if doi not in known}
+    if "references" in result:
+        filtered["references"] = [ref for ref in result["references"] if ref.get("doi") not in known]
+    logger.info(f"Dropped {len(known)} papers that reached the corpus while the mini-review ran")
+    return filtered
+
+
+class MiniReviewScheduler:
+    """Runs ranked mini-reviews concurrently under a shared token budget."""
+
+    def __init__(
+        self,
+        parent_topic: str,
+        quality_settings: QualitySettings,
+        max_concurrent: int = 1,
+        token_budget: Optional[TokenBudget] = None,
+        estimated_tokens: int = DEFAULT_ESTIMATED_TOKENS,
+        run_fn: MiniReviewFn = run_mini_review,
+    ):
+        self.parent_topic = parent_topic
+        self.quality_settings = quality_settings
+        self.max_concurrent = max(1, max_concurrent)
+        self.budget = token_budget or TokenBudget()
+        self.estimated_tokens = estimated_tokens
+        self._run_fn = run_fn
+        self._jobs: dict[str, MiniReviewJob] = {}
+        self.cancelled: list[str] = []
+
+    @property
+    def jobs(self) -> dict[str, MiniReviewJob]:
+        return dict(self._jobs)
+
+    def _running(self) -> list[str]:
+        return [key for key, job in self._jobs.items() if not job.task.done()]
+
+    def _launch(
+        self,
+        literature_base: LiteratureBase,
+        exclude_dois: set[str],
+        speculative: bool,
+    ) -> Optional[MiniReviewJob]:
+        key = base_key(literature_base)
+        if not self.budget.try_reserve(self.estimated_tokens, force=not speculative):
+            logger.info(
+                f"Token budget exhausted ({self.budget.remaining} left), not speculating on '{literature_base.name}'"
+            )
+            return None
+
+        job = MiniReviewJob(
+            literature_base=literature_base,
+            task=None,  # type: ignore[arg-type]
+            reserved_tokens=self.estimated_tokens,
+            speculative=speculative,
+            started_at=time.monotonic(),
+        )
+        job.task = asyncio.create_task(self._run(job, set(exclude_dois)), name=f"mini_review[{key[:40]}]")
+        self._jobs[key] = job
+        logger.info(
+            f"Started {'speculative ' if speculative else ''}mini-review: "
+            f"{literature_base.name} ({len(self._running())} running)"
+        )
+        return job
+
+    async def _run(self, job: MiniReviewJob, exclude_dois: set[str]) -> dict[str, Any]:
+        try:
+            result = await self._run_fn(
+                literature_base=job.literature_base,
+                parent_topic=self.parent_topic,
+                quality_settings=self.quality_settings,
+                exclude_dois=exclude_dois,
+            )
+        except asyncio.CancelledError:
+            self.budget.release(job.reserved_tokens)
+            raise
+        finally:
+            job.finished_at = time.monotonic()
+
+        tokens_used = result.get("tokens_used")
+        self.budget.settle(job.reserved_tokens, tokens_used if isinstance(tokens_used, int) else None)
+        return result
+
+    def schedule(self, ranking: list[LiteratureBase], exclude_dois: set[str]) -> None:
+        """Align running mini-reviews with the analyzer's latest ranking.
+
+        Args:
+            ranking: Candidate bases, best first; ranking[0] is the base
+                integrated next, the rest are speculative
+            exclude_dois: DOIs already in the parent corpus
+        """
+        wanted = [base_key(b) for b in ranking[: self.max_concurrent]]
+
+        for key in self._running():
+            if key not in wanted:
+                logger.info(f"Cancelling mini-review that lost ranking: {self._jobs[key].literature_base.name}")
+                self._jobs.pop(key).task.cancel()
+                self.cancelled.append(key)
+
+        for key in [key for key, job in self._jobs.items() if job.task.done() and key not in wanted]:
+            logger.info(f"Dropping finished mini-review that lost ranking: {self._jobs[key].literature_base.name}")
+            self._jobs.pop(key)
+
+        for rank, literature_base in enumerate(ranking[: self.max_concurrent]):
+            if base_key(literature_base) in self._jobs:
+                continue
+            if len(self._running()) >= self.max_concurrent:
+                break
+            self._launch(literature_base, exclude_dois, speculative=rank > 0)
+
+    async def result(self, literature_base: LiteratureBase, exclude_dois: set[str]) -> dict[str, Any]:
+        """Wait for a base's mini-review, starting it now if not yet scheduled.
+
+        The job is consumed: a later ranking that includes the same base
+        starts a fresh run. A speculative run excluded the corpus as it was
+        at launch, so papers in exclude_dois are filtered from its result.
+        """
+        key = base_key(literature_base)
+        job = self._jobs.get(key)
+        if job is None:
+            job = self._launch(literature_base, exclude_dois, speculative=False)
+        elif job.task.done():
+            logger.info(f"Using completed speculative mini-review: {literature_base.name}")
+
+        try:
+            return drop_known_papers(await job.task, exclude_dois)
+        finally:
+            self._jobs.pop(key, None)
+
+    async def aclose(self) -> None:
+        """Cancel any mini-reviews still running."""
+        running = self._running()
+        for key in running:
+            self._jobs[key].task.cancel()
+            self.cancelled.append(key)
+        await asyncio.gather(*(self._jobs[key].task for key in running), return_exceptions=True)
+        self._jobs.clear()
@@ -11,6 +11,8 @@ from .loop2_literature import (
     LOOP2_ANALYZER_USER,
     LOOP2_INTEGRATOR_SYSTEM,
     LOOP2_INTEGRATOR_USER,
+    LOOP2_PATCH_INTEGRATOR_SYSTEM,
+    LOOP2_PATCH_INTEGRATOR_USER,
 )
 from .shared import build_word_budget_guidance
 
@@ -25,6 +27,8 @@ __all__ = [
     "LOOP2_ANALYZER_USER",
     "LOOP2_INTEGRATOR_SYSTEM",
     "LOOP2_INTEGRATOR_USER",
+    "LOOP2_PATCH_INTEGRATOR_SYSTEM",
+    "LOOP2_PATCH_INTEGRATOR_USER",
     # Shared helpers
     "build_word_budget_guidance",
 ]
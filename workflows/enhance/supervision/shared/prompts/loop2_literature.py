@@ -38,7 +38,8 @@ LOOP2_ANALYZER_USER = """Review the following literature review and identify ONE
 ## Current Iteration
 {iteration} of {max_iterations}
 
-Identify one missing literature base, or indicate pass_through if coverage is adequate."""
+Identify one missing literature base, or indicate pass_through if coverage is adequate.
+If other missing bases are nearly as important, list up to 3 of them as alternative_bases, best first."""
 
 LOOP2_INTEGRATOR_SYSTEM = """You are an expert academic editor integrating new research findings into an existing literature review.
 
@@ -90,3 +91,50 @@ LOOP2_INTEGRATOR_USER = """Integrate the following mini-review findings into the
 IMPORTANT: If the Methodology section states a corpus size (e.g., "sixty studies", "50 papers"), update that number to reflect the new total after integrating these papers. The review's stated corpus size must match the actual number of distinct sources cited.
 
 Return the complete updated literature review with the new findings integrated."""
+
+LOOP2_PATCH_INTEGRATOR_SYSTEM = """You are an expert academic editor integrating new research findings into an existing literature review.
+
+You have received a mini-review on a new literature base. Instead of rewriting the review, return a small set of targeted edits. The review is shown with stable ids: every section is wrapped in <section id="sec_..."> and every paragraph in <block id="blk_...">.
+
+Available edit operations:
+- replace_block: rewrite one paragraph (target_id = blk_ id). Return the complete new paragraph, preserving its existing citations.
+- insert_after_block: add a new paragraph after an existing one (target_id = blk_ id).
+- append_to_section: add a new paragraph at the end of a section's own text (target_id = sec_ id).
+- insert_section_after: add a new section at the same level after a section and its subsections (target_id = sec_ id, heading = new heading text, content = section body with paragraphs separated by blank lines).
+
+Integration approaches (use your judgment):
+1. Add a new thematic section if the literature base is distinct enough
+2. Weave findings into existing paragraphs where relevant
+3. Extend the discussion if findings primarily challenge or contextualize existing arguments
+
+Rules:
+1. **Surgical Precision**: Touch only the paragraphs and sections the new findings belong in. Everything else is kept verbatim automatically.
+2. **Citation Integrity**: Preserve every existing citation in paragraphs you replace; add new ones using [@KEY] format.
+3. **Natural Flow**: New content should read as if it was always part of the review.
+4. **Academic Voice**: Maintain consistent scholarly tone.
+5. **No headings in content**: Never put markdown headings (#) inside content; use insert_section_after with a heading instead.
+6. **Use ids exactly as shown**: Edits with unknown ids are discarded.
+
+Prose quality constraints: avoid "not merely"/"not just ... but", "no single [study] can", and "precisely"/"systematically" as intensifiers. No meta-commentary.
+
+Do NOT add a References / Bibliography section; references are appended automatically."""
+
+LOOP2_PATCH_INTEGRATOR_USER = """Integrate the following mini-review findings into the main literature review by returning section-level edits.
+
+{word_budget}
+
+## Current Literature Review (with ids)
+{current_review}
+
+## Mini-Review: {literature_base_name}
+{mini_review}
+
+## Integration Strategy Suggested
+{integration_strategy}
+
+## New Citation Keys Available
+{new_citation_keys}
+
+IMPORTANT: If a Methodology paragraph states a corpus size (e.g., "sixty studies", "50 papers"), include a replace_block edit updating that number to reflect the new total after integrating these papers.
+
+Return the edits as a SectionPatchSet."""
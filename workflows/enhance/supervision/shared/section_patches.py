@@ -0,0 +1,235 @@
+"""Section-scoped patch application for supervision integrators.
+
+Rather than having the integrator return the whole review, it returns a
+`SectionPatchSet` of edits addressed by DocumentModel ids. Edits are applied
+to the model in a transaction and only the sections they touch are
+re-rendered; every other section is copied from the input text verbatim, so
+untouched sections stay byte-identical.
+"""
+
+import logging
+import re
+from dataclasses import dataclass, field
+
+from workflows.enhance.editing.document_model import (
+    ContentBlock,
+    DocumentModel,
+    DocumentTransaction,
+    Section,
+)
+from workflows.enhance.editing.parser import parse_markdown_to_model
+
+from .types import SectionPatch
+
+logger = logging.getLogger(__name__)
+
+PREAMBLE_ID = "__preamble__"
+
+_HEADING_RE = re.compile(r"^(#{1,6})\s+(.+)$")
+_HEADING_LINE_RE = re.compile(r"^#{1,6}\s", re.MULTILINE)
+
+
+class PatchApplicationError(ValueError):
+    """Raised when patches cannot be mapped onto the document."""
+
+
+@dataclass
+class PatchResult:
+    """Outcome of applying a patch set."""
+
+    text: str
+    applied: int = 0
+    skipped: list[str] = field(default_factory=list)
+    touched_sections: list[str] = field(default_factory=list)
+
+
+def split_section_spans(markdown: str) -> list[tuple[str, str]]:
+    """Split markdown into raw (section_id, text) spans in document order.
+
+    Mirrors parse_markdown_to_model's heading rules (fenced code is skipped,
+    the first H1 before any section is the title) so span ids match the
+    model's section ids. The first span holds the title and preamble.
+    Concatenating the span texts reproduces the input exactly.
+    """
+    spans: list[tuple[str, list[str]]] = [(PREAMBLE_ID, [])]
+    in_code_block = False
+    seen_title = False
+
+    for line in markdown.splitlines(keepends=True):
+        stripped = line.rstrip("\r\n")
+        if stripped.strip().startswith("```"):
+            in_code_block = not in_code_block
+        elif not in_code_block:
+            match = _HEADING_RE.match(stripped)
+            if match:
+                level = len(match.group(1))
+                heading = match.group(2).strip()
+                if level == 1 and not seen_title and len(spans) == 1:
+                    seen_title = True
+                else:
+                    section_id = Section.from_heading(heading, level).section_id
+                    spans.append((section_id, []))
+        spans[-1][1].append(line)
+
+    return [(section_id, "".join(lines)) for section_id, lines in spans]
+
+
+def render_with_ids(model: DocumentModel) -> str:
+    """Render the document with section and block ids for patch addressing.
+
+    Unlike DocumentModel.render_for_analysis, block text is never truncated:
+    the integrator must see a paragraph in full before replacing it.
+    """
+    lines = []
+
+    def render_section(section: Section) -> None:
+        lines.append(f'<section id="{section.section_id}" level="{section.level}">')
+        lines.append(f"{'#' * section.level} {section.heading}")
+        for block in section.blocks:
+            lines.append(f'<block id="{block.block_id}">')
+            lines.append(block.content)
+            lines.append("</block>")
+        for sub in section.subsections:
+            render_section(sub)
+        lines.append("</section>")
+
+    if model.title:
+        lines.append(f"# {model.title}")
+    for section in model.sections:
+        render_section(section)
+
+    return "\n".join(lines)
+
+
+def _render_own_text(section: Section) -> str:
+    """Render a section's heading and own blocks (not its subsections)."""
+    parts = [f"{'#' * section.level} {section.heading}"]
+    parts.extend(b.content.strip() for b in section.blocks if b.content.strip())
+    return "\n\n".join(parts)
+
+
+def _last_descendant_id(section: Section) -> str:
+    while section.subsections:
+        section = section.subsections[-1]
+    return section.section_id
+
+
+def _apply_patch(
+    txn: DocumentTransaction,
+    patch: SectionPatch,
+    touched: set[str],
+    new_sections: dict[str, list[Section]],
+) -> str | None:
+    """Apply one patch; return a skip reason or None on success."""
+    content = patch.content.strip()
+    if not content:
+        return "empty content"
+    if _HEADING_LINE_RE.search(content):
+        return "content contains a markdown heading"
+
+    doc = txn.get_result()
+    block = ContentBlock.from_content(content)
+
+    if patch.operation in ("replace_block", "insert_after_block"):
+        context = doc.get_block_context(patch.target_id)
+        if not context or context[1] == PREAMBLE_ID:
+            return f"unknown block {patch.target_id}"
+        if patch.operation == "replace_block":
+            ok = txn.replace_block(patch.target_id, block)
+        else:
+            ok = txn.insert_block_after(patch.target_id, block)
+        if ok:
+            touched.add(context[1])
+        return None if ok else f"could not apply to {patch.target_id}"
+
+    target = doc.get_section(patch.target_id)
+    if not target:
+        return f"unknown section {patch.target_id}"
+
+    if patch.operation == "append_to_section":
+        txn.insert_block_at_end(target.section_id, block)
+        touched.add(target.section_id)
+        return None
+
+    heading = (patch.heading or "").strip().lstrip("#").strip()
+    if not heading:
+        return "insert_section_after without heading"
+    new_section = Section.from_heading(heading, target.level)
+    if doc.get_section(new_section.section_id):
+        return f"section '{heading}' already exists"
+    new_section.blocks = [
+        ContentBlock.from_content(paragraph.strip()) for paragraph in re.split(r"\n\s*\n", content) if paragraph.strip()
+    ]
+    if not txn.insert_section_after(target.section_id, new_section):
+        return f"could not insert after {target.section_id}"
+    new_sections.setdefault(target.section_id, []).append(new_section)
+    return None
+
+
+def apply_section_patches(markdown: str, patches: list[SectionPatch]) -> PatchResult:
+    """Apply section patches to markdown, re-rendering only touched sections.
+
+    Args:
+        markdown: Document body (references block already stripped)
+        patches: Edits addressed by ids from render_with_ids()
+
+    Returns:
+        PatchResult with the patched text and applied/skipped counts
+
+    Raises:
+        PatchApplicationError: If the document's sections cannot be mapped
+            to raw text spans (e.g. duplicate headings merged by the parser)
+    """
+    model = parse_markdown_to_model(markdown)
+    spans = split_section_spans(markdown)
+
+    span_ids = [section_id for section_id, _ in spans[1:]]
+    model_ids = [s.section_id for s in model.get_all_sections()]
+    if span_ids != model_ids:
+        raise PatchApplicationError(
+            "Document sections could not be mapped to text spans "
+            f"({len(span_ids)} headings, {len(model_ids)} parsed sections)"
+        )
+
+    result = PatchResult(text=markdown)
+    touched: set[str] = set()
+    new_sections: dict[str, list[Section]] = {}
+
+    with model.transaction() as txn:
+        for patch in patches:
+            reason = _apply_patch(txn, patch, touched, new_sections)
+            if reason:
+                logger.warning(f"Skipped {patch.operation} patch on {patch.target_id}: {reason}")
+                result.skipped.append(f"{patch.operation} {patch.target_id}: {reason}")
+            else:
+                result.applied += 1
+
+    if not result.applied:
+        return result
+
+    # New sections go after the target's last descendant span
+    emit_after: dict[str, list[Section]] = {}
+    for target_id, sections in new_sections.items():
+        target = model.get_section(target_id)
+        emit_after.setdefault(_last_descendant_id(target), []).extend(sections)
+
+    pieces: list[str] = []
+    for section_id, raw in spans:
+        if section_id in touched:
+            trailing = raw[len(raw.rstrip()) :] or "\n\n"
+            pieces.append(_render_own_text(model.get_section(section_id)) + trailing)
+        else:
+            pieces.append(raw)
+
+        for new_section in emit_after.get(section_id, []):
+            if not pieces[-1].endswith("\n\n"):
+                pieces.append("\n" if pieces[-1].endswith("\n") else "\n\n")
+            pieces.append(_render_own_text(new_section) + "\n\n")
+
+    text = "".join(pieces)
+    if not markdown[len(markdown.rstrip()) :]:
+        text = text.rstrip()
+
+    result.text = text
+    result.touched_sections = sorted(touched)
+    return result
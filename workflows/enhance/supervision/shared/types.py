@@ -42,6 +42,8 @@ __all__ = [
     "TodoResolution",
     "Edit",
     "DocumentEdits",
+    "SectionPatch",
+    "SectionPatchSet",
     "LoopErrorRecord",
     "LoopResultWithErrors",
 ]
@@ -113,6 +115,10 @@ class LiteratureBaseDecision(BaseModel):
         default=None,
         description="The literature base to expand (only if action is expand_base)",
     )
+    alternative_bases: list[LiteratureBase] = Field(
+        default_factory=list,
+        description="Runner-up literature bases, best first (candidates for later iterations)",
+    )
     reasoning: str = Field(description="Academic justification for the decision")
 
 
@@ -543,6 +549,36 @@ class DocumentEdits(BaseModel):
         return v if v is not None else []
 
 
+class SectionPatch(BaseModel):
+    """A section-level edit addressed by DocumentModel section/block ids."""
+
+    operation: Literal[
+        "replace_block",  # Rewrite one paragraph in place
+        "insert_after_block",  # New paragraph after an existing one
+        "append_to_section",  # New paragraph at the end of a section's own text
+        "insert_section_after",  # New section after a section (and its subsections)
+    ] = Field(description="Edit operation to apply")
+    target_id: str = Field(
+        description="blk_... id for block operations, sec_... id for section operations"
+    )
+    content: str = Field(
+        description="Paragraph text (or full new-section body). No markdown headings."
+    )
+    heading: Optional[str] = Field(
+        default=None,
+        description="Heading text for insert_section_after (without leading #)",
+    )
+
+
+class SectionPatchSet(BaseModel):
+    """Structured integration output: edits instead of a full rewrite."""
+
+    patches: list[SectionPatch] = Field(
+        default_factory=list, description="Edits to apply, in order"
+    )
+    reasoning: str = Field(default="", description="Brief integration rationale")
+
+
 # =============================================================================
 # Error Tracking Types
 # =============================================================================
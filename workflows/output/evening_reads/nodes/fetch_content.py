@@ -18,67 +18,69 @@ logger = logging.getLogger(__name__)
 L0_SIZE_THRESHOLD_FOR_L2 = 150_000
 
 
-async def _fetch_content_for_key(
-    store, zotero_key: str, es_record_id: str | None
-) -> tuple[str | None, Literal["L0", "L2"] | None]:
-    """Fetch content for a single Zotero key, preferring L2 over L0.
+async def _fetch_content_for_keys(
+    store, zotero_keys: list[str]
+) -> dict[str, tuple[str, Literal["L0", "L2"]]]:
+    """Fetch content for several Zotero keys, preferring L2 over L0.
 
-    This mirrors the logic from paper_processor/extraction/parsers.py.
+    This mirrors the logic from paper_processor/extraction/parsers.py. Keys
+    are resolved through the store's key index, then the chosen records are
+    fetched with a single mget (plus one L0 retry for stale L2 entries).
 
     Args:
         store: MainStore instance
-        zotero_key: Zotero citation key
-        es_record_id: Pre-looked-up ES record ID (L0), or None to search
+        zotero_keys: Zotero citation keys
 
     Returns:
-        (content, level) tuple, or (None, None) if not found
+        Dict of zotero_key -> (content, level) for keys with content
     """
-    # If we don't have the ES record ID, look it up
-    if es_record_id is None:
-        query = {
-            "bool": {
-                "must": [{"term": {"zotero_key": zotero_key}}],
-                "filter": [{"term": {"compression_level": 0}}],
-            }
-        }
-        try:
-            results = await store.search(query=query, size=1, compression_level=0)
-            if results:
-                es_record_id = str(results[0].id)
-            else:
-                logger.warning(f"No L0 record found for zotero_key: {zotero_key}")
-                return None, None
-        except Exception as e:
-            logger.error(f"Failed to search for L0 record: {e}")
-            return None, None
-
-    record_uuid = UUID(es_record_id)
-
-    # Try L2 first (10:1 summary) - better for long documents
     try:
-        l2_record = await store.get_by_source_id(record_uuid, compression_level=2)
-        if l2_record and l2_record.content:
-            logger.debug(f"Using L2 (10:1 summary) for {zotero_key}")
-            return l2_record.content, "L2"
+        entries = await store.resolve_keys(zotero_keys)
     except Exception as e:
-        logger.warning(f"Failed to fetch L2 for {zotero_key}: {e}")
+        logger.error(f"Failed to resolve keys {zotero_keys}: {e}")
+        return {}
 
-    # Fall back to L0 (original)
-    try:
-        l0_record = await store.get(record_uuid, compression_level=0)
-        if l0_record and l0_record.content:
-            # Check if L0 is too large
-            if len(l0_record.content) > L0_SIZE_THRESHOLD_FOR_L2:
-                logger.warning(
-                    f"L0 for {zotero_key} is {len(l0_record.content)} chars "
-                    f"(>{L0_SIZE_THRESHOLD_FOR_L2}), may need truncation"
-                )
-            logger.debug(f"Using L0 (original) for {zotero_key}")
-            return l0_record.content, "L0"
-    except Exception as e:
-        logger.error(f"Failed to fetch L0 for {zotero_key}: {e}")
+    for key in zotero_keys:
+        if key not in entries or entries[key].l0_id is None:
+            logger.warning(f"No L0 record found for zotero_key: {key}")
 
-    return None, None
+    # Try L2 first (10:1 summary) - better for long documents
+    wanted: dict[str, tuple[UUID, int]] = {}
+    for key, entry in entries.items():
+        if entry.l2_id is not None:
+            wanted[key] = (entry.l2_id, 2)
+        elif entry.l0_id is not None:
+            wanted[key] = (entry.l0_id, 0)
+
+    fetched: dict[str, tuple[str, Literal["L0", "L2"]]] = {}
+    for _attempt in range(2):
+        if not wanted:
+            break
+        try:
+            records = await store.mget(list(wanted.values()), fields=["content"])
+        except Exception as e:
+            logger.error(f"Failed to fetch content for {list(wanted)}: {e}")
+            break
+
+        retry: dict[str, tuple[UUID, int]] = {}
+        for key, (record_id, level) in wanted.items():
+            record = records.get(record_id)
+            if record and record.content:
+                fetched[key] = (record.content, "L2" if level == 2 else "L0")
+            elif level == 2 and entries[key].l0_id is not None:
+                # Fall back to L0 (original)
+                retry[key] = (entries[key].l0_id, 0)
+        wanted = retry
+
+    for key, (content, level) in fetched.items():
+        if level == "L0" and len(content) > L0_SIZE_THRESHOLD_FOR_L2:
+            logger.warning(
+                f"L0 for {key} is {len(content)} chars "
+                f"(>{L0_SIZE_THRESHOLD_FOR_L2}), may need truncation"
+            )
+        logger.debug(f"Using {level} for {key}")
+
+    return fetched
 
 
 async def fetch_content_node(state: dict) -> dict[str, Any]:
@@ -90,14 +92,12 @@ async def fetch_content_node(state: dict) -> dict[str, Any]:
     Expected state keys from Send():
         - deep_dive_id: Which deep-dive this is for
         - anchor_keys: List of Zotero keys to fetch
-        - citation_mappings: Dict of zotero_key -> CitationKeyMapping
 
     Returns:
         State update with enriched_content list (aggregated via add reducer)
     """
     deep_dive_id = state.get("deep_dive_id")
     anchor_keys = state.get("anchor_keys", [])
-    citation_mappings = state.get("citation_mappings", {})
 
     if not deep_dive_id or not anchor_keys:
         logger.error(f"Missing required state: deep_dive_id={deep_dive_id}, anchor_keys={anchor_keys}")
@@ -107,12 +107,10 @@ async def fetch_content_node(state: dict) -> dict[str, Any]:
     store = store_manager.es_stores.store
 
     enriched: list[EnrichedContent] = []
+    fetched = await _fetch_content_for_keys(store, anchor_keys)
 
     for key in anchor_keys:
-        mapping = citation_mappings.get(key, {})
-        es_record_id = mapping.get("es_record_id") if mapping else None
-
-        content, level = await _fetch_content_for_key(store, key, es_record_id)
+        content, level = fetched.get(key, (None, None))
 
         if content and level:
             enriched.append(
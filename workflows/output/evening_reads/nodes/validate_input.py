@@ -1,6 +1,5 @@
 """Input validation node for evening_reads workflow."""
 
-import asyncio
 import logging
 import re
 from typing import Any
@@ -15,36 +14,6 @@ CITATION_PATTERN = r"\[@([^\]]+)\]"
 MIN_WORD_COUNT = 500
 
 
-async def _lookup_es_record_for_key(store, zotero_key: str) -> tuple[str | None, str | None, int | None]:
-    """Look up ES record ID, title, and publication year for a Zotero key.
-
-    Returns (es_record_id, title, year) or (None, None, None) if not found.
-    """
-    query = {
-        "bool": {
-            "must": [{"term": {"zotero_key": zotero_key}}],
-            "filter": [{"term": {"compression_level": 0}}],
-        }
-    }
-    try:
-        results = await store.search(query=query, size=1, compression_level=0)
-        if results:
-            record = results[0]
-            metadata = record.metadata or {}
-            title = metadata.get("title")
-            year = None
-            date_str = metadata.get("date", "")
-            if date_str:
-                try:
-                    year = int(str(date_str)[:4])
-                except (ValueError, IndexError):
-                    pass
-            return str(record.id), title, year
-    except Exception as e:
-        logger.warning(f"Failed to look up ES record for {zotero_key}: {e}")
-    return None, None, None
-
-
 async def validate_input_node(state: dict) -> dict[str, Any]:
     """Validate input and extract citation key mappings.
 
@@ -92,27 +61,24 @@ async def validate_input_node(state: dict) -> dict[str, Any]:
             "citation_mappings": {},
         }
 
-    # Look up ES record IDs for each citation key
+    # Look up ES record IDs for all citation keys in one batch
     store_manager = get_store_manager()
-    store = store_manager.es_stores.store
-
-    semaphore = asyncio.Semaphore(10)
-
-    async def lookup_with_semaphore(key: str) -> tuple[str, str | None, str | None, int | None]:
-        async with semaphore:
-            es_id, title, year = await _lookup_es_record_for_key(store, key)
-            return key, es_id, title, year
-
-    results = await asyncio.gather(*[lookup_with_semaphore(k) for k in citation_keys])
+    try:
+        entries = await store_manager.es_stores.store.resolve_keys(citation_keys)
+    except Exception as e:
+        logger.warning(f"Failed to look up ES records for citations: {e}")
+        entries = {}
 
     citation_mappings: dict[str, CitationKeyMapping] = {}
     found_count = 0
-    for key, es_id, title, year in results:
+    for key in citation_keys:
+        entry = entries.get(key)
+        es_id = str(entry.l0_id) if entry and entry.l0_id else None
         citation_mappings[key] = CitationKeyMapping(
             zotero_key=key,
             es_record_id=es_id,
-            title=title,
-            year=year,
+            title=entry.title if es_id else None,
+            year=entry.year if es_id else None,
         )
         if es_id:
             found_count += 1
@@ -27,6 +27,7 @@ from langsmith import traceable
 
 from core.task_queue.task_context import get_trace_metadata, get_trace_tags
 
+from .blob_store import get_blob_store, new_run_id
 from .config import IllustrateConfig
 from .graph import illustrate_graph
 from .schemas import ImageLocationPlan
@@ -39,6 +40,34 @@ from .state import (
 )
 
 
+async def run_illustrate_graph(
+    graph: Any,
+    graph_input: dict[str, Any],
+    config: dict[str, Any] | None = None,
+) -> dict[str, Any]:
+    """Invoke an illustrate graph in its own blob namespace.
+
+    Every caller of the graph goes through here so candidate images are
+    kept apart per run and cleared when it ends, success or not, instead
+    of piling up in the shared default namespace.
+
+    Args:
+        graph: Compiled illustrate graph (injectable for tests)
+        graph_input: Initial state; run_id is assigned here
+        config: Optional LangGraph run config
+
+    Returns:
+        Final graph state
+    """
+    run_id = new_run_id()
+    kwargs = {"config": config} if config is not None else {}
+    try:
+        return await graph.ainvoke({**graph_input, "run_id": run_id}, **kwargs)
+    finally:
+        # Finalize has written the winners to disk
+        get_blob_store(run_id).clear()
+
+
 @traceable(run_type="chain", name="IllustrateDocument")
 async def illustrate_document(
     markdown_document: str,
@@ -62,7 +91,8 @@ async def illustrate_document(
         - errors: Any errors encountered
     """
     display_title = (title or "Untitled")[:60]
-    result = await illustrate_graph.ainvoke(
+    return await run_illustrate_graph(
+        illustrate_graph,
         {
             "input": {
                 "markdown_document": markdown_document,
@@ -83,12 +113,12 @@ async def illustrate_document(
             },
         },
     )
-    return result
 
 
 __all__ = [
     # Main API
     "illustrate_document",
+    "run_illustrate_graph",
     # Graph (for direct access if needed)
     "illustrate_graph",
     # Config
@@ -0,0 +1,136 @@
+"""Content-addressed image storage for illustrate graph state.
+
+Candidate images are several hundred KB to a few MB each, and every state
+update and checkpoint would otherwise serialize them. Generation writes the
+bytes here once and state carries only the SHA-256 digest (``image_ref``);
+selection, editorial review and finalize load the bytes when they need them.
+
+Blobs live under ``THALA_ILLUSTRATE_BLOB_DIR/<run_id>/<digest>`` so each run
+can be garbage collected as a whole when it finishes.
+"""
+
+import asyncio
+import hashlib
+import logging
+import os
+import re
+import shutil
+import tempfile
+import uuid
+from collections.abc import Iterable, Mapping
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+BLOB_ROOT = Path(os.environ.get("THALA_ILLUSTRATE_BLOB_DIR", Path(tempfile.gettempdir()) / "thala_illustrate_blobs"))
+
+# Namespace for graph invocations that don't supply a run_id
+DEFAULT_RUN_ID = "default"
+
+_DIGEST_RE = re.compile(r"^[0-9a-f]{64}$")
+
+
+class ImageBlobStore:
+    """Content-addressed blob storage on local disk for one workflow run."""
+
+    def __init__(self, root: Path):
+        self.root = root
+
+    def _path(self, digest: str) -> Path:
+        if not _DIGEST_RE.match(digest):
+            raise ValueError(f"Invalid image blob digest: {digest!r}")
+        return self.root / digest
+
+    def put(self, data: bytes) -> str:
+        """Store bytes and return their SHA-256 digest.
+
+        Identical images are stored once; writes go through a temp file so
+        concurrent readers never see a partial blob.
+        """
+        digest = hashlib.sha256(data).hexdigest()
+        path = self._path(digest)
+        if not path.exists():
+            self.root.mkdir(parents=True, exist_ok=True)
+            tmp = self.root / f".{digest}.{uuid.uuid4().hex}.tmp"
+            tmp.write_bytes(data)
+            os.replace(tmp, path)
+        return digest
+
+    def get(self, digest: str) -> bytes:
+        """Load the bytes stored under a digest.
+
+        Raises:
+            KeyError: If no blob exists for the digest
+        """
+        try:
+            return self._path(digest).read_bytes()
+        except FileNotFoundError:
+            raise KeyError(f"Image blob {digest} not found in {self.root}") from None
+
+    def delete(self, digests: Iterable[str]) -> int:
+        """Delete blobs by digest, ignoring ones already gone.
+
+        Returns:
+            Number of blobs deleted
+        """
+        deleted = 0
+        for digest in set(digests):
+            try:
+                self._path(digest).unlink()
+                deleted += 1
+            except FileNotFoundError:
+                pass
+        return deleted
+
+    def clear(self) -> None:
+        """Remove every blob for this run."""
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    async def aput(self, data: bytes) -> str:
+        return await asyncio.to_thread(self.put, data)
+
+    async def aget(self, digest: str) -> bytes:
+        return await asyncio.to_thread(self.get, digest)
+
+
+def get_blob_store(run_id: str | None = None) -> ImageBlobStore:
+    """Get the blob store for a workflow run."""
+    return ImageBlobStore(BLOB_ROOT / (run_id or DEFAULT_RUN_ID))
+
+
+def new_run_id() -> str:
+    """Generate a blob namespace for a new workflow run."""
+    return uuid.uuid4().hex
+
+
+def has_image(result: Mapping) -> bool:
+    """Whether a generation result or assembled image carries an image."""
+    return bool(result.get("image_ref") or result.get("image_bytes"))
+
+
+async def load_image(result: Mapping, run_id: str | None = None) -> bytes | None:
+    """Resolve a result's image bytes from its blob reference.
+
+    Results from before blob offloading carry ``image_bytes`` inline; those
+    are returned as-is.
+    """
+    if result.get("image_ref"):
+        return await get_blob_store(run_id).aget(result["image_ref"])
+    return result.get("image_bytes") or None
+
+
+async def offload_image(result: dict, run_id: str | None = None) -> dict:
+    """Move a result's inline image bytes into the blob store.
+
+    Returns a copy with ``image_ref`` set and ``image_bytes`` cleared. If the
+    write fails the result is returned unchanged so the image isn't lost.
+    """
+    image_bytes = result.get("image_bytes")
+    if not image_bytes:
+        return result
+    try:
+        digest = await get_blob_store(run_id).aput(image_bytes)
+    except OSError as e:
+        logger.warning(f"Could not offload image for {result.get('brief_id')}, keeping inline: {e}")
+        return result
+    return {**result, "image_bytes": None, "image_ref": digest}
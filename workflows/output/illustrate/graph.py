@@ -34,6 +34,7 @@ from collections import defaultdict
 from langgraph.graph import END, START, StateGraph
 from langgraph.types import Send
 
+from .blob_store import get_blob_store, has_image
 from .config import IllustrateConfig
 from .nodes import (
     assemble_document_node,
@@ -102,6 +103,7 @@ def route_after_analysis(state: IllustrateState) -> list[Send] | str:
             "document_context": document,
             "config": config,
             "visual_identity": visual_identity,
+            "run_id": state.get("run_id"),
         }
         sends.append(Send("generate_candidate", send_data))
 
@@ -159,7 +161,7 @@ def route_to_selection(state: IllustrateState) -> list[Send] | str:
 
     sends = []
     for location_id, candidates in by_location.items():
-        successful = [c for c in candidates if c["success"] and c.get("image_bytes")]
+        successful = [c for c in candidates if c["success"] and has_image(c)]
         sends.append(
             Send(
                 "select_per_location",
@@ -167,6 +169,7 @@ def route_to_selection(state: IllustrateState) -> list[Send] | str:
                     "location_id": location_id,
                     "candidates": successful,
                     "selection_criteria": _build_selection_criteria(opportunities, editorial_notes, location_id),
+                    "run_id": state.get("run_id"),
                 },
             )
         )
@@ -178,8 +181,9 @@ def route_to_selection(state: IllustrateState) -> list[Send] | str:
 def sync_after_selection(state: IllustrateState) -> dict:
     """Synchronization barrier after all selections complete.
 
-    Updates retry_count for failed locations and clears image_bytes
-    from non-winning generation results to free memory.
+    Updates retry_count for failed locations and clears image_bytes and
+    blob references from non-winning generation results to free memory
+    and disk.
     """
     selection_results = state.get("selection_results", [])
     passed = sum(1 for s in selection_results if s["quality_tier"] != "failed")
@@ -212,11 +216,22 @@ def sync_after_selection(state: IllustrateState) -> dict:
             winning_brief_ids.add(sel["selected_brief_id"])
 
     generation_results = state.get("generation_results", [])
+    winning_refs = {gen.get("image_ref") for gen in generation_results if gen["brief_id"] in winning_brief_ids}
+    loser_refs: list[str] = []
     cleared = 0
     for gen in generation_results:
-        if gen["brief_id"] not in winning_brief_ids and gen.get("image_bytes"):
-            gen["image_bytes"] = b""
-            cleared += 1
+        if gen["brief_id"] in winning_brief_ids or not has_image(gen):
+            continue
+        if gen.get("image_ref"):
+            # Identical images share a blob; keep it if a winner uses it
+            if gen["image_ref"] not in winning_refs:
+                loser_refs.append(gen["image_ref"])
+            gen["image_ref"] = None
+        gen["image_bytes"] = b""
+        cleared += 1
+
+    if loser_refs:
+        get_blob_store(state.get("run_id")).delete(loser_refs)
 
     logger.info(f"Selection sync: {passed} selected, {failed} failed, {cleared} losers cleared")
     return {"retry_count": retry_count}
@@ -275,6 +290,7 @@ def route_after_selection(state: IllustrateState) -> list[Send] | str:
                 "document_context": document,
                 "config": config,
                 "visual_identity": visual_identity,
+                "run_id": state.get("run_id"),
             }
             sends.append(Send("generate_candidate", send_data))
 
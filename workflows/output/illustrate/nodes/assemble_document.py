@@ -2,11 +2,13 @@
 
 Pure Python node (no LLM call) that collects all winning images into
 AssembledImage records so the editorial review vision model can evaluate
-the full illustrated set.
+the full illustrated set. Images are passed by blob reference; the review
+node loads the bytes itself.
 """
 
 import logging
 
+from ..blob_store import has_image
 from ..state import AssembledImage, IllustrateState
 from ..utils import select_winning_results
 
@@ -41,7 +43,7 @@ async def assemble_document_node(state: IllustrateState) -> dict:
     for gen_result in winners:
         location_id = gen_result["location_id"]
         plan = plans_by_id.get(location_id)
-        if not plan or not gen_result.get("image_bytes"):
+        if not plan or not has_image(gen_result):
             continue
 
         assembled_images.append(
@@ -49,7 +51,8 @@ async def assemble_document_node(state: IllustrateState) -> dict:
                 location_id=location_id,
                 image_type=gen_result["image_type"],
                 purpose=purpose_by_id.get(location_id, plan.purpose),
-                image_bytes=gen_result["image_bytes"],
+                image_bytes=gen_result.get("image_bytes"),
+                image_ref=gen_result.get("image_ref"),
             )
         )
 
@@ -4,6 +4,7 @@ A single SONNET vision call evaluates all non-header images in context and
 identifies the weakest for cutting. This is the N-from-N+2 quality gate.
 """
 
+import asyncio
 import base64
 import logging
 
@@ -11,6 +12,7 @@ from langsmith import traceable
 
 from workflows.shared.llm_utils import ModelTier, invoke, InvokeConfig
 
+from ..blob_store import load_image
 from ..schemas import EditorialReviewResult, ImageOpportunity
 from ..state import AssembledImage, IllustrateState
 from ..utils import detect_media_type
@@ -109,8 +111,15 @@ async def editorial_review_node(state: IllustrateState) -> dict:
 
     content_parts: list[dict] = [{"type": "text", "text": user_prompt}]
 
-    for img in non_header_images:
-        image_bytes = img["image_bytes"]
+    loaded = await asyncio.gather(
+        *(load_image(img, state.get("run_id")) for img in non_header_images),
+        return_exceptions=True,
+    )
+
+    for img, image_bytes in zip(non_header_images, loaded):
+        if isinstance(image_bytes, Exception):
+            logger.warning(f"Skipping image '{img['location_id']}' from editorial review: {image_bytes}")
+            continue
         if not image_bytes:
             continue
         if len(image_bytes) > MAX_IMAGE_SIZE:
@@ -1,11 +1,13 @@
 """Finalize workflow: save images and insert into document."""
 
+import asyncio
 import logging
 import os
 import re
 import tempfile
 from typing import Literal
 
+from ..blob_store import get_blob_store, load_image
 from ..config import IllustrateConfig
 from ..schemas import ImageLocationPlan
 from ..state import (
@@ -108,6 +110,7 @@ async def finalize_node(state: IllustrateState) -> dict:
 
     Uses selection_results to pick the winning image per location,
     then saves to disk and inserts references into the markdown document.
+    Once the files are written, the run's candidate blobs are deleted.
 
     Returns:
         State update with final_images, illustrated_document, status
@@ -118,6 +121,7 @@ async def finalize_node(state: IllustrateState) -> dict:
     generation_results = state.get("generation_results", [])
     selection_results = state.get("selection_results", [])
     existing_errors = state.get("errors", [])
+    run_id = state.get("run_id")
 
     # Get output directory
     output_dir = config.output_dir or state["input"].get("output_dir")
@@ -164,7 +168,21 @@ async def finalize_node(state: IllustrateState) -> dict:
             logger.warning(f"No plan found for {location_id}")
             continue
 
-        if not gen_result["image_bytes"]:
+        try:
+            image_bytes = await load_image(gen_result, run_id)
+        except KeyError as e:
+            logger.error(f"Image blob missing for {location_id}: {e}")
+            errors.append(
+                WorkflowError(
+                    location_id=location_id,
+                    severity="error",
+                    message=f"Image blob missing: {e}",
+                    stage="finalize",
+                )
+            )
+            continue
+
+        if not image_bytes:
             logger.warning(f"No image bytes for {location_id}")
             continue
 
@@ -172,7 +190,7 @@ async def finalize_node(state: IllustrateState) -> dict:
         image_type = gen_result["image_type"]
         ext = "png"
         if image_type == "public_domain":
-            if gen_result["image_bytes"][:2] == b"\xff\xd8":
+            if image_bytes[:2] == b"\xff\xd8":
                 ext = "jpg"
 
         filename = f"{location_id}.{ext}"
@@ -180,7 +198,7 @@ async def finalize_node(state: IllustrateState) -> dict:
 
         try:
             with open(file_path, "wb") as f:
-                f.write(gen_result["image_bytes"])
+                f.write(image_bytes)
             logger.info(f"Saved image: {file_path}")
 
             final_images.append(
@@ -205,6 +223,12 @@ async def finalize_node(state: IllustrateState) -> dict:
                 )
             )
 
+    # Images are on disk now; drop every candidate blob for this run
+    blob_refs = [g["image_ref"] for g in generation_results if g.get("image_ref")]
+    if blob_refs:
+        deleted = await asyncio.to_thread(get_blob_store(run_id).delete, blob_refs)
+        logger.debug(f"Deleted {deleted} image blobs")
+
     # Insert images into document
     illustrated_document = _insert_images_into_markdown(
         document=document,
@@ -2,6 +2,7 @@
 
 import logging
 
+from ..blob_store import offload_image
 from ..config import IllustrateConfig
 from ..schemas import CandidateBrief, ImageLocationPlan, VisualIdentity
 from ..state import ImageGenResult, WorkflowError
@@ -18,10 +19,12 @@ async def generate_candidate_node(state: dict) -> dict:
     """Generate a single image candidate from a CandidateBrief.
 
     Receives brief + location plan, routes to the appropriate generator,
-    and tags the result with brief_id for downstream grouping.
+    and tags the result with brief_id for downstream grouping. Image bytes
+    are moved to the run's blob store so state carries only a digest.
 
     Args:
-        state: Contains location, brief, brief_id, document_context, config, visual_identity
+        state: Contains location, brief, brief_id, document_context, config,
+               visual_identity, run_id
 
     Returns:
         State update with generation_results (tagged with brief_id)
@@ -32,6 +35,7 @@ async def generate_candidate_node(state: dict) -> dict:
     document_context: str = state["document_context"]
     config: IllustrateConfig = state.get("config") or IllustrateConfig()
     visual_identity: VisualIdentity | None = state.get("visual_identity")
+    run_id: str | None = state.get("run_id")
 
     location_id = plan.location_id
     image_type = brief.image_type
@@ -84,6 +88,7 @@ async def generate_candidate_node(state: dict) -> dict:
             logger.error(f"Unknown image type: {image_type}")
             return _failure_result(location_id, brief_id, image_type, brief_text, f"Unknown image type: {image_type}")
 
+        result["generation_results"] = [await offload_image(r, run_id) for r in result["generation_results"]]
         return result
 
     except Exception as e:
@@ -1,9 +1,11 @@
 """Vision pair comparison to select the best candidate at each location."""
 
+import asyncio
 import logging
 
 from workflows.shared.vision_comparison import vision_pair_select
 
+from ..blob_store import load_image
 from ..state import LocationSelection
 
 logger = logging.getLogger(__name__)
@@ -19,7 +21,8 @@ async def select_per_location_node(state: dict) -> dict:
 
     Args:
         state: Contains location_id, candidates (successful ImageGenResults),
-               and selection_criteria for vision comparison
+               selection_criteria for vision comparison, and run_id for
+               loading candidate images from the blob store
 
     Returns:
         State update with selection_results
@@ -56,7 +59,7 @@ async def select_per_location_node(state: dict) -> dict:
 
     # Vision pair comparison
     try:
-        png_list = [c["image_bytes"] for c in candidates]
+        png_list = await asyncio.gather(*(load_image(c, state.get("run_id")) for c in candidates))
         best_idx = await vision_pair_select(
             png_list,
             selection_criteria=selection_criteria,
@@ -3,7 +3,7 @@
 from operator import add
 from typing import Annotated, Literal
 
-from typing_extensions import TypedDict
+from typing_extensions import NotRequired, TypedDict
 
 from .config import IllustrateConfig
 from .schemas import CandidateBrief, ImageLocationPlan, ImageOpportunity, VisualIdentity
@@ -15,7 +15,8 @@ class AssembledImage(TypedDict):
     location_id: str
     image_type: Literal["generated", "public_domain", "diagram"]
     purpose: str  # header, illustration, diagram
-    image_bytes: bytes  # Raw image data for vision call
+    image_bytes: NotRequired[bytes | None]  # Inline image data (pre-blob-store results)
+    image_ref: NotRequired[str | None]  # Blob store digest, loaded for the vision call
 
 
 def merge_dicts(left: dict, right: dict) -> dict:
@@ -40,7 +41,8 @@ class ImageGenResult(TypedDict):
     location_id: str
     brief_id: str  # "{location_id}_{candidate_index}" — groups results by brief
     success: bool
-    image_bytes: bytes | None
+    image_bytes: bytes | None  # Set by generators; moved to the blob store before entering state
+    image_ref: NotRequired[str | None]  # Blob store digest (see blob_store.py)
     image_type: Literal["generated", "public_domain", "diagram"]
     prompt_or_query_used: str  # What was actually used to generate/find
     alt_text: str | None
@@ -86,6 +88,7 @@ class IllustrateState(TypedDict, total=False):
     # Input
     input: IllustrateInput
     config: IllustrateConfig
+    run_id: str  # Blob store namespace for candidate images
 
     # Analysis phase
     extracted_title: str
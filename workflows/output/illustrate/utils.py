@@ -3,6 +3,7 @@
 import logging
 from collections import defaultdict
 
+from .blob_store import has_image
 from .state import ImageGenResult, LocationSelection
 
 logger = logging.getLogger(__name__)
@@ -42,7 +43,7 @@ def select_winning_results(
     results_by_brief_id: dict[str, ImageGenResult] = {}
     results_by_location: dict[str, list[ImageGenResult]] = defaultdict(list)
     for gen in generation_results:
-        if gen["success"] and gen.get("image_bytes"):
+        if gen["success"] and has_image(gen):
             results_by_brief_id[gen["brief_id"]] = gen
             results_by_location[gen["location_id"]].append(gen)
 
@@ -15,7 +15,7 @@ async def check_document_exists_by_doi(doi: str) -> Optional[dict[str, Any]]:
         doi: The DOI to search for
 
     Returns:
-        Dict with es_record_id, zotero_key, short_summary, content if found,
+        Dict with es_record_id, zotero_key, short_summary if found,
         None otherwise.
     """
     store_manager = get_store_manager()
@@ -32,6 +32,7 @@ async def check_document_exists_by_doi(doi: str) -> Optional[dict[str, Any]]:
             },
             size=1,
             compression_level=0,
+            fields=["zotero_key", "metadata.short_summary"],
         )
 
         if results:
@@ -39,7 +40,6 @@ async def check_document_exists_by_doi(doi: str) -> Optional[dict[str, Any]]:
             return {
                 "es_record_id": str(record.id),
                 "zotero_key": record.zotero_key,
-                "content": record.content,
                 "short_summary": record.metadata.get("short_summary", ""),
             }
     except Exception as e:
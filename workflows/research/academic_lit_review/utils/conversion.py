@@ -208,11 +208,16 @@ def deduplicate_papers(
             seen_dois.add(doi)
             doi_unique.append(paper)
 
-    # Pass 2: title+author dedup within the batch
+    # Pass 2: title+author dedup within the batch. Duplicates must share a
+    # normalized title, so candidates are looked up by title instead of
+    # comparing every pair.
     title_unique: list[PaperMetadata] = []
+    kept_by_title: dict[str, list[int]] = {}
     for paper in doi_unique:
+        title = _normalize_title(paper.get("title", ""))
         is_dup = False
-        for i, kept in enumerate(title_unique):
+        for i in kept_by_title.get(title, []) if title else []:
+            kept = title_unique[i]
             if _is_title_author_duplicate(paper, kept):
                 preferred = _pick_preferred_version(kept, paper)
                 dropped = paper if preferred is kept else kept
@@ -227,14 +232,22 @@ def deduplicate_papers(
                 is_dup = True
                 break
         if not is_dup:
+            kept_by_title.setdefault(title, []).append(len(title_unique))
             title_unique.append(paper)
 
     # Pass 3: title+author dedup against existing corpus
     if existing_papers:
+        existing_by_title: dict[str, list[PaperMetadata]] = {}
+        for existing in existing_papers:
+            title = _normalize_title(existing.get("title", ""))
+            if title:
+                existing_by_title.setdefault(title, []).append(existing)
+
         final: list[PaperMetadata] = []
         for paper in title_unique:
             dup_found = False
-            for existing in existing_papers:
+            title = _normalize_title(paper.get("title", ""))
+            for existing in existing_by_title.get(title, []) if title else []:
                 if _is_title_author_duplicate(paper, existing):
                     logger.info(
                         "Dropping corpus duplicate: '%s' (DOI %s) — "
@@ -2,12 +2,21 @@
 
 Uses invoke_via_cli for planning and report generation (no tools).
 Dispatches parallel researcher subagents for actual web research.
+
+The loop streams: whenever a researcher finishes, its finding is recorded
+and, if no planned questions are waiting, the supervisor replans and
+dispatches follow-ups into the freed slots while slower researchers keep
+running. Dispatch is bounded by a concurrency cap and a total-turn budget.
+When the planner reports the brief's key questions covered, stragglers are
+cancelled.
 """
 
 import asyncio
 import json
 import logging
 import re
+from collections import deque
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 
 from workflows.shared.llm_utils import ModelTier
@@ -19,20 +28,53 @@ from .researcher import run_researcher, ResearchFinding
 logger = logging.getLogger(__name__)
 
 
+# Researchers running at once
+MAX_CONCURRENT_RESEARCHERS = 3
+
+
+@dataclass
+class _ResearchLoop:
+    """Bookkeeping for the streaming research loop."""
+
+    max_concurrent: int
+    turns_remaining: int
+    queue: deque = field(default_factory=deque)
+    running: dict[asyncio.Task, str] = field(default_factory=dict)
+    findings: list[ResearchFinding] = field(default_factory=list)
+    errors: list[dict] = field(default_factory=list)
+    dispatched: int = 0
+
+    def free_slots(self) -> int:
+        return self.max_concurrent - len(self.running)
+
+
 async def run_research(
     query: str,
     max_iterations: int = 3,
     max_researcher_turns: int = 20,
     recency_info: str = "",
+    max_concurrent_researchers: int = MAX_CONCURRENT_RESEARCHERS,
+    turn_budget: int | None = None,
+    cancel_stragglers: bool = True,
 ) -> dict:
     """Run the full research workflow.
 
+    Args:
+        query: Research question or topic
+        max_iterations: Maximum planning rounds
+        max_researcher_turns: Turn limit per researcher
+        recency_info: Recency guidance passed to researchers
+        max_concurrent_researchers: Researchers running at once
+        turn_budget: Total researcher turns to allocate (each dispatch
+            reserves max_researcher_turns). Defaults to enough for every
+            planning round to fill every slot.
+        cancel_stragglers: Cancel running researchers once the planner
+            reports the key questions covered
+
     Returns:
         {"final_report": str, "source_count": int, "errors": list, ...}
     """
     started_at = datetime.now(timezone.utc)
-    errors = []
-    all_findings: list[ResearchFinding] = []
 
     # Phase 1: Generate research brief
     logger.info(f"Generating research brief for: {query[:80]}...")
@@ -45,36 +87,71 @@ async def run_research(
         f"{len(brief.get('key_questions', []))} key questions"
     )
 
-    # Phase 2: Research loop
-    for iteration in range(max_iterations):
-        logger.info(f"Research iteration {iteration + 1}/{max_iterations}")
-
-        plan = await _plan_iteration(brief, all_findings, iteration, max_iterations)
-
-        if plan is None:
-            errors.append({"node": "plan", "error": "Planning failed"})
-            continue
-
-        if plan == "RESEARCH_COMPLETE":
-            logger.info("Supervisor signaled research complete")
-            break
-
-        questions = plan.get("questions", [])
-        if not questions:
-            logger.warning("No questions generated, completing")
-            break
+    # Phase 2: Streaming research loop
+    if turn_budget is None:
+        turn_budget = max_iterations * max_concurrent_researchers * max_researcher_turns
+    loop = _ResearchLoop(max_concurrent=max_concurrent_researchers, turns_remaining=turn_budget)
+    planning_round = 0
+    complete = False
 
-        # Dispatch researchers in parallel
-        logger.info(f"Dispatching {len(questions)} researchers")
-        findings, dispatch_errors = await _dispatch_researchers(
-            questions, brief, recency_info, max_researcher_turns
-        )
-        all_findings.extend(findings)
-        errors.extend(dispatch_errors)
-        logger.info(
-            f"Iteration {iteration + 1}: {len(findings)} new findings, "
-            f"{len(all_findings)} total"
-        )
+    try:
+        while True:
+            can_dispatch = loop.turns_remaining >= max_researcher_turns
+
+            # Replan when slots are free and no planned questions are waiting
+            if (
+                not complete
+                and can_dispatch
+                and not loop.queue
+                and loop.free_slots() > 0
+                and planning_round < max_iterations
+            ):
+                logger.info(f"Research planning round {planning_round + 1}/{max_iterations}")
+                plan = await _plan_iteration(
+                    brief,
+                    loop.findings,
+                    planning_round,
+                    max_iterations,
+                    in_progress=list(loop.running.values()),
+                )
+                planning_round += 1
+
+                if plan is None:
+                    loop.errors.append({"node": "plan", "error": "Planning failed"})
+                elif plan == "RESEARCH_COMPLETE":
+                    logger.info("Supervisor signaled research complete")
+                    complete = True
+                    if cancel_stragglers:
+                        _cancel_stragglers(loop)
+                elif plan.get("questions"):
+                    loop.queue.extend(plan["questions"])
+                elif not loop.running:
+                    logger.warning("No questions generated, completing")
+                    complete = True
+
+            # Fill free slots from the queue, within the turn budget
+            while loop.queue and loop.free_slots() > 0 and loop.turns_remaining >= max_researcher_turns:
+                _dispatch_researcher(loop, loop.queue.popleft(), brief, recency_info, max_researcher_turns)
+
+            if not loop.running:
+                if complete or planning_round >= max_iterations or loop.turns_remaining < max_researcher_turns:
+                    break
+                # Planning failed with nothing running; try the next round
+                continue
+
+            done, _ = await asyncio.wait(loop.running, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                _collect_result(loop, task)
+            logger.info(f"{len(loop.findings)} findings so far, {len(loop.running)} researchers running")
+    finally:
+        # Never leave researchers running past the loop (e.g. on cancellation)
+        _cancel_stragglers(loop)
+
+    if loop.queue:
+        logger.info(f"Turn budget exhausted, {len(loop.queue)} planned questions not researched")
+
+    all_findings = loop.findings
+    errors = loop.errors
 
     # Phase 3: Generate final report
     logger.info(f"Generating final report from {len(all_findings)} findings")
@@ -89,6 +166,7 @@ async def run_research(
         "status": "success" if not errors else "partial",
         "source_count": len(all_findings),
         "errors": errors,
+        "researchers_dispatched": loop.dispatched,
         "started_at": started_at,
         "completed_at": datetime.now(timezone.utc),
     }
@@ -113,9 +191,18 @@ async def _plan_iteration(
     findings: list[ResearchFinding],
     iteration: int,
     max_iterations: int,
+    in_progress: list[str] | None = None,
 ) -> dict | str | None:
-    """Ask the supervisor what to research next."""
+    """Ask the supervisor what to research next.
+
+    Questions still being researched are listed so they aren't re-planned.
+    """
     findings_text = _format_findings(findings) if findings else "No findings yet."
+    in_progress_text = (
+        "## In Progress (do not duplicate)\n" + "\n".join(f"- {q}" for q in in_progress) + "\n\n"
+        if in_progress
+        else ""
+    )
 
     user_prompt = f"""## Research Brief
 {json.dumps(brief, indent=2)}
@@ -123,7 +210,7 @@ async def _plan_iteration(
 ## Accumulated Findings ({len(findings)} so far)
 {findings_text}
 
-## Status
+{in_progress_text}## Status
 Iteration {iteration + 1} of {max_iterations}.
 {"This is the LAST iteration — prioritize the biggest remaining gaps." if iteration == max_iterations - 1 else ""}
 
@@ -145,43 +232,55 @@ What should we research next?"""
         return None
 
 
-async def _dispatch_researchers(
-    questions: list[dict],
+def _dispatch_researcher(
+    loop: _ResearchLoop,
+    q: dict,
     brief: dict,
     recency_info: str,
-    max_researcher_turns: int = 20,
-) -> tuple[list[ResearchFinding], list[dict]]:
-    """Dispatch parallel researcher subagents."""
-    tasks = []
-    for q in questions:
-        question = q.get("question", str(q))
-        context = q.get("context", "")
-        hints = q.get("search_hints", [])
-
-        full_context = f"Research topic: {brief.get('topic', '')}\n{context}"
-
-        tasks.append(
-            run_researcher(
-                question=question,
-                context=full_context,
-                search_hints=hints,
-                recency_info=recency_info,
-                max_turns=max_researcher_turns,
-            )
-        )
-
-    results = await asyncio.gather(*tasks, return_exceptions=True)
-
-    findings = []
-    errors = []
-    for i, result in enumerate(results):
-        if isinstance(result, Exception):
-            logger.error(f"Researcher {i} failed: {result}")
-            errors.append({"node": f"researcher_{i}", "error": str(result)})
-        elif result:
-            findings.append(result)
-
-    return findings, errors
+    max_researcher_turns: int,
+) -> None:
+    """Start one researcher subagent as a task, reserving its turns."""
+    question = q.get("question", str(q))
+    context = q.get("context", "")
+    hints = q.get("search_hints", [])
+
+    full_context = f"Research topic: {brief.get('topic', '')}\n{context}"
+
+    task = asyncio.create_task(
+        run_researcher(
+            question=question,
+            context=full_context,
+            search_hints=hints,
+            recency_info=recency_info,
+            max_turns=max_researcher_turns,
+        ),
+        name=f"researcher_{loop.dispatched}",
+    )
+    loop.running[task] = question
+    loop.turns_remaining -= max_researcher_turns
+    loop.dispatched += 1
+    logger.info(f"Dispatched researcher {loop.dispatched}: {question[:80]}")
+
+
+def _collect_result(loop: _ResearchLoop, task: asyncio.Task) -> None:
+    """Record a finished researcher's finding or error."""
+    question = loop.running.pop(task)
+    error = task.exception()
+    if error is not None:
+        logger.error(f"Researcher failed ({question[:60]}): {error}")
+        loop.errors.append({"node": task.get_name(), "error": str(error)})
+    elif task.result():
+        loop.findings.append(task.result())
+
+
+def _cancel_stragglers(loop: _ResearchLoop) -> None:
+    """Cancel researchers still running."""
+    if not loop.running:
+        return
+    logger.info(f"Cancelling {len(loop.running)} straggling researchers")
+    for task in loop.running:
+        task.cancel()
+    loop.running.clear()
 
 
 async def _generate_report(
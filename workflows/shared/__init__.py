@@ -1,68 +1,77 @@
-"""Shared utilities for document processing workflows."""
+"""Shared utilities for document processing workflows.
+
+Exports are imported on first access: this package is imported (via
+workflows.shared.persistent_cache) by stores and CLIs that never touch
+the LLM layer, and eagerly importing llm_utils would load the broker,
+anthropic and langchain on every start-up.
+"""
+
+import importlib
+
+# Exported name -> submodule that defines it
+_EXPORTS = {
+    "chunk_by_headings": ".text_utils",
+    "count_words": ".text_utils",
+    "estimate_pages": ".text_utils",
+    "get_first_n_pages": ".text_utils",
+    "get_last_n_pages": ".text_utils",
+    "ModelTier": ".llm_utils",
+    "get_llm": ".llm_utils",
+    "invoke": ".llm_utils",
+    "InvokeConfig": ".llm_utils",
+    "BatchProcessor": ".batch_processor",
+    "BatchRequest": ".batch_processor",
+    "BatchResult": ".batch_processor",
+    "get_batch_processor": ".batch_processor",
+    "get_cached": ".persistent_cache",
+    "set_cached": ".persistent_cache",
+    "clear_cache": ".persistent_cache",
+    "get_cache_stats": ".persistent_cache",
+    "compute_file_hash": ".persistent_cache",
+    "run_with_concurrency": ".async_utils",
+    "with_retry": ".retry_utils",
+    "safe_node_execution": ".node_utils",
+    "StateUpdater": ".node_utils",
+    "extract_json_from_response": ".llm_utils.response_parsing",
+    "extract_response_content": ".llm_utils.response_parsing",
+    "estimate_tokens_fast": ".token_utils",
+    "count_tokens_accurate": ".token_utils",
+    "acount_tokens_accurate": ".token_utils",
+    "acount_tokens_many": ".token_utils",
+    "TokenCounter": ".token_utils",
+    "get_token_counter": ".token_utils",
+    "estimate_request_tokens": ".token_utils",
+    "check_token_budget": ".token_utils",
+    "select_model_for_context": ".token_utils",
+    "get_safe_limit_for_model": ".token_utils",
+    "TokenBudgetExceeded": ".token_utils",
+    "HAIKU_SAFE_LIMIT": ".token_utils",
+    "SONNET_SAFE_LIMIT": ".token_utils",
+    "SONNET_1M_SAFE_LIMIT": ".token_utils",
+    "CHARS_PER_TOKEN": ".token_utils",
+    "DEFAULT_RESPONSE_BUFFER": ".token_utils",
+    "generate_diagram": ".diagram_utils",
+    "DiagramResult": ".diagram_utils",
+    "DiagramConfig": ".diagram_utils",
+    "DiagramType": ".diagram_utils",
+    "DiagramAnalysis": ".diagram_utils",
+    "OverlapCheckResult": ".diagram_utils",
+    "extract_year": ".metadata_utils",
+    "validate_year": ".metadata_utils",
+    "parse_author_name": ".metadata_utils",
+    "normalize_author_list": ".metadata_utils",
+    "merge_metadata_with_baseline": ".metadata_utils",
+    "ParsedAuthorName": ".metadata_utils",
+}
+
+
+def __getattr__(name: str):
+    if name in _EXPORTS:
+        value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-from .text_utils import (
-    chunk_by_headings,
-    count_words,
-    estimate_pages,
-    get_first_n_pages,
-    get_last_n_pages,
-)
-from .llm_utils import (
-    ModelTier,
-    get_llm,
-    invoke,
-    InvokeConfig,
-)
-from .batch_processor import (
-    BatchProcessor,
-    BatchRequest,
-    BatchResult,
-    get_batch_processor,
-)
-from .persistent_cache import (
-    get_cached,
-    set_cached,
-    clear_cache,
-    get_cache_stats,
-    compute_file_hash,
-)
-from .async_utils import run_with_concurrency
-from .retry_utils import with_retry
-from .node_utils import safe_node_execution, StateUpdater
-from .llm_utils.response_parsing import (
-    extract_json_from_response,
-    extract_response_content,
-)
-from .token_utils import (
-    estimate_tokens_fast,
-    count_tokens_accurate,
-    estimate_request_tokens,
-    check_token_budget,
-    select_model_for_context,
-    get_safe_limit_for_model,
-    TokenBudgetExceeded,
-    HAIKU_SAFE_LIMIT,
-    SONNET_SAFE_LIMIT,
-    SONNET_1M_SAFE_LIMIT,
-    CHARS_PER_TOKEN,
-    DEFAULT_RESPONSE_BUFFER,
-)
-from .diagram_utils import (
-    generate_diagram,
-    DiagramResult,
-    DiagramConfig,
-    DiagramType,
-    DiagramAnalysis,
-    OverlapCheckResult,
-)
-from .metadata_utils import (
-    extract_year,
-    validate_year,
-    parse_author_name,
-    normalize_author_list,
-    merge_metadata_with_baseline,
-    ParsedAuthorName,
-)
 
 __all__ = [
     # Text utilities
@@ -100,6 +109,10 @@ __all__ = [
     # Token utilities
     "estimate_tokens_fast",
     "count_tokens_accurate",
+    "acount_tokens_accurate",
+    "acount_tokens_many",
+    "TokenCounter",
+    "get_token_counter",
     "estimate_request_tokens",
     "check_token_budget",
     "select_model_for_context",
@@ -3,7 +3,7 @@ Shared language utilities for multi-lingual workflow support.
 
 Provides:
 - Language configuration types and data for 30 supported languages
-- Opus-powered prompt translation with caching
+- Opus-powered prompt translation with persistent, pre-warmable caching
 - Haiku-powered query translation for search
 
 Example usage:
@@ -17,7 +17,7 @@ Example usage:
     # Get language config
     config = get_language_config("es")  # Spanish
 
-    # Translate a prompt (uses Opus, cached 24h)
+    # Translate a prompt (uses Opus, cached on disk by prompt hash)
     translated_prompt = await get_translated_prompt(
         SYSTEM_PROMPT,
         language_code="es",
@@ -47,8 +47,12 @@ from .translator import (
     get_translated_prompt,
     clear_translation_cache,
     get_cache_stats,
+    get_cached_translation,
+    pretranslate_prompts,
+    translation_cache_key,
     PROMPT_TRANSLATION_SYSTEM,
 )
+from .prompt_registry import PROMPT_REGISTRY, load_registered_prompts
 from .query_translator import (
     translate_query,
     translate_queries,
@@ -59,6 +63,7 @@ from .detection import (
     detect_language,
     verify_language_match,
     extract_detection_sample,
+    clear_detection_cache,
     DEFAULT_CONFIDENCE_THRESHOLD,
 )
 from .content_filter import filter_by_content_language
@@ -80,7 +85,12 @@ __all__ = [
     "get_translated_prompt",
     "clear_translation_cache",
     "get_cache_stats",
+    "get_cached_translation",
+    "pretranslate_prompts",
+    "translation_cache_key",
     "PROMPT_TRANSLATION_SYSTEM",
+    "PROMPT_REGISTRY",
+    "load_registered_prompts",
     # Query translation
     "translate_query",
     "translate_queries",
@@ -90,6 +100,7 @@ __all__ = [
     "detect_language",
     "verify_language_match",
     "extract_detection_sample",
+    "clear_detection_cache",
     "DEFAULT_CONFIDENCE_THRESHOLD",
     # Content filtering
     "filter_by_content_language",
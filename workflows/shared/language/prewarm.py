@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Pre-translate registered prompts into the persistent translation cache.
+
+Submits every (prompt, language) pair missing from the cache as one batched
+job, so non-English runs start with all prompt translations on disk.
+
+Usage:
+    python -m workflows.shared.language.prewarm                 # Major languages
+    python -m workflows.shared.language.prewarm --languages es,de
+    python -m workflows.shared.language.prewarm --all-languages
+    python -m workflows.shared.language.prewarm --prompts supervisor_system
+    python -m workflows.shared.language.prewarm --list
+"""
+
+import argparse
+import asyncio
+import logging
+
+from core.config import configure_logging
+
+from .languages import LANGUAGE_NAMES, get_all_supported_languages
+from .prompt_registry import load_registered_prompts
+from .translator import pretranslate_prompts
+
+logger = logging.getLogger(__name__)
+
+# Mirrors the multi_lang wrapper's main-language set, minus English
+DEFAULT_LANGUAGES = ["zh", "es", "de", "fr", "ja", "pt", "ru", "ar", "ko"]
+
+
+def _parse_languages(args: argparse.Namespace) -> list[str]:
+    if args.all_languages:
+        return [code for code in get_all_supported_languages() if code != "en"]
+    if not args.languages:
+        return DEFAULT_LANGUAGES
+
+    codes = [code.strip() for code in args.languages.split(",") if code.strip()]
+    unknown = [code for code in codes if code not in LANGUAGE_NAMES]
+    if unknown:
+        raise SystemExit(f"Unsupported language codes: {', '.join(unknown)}")
+    return [code for code in codes if code != "en"]
+
+
+async def prewarm(
+    language_codes: list[str],
+    prompt_names: list[str] | None = None,
+) -> dict[str, int]:
+    """Pre-translate registered prompts for the given languages.
+
+    Args:
+        language_codes: ISO 639-1 codes to translate into
+        prompt_names: Registered prompt names to include; all when None
+
+    Returns:
+        Counts of "cached", "translated" and "failed" pairs
+    """
+    prompts = load_registered_prompts(prompt_names)
+    languages = [LANGUAGE_NAMES[code] for code in language_codes]
+    return await pretranslate_prompts(prompts, languages)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Pre-translate registered prompts into the translation cache")
+    parser.add_argument(
+        "--languages",
+        help="Comma-separated language codes (default: major languages)",
+    )
+    parser.add_argument(
+        "--all-languages",
+        action="store_true",
+        help="Translate into every supported language",
+    )
+    parser.add_argument(
+        "--prompts",
+        nargs="+",
+        help="Registered prompt names to translate (default: all)",
+    )
+    parser.add_argument(
+        "--list",
+        action="store_true",
+        help="List registered prompt names and exit",
+    )
+    args = parser.parse_args()
+
+    if args.list:
+        for name in load_registered_prompts():
+            print(name)
+        return
+
+    configure_logging()
+    codes = _parse_languages(args)
+    try:
+        stats = asyncio.run(prewarm(codes, args.prompts))
+    except KeyError as e:
+        raise SystemExit(str(e))
+
+    logger.info(
+        f"Prompt cache warm for {len(codes)} languages: "
+        f"{stats['translated']} translated, {stats['cached']} already cached, "
+        f"{stats['failed']} failed"
+    )
+    if stats["failed"]:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Registry of prompts that workflows translate for non-English runs.
+
+Maps each `prompt_name` passed to `get_translated_prompt()` to the module
+attribute holding its English text. Only prompts translated verbatim are
+listed: prompts assembled at runtime (e.g. with a topic or language
+instruction substituted in) have no fixed text to pre-translate.
+
+Modules are imported lazily so listing the registry stays cheap.
+"""
+
+import importlib
+from collections.abc import Iterable
+from typing import Optional
+
+_WEB_PROMPTS = "workflows.research.web_research.prompts"
+_LIT_REVIEW = "workflows.research.academic_lit_review"
+_BOOK_FINDING = "workflows.research.book_finding"
+
+# prompt_name -> (module, attribute)
+PROMPT_REGISTRY: dict[str, tuple[str, str]] = {
+    # Web research
+    "compress_web_research_system": (f"{_WEB_PROMPTS}.compression", "COMPRESS_WEB_RESEARCH_SYSTEM"),
+    "compress_research_user": (f"{_WEB_PROMPTS}.compression", "COMPRESS_RESEARCH_USER_TEMPLATE"),
+    "create_brief_system": (f"{_WEB_PROMPTS}.brief", "CREATE_BRIEF_SYSTEM"),
+    "create_brief_human": (f"{_WEB_PROMPTS}.brief", "CREATE_BRIEF_HUMAN"),
+    "supervisor_system": (f"{_WEB_PROMPTS}.supervision", "SUPERVISOR_SYSTEM_CACHED"),
+    "supervisor_user": (f"{_WEB_PROMPTS}.supervision", "SUPERVISOR_USER_TEMPLATE"),
+    "final_report_system": (f"{_WEB_PROMPTS}.reporting", "FINAL_REPORT_SYSTEM_STATIC"),
+    "final_report_user": (f"{_WEB_PROMPTS}.reporting", "FINAL_REPORT_USER_TEMPLATE"),
+    "refine_draft_system": (f"{_WEB_PROMPTS}.reporting", "REFINE_DRAFT_SYSTEM"),
+    "clarify_intent_system": (f"{_WEB_PROMPTS}.clarification", "CLARIFY_INTENT_SYSTEM"),
+    "clarify_intent_human": (f"{_WEB_PROMPTS}.clarification", "CLARIFY_INTENT_HUMAN"),
+    "iterate_plan_system": (f"{_WEB_PROMPTS}.planning", "ITERATE_PLAN_SYSTEM"),
+    "iterate_plan_human": (f"{_WEB_PROMPTS}.planning", "ITERATE_PLAN_HUMAN"),
+    # Academic literature review
+    "lit_review_clustering_system": (f"{_LIT_REVIEW}.clustering.prompts", "LLM_CLUSTERING_SYSTEM_PROMPT"),
+    "lit_review_clustering_user": (f"{_LIT_REVIEW}.clustering.prompts", "LLM_CLUSTERING_USER_TEMPLATE"),
+    "lit_review_quality_system": (f"{_LIT_REVIEW}.synthesis.prompts", "QUALITY_CHECK_SYSTEM_PROMPT"),
+    "lit_review_abstract_user": (f"{_LIT_REVIEW}.synthesis.prompts", "ABSTRACT_USER_TEMPLATE"),
+    "lit_review_intro_user": (f"{_LIT_REVIEW}.synthesis.nodes.writing.prompts", "INTRODUCTION_USER_TEMPLATE"),
+    "lit_review_method_user": (f"{_LIT_REVIEW}.synthesis.nodes.writing.prompts", "METHODOLOGY_USER_TEMPLATE"),
+    "lit_review_discussion_user": (f"{_LIT_REVIEW}.synthesis.nodes.writing.prompts", "DISCUSSION_USER_TEMPLATE"),
+    "lit_review_conclusions_user": (f"{_LIT_REVIEW}.synthesis.nodes.writing.prompts", "CONCLUSIONS_USER_TEMPLATE"),
+    "lit_review_thematic_user": (f"{_LIT_REVIEW}.synthesis.nodes.writing.prompts", "THEMATIC_SECTION_USER_TEMPLATE"),
+    "lit_review_relevance_system": (f"{_LIT_REVIEW}.utils.relevance_scoring.types", "RELEVANCE_SCORING_SYSTEM"),
+    "lit_review_batch_relevance_system": (
+        f"{_LIT_REVIEW}.utils.relevance_scoring.types",
+        "BATCH_RELEVANCE_SCORING_SYSTEM",
+    ),
+    # Book finding
+    "book_finding_analogous_system": (f"{_BOOK_FINDING}.prompts", "ANALOGOUS_DOMAIN_SYSTEM"),
+    "book_finding_inspiring_system": (f"{_BOOK_FINDING}.prompts", "INSPIRING_ACTION_SYSTEM"),
+    "book_finding_expressive_system": (f"{_BOOK_FINDING}.prompts", "EXPRESSIVE_SYSTEM"),
+    "book_finding_summary": (f"{_BOOK_FINDING}.prompts", "SUMMARY_PROMPT"),
+}
+
+# prefix -> (module, attribute) of a dict whose entries are translated as
+# f"{prefix}{key}"
+PROMPT_GROUP_REGISTRY: dict[str, tuple[str, str]] = {
+    "book_finding_header_": (f"{_BOOK_FINDING}.nodes.synthesize_output", "SECTION_HEADERS_EN"),
+}
+
+
+def _load(module: str, attribute: str):
+    return getattr(importlib.import_module(module), attribute)
+
+
+def load_registered_prompts(names: Optional[Iterable[str]] = None) -> dict[str, str]:
+    """Load the English text of registered prompts.
+
+    Args:
+        names: Prompt names (or group prefixes) to load; all when None
+
+    Returns:
+        Dict of prompt_name -> English prompt text
+
+    Raises:
+        KeyError: If a requested name is not registered
+    """
+    wanted = set(names) if names is not None else None
+    if wanted is not None:
+        unknown = wanted - set(PROMPT_REGISTRY) - set(PROMPT_GROUP_REGISTRY)
+        if unknown:
+            raise KeyError(f"Unregistered prompts: {', '.join(sorted(unknown))}")
+
+    prompts: dict[str, str] = {}
+    for name, (module, attribute) in PROMPT_REGISTRY.items():
+        if wanted is None or name in wanted:
+            prompts[name] = _load(module, attribute)
+    for prefix, (module, attribute) in PROMPT_GROUP_REGISTRY.items():
+        if wanted is None or prefix in wanted:
+            for key, text in _load(module, attribute).items():
+                prompts[f"{prefix}{key}"] = text
+    return prompts
@@ -7,6 +7,12 @@ high-quality, context-aware translation that preserves prompt intent.
 This is NOT machine translation - Opus understands the semantic purpose
 of prompts and produces natural, fluent translations.
 
+Translations are cached in memory and on disk (persistent_cache), keyed by
+(hash of the English prompt, target language, model). Editing a prompt
+changes its hash, so stale translations are never served. Use
+`python -m workflows.shared.language.prewarm` to pre-translate all
+registered prompts before a run.
+
 Usage:
     translated = await translate_prompt(
         CLARIFY_INTENT_SYSTEM,
@@ -16,17 +22,26 @@ Usage:
 """
 
 import asyncio
+import hashlib
 import logging
+from collections.abc import Mapping, Sequence
 from typing import Optional
 
 from cachetools import TTLCache
 
-from workflows.shared.llm_utils import invoke, InvokeConfig, ModelTier
+from workflows.shared.llm_utils import invoke, invoke_batch, InvokeConfig, ModelTier
+from workflows.shared.persistent_cache import get_cached, set_cached
 from workflows.shared.retry_utils import with_retry
 from workflows.shared.llm_utils.response_parsing import extract_response_content
 
 logger = logging.getLogger(__name__)
 
+TRANSLATION_MODEL = ModelTier.OPUS
+TRANSLATION_MAX_TOKENS = 8192
+PROMPT_CACHE_TYPE = "prompt_translations"
+# Entries are content-addressed, so the TTL only bounds disk usage
+PROMPT_CACHE_TTL_DAYS = 180
+
 _prompt_cache: TTLCache = TTLCache(maxsize=500, ttl=86400)
 _translation_locks: dict[str, asyncio.Lock] = {}
 
@@ -49,56 +64,174 @@ CRITICAL RULES:
 Output ONLY the translated prompt text. No explanations, no "Here's the translation:", just the translated prompt."""
 
 
+def translation_cache_key(
+    english_prompt: str,
+    target_language: str,
+    model: ModelTier = TRANSLATION_MODEL,
+) -> str:
+    """Build the cache key for a translation: (prompt hash, language, model)."""
+    prompt_hash = hashlib.sha256(english_prompt.encode()).hexdigest()
+    return f"{prompt_hash}:{target_language}:{model.value}"
+
+
+def get_cached_translation(english_prompt: str, target_language: str) -> Optional[str]:
+    """Look up a translation in the memory cache, then the disk cache."""
+    key = translation_cache_key(english_prompt, target_language)
+    if key in _prompt_cache:
+        return _prompt_cache[key]
+
+    cached = get_cached(PROMPT_CACHE_TYPE, key, ttl_days=PROMPT_CACHE_TTL_DAYS, format="json")
+    translation = cached.get("translation") if isinstance(cached, dict) else None
+    if translation is not None:
+        _prompt_cache[key] = translation
+    return translation
+
+
+def _store_translation(english_prompt: str, target_language: str, translation: str) -> None:
+    key = translation_cache_key(english_prompt, target_language)
+    _prompt_cache[key] = translation
+    set_cached(
+        PROMPT_CACHE_TYPE,
+        key,
+        {
+            "language": target_language,
+            "model": TRANSLATION_MODEL.value,
+            "translation": translation,
+        },
+        format="json",
+    )
+
+
 async def translate_prompt(
     english_prompt: str,
     target_language: str,
     cache_key: Optional[str] = None,
 ) -> str:
-    """Translate an English prompt to the target language using Opus."""
-    if cache_key and cache_key in _prompt_cache:
-        logger.debug(f"Prompt translation cache hit: {cache_key}")
-        return _prompt_cache[cache_key]
+    """Translate an English prompt to the target language using Opus.
+
+    Args:
+        english_prompt: Prompt text to translate
+        target_language: Target language name (e.g., "Spanish")
+        cache_key: Optional label for log messages; caching is keyed by the
+            prompt content so edited prompts are re-translated automatically
+
+    Returns:
+        Translated prompt, or the English prompt if translation failed
+    """
+    if not english_prompt.strip():
+        return english_prompt
 
-    if cache_key:
-        if cache_key not in _translation_locks:
-            _translation_locks[cache_key] = asyncio.Lock()
+    label = cache_key or f"{len(english_prompt)}-char prompt"
+    cached = get_cached_translation(english_prompt, target_language)
+    if cached is not None:
+        logger.debug(f"Prompt translation cache hit: {label}")
+        return cached
 
-        async with _translation_locks[cache_key]:
-            if cache_key in _prompt_cache:
-                return _prompt_cache[cache_key]
+    key = translation_cache_key(english_prompt, target_language)
+    if key not in _translation_locks:
+        _translation_locks[key] = asyncio.Lock()
 
+    async with _translation_locks[key]:
+        cached = get_cached_translation(english_prompt, target_language)
+        if cached is not None:
+            return cached
+
+        try:
             result = await _do_translation(english_prompt, target_language)
+        except Exception as e:
+            # Not cached, so the next call retries the translation
+            logger.error(f"Translation failed after retries: {e}")
+            logger.warning("Falling back to English prompt")
+            return english_prompt
 
-            _prompt_cache[cache_key] = result
-            logger.debug(
-                f"Translated and cached prompt: {cache_key} ({len(result)} chars)"
-            )
-            return result
-    else:
-        return await _do_translation(english_prompt, target_language)
+        _store_translation(english_prompt, target_language, result)
+        logger.debug(f"Translated and cached prompt: {label} ({len(result)} chars)")
+        return result
 
 
-async def _do_translation(english_prompt: str, target_language: str) -> str:
-    """Perform the actual translation using Opus."""
-    user_prompt = f"""Translate this LLM prompt to {target_language}:
+def _translation_user_prompt(english_prompt: str, target_language: str) -> str:
+    return f"""Translate this LLM prompt to {target_language}:
 
 {english_prompt}"""
 
+
+async def _do_translation(english_prompt: str, target_language: str) -> str:
+    """Perform the actual translation using Opus."""
+
     async def _invoke():
         response = await invoke(
-            tier=ModelTier.OPUS,
+            tier=TRANSLATION_MODEL,
             system=PROMPT_TRANSLATION_SYSTEM,
-            user=user_prompt,
-            config=InvokeConfig(max_tokens=8192),
+            user=_translation_user_prompt(english_prompt, target_language),
+            config=InvokeConfig(max_tokens=TRANSLATION_MAX_TOKENS),
         )
         return extract_response_content(response)
 
+    return await with_retry(_invoke, max_attempts=2)
+
+
+async def pretranslate_prompts(
+    prompts: Mapping[str, str],
+    target_languages: Sequence[str],
+) -> dict[str, int]:
+    """Translate prompts missing from the cache in one batched job.
+
+    Args:
+        prompts: Prompt name -> English prompt text
+        target_languages: Target language names (e.g., ["Spanish", "German"])
+
+    Returns:
+        Counts of "cached", "translated" and "failed" (prompt, language) pairs
+    """
+    stats = {"cached": 0, "translated": 0, "failed": 0}
+    pending: list[tuple[str, str, str]] = []
+    for language in target_languages:
+        for name, text in prompts.items():
+            if not text.strip():
+                continue
+            if get_cached_translation(text, language) is not None:
+                stats["cached"] += 1
+            else:
+                pending.append((name, text, language))
+
+    if not pending:
+        return stats
+
+    logger.info(f"Pre-translating {len(pending)} prompts ({stats['cached']} already cached) in one batch")
     try:
-        return await with_retry(_invoke, max_attempts=2)
+        # Failed requests come back as exceptions so the others are still kept
+        async with invoke_batch(return_exceptions=True) as batch:
+            for _name, text, language in pending:
+                batch.add(
+                    tier=TRANSLATION_MODEL,
+                    system=PROMPT_TRANSLATION_SYSTEM,
+                    user=_translation_user_prompt(text, language),
+                    config=InvokeConfig(max_tokens=TRANSLATION_MAX_TOKENS),
+                )
+        responses = await batch.results()
     except Exception as e:
-        logger.error(f"Translation failed after retries: {e}")
-        logger.warning("Falling back to English prompt")
-        return english_prompt
+        logger.error(f"Prompt pre-translation batch failed: {e}")
+        stats["failed"] += len(pending)
+        return stats
+
+    failed: list[str] = []
+    for (name, text, language), response in zip(pending, responses):
+        if isinstance(response, BaseException):
+            logger.warning(f"Translation of {name} ({language}) failed: {response}")
+            failed.append(f"{name} ({language})")
+            continue
+        translation = extract_response_content(response)
+        if not translation.strip():
+            logger.warning(f"Empty translation for {name} ({language})")
+            failed.append(f"{name} ({language})")
+            continue
+        _store_translation(text, language, translation)
+        stats["translated"] += 1
+
+    stats["failed"] += len(failed)
+    if failed:
+        logger.error(f"{len(failed)} prompt translations failed: {', '.join(failed)}")
+    return stats
 
 
 async def get_translated_prompt(
@@ -120,7 +253,7 @@ async def get_translated_prompt(
 
 
 def clear_translation_cache() -> None:
-    """Clear the prompt translation cache."""
+    """Clear the in-memory prompt translation cache (the disk cache is kept)."""
     _prompt_cache.clear()
     logger.debug("Prompt translation cache cleared")
 
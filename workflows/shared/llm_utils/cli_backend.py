@@ -2,6 +2,10 @@
 
 Routes LLM calls through `claude -p` subprocess, using subscription
 billing instead of API billing. Enabled via THALA_LLM_BACKEND=cli.
+
+Text and structured calls run on pre-spawned stream-json workers from
+cli_pool (disable with THALA_CLI_POOL=0); tool agents spawn one
+subprocess per call since their MCP server is part of the command.
 """
 
 import asyncio
@@ -236,6 +240,32 @@ async def _run_claude_cli(
     return envelope
 
 
+async def _run_cli(cmd: list[str], user_prompt: str) -> dict:
+    """Run a text/structured claude -p call, via the worker pool if enabled.
+
+    Applies the same rate-limit and error checks as _run_claude_cli so the
+    retry loops in invoke_via_cli / invoke_structured_via_cli behave
+    identically on either path.
+    """
+    from .cli_pool import CLIWorkerError, get_cli_pool, is_cli_pool_enabled, stream_json_cmd
+
+    if not is_cli_pool_enabled():
+        return await _run_claude_cli(cmd, user_prompt)
+
+    try:
+        envelope = await get_cli_pool().run(stream_json_cmd(cmd), user_prompt)
+    except CLIWorkerError as e:
+        _check_rate_limit(e.stderr)
+        raise
+
+    result_field = envelope.get("result")
+    if isinstance(result_field, str):
+        _check_rate_limit(result_field)
+    if envelope.get("is_error"):
+        raise RuntimeError(f"claude worker returned an error: {str(result_field)[:500]}")
+    return envelope
+
+
 def _build_base_cmd(
     model: str,
     system: str,
@@ -342,7 +372,7 @@ async def invoke_via_cli(
     while attempt < _CLI_MAX_RETRIES:
         try:
             logger.debug("CLI backend: invoking %s (text, effort=%s, attempt=%d)", model, effort, attempt + 1)
-            envelope = await _run_claude_cli(cmd, user_prompt)
+            envelope = await _run_cli(cmd, user_prompt)
             text = envelope["result"]
             return _envelope_to_message(envelope, text, model)
         except _RateLimitError as e:
@@ -395,7 +425,7 @@ async def invoke_structured_via_cli(
                 "CLI backend: invoking %s (structured=%s, effort=%s, attempt=%d)",
                 model, schema.__name__, effort, attempt + 1,
             )
-            envelope = await _run_claude_cli(cmd, user_prompt)
+            envelope = await _run_cli(cmd, user_prompt)
             raw = envelope["structured_output"]
             return schema.model_validate(raw)
         except _RateLimitError as e:
@@ -0,0 +1,373 @@
+"""Pool of long-lived `claude -p` workers for the CLI backend.
+
+Each worker is a `claude -p --input-format stream-json --output-format
+stream-json` process. Requests are written to its stdin as JSON user
+messages and the matching `result` event is read back from stdout, so
+process start-up and auth happen before a request arrives instead of on
+its critical path.
+
+Workers are keyed by their full command (model, system prompt, schema,
+effort), since those are fixed at spawn. After a request the pool spawns
+a spare for the same command in the background, so repeated calls with
+one configuration (the common case in per-paper loops) find a warm
+worker waiting.
+
+A stream-json session keeps its conversation history, so by default a
+worker serves one request and is then recycled. Raising
+THALA_CLI_WORKER_MAX_REQUESTS lets a worker serve several requests that
+share context; it is recycled after that many, on crash, on timeout, or
+when idle longer than THALA_CLI_WORKER_IDLE_TTL.
+
+Environment:
+    THALA_CLI_POOL: "0" disables the pool (one subprocess per call)
+    THALA_CLI_MAX_CONCURRENCY: Max requests in flight (default 4)
+    THALA_CLI_WORKER_MAX_REQUESTS: Requests per worker (default 1)
+    THALA_CLI_WORKER_IDLE_TTL: Seconds an idle worker is kept (default 300)
+    THALA_CLI_MAX_IDLE_WORKERS: Cap on idle workers across commands (default 4)
+"""
+
+import asyncio
+import json
+import logging
+import os
+import time
+from collections import deque
+from typing import Optional
+
+from .cli_backend import _CLI_TIMEOUT_SECONDS, _kill_process_tree
+
+logger = logging.getLogger(__name__)
+
+# StreamReader line limit; a single result event carries the whole response
+_STDOUT_LINE_LIMIT = 64 * 1024 * 1024
+
+# Bytes of stderr kept per worker for error messages
+_STDERR_TAIL_BYTES = 4096
+
+
+def is_cli_pool_enabled() -> bool:
+    """Check whether CLI calls go through the worker pool."""
+    return os.getenv("THALA_CLI_POOL", "1") != "0"
+
+
+def stream_json_cmd(cmd: list[str]) -> list[str]:
+    """Convert a one-shot `claude -p --output-format json` command to stream-json.
+
+    --verbose is required by claude -p for stream-json output.
+    """
+    out: list[str] = []
+    i = 0
+    while i < len(cmd):
+        if cmd[i] == "--output-format" and i + 1 < len(cmd):
+            out.extend(["--input-format", "stream-json", "--output-format", "stream-json", "--verbose"])
+            i += 2
+            continue
+        out.append(cmd[i])
+        i += 1
+    return out
+
+
+class CLIWorkerError(RuntimeError):
+    """A CLI worker exited or misbehaved before returning a result.
+
+    Attributes:
+        stderr: Tail of the worker's stderr, for rate-limit detection
+    """
+
+    def __init__(self, message: str, stderr: str = ""):
+        self.stderr = stderr
+        super().__init__(message)
+
+
+class CLIWorker:
+    """One long-lived `claude -p` stream-json process."""
+
+    def __init__(self, cmd: list[str], max_requests: int = 1):
+        self.cmd = cmd
+        self.key = tuple(cmd)
+        self.max_requests = max_requests
+        self.requests = 0
+        self.proc: Optional[asyncio.subprocess.Process] = None
+        self.idle_since = time.monotonic()
+        self._stderr: deque[bytes] = deque()
+        self._stderr_size = 0
+        self._stderr_task: Optional[asyncio.Task] = None
+        self._closed = False
+
+    async def start(self) -> None:
+        # Strip ANTHROPIC_API_KEY so claude -p uses Max subscription billing
+        env = {k: v for k, v in os.environ.items() if k != "ANTHROPIC_API_KEY"}
+        self.proc = await asyncio.create_subprocess_exec(
+            *self.cmd,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            env=env,
+            start_new_session=True,
+            limit=_STDOUT_LINE_LIMIT,
+        )
+        # Drain stderr continuously so a chatty worker cannot block on a full pipe
+        self._stderr_task = asyncio.create_task(self._drain_stderr())
+
+    async def _drain_stderr(self) -> None:
+        while True:
+            chunk = await self.proc.stderr.read(4096)
+            if not chunk:
+                return
+            self._stderr.append(chunk)
+            self._stderr_size += len(chunk)
+            while self._stderr_size > _STDERR_TAIL_BYTES and len(self._stderr) > 1:
+                self._stderr_size -= len(self._stderr.popleft())
+
+    @property
+    def stderr_tail(self) -> str:
+        return b"".join(self._stderr).decode(errors="replace")[-_STDERR_TAIL_BYTES:]
+
+    @property
+    def exhausted(self) -> bool:
+        return self.requests >= self.max_requests
+
+    def is_healthy(self, idle_ttl: float) -> bool:
+        """Process is running, has requests left, and has not idled too long."""
+        if self._closed or self.proc is None or self.exhausted:
+            return False
+        if time.monotonic() - self.idle_since > idle_ttl:
+            return False
+        # asyncio's child watcher reaps the process and sets returncode;
+        # waiting on the pid here would race it
+        return self.proc.returncode is None
+
+    async def request(self, prompt: str, timeout: float) -> dict:
+        """Send one user message and return its `result` event.
+
+        Raises:
+            CLIWorkerError: If the worker exits or its output is malformed
+            TimeoutError: If no result arrives within timeout
+        """
+        message = {"type": "user", "message": {"role": "user", "content": prompt}}
+        self.requests += 1
+        try:
+            self.proc.stdin.write((json.dumps(message) + "\n").encode())
+            await self.proc.stdin.drain()
+            if self.exhausted:
+                # Last request: let the process exit once it has answered
+                self.proc.stdin.close()
+        except (BrokenPipeError, ConnectionResetError) as e:
+            raise CLIWorkerError(f"claude worker stdin closed: {e}", self.stderr_tail) from e
+
+        try:
+            return await asyncio.wait_for(self._read_result(), timeout=timeout)
+        except asyncio.TimeoutError:
+            raise TimeoutError(f"claude worker timed out after {timeout:.0f}s (cmd: {' '.join(self.cmd[:6])}...)")
+
+    async def _read_result(self) -> dict:
+        while True:
+            line = await self.proc.stdout.readline()
+            if not line:
+                # Give the stderr drain a moment to collect the exit message
+                if self._stderr_task:
+                    await asyncio.wait([self._stderr_task], timeout=1)
+                raise CLIWorkerError(
+                    f"claude worker exited before result: {self.stderr_tail[-500:]}",
+                    self.stderr_tail,
+                )
+            try:
+                event = json.loads(line)
+            except json.JSONDecodeError:
+                logger.debug(f"Skipping non-JSON worker output: {line[:200]!r}")
+                continue
+            if isinstance(event, dict) and event.get("type") == "result":
+                return event
+
+    async def close(self) -> None:
+        """Kill the process tree (if still running) and reap it."""
+        if self._closed:
+            return
+        self._closed = True
+        if self.proc is not None:
+            await asyncio.to_thread(_kill_process_tree, self.proc)
+        if self._stderr_task:
+            self._stderr_task.cancel()
+
+
+class CLIWorkerPool:
+    """Bounded pool of pre-spawned `claude -p` workers.
+
+    Args:
+        max_concurrency: Max requests in flight at once
+        max_requests_per_worker: Requests served before a worker is recycled
+        idle_ttl: Seconds an idle worker is kept before being recycled
+        max_idle: Cap on idle (warm) workers across all commands
+        request_timeout: Per-request timeout in seconds
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 4,
+        max_requests_per_worker: int = 1,
+        idle_ttl: float = 300.0,
+        max_idle: int = 4,
+        request_timeout: float = _CLI_TIMEOUT_SECONDS,
+    ):
+        self.max_concurrency = max_concurrency
+        self.max_requests_per_worker = max(1, max_requests_per_worker)
+        self.idle_ttl = idle_ttl
+        self.max_idle = max_idle
+        self.request_timeout = request_timeout
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._idle: list[CLIWorker] = []
+        # One in-flight spare spawn per command key
+        self._spawning: dict[tuple[str, ...], asyncio.Task] = {}
+        self._active = 0
+        self._closed = False
+        self.stats = {
+            "spawned": 0,
+            "warm_hits": 0,
+            "recycled": 0,
+            "crashed": 0,
+            "timeouts": 0,
+            "unhealthy": 0,
+            "peak_active": 0,
+        }
+
+    async def run(self, cmd: list[str], prompt: str, timeout: Optional[float] = None) -> dict:
+        """Run one request on a worker for cmd and return its result event.
+
+        Args:
+            cmd: Full stream-json claude command (see stream_json_cmd)
+            prompt: User prompt
+            timeout: Per-request timeout (default: pool request_timeout)
+
+        Raises:
+            CLIWorkerError: If the worker crashed
+            TimeoutError: If the request timed out (the worker is killed)
+        """
+        if self._closed:
+            raise RuntimeError("CLI worker pool is closed")
+
+        async with self._semaphore:
+            self._active += 1
+            self.stats["peak_active"] = max(self.stats["peak_active"], self._active)
+            try:
+                worker = await self._checkout(cmd)
+                try:
+                    result = await worker.request(prompt, timeout or self.request_timeout)
+                except TimeoutError:
+                    self.stats["timeouts"] += 1
+                    await worker.close()
+                    raise
+                except CLIWorkerError:
+                    self.stats["crashed"] += 1
+                    await worker.close()
+                    raise
+                except BaseException:
+                    # Cancelled mid-request: the session state is unknown
+                    await worker.close()
+                    raise
+                await self._checkin(worker)
+                return result
+            finally:
+                self._active -= 1
+                self._prewarm(cmd)
+
+    async def _checkout(self, cmd: list[str]) -> CLIWorker:
+        await self._sweep()
+        key = tuple(cmd)
+        for worker in list(self._idle):
+            if worker.key != key:
+                continue
+            self._idle.remove(worker)
+            if worker.is_healthy(self.idle_ttl):
+                self.stats["warm_hits"] += 1
+                return worker
+            self.stats["unhealthy"] += 1
+            await worker.close()
+        return await self._spawn(cmd)
+
+    async def _sweep(self) -> None:
+        """Recycle idle workers that have exited or outlived idle_ttl."""
+        stale = [w for w in self._idle if not w.is_healthy(self.idle_ttl)]
+        for worker in stale:
+            self._idle.remove(worker)
+            self.stats["unhealthy"] += 1
+        await asyncio.gather(*(w.close() for w in stale), return_exceptions=True)
+
+    async def _spawn(self, cmd: list[str]) -> CLIWorker:
+        worker = CLIWorker(cmd, max_requests=self.max_requests_per_worker)
+        await worker.start()
+        self.stats["spawned"] += 1
+        return worker
+
+    async def _checkin(self, worker: CLIWorker) -> None:
+        if worker.exhausted or self._closed:
+            self.stats["recycled"] += 1
+            await worker.close()
+            return
+        worker.idle_since = time.monotonic()
+        self._add_idle(worker)
+
+    def _add_idle(self, worker: CLIWorker) -> None:
+        self._idle.append(worker)
+        while len(self._idle) > self.max_idle:
+            oldest = self._idle.pop(0)
+            asyncio.create_task(oldest.close())
+
+    def _prewarm(self, cmd: list[str]) -> None:
+        """Spawn a spare worker for cmd in the background if none is idle or spawning."""
+        if self._closed or self.max_idle <= 0:
+            return
+        key = tuple(cmd)
+        if key in self._spawning or any(w.key == key for w in self._idle):
+            return
+        task = asyncio.create_task(self._spawn_spare(cmd))
+        self._spawning[key] = task
+        task.add_done_callback(lambda _: self._spawning.pop(key, None))
+
+    async def _spawn_spare(self, cmd: list[str]) -> None:
+        try:
+            worker = await self._spawn(cmd)
+        except Exception as e:
+            logger.warning(f"Failed to pre-spawn claude worker: {e}")
+            return
+        if self._closed or any(w.key == worker.key for w in self._idle):
+            await worker.close()
+            return
+        self._add_idle(worker)
+
+    async def aclose(self) -> None:
+        """Stop pre-spawning and kill all idle workers."""
+        self._closed = True
+        spawning = list(self._spawning.values())
+        for task in spawning:
+            task.cancel()
+        await asyncio.gather(*spawning, return_exceptions=True)
+        idle, self._idle = self._idle, []
+        await asyncio.gather(*(w.close() for w in idle), return_exceptions=True)
+
+
+_pool: Optional[CLIWorkerPool] = None
+_pool_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def get_cli_pool() -> CLIWorkerPool:
+    """Get the CLI worker pool for the running event loop.
+
+    Subprocess transports belong to one event loop, so a new pool is
+    created when called from a different loop (e.g. successive
+    asyncio.run() calls) and the old pool's idle workers are killed.
+    """
+    global _pool, _pool_loop
+    loop = asyncio.get_running_loop()
+    if _pool is None or _pool_loop is not loop:
+        if _pool is not None:
+            for worker in _pool._idle:
+                if worker.proc is not None:
+                    _kill_process_tree(worker.proc)
+        _pool = CLIWorkerPool(
+            max_concurrency=int(os.getenv("THALA_CLI_MAX_CONCURRENCY", "4")),
+            max_requests_per_worker=int(os.getenv("THALA_CLI_WORKER_MAX_REQUESTS", "1")),
+            idle_ttl=float(os.getenv("THALA_CLI_WORKER_IDLE_TTL", "300")),
+            max_idle=int(os.getenv("THALA_CLI_MAX_IDLE_WORKERS", "4")),
+        )
+        _pool_loop = loop
+    return _pool
@@ -851,11 +851,12 @@ class InvokeBatch:
             results = await batch.results()
     """
 
-    def __init__(self, *, use_broker: bool = True) -> None:
+    def __init__(self, *, use_broker: bool = True, return_exceptions: bool = False) -> None:
         self._requests: list[tuple[ModelTier, str, str, InvokeConfig]] = []
         self._futures: list[asyncio.Future] = []
-        self._results: list[AIMessage] | None = None
+        self._results: list[AIMessage | BaseException] | None = None
         self._use_broker = use_broker
+        self._return_exceptions = return_exceptions
 
     def add(
         self,
@@ -876,19 +877,19 @@ class InvokeBatch:
         self._requests.append((tier, system, user, config or InvokeConfig()))
 
     async def _submit_to_broker(self) -> None:
-        """Submit all accumulated requests to the broker."""
-        from core.llm_broker import get_broker, BatchPolicy
+        """Submit all accumulated requests to the broker in one enqueue."""
+        from core.llm_broker import get_broker, BatchPolicy, RequestSpec
 
-        broker = get_broker()
-
-        for tier, system, user, config in self._requests:
-            # Force batching for batch context
-            policy = config.batch_policy or BatchPolicy.PREFER_BALANCE
+        if not self._requests:
+            return
 
-            future = await broker.request(
+        broker = get_broker()
+        specs = [
+            RequestSpec(
                 prompt=user,
                 model=tier,
-                policy=policy,
+                # Force batching for batch context
+                policy=config.batch_policy or BatchPolicy.PREFER_BALANCE,
                 max_tokens=config.max_tokens,
                 system=system,
                 effort=config.effort,
@@ -896,7 +897,9 @@ class InvokeBatch:
                 tool_choice=config.tool_choice,
                 metadata=config.metadata,
             )
-            self._futures.append(future)
+            for tier, system, user, config in self._requests
+        ]
+        self._futures.extend(await broker.request_many(specs))
 
     async def _submit_via_invoke(self) -> None:
         """Fallback: execute requests concurrently via invoke()."""
@@ -920,15 +923,17 @@ class InvokeBatch:
                 )
 
         results = await asyncio.gather(
-            *(_run_one(tier, system, user, config) for tier, system, user, config in self._requests)
+            *(_run_one(tier, system, user, config) for tier, system, user, config in self._requests),
+            return_exceptions=self._return_exceptions,
         )
         self._results = list(results)
 
-    async def results(self) -> list[AIMessage]:
+    async def results(self) -> list[AIMessage | BaseException]:
         """Get batch results.
 
         Returns:
-            List of AIMessage responses in order of add() calls
+            List of AIMessage responses in order of add() calls. With
+            return_exceptions, a failed request's entry is its exception.
 
         Raises:
             RuntimeError: If called before context manager exits or if any request failed
@@ -943,18 +948,26 @@ class InvokeBatch:
         for future in self._futures:
             response = await future
             if not response.success:
-                raise RuntimeError(f"Batch request failed: {response.error}")
+                error = RuntimeError(f"Batch request failed: {response.error}")
+                if not self._return_exceptions:
+                    raise error
+                self._results.append(error)
+                continue
             self._results.append(_broker_response_to_message(response))
 
 
 @asynccontextmanager
-async def invoke_batch() -> AsyncIterator[InvokeBatch]:
+async def invoke_batch(return_exceptions: bool = False) -> AsyncIterator[InvokeBatch]:
     """Context manager for dynamic batch building.
 
     When the broker is enabled and CLI backend is not active, wraps
     broker.batch_group() for cost-optimized batching. Otherwise falls
     back to concurrent invoke() calls that respect the active backend.
 
+    By default one failed request fails the whole batch. With
+    return_exceptions=True (as in asyncio.gather), failed requests appear
+    as exceptions in results() and the other responses are kept.
+
     Example:
         async with invoke_batch() as batch:
             for paper in papers:
@@ -976,7 +989,7 @@ async def invoke_batch() -> AsyncIterator[InvokeBatch]:
     from core.llm_broker import is_broker_enabled
 
     use_broker = not is_cli_backend_enabled() and is_broker_enabled()
-    batch = InvokeBatch(use_broker=use_broker)
+    batch = InvokeBatch(use_broker=use_broker, return_exceptions=return_exceptions)
 
     if use_broker:
         from core.llm_broker import get_broker
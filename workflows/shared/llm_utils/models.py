@@ -62,6 +62,8 @@ def get_llm(
     from langchain_anthropic import ChatAnthropic
     from langchain_deepseek import ChatDeepSeek
 
+    from .usage import UsageLedgerCallback
+
     # DeepSeek models use native ChatDeepSeek integration
     if is_deepseek_tier(tier):
         # ChatDeepSeek auto-reads DEEPSEEK_API_KEY and sets LangSmith metadata
@@ -69,6 +71,7 @@ def get_llm(
             "model": tier.value,
             "max_tokens": max_tokens,
             "max_retries": 3,
+            "callbacks": [UsageLedgerCallback(tier.value)],
         }
 
         if tier == ModelTier.DEEPSEEK_R1:
@@ -97,6 +100,8 @@ def get_llm(
         "api_key": api_key,
         "max_tokens": max_tokens,
         "max_retries": 3,  # Handles 429, 500, 502, 503, 529 with exponential backoff
+        # Records token usage in the local usage ledger (budget tracking)
+        "callbacks": [UsageLedgerCallback(tier.value)],
         # LangSmith metadata for automatic cost tracking
         "metadata": {
             "ls_provider": "anthropic",
@@ -0,0 +1,49 @@
+"""Usage ledger recording for direct (non-broker) LLM calls.
+
+get_llm() attaches UsageLedgerCallback to every model it builds, so each
+direct invoke() call (text, structured or tool-agent) is recorded in the
+local usage ledger. Broker calls are recorded by the broker itself.
+"""
+
+from typing import Any, Optional
+
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.outputs import LLMResult
+
+from core.task_queue.budget.ledger import record_llm_usage
+
+
+def usage_from_metadata(usage_metadata: Optional[dict[str, Any]]) -> Optional[dict[str, int]]:
+    """Convert LangChain usage_metadata to an Anthropic-style usage dict.
+
+    LangChain reports input_tokens including prompt-cache reads and writes;
+    the ledger counts uncached input separately.
+    """
+    if not usage_metadata:
+        return None
+    details = usage_metadata.get("input_token_details") or {}
+    cache_read = details.get("cache_read") or 0
+    cache_creation = details.get("cache_creation") or 0
+    return {
+        "input_tokens": max((usage_metadata.get("input_tokens") or 0) - cache_read - cache_creation, 0),
+        "output_tokens": usage_metadata.get("output_tokens") or 0,
+        "cache_read_input_tokens": cache_read,
+        "cache_creation_input_tokens": cache_creation,
+    }
+
+
+class UsageLedgerCallback(BaseCallbackHandler):
+    """Record token usage of each LLM response in the usage ledger."""
+
+    def __init__(self, model: str):
+        self.model = model
+
+    def on_llm_end(self, response: LLMResult, **kwargs: Any) -> None:
+        for generations in response.generations:
+            for generation in generations:
+                message = getattr(generation, "message", None)
+                usage = usage_from_metadata(getattr(message, "usage_metadata", None))
+                if usage is None:
+                    continue
+                model = (message.response_metadata or {}).get("model_name") or self.model
+                record_llm_usage(model, usage, source="invoke")
@@ -3,15 +3,26 @@
 Provides both quick character-based estimates (with safety margins) and
 accurate tiktoken-based counting for critical path decisions.
 
+Accurate counts go through a shared TokenCounter, which caches counts by
+content hash, encodes batches of texts on tiktoken's thread pool, offers
+async variants that keep encoding off the event loop, and counts
+concatenations of already-counted segments by re-encoding only the text
+around each join.
+
 This module consolidates token management that was previously duplicated
 across loop5_factcheck.py and core/embedding.py.
 """
 
+import asyncio
+import hashlib
 import logging
+import os
+import threading
 from functools import lru_cache
-from typing import Optional
+from typing import Iterable, Optional, Sequence
 
 import tiktoken
+from cachetools import LRUCache
 
 logger = logging.getLogger(__name__)
 
@@ -47,6 +58,11 @@ EXTENDED_RESPONSE_BUFFER = 16384
 # Maximum output tokens (Opus 4.5 limit)
 OPUS_MAX_OUTPUT_TOKENS = 64_000
 
+# Token counting service
+TOKEN_CACHE_SIZE = int(os.getenv("THALA_TOKEN_CACHE_SIZE", "4096"))  # Cached counts (keyed by content hash)
+# encode_batch worker threads; capped at the CPU count since extra threads only add overhead
+TOKEN_COUNT_THREADS = int(os.getenv("THALA_TOKEN_COUNT_THREADS", str(min(4, os.cpu_count() or 1))))
+
 
 # =============================================================================
 # Token Counting Functions
@@ -62,11 +78,187 @@ def _get_encoding():
     return tiktoken.get_encoding("cl100k_base")
 
 
+def _is_piece_boundary(text: str, pos: int) -> bool:
+    """Whether cl100k pre-tokenization always splits text at pos.
+
+    No cl100k regex piece continues past a newline into a non-whitespace
+    character, so such a position splits the text the same way whatever
+    comes before or after it. Token counts are additive across it.
+    """
+    return 0 < pos < len(text) and text[pos - 1] == "\n" and not text[pos].isspace()
+
+
+def _first_boundary(text: str, start: int = 0) -> int:
+    """First guaranteed piece boundary at or after start (len(text) if none)."""
+    pos = text.find("\n", max(start - 1, 0))
+    while pos != -1:
+        if _is_piece_boundary(text, pos + 1) and pos + 1 >= start:
+            return pos + 1
+        pos = text.find("\n", pos + 1)
+    return len(text)
+
+
+def _last_boundary(text: str) -> int:
+    """Last guaranteed piece boundary in text (0 if none)."""
+    pos = text.rfind("\n")
+    while pos != -1:
+        if _is_piece_boundary(text, pos + 1):
+            return pos + 1
+        pos = text.rfind("\n", 0, pos)
+    return 0
+
+
+class TokenCounter:
+    """Cached, batched tiktoken counting.
+
+    Counts are cached in an LRU keyed by a BLAKE2 hash of the text, so
+    repeated checks of the same document (budget checks, model selection,
+    retries) encode it once without the cache holding the document itself.
+    The sync methods are thread-safe; the async variants run in a worker
+    thread so large documents don't block the event loop.
+    """
+
+    def __init__(
+        self,
+        encoding: Optional[tiktoken.Encoding] = None,
+        cache_size: int = TOKEN_CACHE_SIZE,
+        num_threads: int = TOKEN_COUNT_THREADS,
+    ):
+        self._encoding = encoding or _get_encoding()
+        self._cache: LRUCache = LRUCache(maxsize=cache_size)
+        self._lock = threading.Lock()
+        self.num_threads = num_threads
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _key(text: str) -> bytes:
+        return hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+
+    def _lookup(self, key: bytes) -> Optional[int]:
+        with self._lock:
+            count = self._cache.get(key)
+            if count is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return count
+
+    def _store(self, key: bytes, count: int) -> None:
+        with self._lock:
+            self._cache[key] = count
+
+    def count(self, text: str) -> int:
+        """Count tokens in text, using the cache."""
+        if not text:
+            return 0
+        key = self._key(text)
+        count = self._lookup(key)
+        if count is None:
+            # disallowed_special=() allows arbitrary document content (which may
+            # contain literal special-token strings like <|endofprompt|> from
+            # scraped PDFs) without raising.
+            count = len(self._encoding.encode(text, disallowed_special=()))
+            self._store(key, count)
+        return count
+
+    def count_many(self, texts: Sequence[str]) -> list[int]:
+        """Count tokens for many texts, encoding cache misses in one batch.
+
+        Misses (deduplicated) go through tiktoken's encode_batch, which
+        encodes them in parallel on num_threads threads. With a single
+        thread they are encoded sequentially to skip the pool overhead.
+        """
+        counts: list[Optional[int]] = []
+        missing: dict[bytes, list[int]] = {}
+        missing_texts: list[str] = []
+        for i, text in enumerate(texts):
+            if not text:
+                counts.append(0)
+                continue
+            key = self._key(text)
+            count = self._lookup(key)
+            counts.append(count)
+            if count is None:
+                if key not in missing:
+                    missing[key] = []
+                    missing_texts.append(text)
+                missing[key].append(i)
+
+        if missing_texts:
+            if len(missing_texts) == 1 or self.num_threads <= 1:
+                encoded = [self._encoding.encode(t, disallowed_special=()) for t in missing_texts]
+            else:
+                encoded = self._encoding.encode_batch(
+                    missing_texts, num_threads=self.num_threads, disallowed_special=()
+                )
+            for (key, indices), tokens in zip(missing.items(), encoded):
+                self._store(key, len(tokens))
+                for i in indices:
+                    counts[i] = len(tokens)
+
+        return counts
+
+    def count_concat(self, segments: Iterable[str], separator: str = "") -> int:
+        """Count tokens in separator.join(segments) without re-encoding it.
+
+        Each segment's count comes from the cache. At each join only the
+        text between the nearest guaranteed pre-token boundaries on either
+        side is re-encoded, so the result is exact, not an estimate.
+        """
+        parts: list[str] = []
+        for i, segment in enumerate(segments):
+            if i and separator:
+                parts.append(separator)
+            if segment:
+                parts.append(segment)
+
+        total = 0
+        tail = ""  # Text after the last guaranteed boundary so far
+        tail_tokens = 0
+        for part in parts:
+            combined = tail + part
+            head_end = _first_boundary(combined, len(tail))
+            head = combined[len(tail) : head_end]
+            if tail or head:
+                total += self.count(tail + head) - tail_tokens - self.count(head)
+            total += self.count(part)
+
+            tail = combined[_last_boundary(combined) :]
+            tail_tokens = self.count(tail)
+        return total
+
+    async def acount(self, text: str) -> int:
+        """Count tokens in a worker thread."""
+        return await asyncio.to_thread(self.count, text)
+
+    async def acount_many(self, texts: Sequence[str]) -> list[int]:
+        """Count tokens for many texts in a worker thread."""
+        return await asyncio.to_thread(self.count_many, list(texts))
+
+    def cache_info(self) -> dict:
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "size": len(self._cache), "maxsize": self._cache.maxsize}
+
+    def clear_cache(self) -> None:
+        with self._lock:
+            self._cache.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+@lru_cache(maxsize=1)
+def get_token_counter() -> TokenCounter:
+    """Get the shared token counter."""
+    return TokenCounter()
+
+
 def count_tokens_accurate(text: str) -> int:
     """Count tokens accurately using tiktoken.
 
     Use for critical path decisions (pre-flight checks, model selection).
-    ~10x slower than estimate_tokens_fast but precise.
+    ~10x slower than estimate_tokens_fast on first sight of a text; repeat
+    counts of the same text are served from the shared cache.
 
     Args:
         text: Text to count tokens for
@@ -74,13 +266,17 @@ def count_tokens_accurate(text: str) -> int:
     Returns:
         Exact token count using cl100k_base encoding
     """
-    if not text:
-        return 0
-    encoding = _get_encoding()
-    # disallowed_special=() allows arbitrary document content (which may
-    # contain literal special-token strings like <|endofprompt|> from
-    # scraped PDFs) without raising.
-    return len(encoding.encode(text, disallowed_special=()))
+    return get_token_counter().count(text)
+
+
+async def acount_tokens_accurate(text: str) -> int:
+    """Async count_tokens_accurate that encodes off the event loop."""
+    return await get_token_counter().acount(text)
+
+
+async def acount_tokens_many(texts: Sequence[str]) -> list[int]:
+    """Count tokens for many texts in one batch, off the event loop."""
+    return await get_token_counter().acount_many(texts)
 
 
 def estimate_tokens_fast(text: str, with_safety_margin: bool = True) -> int:
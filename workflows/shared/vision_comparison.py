@@ -4,12 +4,19 @@ Uses MLLM pair comparison (80.6% accuracy per MLLM-as-a-Judge research,
 vs 55.7% for scoring-based evaluation) to select the best image from
 a set of candidates.
 
+Candidates are compared in a single-elimination bracket whose rounds run
+their comparisons concurrently, so N candidates take ceil(log2(N)) rounds
+of latency. Each image is downscaled to VISION_MAX_DIMENSION and re-encoded
+once before comparison, keeping payloads (and image tokens) bounded.
+
 Call sites:
 - image_utils.py: Imagen multi-candidate selection (A3)
 - diagram_utils/mermaid.py: Mermaid candidate selection (B5, future)
 """
 
+import asyncio
 import base64
+import io
 import logging
 
 from langsmith import traceable
@@ -21,6 +28,11 @@ logger = logging.getLogger(__name__)
 
 MAX_IMAGE_SIZE = 10 * 1024 * 1024  # 10 MB
 
+# Longest edge sent to the vision model; larger images cost more tokens
+# without improving the comparison
+VISION_MAX_DIMENSION = 1568
+JPEG_QUALITY = 85
+
 
 def _detect_media_type(image_bytes: bytes) -> str:
     """Detect media type from image magic bytes.
@@ -38,6 +50,49 @@ def _detect_media_type(image_bytes: bytes) -> str:
     return "image/jpeg"
 
 
+def _normalize_image(image_bytes: bytes) -> bytes:
+    """Downscale and re-encode an image for vision comparison.
+
+    Images are shrunk so the longest edge is at most VISION_MAX_DIMENSION,
+    then encoded as PNG if they have transparency and JPEG otherwise. The
+    original bytes are kept when they are already within bounds and
+    smaller, or when the image cannot be decoded.
+
+    Args:
+        image_bytes: Raw PNG or JPEG bytes
+
+    Returns:
+        Image bytes ready for base64 encoding
+    """
+    try:
+        from PIL import Image
+    except ImportError:
+        logger.warning("Pillow not installed, sending images unscaled. Run: pip install pillow")
+        return image_bytes
+
+    try:
+        with Image.open(io.BytesIO(image_bytes)) as img:
+            img.load()
+            resized = max(img.size) > VISION_MAX_DIMENSION
+            if resized:
+                img.thumbnail((VISION_MAX_DIMENSION, VISION_MAX_DIMENSION), Image.Resampling.LANCZOS)
+
+            has_alpha = img.mode in ("RGBA", "LA") or (img.mode == "P" and "transparency" in img.info)
+            out = io.BytesIO()
+            if has_alpha:
+                img.convert("RGBA").save(out, format="PNG", optimize=True)
+            else:
+                img.convert("RGB").save(out, format="JPEG", quality=JPEG_QUALITY, optimize=True)
+    except Exception as e:
+        logger.debug(f"Could not normalize image for vision comparison: {e}")
+        return image_bytes
+
+    normalized = out.getvalue()
+    if not resized and len(image_bytes) <= len(normalized):
+        return image_bytes
+    return normalized
+
+
 PAIR_COMPARISON_SYSTEM = """You are comparing two images to select the better one.
 
 Evaluate based on the selection criteria provided. Consider:
@@ -65,8 +120,10 @@ async def vision_pair_select(
 ) -> int:
     """Select the best candidate image via vision-based pair comparison.
 
-    Uses tournament-style pair comparison to find the best image from
-    a list of candidates. More accurate than scoring-based evaluation.
+    Uses a single-elimination bracket of pair comparisons to find the best
+    image from a list of candidates. More accurate than scoring-based
+    evaluation. Each round's comparisons run concurrently; a comparison
+    that fails advances Image A.
 
     Args:
         candidates: List of PNG image bytes to compare
@@ -82,26 +139,39 @@ async def vision_pair_select(
         return 0
 
     try:
-        # Tournament: compare sequentially, winner advances.
-        # Known limitation: positional bias toward Image A.
-        # Image A is always the defending champion, and MLLMs show bias toward
-        # the first image presented. On ambiguous responses, we default to "A"
-        # (see _compare_pair fallback). Future options: random position
-        # assignment or swap-and-confirm strategy.
-        current_best_idx = 0
-
-        for challenger_idx in range(1, len(candidates)):
-            winner = await _compare_pair(
-                candidates[current_best_idx],
-                candidates[challenger_idx],
-                selection_criteria,
-                model_tier,
+        images = await asyncio.gather(*(asyncio.to_thread(_normalize_image, c) for c in candidates))
+
+        # Bracket: pair up survivors each round and compare pairs concurrently;
+        # an odd survivor gets a bye. The lower index is always Image A.
+        # Known limitation: positional bias toward Image A. MLLMs show bias
+        # toward the first image presented, and on ambiguous responses we
+        # default to "A" (see _compare_pair fallback). Future options: random
+        # position assignment or swap-and-confirm strategy.
+        survivors = list(range(len(candidates)))
+        rounds = 0
+
+        while len(survivors) > 1:
+            pairs = [(survivors[i], survivors[i + 1]) for i in range(0, len(survivors) - 1, 2)]
+            results = await asyncio.gather(
+                *(_compare_pair(images[a], images[b], selection_criteria, model_tier) for a, b in pairs),
+                return_exceptions=True,
             )
-            if winner == "B":
-                current_best_idx = challenger_idx
 
-        logger.info(f"Vision pair selection chose candidate {current_best_idx + 1} of {len(candidates)}")
-        return current_best_idx
+            winners = []
+            for (a, b), result in zip(pairs, results):
+                if isinstance(result, BaseException):
+                    logger.warning(f"Vision comparison {a + 1} vs {b + 1} failed, keeping {a + 1}: {result}")
+                    result = "A"
+                winners.append(b if result == "B" else a)
+            if len(survivors) % 2:
+                winners.append(survivors[-1])
+
+            survivors = winners
+            rounds += 1
+
+        best_idx = survivors[0]
+        logger.info(f"Vision pair selection chose candidate {best_idx + 1} of {len(candidates)} in {rounds} rounds")
+        return best_idx
 
     except Exception as e:
         logger.warning(f"Vision pair selection failed, using first candidate: {e}")
@@ -114,7 +184,11 @@ async def _compare_pair(
     criteria: str,
     model_tier: ModelTier,
 ) -> str:
-    """Compare two images, return 'A' or 'B'."""
+    """Compare two images, return 'A' or 'B'.
+
+    Images should already be normalized (see _normalize_image); anything
+    still over MAX_IMAGE_SIZE is rejected.
+    """
     for label, img_bytes in [("A", image_a), ("B", image_b)]:
         if len(img_bytes) > MAX_IMAGE_SIZE:
             raise ValueError(
@@ -7,6 +7,16 @@ enabling downstream workflows to retrieve rich state without bloated return type
 This is separate from checkpointing (which is for resumption after interruption).
 The state store persists completed workflow state for sharing between workflows.
 
+States are written by a pluggable serializer (THALA_STATE_FORMAT):
+- "msgpack" (default): top-level keys streamed as msgpack records through a
+  zstd compressor (.msgpack.zst), so saving never builds the whole state as
+  one string. Requires ormsgpack and zstandard.
+- "json": the original indented JSON, gzipped above 1MB (.json/.json.gz).
+
+Loading accepts every registered format, so existing .json/.json.gz states
+still load. Each save also appends to a per-workflow index.jsonl sidecar so
+listing runs needs no decompression.
+
 Usage:
     # In workflow API (at end of workflow)
     from workflows.shared.workflow_state_store import save_workflow_state
@@ -29,9 +39,12 @@ import gzip
 import json
 import logging
 import os
+import struct
+import time
+import uuid
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Optional
+from typing import IO, Any, Iterator, Optional
 from uuid import UUID
 
 from core.config import is_dev_mode
@@ -44,6 +57,14 @@ STATE_STORE_DIR = Path.home() / ".thala" / "workflow_states"
 # Compress states larger than 1MB
 COMPRESSION_THRESHOLD = 1_000_000
 
+# Serializer used for new saves (see SERIALIZERS)
+STATE_FORMAT = os.getenv("THALA_STATE_FORMAT", "msgpack")
+
+ZSTD_LEVEL = 3
+
+# Sidecar with one JSON line per save: run_id, file, format, sizes, keys
+INDEX_FILENAME = "index.jsonl"
+
 
 def _serialize_value(obj: Any) -> Any:
     """JSON serializer for datetime, UUID, and other special types."""
@@ -71,6 +92,257 @@ def _deserialize_hook(obj: dict) -> Any:
     return obj
 
 
+def _atomic_write(path: Path, write: Any) -> None:
+    """Write a file via a temp file so readers never see a partial state."""
+    tmp = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+    try:
+        with open(tmp, "wb") as f:
+            write(f)
+        os.replace(tmp, path)
+    finally:
+        tmp.unlink(missing_ok=True)
+
+
+class StateSerializer:
+    """Base class for workflow state file formats.
+
+    Subclasses set ``name`` and ``suffixes`` (checked in order when
+    loading) and implement ``dump`` and ``load``.
+    """
+
+    name: str = ""
+    suffixes: tuple[str, ...] = ()
+
+    def dump(self, state: dict, stem: Path, compress: bool) -> tuple[Path, int]:
+        """Write state next to ``stem`` (path without suffix).
+
+        Returns:
+            (path written, uncompressed serialized size in bytes)
+        """
+        raise NotImplementedError
+
+    def load(self, path: Path) -> dict:
+        raise NotImplementedError
+
+    def available(self) -> bool:
+        """Whether this serializer's dependencies are installed."""
+        return True
+
+
+class JsonStateSerializer(StateSerializer):
+    """Indented JSON, gzipped when larger than COMPRESSION_THRESHOLD."""
+
+    name = "json"
+    suffixes = (".json.gz", ".json")
+
+    def dump(self, state: dict, stem: Path, compress: bool) -> tuple[Path, int]:
+        # Serialize to JSON string first to check size
+        state_json = json.dumps(state, default=_serialize_value, indent=2)
+        data = state_json.encode("utf-8")
+        if compress and len(state_json) > COMPRESSION_THRESHOLD:
+            path = stem.with_name(stem.name + ".json.gz")
+            _atomic_write(path, lambda f: f.write(gzip.compress(data)))
+        else:
+            path = stem.with_name(stem.name + ".json")
+            _atomic_write(path, lambda f: f.write(data))
+        return path, len(data)
+
+    def load(self, path: Path) -> dict:
+        if path.name.endswith(".gz"):
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                return json.load(f, object_hook=_deserialize_hook)
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f, object_hook=_deserialize_hook)
+
+
+# msgpack extension codes for types JSON stores as {"__type__": ...}
+_EXT_DATETIME = 1
+_EXT_UUID = 2
+_EXT_PATH = 3
+
+_MSGPACK_MAGIC = b"THSS\x01"
+_RECORD_HEADER = struct.Struct(">I")
+
+
+def _read_exact(stream: IO[bytes], size: int) -> bytes:
+    chunks = []
+    while size:
+        chunk = stream.read(size)
+        if not chunk:
+            raise EOFError("Truncated workflow state file")
+        chunks.append(chunk)
+        size -= len(chunk)
+    return b"".join(chunks)
+
+
+class MsgpackZstdStateSerializer(StateSerializer):
+    """Streamed msgpack records, zstd-compressed.
+
+    The file is a magic header followed by one length-prefixed msgpack
+    record per top-level state key, so peak memory while saving is the
+    largest single value rather than the whole state.
+    """
+
+    name = "msgpack"
+    suffixes = (".msgpack.zst", ".msgpack")
+
+    def available(self) -> bool:
+        try:
+            import ormsgpack  # noqa: F401
+            import zstandard  # noqa: F401
+        except ImportError:
+            return False
+        return True
+
+    @staticmethod
+    def _default(obj: Any) -> Any:
+        import ormsgpack
+
+        if isinstance(obj, datetime):
+            return ormsgpack.Ext(_EXT_DATETIME, obj.isoformat().encode())
+        if isinstance(obj, UUID):
+            return ormsgpack.Ext(_EXT_UUID, obj.bytes)
+        if isinstance(obj, Path):
+            return ormsgpack.Ext(_EXT_PATH, str(obj).encode())
+        # Same fallback as the JSON serializer
+        return str(obj)
+
+    @staticmethod
+    def _ext_hook(code: int, data: bytes) -> Any:
+        if code == _EXT_DATETIME:
+            return datetime.fromisoformat(data.decode())
+        if code == _EXT_UUID:
+            return UUID(bytes=data)
+        if code == _EXT_PATH:
+            return Path(data.decode())
+        raise ValueError(f"Unknown msgpack extension type {code}")
+
+    def _records(self, state: dict) -> Iterator[bytes]:
+        import ormsgpack
+
+        option = ormsgpack.OPT_NON_STR_KEYS | ormsgpack.OPT_PASSTHROUGH_DATETIME | ormsgpack.OPT_PASSTHROUGH_UUID
+        for key, value in state.items():
+            payload = ormsgpack.packb([key, value], default=self._default, option=option)
+            yield _RECORD_HEADER.pack(len(payload)) + payload
+
+    def dump(self, state: dict, stem: Path, compress: bool) -> tuple[Path, int]:
+        import zstandard
+
+        raw_bytes = 0
+
+        def write(f: IO[bytes]) -> None:
+            nonlocal raw_bytes
+            out = zstandard.ZstdCompressor(level=ZSTD_LEVEL).stream_writer(f, closefd=False) if compress else f
+            out.write(_MSGPACK_MAGIC)
+            for record in self._records(state):
+                out.write(record)
+                raw_bytes += len(record)
+            if compress:
+                out.close()
+
+        path = stem.with_name(stem.name + (".msgpack.zst" if compress else ".msgpack"))
+        _atomic_write(path, write)
+        return path, raw_bytes
+
+    def load(self, path: Path) -> dict:
+        import ormsgpack
+        import zstandard
+
+        state = {}
+        with open(path, "rb") as f:
+            stream = zstandard.ZstdDecompressor().stream_reader(f) if path.suffix == ".zst" else f
+            if _read_exact(stream, len(_MSGPACK_MAGIC)) != _MSGPACK_MAGIC:
+                raise ValueError(f"Not a msgpack workflow state: {path}")
+            while header := stream.read(_RECORD_HEADER.size):
+                if len(header) < _RECORD_HEADER.size:
+                    header += _read_exact(stream, _RECORD_HEADER.size - len(header))
+                (size,) = _RECORD_HEADER.unpack(header)
+                key, value = ormsgpack.unpackb(
+                    _read_exact(stream, size),
+                    ext_hook=self._ext_hook,
+                    option=ormsgpack.OPT_NON_STR_KEYS,
+                )
+                state[key] = value
+        return state
+
+
+SERIALIZERS: dict[str, StateSerializer] = {}
+
+
+def register_serializer(serializer: StateSerializer) -> None:
+    """Register a state file format for saving and loading."""
+    SERIALIZERS[serializer.name] = serializer
+
+
+register_serializer(MsgpackZstdStateSerializer())
+register_serializer(JsonStateSerializer())
+
+
+def get_serializer(name: Optional[str] = None) -> StateSerializer:
+    """Get the serializer for new saves.
+
+    Falls back to JSON when the requested format's dependencies are missing.
+    """
+    name = name or STATE_FORMAT
+    serializer = SERIALIZERS.get(name)
+    if serializer is None:
+        raise ValueError(f"Unknown workflow state format {name!r}. Known: {sorted(SERIALIZERS)}")
+    if not serializer.available():
+        logger.warning(f"State format {name!r} unavailable, using json. Run: pip install ormsgpack zstandard")
+        return SERIALIZERS["json"]
+    return serializer
+
+
+def _serializer_for(path: Path) -> Optional[StateSerializer]:
+    for serializer in SERIALIZERS.values():
+        if any(path.name.endswith(suffix) for suffix in serializer.suffixes):
+            return serializer
+    return None
+
+
+def _run_id_for(path: Path) -> Optional[str]:
+    serializer = _serializer_for(path)
+    if serializer is None:
+        return None
+    for suffix in serializer.suffixes:
+        if path.name.endswith(suffix):
+            return path.name[: -len(suffix)]
+    return None
+
+
+def _state_paths(workflow_name: str, run_id: str) -> list[Path]:
+    """Existing state files for a run, newest format first."""
+    workflow_dir = STATE_STORE_DIR / workflow_name
+    return [
+        workflow_dir / f"{run_id}{suffix}"
+        for serializer in SERIALIZERS.values()
+        for suffix in serializer.suffixes
+        if (workflow_dir / f"{run_id}{suffix}").exists()
+    ]
+
+
+def _append_index(workflow_dir: Path, entry: dict) -> None:
+    # One short line per append, so concurrent writers don't interleave
+    with open(workflow_dir / INDEX_FILENAME, "a", encoding="utf-8") as f:
+        f.write(json.dumps(entry) + "\n")
+
+
+def _read_index(workflow_dir: Path) -> dict[str, dict]:
+    """Latest index entry per run_id."""
+    entries: dict[str, dict] = {}
+    try:
+        with open(workflow_dir / INDEX_FILENAME, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                    entries[entry["run_id"]] = entry
+                except (json.JSONDecodeError, KeyError, TypeError):
+                    continue
+    except FileNotFoundError:
+        pass
+    return entries
+
+
 def should_persist_state() -> bool:
     """Check if workflow state should be persisted to disk.
 
@@ -83,7 +355,7 @@ def should_persist_state() -> bool:
 
 
 def get_state_path(workflow_name: str, run_id: str, compressed: bool = False) -> Path:
-    """Get the file path for a workflow state.
+    """Get the JSON-format file path for a workflow state.
 
     Args:
         workflow_name: Name of the workflow (e.g., "academic_lit_review")
@@ -104,6 +376,7 @@ def save_workflow_state(
     run_id: str,
     state: dict,
     compress: bool = True,
+    format: Optional[str] = None,
 ) -> Optional[Path]:
     """
     Save workflow state to disk keyed by langsmith_run_id.
@@ -114,7 +387,9 @@ def save_workflow_state(
         workflow_name: Name of the workflow (e.g., "academic_lit_review")
         run_id: The langsmith_run_id (UUID string)
         state: Complete workflow state dict
-        compress: Whether to compress large states (default: True)
+        compress: Whether to compress the state (default: True). The JSON
+            format only compresses states larger than 1MB.
+        format: Serializer name (default: THALA_STATE_FORMAT, "msgpack")
 
     Returns:
         Path to saved state file, or None if persistence is disabled
@@ -124,25 +399,33 @@ def save_workflow_state(
         return None
 
     try:
-        # Serialize to JSON string first to check size
-        state_json = json.dumps(state, default=_serialize_value, indent=2)
-        use_compression = compress and len(state_json) > COMPRESSION_THRESHOLD
-
-        path = get_state_path(workflow_name, run_id, compressed=use_compression)
-
-        if use_compression:
-            with gzip.open(path, "wt", encoding="utf-8") as f:
-                f.write(state_json)
-            logger.debug(
-                f"Saved compressed workflow state ({len(state_json) / 1024:.1f}KB): {path}"
-            )
-        else:
-            with open(path, "w", encoding="utf-8") as f:
-                f.write(state_json)
-            logger.debug(
-                f"Saved workflow state ({len(state_json) / 1024:.1f}KB): {path}"
-            )
-
+        serializer = get_serializer(format)
+        workflow_dir = STATE_STORE_DIR / workflow_name
+        workflow_dir.mkdir(parents=True, exist_ok=True)
+
+        # Earlier saves of this run in other formats would shadow or duplicate it
+        previous = _state_paths(workflow_name, run_id)
+        path, raw_bytes = serializer.dump(state, workflow_dir / run_id, compress)
+        for old in previous:
+            if old != path:
+                old.unlink(missing_ok=True)
+
+        size_bytes = path.stat().st_size
+        _append_index(
+            workflow_dir,
+            {
+                "run_id": run_id,
+                "file": path.name,
+                "format": serializer.name,
+                "saved_at": time.time(),
+                "size_bytes": size_bytes,
+                "raw_bytes": raw_bytes,
+                "keys": [str(k) for k in state],
+            },
+        )
+        logger.debug(
+            f"Saved workflow state ({serializer.name}, {raw_bytes / 1024:.1f}KB -> {size_bytes / 1024:.1f}KB): {path}"
+        )
         return path
 
     except Exception as e:
@@ -154,7 +437,8 @@ def load_workflow_state(workflow_name: str, run_id: str) -> Optional[dict]:
     """
     Load workflow state from disk by langsmith_run_id.
 
-    Tries compressed format first, then uncompressed.
+    Tries every registered format (msgpack, then compressed and
+    uncompressed JSON).
 
     Args:
         workflow_name: Name of the workflow
@@ -163,24 +447,15 @@ def load_workflow_state(workflow_name: str, run_id: str) -> Optional[dict]:
     Returns:
         State dict if found, None otherwise
     """
-    # Try compressed first, then uncompressed
-    for compressed in [True, False]:
-        path = get_state_path(workflow_name, run_id, compressed=compressed)
-        if path.exists():
-            try:
-                if compressed:
-                    with gzip.open(path, "rt", encoding="utf-8") as f:
-                        state = json.load(f, object_hook=_deserialize_hook)
-                else:
-                    with open(path, "r", encoding="utf-8") as f:
-                        state = json.load(f, object_hook=_deserialize_hook)
-
-                logger.debug(f"Loaded workflow state: {path}")
-                return state
-
-            except Exception as e:
-                logger.error(f"Failed to load workflow state from {path}: {e}")
-                return None
+    for path in _state_paths(workflow_name, run_id):
+        try:
+            state = _serializer_for(path).load(path)
+            logger.debug(f"Loaded workflow state: {path}")
+            return state
+
+        except Exception as e:
+            logger.error(f"Failed to load workflow state from {path}: {e}")
+            return None
 
     logger.debug(f"No workflow state found for {workflow_name}/{run_id}")
     return None
@@ -194,36 +469,52 @@ def state_exists(workflow_name: str, run_id: str) -> bool:
         run_id: The langsmith_run_id (UUID string)
 
     Returns:
-        True if state file exists (compressed or uncompressed)
+        True if a state file exists in any format
     """
-    for compressed in [True, False]:
-        if get_state_path(workflow_name, run_id, compressed=compressed).exists():
-            return True
-    return False
+    return bool(_state_paths(workflow_name, run_id))
 
 
 def list_workflow_states(workflow_name: str, limit: int = 100) -> list[dict]:
     """
     List available states for a workflow.
 
+    Metadata comes from the index.jsonl sidecar; files saved before the
+    index existed are listed from their file stats.
+
     Args:
         workflow_name: Name of the workflow
         limit: Maximum number of states to return
 
     Returns:
-        List of {run_id, path, timestamp, size_bytes} dicts,
-        sorted by modification time (newest first)
+        List of {run_id, path, timestamp, size_bytes, format} dicts (plus
+        raw_bytes and keys for indexed states), sorted by save time
+        (newest first)
     """
     workflow_dir = STATE_STORE_DIR / workflow_name
     if not workflow_dir.exists():
         return []
 
+    index = _read_index(workflow_dir)
     states = []
-    for path in workflow_dir.glob("*.json*"):
-        run_id = path.stem
-        # Handle .json.gz by stripping both extensions
-        if path.suffix == ".gz":
-            run_id = Path(run_id).stem
+    for path in workflow_dir.iterdir():
+        run_id = _run_id_for(path)
+        if run_id is None:
+            continue
+
+        entry = index.get(run_id)
+        if entry and entry.get("file") == path.name:
+            states.append(
+                {
+                    "run_id": run_id,
+                    "path": str(path),
+                    "timestamp": entry["saved_at"],
+                    "size_bytes": entry["size_bytes"],
+                    "format": entry["format"],
+                    "raw_bytes": entry.get("raw_bytes"),
+                    "keys": entry.get("keys", []),
+                }
+            )
+            continue
 
         try:
             stat = path.stat()
@@ -233,6 +524,7 @@ def list_workflow_states(workflow_name: str, limit: int = 100) -> list[dict]:
                     "path": str(path),
                     "timestamp": stat.st_mtime,
                     "size_bytes": stat.st_size,
+                    "format": _serializer_for(path).name,
                 }
             )
         except OSError:
@@ -245,6 +537,8 @@ def cleanup_old_states(workflow_name: str, keep_count: int = 50) -> int:
     """
     Remove old workflow states, keeping only the most recent.
 
+    Also compacts the index to the remaining states.
+
     Args:
         workflow_name: Name of the workflow
         keep_count: Number of recent states to keep
@@ -264,6 +558,11 @@ def cleanup_old_states(workflow_name: str, keep_count: int = 50) -> int:
             logger.debug(f"Failed to delete {state_info['path']}: {e}")
 
     if deleted > 0:
+        workflow_dir = STATE_STORE_DIR / workflow_name
+        kept = {s["run_id"] for s in states[:keep_count]}
+        entries = [e for run_id, e in _read_index(workflow_dir).items() if run_id in kept]
+        data = "".join(json.dumps(e) + "\n" for e in entries).encode("utf-8")
+        _atomic_write(workflow_dir / INDEX_FILENAME, lambda f: f.write(data))
         logger.debug(f"Cleaned up {deleted} old states for {workflow_name}")
 
     return deleted
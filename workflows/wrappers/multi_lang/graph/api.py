@@ -17,6 +17,8 @@ from workflows.wrappers.multi_lang.state import (
     MultiLangInput,
     LanguageMode,
     WorkflowType,
+    ExecutionMode,
+    IntegrationStrategy,
 )
 from workflows.wrappers.multi_lang.graph.construction import multi_lang_graph
 from workflows.shared.workflow_state_store import save_workflow_state
@@ -71,6 +73,9 @@ async def multi_lang_research(
     brief: Optional[str] = None,
     workflow: WorkflowType = "web",
     quality: QualityTier = "standard",
+    execution_mode: ExecutionMode = "parallel",
+    integration_strategy: IntegrationStrategy = "tree",
+    time_budget_seconds: Optional[float] = None,
 ) -> MultiLangResult:
     """
     Run multi-language research workflow.
@@ -89,6 +94,13 @@ async def multi_lang_research(
         brief: Optional additional context for the research
         workflow: Which workflow to run ("web", "academic", or "books")
         quality: Quality tier for all languages (test, quick, standard, comprehensive, high_quality)
+        execution_mode: "parallel" runs languages concurrently (at most
+            THALA_MULTI_LANG_MAX_CONCURRENCY at once); "sequential" runs one at a time
+        integration_strategy: "tree" merges language findings pairwise (concurrently)
+            before one integration into the English baseline; "sequential" folds
+            languages into the document one Opus call at a time
+        time_budget_seconds: Optional wall-clock budget shared by all languages.
+            Languages not started when it runs out are skipped and reported in errors.
 
     Returns:
         MultiLangResult with:
@@ -132,6 +144,9 @@ async def multi_lang_research(
         languages=languages,
         workflow=workflow,
         quality=quality,
+        execution_mode=execution_mode,
+        integration_strategy=integration_strategy,
+        time_budget_seconds=time_budget_seconds,
     )
 
     # Build initial state
@@ -144,6 +159,7 @@ async def multi_lang_research(
         "current_language_index": 0,
         "languages_completed": [],
         "languages_failed": [],
+        "execution_deadline": None,
         "relevance_checks": [],
         "language_results": [],
         "sonnet_analysis": None,
@@ -169,6 +185,7 @@ async def multi_lang_research(
             "workflow:multi_lang",
             f"mode:{mode}",
             f"subworkflow:{workflow}",
+            f"execution:{execution_mode}",
             *get_trace_tags(),
         ],
         "metadata": {
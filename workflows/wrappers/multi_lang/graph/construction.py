@@ -2,7 +2,8 @@
 Graph construction for multi_lang research workflow.
 
 Builds a LangGraph StateGraph that orchestrates research across multiple
-languages with relevance checking, sequential execution, and synthesis.
+languages with relevance checking, sequential or parallel execution, and
+synthesis.
 """
 
 from langgraph.graph import END, START, StateGraph
@@ -14,11 +15,14 @@ from workflows.wrappers.multi_lang.nodes import (
     filter_relevant_languages,
     execute_next_language,
     check_languages_complete,
+    dispatch_languages,
+    execute_language,
+    collect_language_results,
     run_sonnet_analysis,
     run_opus_integration,
     save_multi_lang_results,
 )
-from .routing import route_after_language_selection, route_language_loop
+from .routing import route_after_language_selection, route_language_execution, route_language_loop
 
 
 def create_multi_lang_graph() -> StateGraph:
@@ -26,13 +30,17 @@ def create_multi_lang_graph() -> StateGraph:
     Create the multi_lang workflow graph.
 
     Flow for Mode 1 (Set Languages):
-        START -> select_languages -> execute_next_language (loop)
+        START -> select_languages -> dispatch_languages -> [execution]
               -> sonnet_analysis -> opus_integration -> save_results -> END
 
     Flow for Mode 2 (All Languages):
         START -> select_languages -> check_relevance_batch
-              -> filter_relevant_languages -> execute_next_language (loop)
+              -> filter_relevant_languages -> dispatch_languages -> [execution]
               -> sonnet_analysis -> opus_integration -> save_results -> END
+
+    Execution is either sequential (execute_next_language loop) or parallel
+    (one execute_language worker per language via Send, joined by
+    collect_language_results).
     """
     builder = StateGraph(MultiLangState)
 
@@ -43,9 +51,14 @@ def create_multi_lang_graph() -> StateGraph:
     builder.add_node("check_relevance_batch", check_relevance_batch)
     builder.add_node("filter_relevant_languages", filter_relevant_languages)
 
-    # Phase 3: Sequential Language Execution
+    # Phase 3: Language Execution
+    builder.add_node("dispatch_languages", dispatch_languages)
+    # Sequential
     builder.add_node("execute_next_language", execute_next_language)
     builder.add_node("check_languages_complete", check_languages_complete)
+    # Parallel
+    builder.add_node("execute_language", execute_language)
+    builder.add_node("collect_language_results", collect_language_results)
 
     # Phase 4: Cross-Language Synthesis
     builder.add_node("sonnet_analysis", run_sonnet_analysis)
@@ -61,14 +74,25 @@ def create_multi_lang_graph() -> StateGraph:
     builder.add_conditional_edges(
         "select_languages",
         route_after_language_selection,
-        ["execute_next_language", "check_relevance_batch"],
+        ["dispatch_languages", "check_relevance_batch"],
     )
 
     # Relevance checking path (mode 2)
     builder.add_edge("check_relevance_batch", "filter_relevant_languages")
-    builder.add_edge("filter_relevant_languages", "execute_next_language")
+    builder.add_edge("filter_relevant_languages", "dispatch_languages")
+
+    # Execution mode determines sequential loop or parallel fan-out
+    builder.add_conditional_edges(
+        "dispatch_languages",
+        route_language_execution,
+        ["execute_next_language", "execute_language", "collect_language_results"],
+    )
+
+    # Parallel fan-out joins before synthesis
+    builder.add_edge("execute_language", "collect_language_results")
+    builder.add_edge("collect_language_results", "sonnet_analysis")
 
-    # Language execution loop
+    # Sequential language execution loop
     builder.add_edge("execute_next_language", "check_languages_complete")
     builder.add_conditional_edges(
         "check_languages_complete",
@@ -1,6 +1,8 @@
 """Routing functions for multi-language workflow conditional edges."""
 
-from workflows.wrappers.multi_lang.state import MultiLangState
+from langgraph.types import Send
+
+from workflows.wrappers.multi_lang.state import LanguageTask, MultiLangState
 
 
 def route_after_language_selection(state: MultiLangState) -> str:
@@ -12,7 +14,7 @@ def route_after_language_selection(state: MultiLangState) -> str:
     """
     mode = state["input"]["mode"]
     if mode == "set_languages":
-        return "execute_next_language"
+        return "dispatch_languages"
     # main_languages and all_languages both do relevance checking
     return "check_relevance_batch"
 
@@ -27,3 +29,30 @@ def route_language_loop(state: MultiLangState) -> str:
     if idx < len(languages_to_process):
         return "execute_next_language"
     return "sonnet_analysis"
+
+
+def route_language_execution(state: MultiLangState) -> list[Send] | str:
+    """Fan out one execute_language worker per language, or run them in sequence.
+
+    Sends are built in language-list order; collect_language_results
+    restores that order after the workers finish.
+    """
+    languages_to_process = state.get("languages_with_content") or state.get("target_languages", [])
+
+    if state["input"].get("execution_mode", "sequential") != "parallel":
+        return "execute_next_language"
+    if not languages_to_process:
+        return "collect_language_results"
+
+    return [
+        Send(
+            "execute_language",
+            LanguageTask(
+                input=state["input"],
+                language_code=code,
+                language_config=state["language_configs"][code],
+                execution_deadline=state.get("execution_deadline"),
+            ),
+        )
+        for code in languages_to_process
+    ]
@@ -2,7 +2,13 @@
 
 from .language_selector import select_languages
 from .relevance_checker import check_relevance_batch, filter_relevant_languages
-from .language_executor import execute_next_language, check_languages_complete
+from .language_executor import (
+    execute_next_language,
+    check_languages_complete,
+    dispatch_languages,
+    execute_language,
+    collect_language_results,
+)
 from .sonnet_analyzer import run_sonnet_analysis
 from .opus_integrator import run_opus_integration
 from .save_results import save_multi_lang_results
@@ -13,6 +19,9 @@ __all__ = [
     "filter_relevant_languages",
     "execute_next_language",
     "check_languages_complete",
+    "dispatch_languages",
+    "execute_language",
+    "collect_language_results",
     "run_sonnet_analysis",
     "run_opus_integration",
     "save_multi_lang_results",
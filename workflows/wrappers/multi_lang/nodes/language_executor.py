@@ -1,18 +1,51 @@
-"""Language executor node for multi-lingual research workflow.
+"""Language executor nodes for multi-lingual research workflow.
 
-Uses the workflow registry for pluggable workflow dispatch.
+Uses the workflow registry for pluggable workflow dispatch. Languages run
+either one at a time (execute_next_language, looped by index) or all at
+once as Send workers (execute_language), limited by a process-wide
+concurrency cap and the run's shared time budget.
 """
 
+import asyncio
 import logging
-from datetime import datetime, timezone
+import os
+from datetime import datetime, timedelta, timezone
+from typing import Optional
 
-from workflows.wrappers.multi_lang.state import MultiLangState, LanguageResult
+from workflows.wrappers.multi_lang.state import LanguageResult, LanguageTask, MultiLangInput, MultiLangState
 from workflows.wrappers.multi_lang.workflow_registry import WORKFLOW_REGISTRY
 from workflows.shared.llm_utils import invoke, InvokeConfig, ModelTier
 from workflows.research.web_research.utils import extract_json_from_llm_response
 
 logger = logging.getLogger(__name__)
 
+# Languages researched at once across all multi_lang runs in the process
+MAX_CONCURRENT_LANGUAGES = int(os.getenv("THALA_MULTI_LANG_MAX_CONCURRENCY", "3"))
+
+# State keys a parallel worker may write (reducer-backed, so writes merge)
+_WORKER_KEYS = ("language_results", "languages_completed", "languages_failed", "errors")
+
+_language_slots: Optional[asyncio.Semaphore] = None
+_language_slots_key: Optional[tuple[asyncio.AbstractEventLoop, int]] = None
+
+
+def _get_language_slots() -> asyncio.Semaphore:
+    """Get the concurrency-cap semaphore for the running event loop."""
+    global _language_slots, _language_slots_key
+    key = (asyncio.get_running_loop(), MAX_CONCURRENT_LANGUAGES)
+    if _language_slots is None or _language_slots_key != key:
+        _language_slots = asyncio.Semaphore(MAX_CONCURRENT_LANGUAGES)
+        _language_slots_key = key
+    return _language_slots
+
+
+def execution_deadline(workflow_input: MultiLangInput) -> Optional[datetime]:
+    """Deadline for starting languages, from the input's time budget."""
+    budget = workflow_input.get("time_budget_seconds")
+    if not budget:
+        return None
+    return datetime.now(timezone.utc) + timedelta(seconds=budget)
+
 
 async def _compress_language_findings(
     workflow_results: list[dict],
@@ -79,62 +112,55 @@ Format your response as JSON:
         )
 
 
-async def execute_next_language(state: MultiLangState) -> dict:
+async def _run_language(
+    language_code: str,
+    language_config: dict,
+    workflow_input: MultiLangInput,
+    deadline: Optional[datetime],
+) -> dict:
     """
-    Execute chosen workflow(s) for the current language in the sequence.
+    Run the chosen workflow for one language and summarise its findings.
 
-    Uses current_language_index to determine which language to process.
-    Checks languages_with_content (if set) or target_languages.
-
-    For the current language:
-    1. Get quality settings (check per_language_overrides)
-    2. Run selected workflows (web, academic, books based on input.workflows)
+    1. Skip the language if the shared time budget has run out
+    2. Run the selected workflow (web, academic, or books)
     3. Compress findings into summary with key insights
     4. Create LanguageResult
 
     Returns:
         language_results: [LanguageResult]  # appends via reducer
-        current_language_index: incremented
-        current_phase: f"executing_{language_code}"
-        current_status: f"Completed {language_name} ({N} sources)"
-
-    On error:
-        languages_failed: [language_code]
-        errors: [{language, error, phase}]
+        languages_completed / languages_failed: [language_code]
+        current_phase, current_status
+        errors: [{language, error, phase}] on failure
     """
-    idx = state["current_language_index"]
-
-    # Determine which language list to use
-    languages_to_process = state.get("languages_with_content") or state["target_languages"]
+    language_name = language_config["name"]
 
-    if idx >= len(languages_to_process):
-        logger.error(f"Language index {idx} exceeds list length {len(languages_to_process)}")
+    if deadline is not None and datetime.now(timezone.utc) >= deadline:
+        logger.warning(f"Time budget exhausted, skipping {language_name}")
         return {
-            "current_status": "Error: Language index out of bounds",
+            "languages_failed": [language_code],
+            "current_phase": f"skipped_{language_code}",
+            "current_status": f"Skipped {language_name} (time budget exhausted)",
             "errors": [
                 {
+                    "language": language_code,
                     "phase": "language_execution",
-                    "error": f"Index {idx} exceeds language list length {len(languages_to_process)}",
+                    "error": f"Time budget exhausted before {language_name} started",
                 }
             ],
         }
 
-    language_code = languages_to_process[idx]
-    language_config = state["language_configs"][language_code]
-    language_name = language_config["name"]
-
     logger.info(f"Executing workflow for {language_name}")
 
     started_at = datetime.now(timezone.utc)
 
     # Get quality (single global quality tier)
-    quality = state["input"]["quality"]
+    quality = workflow_input["quality"]
     logger.debug(f"Using quality={quality} for {language_name}")
 
     # Get the single workflow to run
-    workflow_key = state["input"]["workflow"]
-    topic = state["input"]["topic"]
-    research_questions = state["input"].get("research_questions")
+    workflow_key = workflow_input["workflow"]
+    topic = workflow_input["topic"]
+    research_questions = workflow_input.get("research_questions")
 
     workflow_results = []
     workflows_run = []
@@ -147,7 +173,6 @@ async def execute_next_language(state: MultiLangState) -> dict:
         logger.error(f"Unknown workflow: {workflow_key}")
         return {
             "languages_failed": [language_code],
-            "current_language_index": idx + 1,
             "current_phase": f"failed_{language_code}",
             "current_status": f"Failed: Unknown workflow '{workflow_key}'",
             "errors": [
@@ -192,7 +217,6 @@ async def execute_next_language(state: MultiLangState) -> dict:
         logger.error(f"All workflows failed for {language_name}")
         return {
             "languages_failed": [language_code],
-            "current_language_index": idx + 1,
             "current_phase": f"failed_{language_code}",
             "current_status": f"Failed: {language_name} (all workflows failed)",
             "errors": [
@@ -210,7 +234,6 @@ async def execute_next_language(state: MultiLangState) -> dict:
         logger.info(f"No sources found for {language_name} - workflows ran but returned no results")
         return {
             "languages_completed": [language_code],
-            "current_language_index": idx + 1,
             "current_phase": f"completed_{language_code}",
             "current_status": f"Completed {language_name} (no sources found)",
         }
@@ -244,12 +267,127 @@ async def execute_next_language(state: MultiLangState) -> dict:
     return {
         "language_results": [language_result],
         "languages_completed": [language_code],
-        "current_language_index": idx + 1,
         "current_phase": f"executed_{language_code}",
         "current_status": f"Completed {language_name} ({total_sources} sources)",
     }
 
 
+async def execute_next_language(state: MultiLangState) -> dict:
+    """
+    Execute chosen workflow for the current language in the sequence.
+
+    Uses current_language_index to determine which language to process.
+    Checks languages_with_content (if set) or target_languages.
+
+    Returns the _run_language update plus:
+        current_language_index: incremented
+    """
+    idx = state["current_language_index"]
+
+    # Determine which language list to use
+    languages_to_process = state.get("languages_with_content") or state["target_languages"]
+
+    if idx >= len(languages_to_process):
+        logger.error(f"Language index {idx} exceeds list length {len(languages_to_process)}")
+        return {
+            "current_status": "Error: Language index out of bounds",
+            "errors": [
+                {
+                    "phase": "language_execution",
+                    "error": f"Index {idx} exceeds language list length {len(languages_to_process)}",
+                }
+            ],
+        }
+
+    language_code = languages_to_process[idx]
+    update = await _run_language(
+        language_code,
+        state["language_configs"][language_code],
+        state["input"],
+        state.get("execution_deadline"),
+    )
+    return {**update, "current_language_index": idx + 1}
+
+
+async def dispatch_languages(state: MultiLangState) -> dict:
+    """
+    Start language execution and the run's shared time budget.
+
+    Routing then either fans out one execute_language worker per language
+    (parallel mode) or enters the execute_next_language loop.
+
+    Returns:
+        execution_deadline: now + input.time_budget_seconds (or None)
+    """
+    languages_to_process = state.get("languages_with_content") or state["target_languages"]
+    mode = state["input"].get("execution_mode", "sequential")
+    logger.info(f"Executing {len(languages_to_process)} languages ({mode})")
+
+    return {
+        "execution_deadline": execution_deadline(state["input"]),
+        "current_phase": "executing_languages",
+        "current_status": f"Executing {len(languages_to_process)} languages",
+    }
+
+
+async def execute_language(task: LanguageTask) -> dict:
+    """
+    Execute chosen workflow for one language as a parallel Send worker.
+
+    Waits for one of MAX_CONCURRENT_LANGUAGES slots, so the time budget
+    also covers time spent queued. Only reducer-backed keys are returned,
+    since sibling workers write in the same superstep.
+    """
+    language_code = task["language_code"]
+
+    async with _get_language_slots():
+        try:
+            update = await _run_language(
+                language_code,
+                task["language_config"],
+                task["input"],
+                task.get("execution_deadline"),
+            )
+        except Exception as e:
+            # One language failing must not cancel its siblings
+            logger.error(f"Language {language_code} failed: {e}")
+            update = {
+                "languages_failed": [language_code],
+                "errors": [{"language": language_code, "phase": "language_execution", "error": str(e)}],
+            }
+
+    return {key: update[key] for key in _WORKER_KEYS if key in update}
+
+
+async def collect_language_results(state: MultiLangState) -> dict:
+    """
+    Join parallel workers, restoring language-list order.
+
+    Workers finish in arbitrary order; results are re-sorted to match
+    languages_with_content / target_languages so synthesis sees the same
+    order as sequential execution.
+
+    Returns:
+        language_results: full list in language order
+        current_language_index: number of languages processed
+    """
+    languages_to_process = state.get("languages_with_content") or state["target_languages"]
+    position = {code: i for i, code in enumerate(languages_to_process)}
+    ordered = sorted(
+        state.get("language_results", []),
+        key=lambda r: position.get(r["language_code"], len(position)),
+    )
+    total = len(languages_to_process)
+    logger.info(f"All {total} languages complete ({len(state.get('languages_failed', []))} failed)")
+
+    return {
+        "language_results": ordered,
+        "current_language_index": total,
+        "current_phase": "languages_complete",
+        "current_status": f"All languages complete ({total}/{total})",
+    }
+
+
 async def check_languages_complete(state: MultiLangState) -> dict:
     """
     Check if all languages have been processed.
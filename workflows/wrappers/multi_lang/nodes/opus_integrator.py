@@ -1,10 +1,27 @@
-"""Opus-powered one-by-one integration producing synthesized documents."""
+"""Opus-powered integration producing synthesized documents.
 
+Two strategies fold non-English findings into the English baseline:
+
+- sequential: integrate one language at a time, re-sending the growing
+  document on every call.
+- tree: merge language findings pairwise in a balanced tree (each level's
+  merges run concurrently, alongside the initial synthesis), then
+  integrate the merged findings into the baseline in one call.
+
+Every OpusIntegrationStep records its estimated prompt tokens and latency;
+the final tree step also records savings against an estimated sequential
+fold of the same languages.
+"""
+
+import asyncio
 import logging
+import time
+from dataclasses import dataclass, field
 from datetime import datetime
 from pydantic import BaseModel, Field
 
 from workflows.shared.llm_utils import ModelTier, invoke, InvokeConfig
+from workflows.shared.token_utils import estimate_tokens_fast
 from workflows.shared.llm_utils.integration_guard import (
     IntegrationShrinkageError,
     with_shrinkage_guard,
@@ -16,8 +33,12 @@ from workflows.wrappers.multi_lang.prompts.integration import (
     INTEGRATION_USER,
     FINAL_ENHANCEMENT_SYSTEM,
     FINAL_ENHANCEMENT_USER,
+    MERGE_FINDINGS_SYSTEM,
+    MERGE_FINDINGS_USER,
 )
 from workflows.wrappers.multi_lang.state import (
+    IntegrationSavings,
+    IntegrationStrategy,
     MultiLangState,
     LanguageResult,
     OpusIntegrationStep,
@@ -39,6 +60,13 @@ class IntegrationOutput(BaseModel):
     enhancement_notes: str = Field(description="What was added or changed during integration")
 
 
+class MergeFindingsOutput(BaseModel):
+    """Structured output from merging two groups of language findings."""
+
+    merged_findings: str = Field(description="One findings brief covering both inputs")
+    enhancement_notes: str = Field(description="Main unique contributions of each language")
+
+
 class FinalEnhancementOutput(BaseModel):
     """Structured output from final document enhancement."""
 
@@ -78,8 +106,10 @@ async def _integrate_language(
     current_document: str,
     language_result: LanguageResult,
     sonnet_guidance: list[str],
+    strategy: IntegrationStrategy = "sequential",
+    level: int = 1,
 ) -> tuple[str, OpusIntegrationStep]:
-    """Integrate one language's findings into the current synthesis."""
+    """Integrate one language's (or merged group's) findings into the current synthesis."""
     language_name = language_result["language_name"]
     language_code = language_result["language_code"]
 
@@ -108,6 +138,7 @@ async def _integrate_language(
         # Structured output — no access to stop_reason; rely on length floor.
         return r, r.updated_document, None
 
+    started = time.perf_counter()
     result: IntegrationOutput = await with_shrinkage_guard(
         _one_call,
         input_chars=len(current_document),
@@ -119,11 +150,235 @@ async def _integrate_language(
         "language_name": language_name,
         "integrated_content": result.updated_document,
         "enhancement_notes": result.enhancement_notes,
+        "strategy": strategy,
+        "level": level,
+        "input_tokens": estimate_tokens_fast(system_prompt + user_prompt),
+        "latency_seconds": time.perf_counter() - started,
+        "savings": None,
     }
 
     return result.updated_document, integration_step
 
 
+@dataclass
+class _Findings:
+    """Findings for one language, or a group of languages merged in the tree."""
+
+    codes: list[str]
+    names: list[str]
+    text: str
+    guidance: list[str] = field(default_factory=list)
+
+    @property
+    def code(self) -> str:
+        return "+".join(self.codes)
+
+    @property
+    def name(self) -> str:
+        if len(self.names) == 1:
+            return self.names[0]
+        return ", ".join(self.names[:-1]) + f" and {self.names[-1]}"
+
+    def as_result(self) -> LanguageResult:
+        """View as a LanguageResult for _integrate_language."""
+        return {
+            "language_code": self.code,
+            "language_name": self.name,
+            "full_report": self.text,
+            "findings_summary": self.text,
+        }
+
+
+def _format_guidance(guidance: list[str]) -> str:
+    return "\n".join(f"- {item}" for item in guidance) or "(none)"
+
+
+async def _merge_findings(left: _Findings, right: _Findings, level: int) -> tuple[_Findings, OpusIntegrationStep | None]:
+    """Merge two groups of findings into one brief.
+
+    If the call fails (other than by shrinking), the two texts are
+    concatenated so no findings are lost; the next merge weaves them in.
+    """
+    merged = _Findings(
+        codes=left.codes + right.codes,
+        names=left.names + right.names,
+        text="",
+        guidance=left.guidance + right.guidance,
+    )
+    logger.debug(f"Merging findings: {left.name} + {right.name}")
+
+    user_prompt = MERGE_FINDINGS_USER.format(
+        left_languages=left.name,
+        left_findings=left.text,
+        left_guidance=_format_guidance(left.guidance),
+        right_languages=right.name,
+        right_findings=right.text,
+        right_guidance=_format_guidance(right.guidance),
+    )
+
+    async def _one_call() -> tuple[MergeFindingsOutput, str, str | None]:
+        r: MergeFindingsOutput = await invoke(
+            tier=ModelTier.OPUS,
+            system=MERGE_FINDINGS_SYSTEM,
+            user=user_prompt,
+            schema=MergeFindingsOutput,
+            config=InvokeConfig(max_tokens=64000),
+        )
+        return r, r.merged_findings, None
+
+    started = time.perf_counter()
+    try:
+        result: MergeFindingsOutput = await with_shrinkage_guard(
+            _one_call,
+            input_chars=max(len(left.text), len(right.text)),
+            label=f"multi_lang_merge[{merged.code}]",
+        )
+    except IntegrationShrinkageError:
+        raise
+    except Exception as e:
+        logger.error(f"Failed to merge {merged.name}, concatenating instead: {e}")
+        merged.text = f"{left.text}\n\n{right.text}"
+        return merged, None
+
+    merged.text = result.merged_findings
+    step: OpusIntegrationStep = {
+        "language_code": merged.code,
+        "language_name": merged.name,
+        "integrated_content": result.merged_findings,
+        "enhancement_notes": result.enhancement_notes,
+        "strategy": "tree",
+        "level": level,
+        "input_tokens": estimate_tokens_fast(MERGE_FINDINGS_SYSTEM + user_prompt),
+        "latency_seconds": time.perf_counter() - started,
+        "savings": None,
+    }
+    return merged, step
+
+
+async def _merge_tree(leaves: list[_Findings]) -> tuple[_Findings, list[OpusIntegrationStep], float]:
+    """Reduce findings pairwise, one concurrent level at a time.
+
+    Adjacent nodes are paired so languages stay in priority order; an odd
+    node is carried up to the next level.
+
+    Returns:
+        (root findings, merge steps, critical-path seconds across levels)
+    """
+    nodes = leaves
+    steps: list[OpusIntegrationStep] = []
+    critical_path = 0.0
+    level = 1
+
+    while len(nodes) > 1:
+        pairs = [(nodes[i], nodes[i + 1]) for i in range(0, len(nodes) - 1, 2)]
+        started = time.perf_counter()
+        merged = await asyncio.gather(*(_merge_findings(left, right, level) for left, right in pairs))
+        critical_path += time.perf_counter() - started
+
+        steps.extend(step for _, step in merged if step is not None)
+        carried = [nodes[-1]] if len(nodes) % 2 else []
+        nodes = [node for node, _ in merged] + carried
+        level += 1
+
+    return nodes[0], steps, critical_path
+
+
+def _estimate_sequential_tokens(baseline_document: str, leaves: list[_Findings]) -> int:
+    """Prompt tokens a sequential fold of the same languages would send.
+
+    Each sequential call re-sends the whole document, which is assumed to
+    grow by the findings integrated so far.
+    """
+    overhead = estimate_tokens_fast(INTEGRATION_SYSTEM + INTEGRATION_USER)
+    document = estimate_tokens_fast(baseline_document)
+    total = 0
+    for leaf in leaves:
+        findings = estimate_tokens_fast(leaf.text) + estimate_tokens_fast(_format_guidance(leaf.guidance))
+        total += overhead + document + findings
+        document += findings
+    return total
+
+
+async def _timed(coro) -> tuple:
+    started = time.perf_counter()
+    result = await coro
+    return result, time.perf_counter() - started
+
+
+async def _tree_integrate(
+    baseline_result: LanguageResult,
+    to_integrate: list[LanguageResult],
+    guidance_for: dict[str, list[str]],
+    topic: str,
+    research_questions: list[str] | None,
+    errors: list[dict],
+) -> tuple[str, list[OpusIntegrationStep], list[str]]:
+    """Integrate languages via a merge tree, concurrently with the initial synthesis.
+
+    If the root integration fails (other than by shrinking), the English
+    baseline is kept and the failure appended to errors, as a failed
+    language is in sequential mode.
+
+    Returns:
+        (integrated document, steps, names of integrated languages)
+    """
+    leaves = [
+        _Findings(
+            codes=[r["language_code"]],
+            names=[r["language_name"]],
+            text=r.get("full_report") or r["findings_summary"],
+            guidance=guidance_for.get(r["language_code"], []),
+        )
+        for r in to_integrate
+    ]
+
+    initial = _timed(_create_initial_synthesis(baseline_result, topic, research_questions))
+    if not leaves:
+        (document, _) = await initial
+        return document, [], []
+
+    (initial_document, initial_seconds), (root, steps, tree_seconds) = await asyncio.gather(
+        initial, _merge_tree(leaves)
+    )
+
+    levels = max((step["level"] for step in steps), default=0)
+    try:
+        document, root_step = await _integrate_language(
+            initial_document, root.as_result(), root.guidance, strategy="tree", level=levels + 1
+        )
+    except IntegrationShrinkageError:
+        raise
+    except Exception as e:
+        logger.error(f"Failed to integrate {root.name} into the baseline: {e}")
+        errors.append(
+            {
+                "timestamp": datetime.now().isoformat(),
+                "phase": "opus_integration",
+                "language": root.code,
+                "error": str(e),
+                "error_type": type(e).__name__,
+            }
+        )
+        # Merge notes describe findings that never reached the document
+        return initial_document, [], []
+    steps.append(root_step)
+
+    savings: IntegrationSavings = {
+        "input_tokens": sum(step["input_tokens"] for step in steps),
+        "sequential_input_tokens": _estimate_sequential_tokens(initial_document, leaves),
+        "critical_path_seconds": max(initial_seconds, tree_seconds) + root_step["latency_seconds"],
+        "sequential_seconds": initial_seconds + sum(step["latency_seconds"] for step in steps),
+    }
+    root_step["savings"] = savings
+    logger.info(
+        f"Tree integration of {len(leaves)} languages: ~{savings['input_tokens']} input tokens "
+        f"(sequential ~{savings['sequential_input_tokens']}), {savings['critical_path_seconds']:.0f}s "
+        f"(sequential ~{savings['sequential_seconds']:.0f}s)"
+    )
+
+    return document, steps, root.names
+
+
 async def _finalize_synthesis(
     current_document: str,
     languages_integrated: list[str],
@@ -169,7 +424,10 @@ async def _finalize_synthesis(
 
 
 async def run_opus_integration(state: MultiLangState) -> dict:
-    """Opus integrates findings one language at a time."""
+    """Opus integrates non-English findings into the English baseline.
+
+    Uses input.integration_strategy: "tree" (default) or "sequential".
+    """
     try:
         language_results = state["language_results"]
         sonnet_analysis = state.get("sonnet_analysis")
@@ -187,62 +445,68 @@ async def run_opus_integration(state: MultiLangState) -> dict:
         english_result = next((r for r in language_results if r["language_code"] == "en"), None)
         baseline_result = english_result or language_results[0]
 
-        # Create initial synthesis
         topic = state["input"]["topic"]
         research_questions = state["input"].get("research_questions")
-
-        logger.info("Starting Opus integration")
-
-        current_document = await _create_initial_synthesis(baseline_result, topic, research_questions)
+        strategy = state["input"].get("integration_strategy", "tree")
 
         # Get integration priority from Sonnet (excluding English)
         integration_priority = []
         if sonnet_analysis and sonnet_analysis.get("integration_priority"):
             integration_priority = [code for code in sonnet_analysis["integration_priority"] if code != "en"]
 
-        # Build language code -> result mapping
+        # Results to integrate, in priority order
         results_by_code = {r["language_code"]: r for r in language_results}
-
-        # Track integration steps
-        integration_steps: list[OpusIntegrationStep] = []
-
-        # Integrate each language in priority order
-        for language_code in integration_priority:
-            if language_code not in results_by_code:
-                continue
-
-            language_result = results_by_code[language_code]
-
-            # Get unique contributions from Sonnet
-            sonnet_guidance = []
-            if sonnet_analysis and sonnet_analysis.get("unique_contributions"):
-                sonnet_guidance = sonnet_analysis["unique_contributions"].get(language_code, [])
-
-            try:
-                current_document, step = await _integrate_language(current_document, language_result, sonnet_guidance)
-                integration_steps.append(step)
-                logger.debug(f"Integrated {language_result['language_name']}")
-
-            except IntegrationShrinkageError:
-                # Error-fail: systematic shrinkage across languages means
-                # the prompt/model is wrong, not a transient per-language
-                # blip. Don't swallow — let the task fail.
-                raise
-            except Exception as e:
-                logger.error(f"Failed to integrate {language_code}: {e}")
-                error_dict = {
-                    "timestamp": datetime.now().isoformat(),
-                    "phase": "opus_integration",
-                    "language": language_code,
-                    "error": str(e),
-                    "error_type": type(e).__name__,
-                }
-                continue
+        to_integrate = [results_by_code[code] for code in integration_priority if code in results_by_code]
+
+        # Unique contributions from Sonnet, per language
+        guidance_for = (sonnet_analysis or {}).get("unique_contributions") or {}
+
+        logger.info(f"Starting Opus integration ({strategy}, {len(to_integrate)} languages)")
+
+        errors = []
+        if strategy == "tree":
+            current_document, integration_steps, names_integrated = await _tree_integrate(
+                baseline_result, to_integrate, guidance_for, topic, research_questions, errors
+            )
+        else:
+            current_document = await _create_initial_synthesis(baseline_result, topic, research_questions)
+            integration_steps: list[OpusIntegrationStep] = []
+
+            # Integrate each language in priority order
+            for position, language_result in enumerate(to_integrate, start=1):
+                language_code = language_result["language_code"]
+                try:
+                    current_document, step = await _integrate_language(
+                        current_document,
+                        language_result,
+                        guidance_for.get(language_code, []),
+                        level=position,
+                    )
+                    integration_steps.append(step)
+                    logger.debug(f"Integrated {language_result['language_name']}")
+
+                except IntegrationShrinkageError:
+                    # Error-fail: systematic shrinkage across languages means
+                    # the prompt/model is wrong, not a transient per-language
+                    # blip. Don't swallow — let the task fail.
+                    raise
+                except Exception as e:
+                    logger.error(f"Failed to integrate {language_code}: {e}")
+                    errors.append(
+                        {
+                            "timestamp": datetime.now().isoformat(),
+                            "phase": "opus_integration",
+                            "language": language_code,
+                            "error": str(e),
+                            "error_type": type(e).__name__,
+                        }
+                    )
+                    continue
+
+            names_integrated = [step["language_name"] for step in integration_steps]
 
         # Finalize the document
-        languages_integrated = [baseline_result["language_name"]] + [
-            step["language_name"] for step in integration_steps
-        ]
+        languages_integrated = [baseline_result["language_name"]] + names_integrated
 
         # Collect all unique workflows used
         workflows_used = list(set(workflow for result in language_results for workflow in result["workflows_run"]))
@@ -258,6 +522,7 @@ async def run_opus_integration(state: MultiLangState) -> dict:
             "final_synthesis": final_document,
             "current_phase": "opus_integration",
             "current_status": "Synthesis complete",
+            "errors": errors,
         }
 
     except IntegrationShrinkageError:
@@ -1,8 +1,16 @@
-"""Relevance checking node for multi-lingual research workflow."""
+"""Relevance checking node for multi-lingual research workflow.
 
+Each language's evidence (query translation plus a quick web search) is
+gathered concurrently, then all languages are judged in one batched
+structured LLM call. Quick searches are cached by (query, language) and
+concurrent identical searches share one request.
+"""
+
+import asyncio
 import logging
 from typing import Literal
 
+from cachetools import TTLCache
 from pydantic import BaseModel, Field
 
 from langchain_tools.firecrawl import web_search
@@ -16,6 +24,12 @@ from workflows.shared.llm_utils import ModelTier, invoke, InvokeConfig
 
 logger = logging.getLogger(__name__)
 
+# Languages gathering search evidence at once
+MAX_CONCURRENT_RELEVANCE_CHECKS = 8
+
+_search_cache: TTLCache = TTLCache(maxsize=500, ttl=3600)
+_search_locks: dict[tuple[str, str], asyncio.Lock] = {}
+
 
 class RelevanceDecision(BaseModel):
     """Structured output for Haiku relevance check."""
@@ -31,41 +45,59 @@ class RelevanceDecision(BaseModel):
 async def _quick_web_search(query: str, language_config: dict) -> list[dict]:
     """Run a quick web search in the target language.
 
+    Results are cached by (query, language); a concurrent identical call
+    waits for the first instead of searching again. Failed searches are
+    not cached.
+
     Returns list of {title, url, description} dicts (limit 5 results).
     """
     code = language_config["code"]
-    locale = language_config.get("locale")
-    preferred_domains = language_config.get("preferred_domains")
-
-    try:
-        search_result = await web_search(query=query, limit=5, locale=locale, preferred_domains=preferred_domains)
-
-        results = search_result.get("results", [])
+    key = (query, code)
+
+    if key in _search_cache:
+        logger.debug(f"Quick search cache hit for {code}")
+        return _search_cache[key]
+
+    lock = _search_locks.setdefault(key, asyncio.Lock())
+    async with lock:
+        if key in _search_cache:
+            return _search_cache[key]
+
+        try:
+            search_result = await web_search(
+                query=query,
+                limit=5,
+                locale=language_config.get("locale"),
+                preferred_domains=language_config.get("preferred_domains"),
+            )
+        except Exception as e:
+            logger.warning(f"Quick web search failed for {code}: {e}")
+            return []
+        finally:
+            _search_locks.pop(key, None)
 
-        return [
+        results = [
             {
                 "title": r.get("title", ""),
                 "url": r.get("url", ""),
                 "description": r.get("description", ""),
             }
-            for r in results
+            for r in search_result.get("results", [])
         ]
-
-    except Exception as e:
-        logger.warning(f"Quick web search failed for {code}: {e}")
-        return []
+        _search_cache[key] = results
+        return results
 
 
-async def _check_language_relevance(
+async def _build_relevance_prompt(
     topic: str,
     research_questions: list[str],
     language_code: str,
     language_config: dict,
-) -> LanguageRelevanceCheck:
-    """Check if meaningful discussion exists for topic in target language."""
+) -> str:
+    """Translate the topic, run a quick search, and format the judgment prompt."""
     language_name = language_config["name"]
 
-    logger.debug(f"Checking relevance for {language_name}")
+    logger.debug(f"Gathering relevance evidence for {language_name}")
 
     # Translate query to target language
     translated_query = await translate_query(
@@ -89,56 +121,81 @@ async def _check_language_relevance(
         "\n".join(f"- {q}" for q in research_questions) if research_questions else "(No specific questions provided)"
     )
 
-    # Build prompts
-    system_prompt = RELEVANCE_CHECK_SYSTEM.format(language_name=language_name)
-    user_prompt = RELEVANCE_CHECK_USER.format(
+    return RELEVANCE_CHECK_USER.format(
         topic=topic,
         research_questions=questions_text,
         language_name=language_name,
         quick_search_results=results_text,
     )
 
+
+async def _judge_relevance(prompts: list[str]) -> list[RelevanceDecision | Exception]:
+    """Judge all languages in one batched structured call.
+
+    If the batch fails, each prompt is retried on its own so one bad
+    response only loses that language.
+    """
+    config = InvokeConfig(max_tokens=512)
     try:
-        decision: RelevanceDecision = await invoke(
+        return await invoke(
             tier=ModelTier.DEEPSEEK_V3,
-            system=system_prompt,
-            user=user_prompt,
+            system=RELEVANCE_CHECK_SYSTEM,
+            user=prompts,
             schema=RelevanceDecision,
-            config=InvokeConfig(max_tokens=512),
+            config=config,
         )
+    except Exception as e:
+        if len(prompts) == 1:
+            return [e]
+        logger.warning(f"Batched relevance check failed ({e}), retrying languages individually")
+
+    return await asyncio.gather(
+        *(
+            invoke(
+                tier=ModelTier.DEEPSEEK_V3,
+                system=RELEVANCE_CHECK_SYSTEM,
+                user=prompt,
+                schema=RelevanceDecision,
+                config=config,
+            )
+            for prompt in prompts
+        ),
+        return_exceptions=True,
+    )
 
-        return {
-            "language_code": language_code,
-            "has_meaningful_discussion": decision.has_meaningful_discussion,
-            "confidence": decision.confidence,
-            "reasoning": decision.reasoning,
-            "suggested_depth": decision.suggested_depth,
-        }
 
-    except Exception as e:
-        logger.error(f"Relevance check failed for {language_code}: {e}")
+def _to_relevance_check(language_code: str, decision: RelevanceDecision | BaseException) -> LanguageRelevanceCheck:
+    if isinstance(decision, BaseException):
+        logger.error(f"Relevance check failed for {language_code}: {decision}")
         return {
             "language_code": language_code,
             "has_meaningful_discussion": False,
             "confidence": 0.5,
-            "reasoning": f"Error during relevance check: {str(e)[:100]}",
+            "reasoning": f"Error during relevance check: {str(decision)[:100]}",
             "suggested_depth": "skip",
         }
+    return {
+        "language_code": language_code,
+        "has_meaningful_discussion": decision.has_meaningful_discussion,
+        "confidence": decision.confidence,
+        "reasoning": decision.reasoning,
+        "suggested_depth": decision.suggested_depth,
+    }
 
 
 async def check_relevance_batch(state: MultiLangState) -> dict:
     """
-    Run quick searches and Haiku relevance checks for all target languages.
+    Run quick searches and relevance checks for all target languages.
 
     For each language (except English which always passes):
     1. Translate query to target language
-    2. Run quick web search
-    3. Ask Haiku with structured output if meaningful discussion exists
+    2. Run quick web search (cached by query and language)
 
-    Process SEQUENTIALLY (hardware constraint mentioned by user).
+    These run concurrently, at most MAX_CONCURRENT_RELEVANCE_CHECKS at a
+    time. All languages are then judged with one batched structured call.
 
     Returns:
-        relevance_checks: list[LanguageRelevanceCheck]
+        relevance_checks: list[LanguageRelevanceCheck] in target_languages order
         current_phase: "relevance_checking"
         current_status: "Checked N languages, M have content"
     """
@@ -149,14 +206,30 @@ async def check_relevance_batch(state: MultiLangState) -> dict:
 
     logger.info(f"Checking relevance for {len(target_languages)} languages")
 
-    relevance_checks = []
+    configured = [code for code in target_languages if code in language_configs]
+    for lang_code in set(target_languages) - set(configured):
+        logger.warning(f"No config for {lang_code}, skipping")
+    to_check = [code for code in configured if code != "en"]
 
-    for lang_code in target_languages:
-        language_config = language_configs.get(lang_code)
-        if not language_config:
-            logger.warning(f"No config for {lang_code}, skipping")
-            continue
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_RELEVANCE_CHECKS)
+
+    async def gather_evidence(lang_code: str) -> str:
+        async with semaphore:
+            return await _build_relevance_prompt(topic, research_questions, lang_code, language_configs[lang_code])
+
+    prompts = await asyncio.gather(*(gather_evidence(code) for code in to_check), return_exceptions=True)
 
+    # Languages whose evidence gathering failed are judged as errors without an LLM call
+    judged = [(code, p) for code, p in zip(to_check, prompts) if not isinstance(p, BaseException)]
+    decisions: dict[str, RelevanceDecision | BaseException] = {
+        code: p for code, p in zip(to_check, prompts) if isinstance(p, BaseException)
+    }
+    if judged:
+        results = await _judge_relevance([prompt for _, prompt in judged])
+        decisions.update((code, result) for (code, _), result in zip(judged, results))
+
+    relevance_checks = []
+    for lang_code in configured:
         # English always passes
         if lang_code == "en":
             relevance_checks.append(
@@ -171,13 +244,12 @@ async def check_relevance_batch(state: MultiLangState) -> dict:
             logger.debug("English: baseline language (auto-pass)")
             continue
 
-        # Check relevance for other languages
-        check = await _check_language_relevance(topic, research_questions, lang_code, language_config)
+        check = _to_relevance_check(lang_code, decisions[lang_code])
         relevance_checks.append(check)
 
         decision_text = "has content" if check["has_meaningful_discussion"] else "skipped"
         logger.debug(
-            f"{language_config['name']}: {decision_text} "
+            f"{language_configs[lang_code]['name']}: {decision_text} "
             f"(confidence: {check['confidence']:.2f}, depth: {check['suggested_depth']})"
         )
 
@@ -8,6 +8,8 @@ from .integration import (
     INITIAL_SYNTHESIS_USER,
     INTEGRATION_SYSTEM,
     INTEGRATION_USER,
+    MERGE_FINDINGS_SYSTEM,
+    MERGE_FINDINGS_USER,
 )
 from .relevance import RELEVANCE_CHECK_SYSTEM, RELEVANCE_CHECK_USER
 
@@ -20,6 +22,8 @@ __all__ = [
     "INITIAL_SYNTHESIS_USER",
     "INTEGRATION_SYSTEM",
     "INTEGRATION_USER",
+    "MERGE_FINDINGS_SYSTEM",
+    "MERGE_FINDINGS_USER",
     "RELEVANCE_CHECK_SYSTEM",
     "RELEVANCE_CHECK_USER",
 ]
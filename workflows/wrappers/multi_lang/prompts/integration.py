@@ -1,4 +1,4 @@
-"""Prompts for Opus one-by-one integration producing synthesized documents."""
+"""Prompts for Opus integration producing synthesized documents."""
 
 INTEGRATION_SYSTEM = """You are integrating research findings from {language_name} into an evolving English synthesis document.
 
@@ -94,3 +94,36 @@ Integration notes from each language:
 {integration_notes}
 
 Finalize this document for delivery."""
+
+MERGE_FINDINGS_SYSTEM = """You are combining research findings from several non-English languages into one consolidated findings brief in English.
+
+The brief will later be integrated into an English synthesis document, so:
+1. KEEP every distinct finding, perspective, and piece of evidence from both inputs
+2. GROUP related findings by theme, noting agreements and disagreements between languages
+3. Note the language origin of each finding in parentheses, e.g., "(from Spanish sources)"
+4. PRESERVE ALL citation keys in [@KEY] format exactly as they appear
+5. Do NOT summarise away detail - the brief should be at least as long as the longer input
+
+CRITICAL: Citation keys like [@7NM5HWY5] or [@ABC123] MUST be preserved exactly as they appear.
+
+Output:
+1. The merged findings brief
+2. Brief notes on the main unique contributions of each language"""
+
+MERGE_FINDINGS_USER = """Findings from {left_languages}:
+{left_findings}
+
+Guidance on their unique contributions:
+{left_guidance}
+
+---
+
+Findings from {right_languages}:
+{right_findings}
+
+Guidance on their unique contributions:
+{right_guidance}
+
+---
+
+Merge these into one findings brief covering {left_languages} and {right_languages}."""
@@ -2,12 +2,12 @@
 
 RELEVANCE_CHECK_SYSTEM = """You are assessing whether a research topic has meaningful discussion in a specific language.
 
-Your task: Determine if searching in {language_name} will yield valuable, unique content for the research topic.
+Your task: Determine if searching in the language named in the request will yield valuable, unique content for the research topic.
 
 Consider:
-1. Is this topic discussed in {language_name} sources?
-2. Would {language_name} sources offer unique perspectives not found in English?
-3. Are there regional/cultural aspects relevant to {language_name} speakers?
+1. Is this topic discussed in sources in that language?
+2. Would those sources offer unique perspectives not found in English?
+3. Are there regional/cultural aspects relevant to its speakers?
 4. Is there academic, journalistic, or professional coverage in this language?
 
 Be conservative - only say "yes" if you're reasonably confident valuable content exists.
@@ -15,7 +15,9 @@ Be decisive - if the quick search results show relevant discussions, mark as mea
 
 Respond with structured JSON matching the schema provided."""
 
-RELEVANCE_CHECK_USER = """Topic: {topic}
+RELEVANCE_CHECK_USER = """Language: {language_name}
+
+Topic: {topic}
 
 Research questions:
 {research_questions}
@@ -23,6 +23,12 @@ WorkflowType = Literal["web", "academic", "books"]
 # Supported language modes
 LanguageMode = Literal["set_languages", "main_languages", "all_languages"]
 
+# How per-language research is scheduled
+ExecutionMode = Literal["sequential", "parallel"]
+
+# How Opus folds language findings into the synthesis
+IntegrationStrategy = Literal["sequential", "tree"]
+
 
 # =============================================================================
 # Relevance and Results
@@ -82,13 +88,27 @@ class SonnetCrossAnalysis(TypedDict):
     comparative_document: str  # The actual markdown document
 
 
+class IntegrationSavings(TypedDict):
+    """Tree integration cost compared with an estimated sequential fold."""
+
+    input_tokens: int  # Prompt tokens across all tree calls
+    sequential_input_tokens: int  # Estimated for folding languages one at a time
+    critical_path_seconds: float  # Initial synthesis and tree, as run concurrently
+    sequential_seconds: float  # The same calls run back to back
+
+
 class OpusIntegrationStep(TypedDict):
-    """Opus-powered integration of one language into synthesis."""
+    """Opus-powered integration of one language (or merged group) into synthesis."""
 
-    language_code: str
+    language_code: str  # "es", or "es+de" for a tree merge
     language_name: str
     integrated_content: str
     enhancement_notes: str
+    strategy: IntegrationStrategy
+    level: int  # Fold position (sequential) or tree depth, leaves first (tree)
+    input_tokens: int  # Estimated prompt tokens
+    latency_seconds: float
+    savings: Optional[IntegrationSavings]  # Final tree step only
 
 
 # =============================================================================
@@ -106,6 +126,18 @@ class MultiLangInput(TypedDict):
     languages: Optional[list[str]]  # ISO 639-1 codes for set_languages mode
     workflow: WorkflowType
     quality: QualityTier
+    execution_mode: ExecutionMode
+    integration_strategy: IntegrationStrategy
+    time_budget_seconds: Optional[float]  # Shared wall-clock budget for language execution
+
+
+class LanguageTask(TypedDict):
+    """Send payload for one language in parallel execution mode."""
+
+    input: MultiLangInput
+    language_code: str
+    language_config: dict
+    execution_deadline: Optional[datetime]
 
 
 # =============================================================================
@@ -114,10 +146,16 @@ class MultiLangInput(TypedDict):
 
 
 def merge_language_results(existing: list[LanguageResult], new: list[LanguageResult]) -> list[LanguageResult]:
-    """Merge language results, keeping latest by language_code."""
+    """Merge language results, keeping latest by language_code.
+
+    An update that covers every existing language also sets the order, so a
+    node can reorder results by returning the full list.
+    """
     merged = {r["language_code"]: r for r in existing}
     for result in new:
         merged[result["language_code"]] = result
+    if merged.keys() <= {r["language_code"] for r in new}:
+        return [merged[code] for code in dict.fromkeys(r["language_code"] for r in new)]
     return list(merged.values())
 
 
@@ -137,8 +175,9 @@ class MultiLangState(TypedDict):
     language_configs: dict  # code -> LanguageConfig dict
     languages_with_content: list[str]  # After relevance filtering
     current_language_index: int
-    languages_completed: list[str]
-    languages_failed: list[str]
+    languages_completed: Annotated[list[str], add]
+    languages_failed: Annotated[list[str], add]
+    execution_deadline: Optional[datetime]  # From input.time_budget_seconds
 
     # Relevance checks (mode 2)
     relevance_checks: Annotated[list[LanguageRelevanceCheck], add]